@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import sys
+
+from benchmarks import harness
+from benchmarks.cases import BENCHMARKS
+
+BASELINE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT = "default"
+
+
+def default_baseline(quick: bool) -> str:
+    """The stored baseline for full or quick runs."""
+    return os.path.join(BASELINE_DIR, "baseline-quick.json" if quick else "baseline.json")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure client-side overhead of the Pangram SDK with the network stubbed out.",
+    )
+    parser.add_argument("-k", "--filter", help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--quick", action="store_true", help="Fewer samples and smaller inputs, for a fast check.")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit.")
+    parser.add_argument(
+        "--save", metavar="PATH", nargs="?", const=DEFAULT, help="Write the results as a baseline. Defaults to the stored one."
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="PATH",
+        nargs="?",
+        const=DEFAULT,
+        help="Compare with a baseline, by default the stored one, and exit with status 1 on regressions.",
+    )
+    parser.add_argument("--time-threshold", type=float, default=harness.DEFAULT_TIME_THRESHOLD, help="Allowed slowdown, e.g. 0.25.")
+    parser.add_argument(
+        "--memory-threshold", type=float, default=harness.DEFAULT_MEMORY_THRESHOLD, help="Allowed peak memory growth, e.g. 0.1."
+    )
+    parser.add_argument("--output", metavar="PATH", help="Also write the report to this file.")
+    parser.add_argument("--no-isolate", action="store_true", help="Run every benchmark in this process.")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        benchmark = next(benchmark for benchmark in BENCHMARKS if benchmark.name == args.worker)
+        print(json.dumps(benchmark.measure(args.quick)))
+        return 0
+
+    benchmarks = [benchmark for benchmark in BENCHMARKS if not args.filter or args.filter in benchmark.name]
+    if args.list:
+        for benchmark in benchmarks:
+            print(f"{benchmark.name}: {benchmark.description}")
+        return 0
+    if not benchmarks:
+        parser.error(f"no benchmark matches {args.filter!r}")
+    if args.compare == DEFAULT:
+        args.compare = default_baseline(args.quick)
+    if args.save == DEFAULT:
+        args.save = default_baseline(args.quick)
+    baseline = harness.load(args.compare) if args.compare else None
+
+    current = harness.run(benchmarks, quick=args.quick, isolate=not args.no_isolate, log=lambda line: print(line, file=sys.stderr))
+    rows = None
+    if baseline is not None:
+        if args.filter:
+            baseline = {**baseline, "results": {name: result for name, result in baseline["results"].items() if name in current["results"]}}
+        overrides = {benchmark.name: benchmark.time_threshold for benchmark in benchmarks if benchmark.time_threshold is not None}
+        rows = harness.compare(baseline, current, args.time_threshold, args.memory_threshold, overrides)
+    report = harness.format_report(current, rows, baseline)
+    print(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(report + "\n")
+    if args.save:
+        if args.filter and os.path.exists(args.save):
+            stored = harness.load(args.save)
+            current = {**current, "results": {**stored["results"], **current["results"]}}
+        harness.save(current, args.save)
+    return 1 if rows and any(row["status"] == "regressed" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+import atexit
+import itertools
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from benchmarks.harness import REPO_ROOT, Benchmark
+from pangram import FixedPolling, PangramText
+from pangram.codec import JSONCodec, MsgspecCodec, OrjsonCodec
+from pangram.testing import fake_prediction
+
+BULK_ITEMS = 1_000_000
+QUICK_BULK_ITEMS = 100_000
+BULK_PAGE_SIZE = 1000
+LARGE_PAGE_ITEMS = 1000
+UPLOAD_FILES = 20
+UPLOAD_FILE_BYTES = 256 * 1024
+DOCUMENT_WORDS = 1000
+IMPORT_SCRIPT = "import time; started = time.perf_counter(); import pangram; print(time.perf_counter() - started)"
+
+Handler = Callable[[requests.PreparedRequest], Tuple[int, bytes]]
+
+
+class StubAdapter(BaseAdapter):
+    def __init__(self, routes: List[Tuple[str, str, Handler]]) -> None:
+        """
+        A ``requests`` transport that answers from memory instead of the network.
+
+        Request bodies are read to the end, as a socket would, so the cost of
+        producing them is measured. Everything above the transport, from
+        request preparation to response parsing, runs as it does in
+        production.
+
+        :param routes: ``(method, path pattern, handler)`` triples. The handler returns a status code and body.
+        :type routes: List[Tuple[str, str, Callable[[requests.PreparedRequest], Tuple[int, bytes]]]]
+        """
+        super().__init__()
+        self.routes = [(method, re.compile(pattern), handler) for method, pattern, handler in routes]
+
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        _consume(request.body)
+        path = urlsplit(request.url).path
+        for method, pattern, handler in self.routes:
+            if method == request.method and pattern.fullmatch(path):
+                status, body = handler(request)
+                break
+        else:
+            status, body = 404, b'{"error": "no stub route"}'
+        return stub_response(status, body, request)
+
+    def close(self) -> None:
+        pass
+
+
+def _consume(body) -> None:
+    if body is None or isinstance(body, (bytes, str)):
+        return
+    if hasattr(body, "read"):
+        while body.read(64 * 1024):
+            pass
+        return
+    for _ in body:
+        pass
+
+
+def stub_response(status: int, body: bytes, request: Optional[requests.PreparedRequest] = None) -> requests.Response:
+    """Build a ``requests.Response`` with an in-memory body."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict({"Content-Type": "application/json", "Content-Length": str(len(body))})
+    response.encoding = "utf-8"
+    response.reason = "OK" if status < 400 else "Error"
+    if request is not None:
+        response.url = request.url
+        response.request = request
+    return response
+
+
+def stub_client(routes: List[Tuple[str, str, Handler]], **kwargs) -> PangramText:
+    """A client whose every request is answered by a :class:`StubAdapter` with ``routes``, polling without delay."""
+    session = requests.Session()
+    session.mount("https://", StubAdapter(routes))
+    return PangramText(api_key="bench-key", session=session, polling=FixedPolling(0), **kwargs)
+
+
+def _encode(payload) -> bytes:
+    return json.dumps(payload).encode("utf-8")
+
+
+def _document(words: int = DOCUMENT_WORDS, seed: int = 0) -> str:
+    return " ".join(f"word{(seed * 7919 + index) % 5000}" for index in range(words))
+
+
+def _summary_result() -> Dict:
+    return {
+        "stage": "STAGE_SUCCESS",
+        "version": "3.0",
+        "prediction_short": "Human",
+        "fraction_ai": 0.0,
+        "fraction_ai_assisted": 0.1,
+        "fraction_human": 0.9,
+        "num_ai_segments": 0,
+        "num_ai_assisted_segments": 1,
+        "num_human_segments": 4,
+    }
+
+
+def setup_import(quick: bool) -> Callable[[], float]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")]))}
+
+    def operation() -> float:
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT], cwd=REPO_ROOT, env=env, check=True, capture_output=True, text=True
+        )
+        return float(output.stdout.strip())
+
+    return operation
+
+
+def setup_predict(quick: bool) -> Callable[[], object]:
+    result = _encode({"task_id": "task-1", **fake_prediction(_document())})
+    pending = _encode({"task_id": "task-1", "stage": "STAGE_RUNNING"})
+    polls = itertools.cycle([pending, result])
+    client = stub_client(
+        [
+            ("POST", r"/task", lambda request: (200, b'{"task_id": "task-1"}')),
+            ("GET", r"/task/[^/]+", lambda request: (200, next(polls))),
+        ]
+    )
+    return lambda: client.predict("benchmark text")
+
+
+def setup_predict_many(quick: bool) -> Callable[[], object]:
+    result = _encode({"task_id": "task", **fake_prediction(_document(200))})
+    texts = [f"benchmark text {index}" for index in range(100)]
+    task_ids = itertools.count()
+    client = stub_client(
+        [
+            ("POST", r"/task", lambda request: (200, _encode({"task_id": f"task-{next(task_ids)}"}))),
+            ("GET", r"/task/[^/]+", lambda request: (200, result)),
+        ]
+    )
+    return lambda: client.predict_many(texts)
+
+
+def setup_parse(codec: JSONCodec) -> Callable[[bool], Callable[[], object]]:
+    def setup(quick: bool) -> Callable[[], object]:
+        items = [
+            {"index": index, "id": f"row-{index}", "stage": "STAGE_SUCCESS", "error": None,
+             "result": fake_prediction(_document(seed=index))}
+            for index in range(LARGE_PAGE_ITEMS // (10 if quick else 1))
+        ]
+        response = stub_response(200, _encode({"bulk_id": "blk", "total_items": len(items), "items": items, "failed_items": []}))
+        client = PangramText(api_key="bench-key", json_codec=codec)
+        return lambda: client._parse_response_json(response)
+
+    return setup
+
+
+def setup_bulk_results(typed: bool) -> Callable[[bool], Callable[[], object]]:
+    def setup(quick: bool) -> Callable[[], object]:
+        total = QUICK_BULK_ITEMS if quick else BULK_ITEMS
+        # Every page repeats the same items; aggregation does not depend on their indices.
+        page = _encode(
+            {
+                "bulk_id": "blk",
+                "total_items": total,
+                "items": [
+                    {"index": index, "id": f"row-{index}", "stage": "STAGE_SUCCESS", "error": None, "result": _summary_result()}
+                    for index in range(BULK_PAGE_SIZE)
+                ],
+                "failed_items": [],
+            }
+        )
+        client = stub_client([("GET", r"/bulk/[^/]+/results", lambda request: (200, page))])
+        return lambda: client.get_bulk_results("blk", page_size=BULK_PAGE_SIZE, typed=typed)
+
+    return setup
+
+
+def _upload_fixture(quick: bool) -> Tuple[List[str], PangramText]:
+    directory = tempfile.mkdtemp(prefix="pangram-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+    paths = []
+    for index in range(UPLOAD_FILES // (4 if quick else 1)):
+        path = os.path.join(directory, f"essay-{index}.txt")
+        with open(path, "wb") as handle:
+            handle.write(os.urandom(UPLOAD_FILE_BYTES // 2).hex().encode("ascii"))
+        paths.append(path)
+
+    results = _encode([_summary_result() for _ in paths])
+    return paths, stub_client([("POST", r"/?", lambda request: (200, results))])
+
+
+def setup_predict_files(quick: bool) -> Callable[[], object]:
+    paths, client = _upload_fixture(quick)
+    return lambda: client.predict_files(paths)
+
+
+def setup_predict_files_batched(quick: bool) -> Callable[[], object]:
+    paths, client = _upload_fixture(quick)
+    return lambda: client.predict_files_batched(
+        paths, max_files_per_request=len(paths), max_bytes_per_request=len(paths) * UPLOAD_FILE_BYTES, max_workers=1
+    )
+
+
+def _installed_codecs() -> List[JSONCodec]:
+    codecs = [JSONCodec()]
+    for codec_class in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_class())
+        except ImportError:
+            pass
+    return codecs
+
+
+BENCHMARKS = [
+    Benchmark("import_pangram", setup_import, repeat=10, self_timed=True, description="import pangram in a fresh interpreter"),
+    Benchmark("predict", setup_predict, number=60, repeat=7, description="predict(): submit, one pending poll, one result"),
+    Benchmark("predict_many_100", setup_predict_many, number=3, repeat=5, description="predict_many() of 100 texts"),
+    *[
+        Benchmark(
+            f"parse_response_json_large[{codec.name}]",
+            setup_parse(codec),
+            number=3,
+            repeat=5,
+            memory=True,
+            description=f"_parse_response_json() of a 1000-item results page with {codec.name}",
+        )
+        for codec in _installed_codecs()
+    ],
+    Benchmark(
+        "get_bulk_results_1m",
+        setup_bulk_results(typed=False),
+        repeat=3,
+        memory=True,
+        description="get_bulk_results() aggregating 1M items from 1000 pages",
+    ),
+    Benchmark(
+        "get_bulk_results_1m_typed",
+        setup_bulk_results(typed=True),
+        repeat=3,
+        memory=True,
+        description="get_bulk_results(typed=True) aggregating 1M items from 1000 pages",
+    ),
+    Benchmark(
+        "predict_files",
+        setup_predict_files,
+        number=6,
+        repeat=5,
+        memory=True,
+        time_threshold=0.5,
+        description="predict_files() building one multipart body of 20 files of 256 KiB",
+    ),
+    Benchmark(
+        "predict_files_batched",
+        setup_predict_files_batched,
+        number=6,
+        repeat=5,
+        memory=True,
+        description="predict_files_batched() streaming one multipart body of 20 files of 256 KiB",
+    ),
+]
@@ -0,0 +1,318 @@
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.10
+BASELINE_FORMAT = 1
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Benchmark:
+    def __init__(
+        self,
+        name: str,
+        setup: Callable[[bool], Callable[[], object]],
+        number: int = 1,
+        repeat: int = 5,
+        memory: bool = False,
+        self_timed: bool = False,
+        time_threshold: Optional[float] = None,
+        description: str = "",
+    ) -> None:
+        """
+        One measured operation.
+
+        ``setup(quick)`` builds the fixture outside the timed region and
+        returns a callable that performs the operation once. Each sample
+        times ``number`` calls and reports the time per call.
+
+        :param name: Unique name, used as the key in baseline files.
+        :type name: str
+        :param setup: Builds the fixture and returns the operation. Receives True for a quick run.
+        :type setup: Callable[[bool], Callable[[], object]]
+        :param number: Calls per sample. Defaults to 1.
+        :type number: int
+        :param repeat: Samples per run. Defaults to 5.
+        :type repeat: int
+        :param memory: Also record peak traced memory of one call. Defaults to False.
+        :type memory: bool
+        :param self_timed: The operation returns its own duration in seconds, which is used instead of
+                           the time around the call. Use this when the call includes setup that should
+                           not be measured, such as starting a subprocess. Defaults to False.
+        :type self_timed: bool
+        :param time_threshold: Allowed relative slowdown for this benchmark, for ones whose timing varies more
+                               between runs. Defaults to the threshold given to :func:`compare`.
+        :type time_threshold: float, optional
+        :param description: One line shown in reports.
+        :type description: str
+        """
+        self.name = name
+        self.setup = setup
+        self.number = number
+        self.repeat = repeat
+        self.memory = memory
+        self.self_timed = self_timed
+        self.time_threshold = time_threshold
+        self.description = description
+
+    def measure(self, quick: bool = False) -> Dict:
+        """
+        Run the benchmark and return its ``median_s``, ``min_s``, ``samples``, and, with ``memory``, ``peak_bytes``.
+
+        Quick runs take a third of the samples and calls. The memory pass
+        runs once, separately from timing, because tracing slows every
+        allocation.
+
+        :param quick: Take fewer samples and let ``setup`` shrink its inputs. Defaults to False.
+        :type quick: bool
+        :rtype: Dict
+        """
+        operation = self.setup(quick)
+        number = max(1, self.number // 3) if quick else self.number
+        repeat = max(3, self.repeat // 3) if quick else self.repeat
+        operation()
+        samples = []
+        for _ in range(repeat):
+            gc.collect()
+            started = time.perf_counter()
+            durations = [operation() for _ in range(number)]
+            elapsed = sum(durations) if self.self_timed else time.perf_counter() - started
+            samples.append(elapsed / number)
+        result = {"median_s": statistics.median(samples), "min_s": min(samples), "samples": repeat}
+        if self.memory:
+            gc.collect()
+            tracemalloc.start()
+            try:
+                operation()
+                result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        return result
+
+
+def environment() -> Dict[str, str]:
+    """Describe the interpreter and machine a run was taken on."""
+    import pangram
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pangram": pangram.__version__,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def measure_isolated(benchmark: Benchmark, quick: bool = False) -> Dict:
+    """
+    Run :meth:`Benchmark.measure` in a fresh interpreter.
+
+    Earlier benchmarks leave the allocator and caches in a different state,
+    which shifts allocation-heavy timings by tens of percent. A fresh process
+    per benchmark makes results independent of which others ran before.
+
+    :rtype: Dict
+    """
+    command = [sys.executable, "-m", "benchmarks", "--worker", benchmark.name] + (["--quick"] if quick else [])
+    output = subprocess.run(command, cwd=REPO_ROOT, check=True, capture_output=True, text=True)
+    return json.loads(output.stdout)
+
+
+def run(
+    benchmarks: Sequence[Benchmark],
+    quick: bool = False,
+    isolate: bool = True,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict:
+    """
+    Measure ``benchmarks`` in order and return a report in the baseline file format.
+
+    :param benchmarks: The benchmarks to run.
+    :type benchmarks: Sequence[Benchmark]
+    :param quick: Take fewer samples with smaller inputs. Defaults to False.
+    :type quick: bool
+    :param isolate: Run each benchmark in its own interpreter with :func:`measure_isolated`. Defaults to True.
+    :type isolate: bool
+    :param log: Called with a progress line after each benchmark. Defaults to none.
+    :type log: Callable[[str], None], optional
+    :rtype: Dict
+    """
+    results = {}
+    for benchmark in benchmarks:
+        results[benchmark.name] = measure_isolated(benchmark, quick) if isolate else benchmark.measure(quick)
+        if log is not None:
+            log(f"{benchmark.name}: {format_seconds(results[benchmark.name]['median_s'])}")
+    return {"format": BASELINE_FORMAT, "quick": quick, "environment": environment(), "results": results}
+
+
+def save(report: Dict, path: str) -> None:
+    """Write ``report`` to ``path`` as JSON."""
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def load(path: str) -> Dict:
+    """
+    Read a report written by :func:`save`.
+
+    :raises ValueError: If the file is not a baseline report.
+    """
+    with open(path, encoding="utf-8") as handle:
+        report = json.load(handle)
+    if not isinstance(report, dict) or report.get("format") != BASELINE_FORMAT or not isinstance(report.get("results"), dict):
+        raise ValueError(f"{path} is not a benchmark baseline")
+    return report
+
+
+def compare(
+    baseline: Dict,
+    current: Dict,
+    time_threshold: float = DEFAULT_TIME_THRESHOLD,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    time_thresholds: Optional[Dict[str, float]] = None,
+) -> List[Dict]:
+    """
+    Compare two reports benchmark by benchmark.
+
+    Each row has the benchmark ``name``, the baseline and current
+    ``median_s`` and ``peak_bytes``, their ratios, and a ``status``:
+    ``"regressed"`` when the median time grew by more than
+    ``time_threshold`` or peak memory by more than ``memory_threshold``,
+    ``"improved"`` when time shrank by more than ``time_threshold``,
+    ``"new"`` or ``"missing"`` when only one report has the benchmark, and
+    ``"ok"`` otherwise.
+
+    :param baseline: The stored report.
+    :type baseline: Dict
+    :param current: The report to check.
+    :type current: Dict
+    :param time_threshold: Allowed relative slowdown. Defaults to 0.25.
+    :type time_threshold: float
+    :param memory_threshold: Allowed relative growth of peak memory. Defaults to 0.10.
+    :type memory_threshold: float
+    :param time_thresholds: Per-benchmark overrides of ``time_threshold``, by name. Defaults to none.
+    :type time_thresholds: Dict[str, float], optional
+    :rtype: List[Dict]
+    :raises ValueError: If one report is a quick run and the other is not, since their inputs differ.
+    """
+    if bool(baseline.get("quick")) != bool(current.get("quick")):
+        raise ValueError("cannot compare a quick run with a full run; rerun with the same --quick setting as the baseline")
+    old, new = baseline["results"], current["results"]
+    rows = []
+    for name in list(new) + [name for name in old if name not in new]:
+        row = {"name": name, "baseline": old.get(name), "current": new.get(name), "time_ratio": None, "memory_ratio": None}
+        if row["baseline"] is None:
+            row["status"] = "new"
+        elif row["current"] is None:
+            row["status"] = "missing"
+        else:
+            allowed = (time_thresholds or {}).get(name, time_threshold)
+            row["time_ratio"] = _ratio(row["current"].get("median_s"), row["baseline"].get("median_s"))
+            row["memory_ratio"] = _ratio(row["current"].get("peak_bytes"), row["baseline"].get("peak_bytes"))
+            if (row["time_ratio"] or 0) > 1 + allowed or (row["memory_ratio"] or 0) > 1 + memory_threshold:
+                row["status"] = "regressed"
+            elif row["time_ratio"] is not None and row["time_ratio"] < 1 - allowed:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
+
+
+def _ratio(current: Optional[float], baseline: Optional[float]) -> Optional[float]:
+    if current is None or not baseline:
+        return None
+    return current / baseline
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Format a duration with a unit that keeps three significant digits."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def format_bytes(size: Optional[int]) -> str:
+    """Format a byte count in binary units."""
+    if size is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.3g} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.3g} GiB"
+
+
+def _change(ratio: Optional[float]) -> str:
+    return "-" if ratio is None else f"{(ratio - 1) * 100:+.1f}%"
+
+
+def format_report(current: Dict, rows: Optional[List[Dict]] = None, baseline: Optional[Dict] = None) -> str:
+    """
+    Render a run, and its comparison rows if any, as a plain-text table.
+
+    :param current: The report of the run.
+    :type current: Dict
+    :param rows: Rows from :func:`compare`. Defaults to reporting the run alone.
+    :type rows: List[Dict], optional
+    :param baseline: The baseline report, used for its environment line.
+    :type baseline: Dict, optional
+    :rtype: str
+    """
+    lines = [_describe("current", current)]
+    if rows is None:
+        header = ("benchmark", "median", "min", "peak memory")
+        table = [
+            (name, format_seconds(result["median_s"]), format_seconds(result["min_s"]), format_bytes(result.get("peak_bytes")))
+            for name, result in current["results"].items()
+        ]
+    else:
+        lines.insert(0, _describe("baseline", baseline or {}))
+        header = ("benchmark", "baseline", "current", "time", "baseline mem", "current mem", "memory", "status")
+        table = []
+        for row in rows:
+            old, new = row["baseline"] or {}, row["current"] or {}
+            table.append(
+                (
+                    row["name"],
+                    format_seconds(old.get("median_s")),
+                    format_seconds(new.get("median_s")),
+                    _change(row["time_ratio"]),
+                    format_bytes(old.get("peak_bytes")),
+                    format_bytes(new.get("peak_bytes")),
+                    _change(row["memory_ratio"]),
+                    row["status"].upper() if row["status"] == "regressed" else row["status"],
+                )
+            )
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *table)]
+    lines.append("")
+    for cells in [header, tuple("-" * width for width in widths), *table]:
+        lines.append("  ".join(str(cell).ljust(width) for cell, width in zip(cells, widths)).rstrip())
+    if rows is not None:
+        regressed = [row["name"] for row in rows if row["status"] == "regressed"]
+        lines.append("")
+        lines.append(f"{len(regressed)} regression(s)" + (f": {', '.join(regressed)}" if regressed else ""))
+    return "\n".join(lines)
+
+
+def _describe(label: str, report: Dict) -> str:
+    env = report.get("environment") or {}
+    quick = " (quick)" if report.get("quick") else ""
+    return (
+        f"{label}: pangram {env.get('pangram', '?')}, {env.get('implementation', 'Python')} {env.get('python', '?')}, "
+        f"{env.get('platform', '?')}, {env.get('created_at', '?')}{quick}"
+    )
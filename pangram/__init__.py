@@ -5,6 +5,38 @@ __email__ = "max@pangram.com"
 __license__ = "MIT"
 
 from pangram.text_classifier import PangramText
+from pangram.bulk import ChunkedBulkJob
+from pangram.pipeline import BulkPipeline
+from pangram.cache import ResultCache
+from pangram.compression import RequestCompression
+from pangram.errors import PangramAPIError
+from pangram.polling import AdaptivePolling, FixedPolling, PollingStrategy
+from pangram.rate_limit import RateLimiter
+from pangram.retry import RetryPolicy
 Pangram = PangramText
 
-__all__ = ["PangramText", "Pangram"]
+__all__ = [
+    "PangramText",
+    "Pangram",
+    "AsyncPangramText",
+    "AsyncPangram",
+    "AdaptivePolling",
+    "FixedPolling",
+    "PollingStrategy",
+    "PangramAPIError",
+    "RetryPolicy",
+    "RateLimiter",
+    "ResultCache",
+    "RequestCompression",
+    "ChunkedBulkJob",
+    "BulkPipeline",
+]
+
+
+def __getattr__(name):
+    # The async client needs the optional httpx package, so it is imported on first use.
+    if name in ("AsyncPangramText", "AsyncPangram"):
+        from pangram.async_client import AsyncPangramText
+
+        return AsyncPangramText
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,701 @@
+import asyncio
+import os
+import time
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only when httpx is absent
+    httpx = None
+
+from pangram.text_classifier import (
+    BULK_TERMINAL_STATUSES,
+    DEFAULT_BULK_PAGE_WORKERS,
+    DEFAULT_BULK_TIMEOUT_SECONDS,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PREDICT_TIMEOUT_SECONDS,
+    HTTP_REQUEST_TIMEOUT_SECONDS,
+    MAX_BULK_PAGE_LIMIT,
+    PLAGIARISM_REQUEST_TIMEOUT_SECONDS,
+    _BulkHarvest,
+    _PangramClientBase,
+)
+from pangram.codec import JSONCodec
+from pangram.errors import PangramAPIError
+from pangram.polling import PollingStrategy, PollSchedule
+
+DEFAULT_MAX_CONNECTIONS = 100
+
+
+class AsyncPangramText(_PangramClientBase):
+    _request_errors = (httpx.RequestError,) if httpx is not None else ()
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_POOL_MAXSIZE,
+        client: Optional["httpx.AsyncClient"] = None,
+        polling: Optional[PollingStrategy] = None,
+        json_codec: Optional[JSONCodec] = None,
+        api_endpoint: Optional[str] = None,
+        file_upload_endpoint: Optional[str] = None,
+        plagiarism_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        An asyncio client for the Pangram Labs API.
+
+        Mirrors :class:`pangram.PangramText` with awaitable methods. Polling uses
+        ``asyncio.sleep``, so one event loop can keep many predictions in flight
+        without dedicating a thread to each. All calls share one pooled
+        ``httpx.AsyncClient``; call :meth:`aclose` or use the client as an async
+        context manager to release it.
+
+        Requires the optional ``httpx`` dependency (``pip install "pangram-sdk[async]"``).
+
+        :param api_key: Your API key for the Pangram Labs. If not provided, the environment variable PANGRAM_API_KEY will be used.
+        :type api_key: str, optional
+        :param max_connections: Maximum number of concurrent connections in the pool. Defaults to 100.
+        :type max_connections: int
+        :param max_keepalive_connections: Maximum number of idle kept-alive connections. Defaults to 10.
+        :type max_keepalive_connections: int
+        :param client: An existing ``httpx.AsyncClient`` to use instead of creating one. The client
+                       does not close instances it did not create.
+        :type client: httpx.AsyncClient, optional
+        :param polling: Default polling strategy for :meth:`predict` and :meth:`wait_for_bulk`.
+                        When unset, calls poll at their fixed ``poll_interval``.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param json_codec: Codec used to encode request bodies and decode responses.
+                           Defaults to the standard library ``json`` module.
+        :type json_codec: pangram.codec.JSONCodec, optional
+        :param api_endpoint: Base URL of the prediction and Bulk API endpoints. Defaults to Pangram's API.
+        :type api_endpoint: str, optional
+        :param file_upload_endpoint: URL of the file upload endpoint. Defaults to Pangram's API.
+        :type file_upload_endpoint: str, optional
+        :param plagiarism_endpoint: URL of the plagiarism endpoint. Defaults to Pangram's API.
+        :type plagiarism_endpoint: str, optional
+        :raises ImportError: If httpx is not installed.
+        :raises ValueError: If the API key is not provided and not set in the environment, or if pool sizes are invalid.
+        """
+        if httpx is None:
+            raise ImportError('AsyncPangramText requires httpx. Install it with `pip install "pangram-sdk[async]"`.')
+        self._init_api_key(api_key)
+        self._init_endpoints(api_endpoint, file_upload_endpoint, plagiarism_endpoint)
+        self._polling = polling
+        if json_codec is not None:
+            self._json_codec = json_codec
+        if max_connections < 1 or max_keepalive_connections < 0:
+            raise ValueError("max_connections must be at least 1 and max_keepalive_connections cannot be negative")
+
+        if client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                ),
+                timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+            )
+            self._owns_client = True
+        else:
+            self._client = client
+            self._owns_client = False
+
+    async def aclose(self) -> None:
+        """
+        Close the client's pooled HTTP connections.
+
+        Clients passed in by the caller are left open.
+        """
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncPangramText":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    async def _sleep_until_next_poll(
+        self,
+        schedule: PollSchedule,
+        deadline: float,
+        status: Optional[Dict] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        sleep_for = self._sleep_interval(schedule, deadline, status=status, retry_after=retry_after)
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+
+    async def submit_bulk(
+        self,
+        text: Optional[List[str]] = None,
+        items: Optional[List[Dict[str, str]]] = None,
+    ) -> Dict:
+        """
+        Submit a Bulk API job for asynchronous AI detection.
+
+        See :meth:`pangram.PangramText.submit_bulk`.
+
+        :param text: A list of input texts to analyze.
+        :type text: List[str], optional
+        :param items: A list of item dictionaries. Each item must include
+                      ``text`` and may include ``id``.
+        :type items: List[Dict[str, str]], optional
+        :return: Bulk submission response containing ``bulk_id``, ``status``,
+                 ``total_items``, ``accepted_items``, and ``failed_items``.
+        :rtype: Dict
+        :raises ValueError: If both or neither payload shapes are provided, or
+                            if the API returns an error.
+        """
+        payload = self._bulk_payload(text, items)
+        try:
+            response = await self._client.post(
+                f"{self.api_endpoint}/bulk",
+                content=self._json_codec.dumps(payload),
+                headers=self._headers(),
+                timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while submitting bulk job: {exc}") from exc
+        response_json = self._parse_response_json(response, expected_status_codes=(202,))
+        return self._require_dict(response_json, "bulk response")
+
+    async def _fetch_bulk_status(self, bulk_id: str, request_timeout: float) -> Dict:
+        response = await self._client.get(
+            f"{self.api_endpoint}/bulk/{bulk_id}",
+            headers=self._headers(),
+            timeout=request_timeout,
+        )
+        response_json = self._parse_response_json(response)
+        return self._require_dict(response_json, "bulk status response")
+
+    async def get_bulk_status(self, bulk_id: str) -> Dict:
+        """
+        Fetch the current status for a Bulk API job.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :return: Bulk status response containing counters and timestamps.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or an invalid response.
+        """
+        try:
+            return await self._fetch_bulk_status(bulk_id, HTTP_REQUEST_TIMEOUT_SECONDS)
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while fetching bulk status: {exc}") from exc
+
+    async def get_bulk_items(self, bulk_id: str, offset: int = 0, limit: int = 100) -> Dict:
+        """
+        Fetch paginated item metadata for a Bulk API job.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param offset: Zero-based item offset. Defaults to 0.
+        :type offset: int
+        :param limit: Maximum number of items to return. The API allows up to 1000.
+        :type limit: int
+        :return: Paginated bulk item metadata.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or an invalid response.
+        """
+        try:
+            response = await self._client.get(
+                f"{self.api_endpoint}/bulk/{bulk_id}/items",
+                params={"offset": offset, "limit": limit},
+                headers=self._headers(),
+                timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while fetching bulk items: {exc}") from exc
+        response_json = self._parse_response_json(response)
+        return self._require_dict(response_json, "bulk items response")
+
+    async def get_bulk_results_page(self, bulk_id: str, offset: int = 0, limit: int = 100) -> Dict:
+        """
+        Fetch one page of results for a Bulk API job.
+
+        See :meth:`pangram.PangramText.get_bulk_results_page`.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param offset: Zero-based item offset. Defaults to 0.
+        :type offset: int
+        :param limit: Maximum number of items to return. The API allows up to 1000.
+        :type limit: int
+        :return: Paginated bulk result response.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or an invalid response.
+        """
+        try:
+            response = await self._client.get(
+                f"{self.api_endpoint}/bulk/{bulk_id}/results",
+                params={"offset": offset, "limit": limit},
+                headers=self._headers(),
+                timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while fetching bulk results: {exc}") from exc
+        response_json = self._parse_response_json(response)
+        return self._require_dict(response_json, "bulk results response")
+
+    async def get_bulk_results(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        max_workers: int = DEFAULT_BULK_PAGE_WORKERS,
+    ) -> Dict:
+        """
+        Fetch all available results for a Bulk API job.
+
+        See :meth:`pangram.PangramText.get_bulk_results`. Pages after the
+        first are fetched concurrently, at most ``max_workers`` at a time.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param max_workers: Maximum number of pages fetched at once. Defaults to 4.
+        :type max_workers: int
+        :return: Aggregated bulk result response containing ``bulk_id``,
+                 ``total_items``, ``items``, and ``failed_items``.
+        :rtype: Dict
+        :raises ValueError: If page_size or max_workers is invalid, or if the API returns an
+                            error or invalid response.
+        """
+        self._validate_page_size(page_size)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        first_page = await self.get_bulk_results_page(bulk_id, offset=0, limit=page_size)
+        total_items, _, _ = self._unpack_results_page(first_page)
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def fetch(offset: int) -> Dict:
+            async with semaphore:
+                return await self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
+
+        pages = await asyncio.gather(*(fetch(offset) for offset in range(page_size, total_items, page_size)))
+        return self._merge_results_pages(bulk_id, [first_page, *pages])
+
+    def iter_bulk_results(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        offset: int = 0,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Dict]:
+        """
+        Stream the results of a Bulk API job one item at a time.
+
+        See :meth:`pangram.PangramText.iter_bulk_results`. Use with ``async for``;
+        the next page is prefetched in a background task.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param offset: Zero-based item offset to start from. Defaults to 0.
+        :type offset: int
+        :param prefetch: Whether to fetch the next page while the current page is consumed. Defaults to True.
+        :type prefetch: bool
+        :return: An async iterator of result items.
+        :rtype: AsyncIterator[Dict]
+        :raises ValueError: If page_size or offset is invalid, or if the API returns an
+                            error or invalid response while iterating.
+        """
+        self._validate_page_size(page_size)
+        self._validate_offset(offset)
+        return self._iter_bulk_results(bulk_id, page_size, offset, prefetch)
+
+    async def _iter_bulk_results(self, bulk_id: str, page_size: int, offset: int, prefetch: bool) -> AsyncIterator[Dict]:
+        async for page in self._iter_bulk_results_pages(bulk_id, page_size, offset, prefetch):
+            _, page_items, page_failed_items = self._unpack_results_page(page)
+            for item in self._tagged_results_page(page_items, page_failed_items):
+                yield item
+
+    async def _iter_bulk_results_pages(
+        self, bulk_id: str, page_size: int, offset: int, prefetch: bool
+    ) -> AsyncIterator[Dict]:
+        next_page = None
+        try:
+            page = await self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
+            while True:
+                total_items, _, _ = self._unpack_results_page(page)
+                offset += page_size
+                if prefetch and offset < total_items:
+                    next_page = asyncio.ensure_future(self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size))
+                yield page
+                if offset >= total_items:
+                    return
+                if next_page is not None:
+                    page = await next_page
+                    next_page = None
+                else:
+                    page = await self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def wait_for_bulk(
+        self,
+        bulk_id: str,
+        timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Dict:
+        """
+        Poll a Bulk API job until it reaches a terminal status.
+
+        See :meth:`pangram.PangramText.wait_for_bulk`.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param timeout: Maximum seconds to wait for terminal completion.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values
+                              below 0.1 are clamped to 0.1. Ignored when a
+                              polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this wait. Defaults to the client's
+                        ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: Terminal bulk status response.
+        :rtype: Dict
+        :raises ValueError: If timeout or poll interval values are invalid, or
+                            if the API returns an error.
+        :raises TimeoutError: If the bulk job does not complete before timeout.
+        """
+        self._validate_wait_args(timeout, poll_interval)
+
+        deadline = time.monotonic() + timeout
+        schedule = self._polling_schedule(polling, poll_interval)
+        last_status = None
+
+        while True:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s; last status={last_status}"
+                )
+
+            try:
+                status_response = await self._fetch_bulk_status(
+                    bulk_id,
+                    self._request_timeout(deadline),
+                )
+            except (httpx.RequestError, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s; last status={last_status}"
+                    ) from exc
+                await self._sleep_until_next_poll(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
+                continue
+
+            last_status = status_response.get("status")
+            if last_status in BULK_TERMINAL_STATUSES:
+                return status_response
+
+            await self._sleep_until_next_poll(schedule, deadline, status=status_response)
+
+    def iter_bulk_completed(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield each item of a Bulk API job as soon as it finishes, while the job is still running.
+
+        See :meth:`pangram.PangramText.iter_bulk_completed`. Use with ``async for``.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param timeout: Maximum seconds to wait for terminal completion.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values
+                              below 0.1 are clamped to 0.1. Ignored when a
+                              polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this wait. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: An async iterator of finished result items.
+        :rtype: AsyncIterator[Dict]
+        :raises ValueError: If page_size, timeout, or poll interval values are invalid,
+                            or if the API returns an error while iterating.
+        :raises TimeoutError: If the bulk job does not complete before timeout.
+        """
+        self._validate_page_size(page_size)
+        self._validate_wait_args(timeout, poll_interval)
+        return self._iter_bulk_completed(bulk_id, page_size, timeout, poll_interval, polling)
+
+    async def _iter_bulk_completed(
+        self,
+        bulk_id: str,
+        page_size: int,
+        timeout: float,
+        poll_interval: float,
+        polling: Optional[PollingStrategy],
+    ) -> AsyncIterator[Dict]:
+        deadline = time.monotonic() + timeout
+        schedule = self._polling_schedule(polling, poll_interval)
+        harvest = _BulkHarvest(page_size)
+        last_status = None
+
+        while True:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s; last status={last_status}"
+                )
+
+            try:
+                status_response = await self._fetch_bulk_status(bulk_id, self._request_timeout(deadline))
+            except (httpx.RequestError, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
+                await self._sleep_until_next_poll(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
+                continue
+
+            last_status = status_response.get("status")
+            terminal = last_status in BULK_TERMINAL_STATUSES
+            if harvest.needs_pages(status_response, terminal):
+                offset = harvest.next_offset(-1)
+                while offset is not None and not harvest.caught_up(status_response, terminal):
+                    page = await self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
+                    for item in harvest.take(offset, page):
+                        yield item
+                    offset = harvest.next_offset(offset)
+            if terminal:
+                return
+
+            await self._sleep_until_next_poll(schedule, deadline, status=status_response)
+
+    async def _submit_prediction_task(self, text: str, deadline: float, public_dashboard_link: bool) -> str:
+        try:
+            response = await self._client.post(
+                f"{self.api_endpoint}/task",
+                content=self._json_codec.dumps({"text": text, "public_dashboard_link": public_dashboard_link}),
+                headers=self._headers(),
+                timeout=self._request_timeout(deadline),
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while submitting prediction task: {exc}") from exc
+        return self._task_id_from_response(self._parse_response_json(response))
+
+    async def _poll_prediction_task(
+        self,
+        task_id: str,
+        deadline: float,
+        timeout: float,
+        schedule: PollSchedule,
+    ) -> Dict:
+        while True:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Pangram prediction task {task_id} did not complete within {timeout:.0f}s")
+
+            try:
+                response = await self._client.get(
+                    f"{self.api_endpoint}/task/{task_id}",
+                    headers=self._headers(),
+                    timeout=self._request_timeout(deadline),
+                )
+                task_response = self._parse_response_json(response)
+            except (httpx.RequestError, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Pangram prediction task {task_id} did not complete within {timeout:.0f}s"
+                    ) from exc
+                await self._sleep_until_next_poll(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
+                continue
+            result = self._completed_task_result(task_id, task_response)
+            if result is not None:
+                return result
+
+            await self._sleep_until_next_poll(schedule, deadline, retry_after=self._retry_after(response))
+
+    async def predict(
+        self,
+        text: str,
+        public_dashboard_link: bool = False,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Dict:
+        """
+        Classify text as AI-, AI-assisted, or human-written.
+
+        Submits the text to Pangram's async inference endpoint and awaits
+        completion without blocking the event loop. The result has the same
+        fields as :meth:`pangram.PangramText.predict`.
+
+        :param text: The text to be classified.
+        :type text: str
+        :param public_dashboard_link: Whether to include a public dashboard link in the completed response. Defaults to False.
+        :type public_dashboard_link: bool
+        :param timeout: Maximum seconds to wait for the async task to complete. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: Pangram analysis with AI-assistance detection.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or if the response is invalid
+        :raises TimeoutError: If the async task does not complete before timeout
+        """
+        self._validate_wait_args(timeout, poll_interval)
+
+        deadline = time.monotonic() + timeout
+        task_id = await self._submit_prediction_task(text, deadline, public_dashboard_link)
+        return await self._poll_prediction_task(
+            task_id,
+            deadline,
+            timeout,
+            self._polling_schedule(polling, poll_interval),
+        )
+
+    async def predict_with_dashboard_link(
+        self,
+        text: str,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Dict:
+        """
+        Classify text and include a public dashboard link in the result.
+
+        :param text: The text to be classified.
+        :type text: str
+        :param timeout: Maximum seconds to wait for the async task to complete. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: The classification result from the API, including ``dashboard_link``.
+        :rtype: dict
+        :raises ValueError: If the API returns an error or if the response is invalid
+        :raises TimeoutError: If the async task does not complete before timeout
+        """
+        return await self.predict(
+            text,
+            public_dashboard_link=True,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            polling=polling,
+        )
+
+    @staticmethod
+    def _read_file(path: str) -> bytes:
+        with open(path, "rb") as file_obj:
+            return file_obj.read()
+
+    async def predict_files(
+        self,
+        file_paths: List[Union[str, os.PathLike]],
+        public_dashboard_link: bool = False,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+    ) -> List[Dict]:
+        """
+        Upload one or more files for AI detection.
+
+        File contents are read in a worker thread so disk I/O does not block
+        the event loop. See :meth:`pangram.PangramText.predict_files`.
+
+        :param file_paths: Paths to files to upload and analyze.
+        :type file_paths: List[Union[str, os.PathLike]]
+        :param public_dashboard_link: Whether to create public dashboard links for the uploaded files. Defaults to False.
+        :type public_dashboard_link: bool
+        :param timeout: Maximum seconds to wait for the upload request to complete. Defaults to 300.
+        :type timeout: float
+        :return: A list of per-file result dictionaries returned by the API.
+        :rtype: List[Dict]
+        :raises ValueError: If no files are provided, if timeout is invalid, if
+                            the API returns an error, or if the response is invalid.
+        """
+        if not file_paths:
+            raise ValueError("file_paths must contain at least one file")
+        if timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+
+        files_payload = []
+        for file_path in file_paths:
+            path = os.fspath(file_path)
+            contents = await asyncio.to_thread(self._read_file, path)
+            files_payload.append(("files", (os.path.basename(path), contents)))
+
+        try:
+            response = await self._client.post(
+                self.file_upload_endpoint,
+                files=files_payload,
+                data=self._file_upload_data(public_dashboard_link),
+                headers=self._auth_headers(),
+                timeout=timeout,
+            )
+        except httpx.RequestError as exc:
+            raise ValueError(f"Pangram API request failed while uploading files: {exc}") from exc
+
+        response_json = self._parse_response_json(response)
+        if not isinstance(response_json, list):
+            raise ValueError(f"Error returned by API: invalid file upload response: {response_json}")
+        return response_json
+
+    async def predict_file(
+        self,
+        file_path: Union[str, os.PathLike],
+        public_dashboard_link: bool = False,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+    ) -> Dict:
+        """
+        Upload a single file for AI detection.
+
+        :param file_path: Path to the file to upload and analyze.
+        :type file_path: Union[str, os.PathLike]
+        :param public_dashboard_link: Whether to create a public dashboard link for the uploaded file. Defaults to False.
+        :type public_dashboard_link: bool
+        :param timeout: Maximum seconds to wait for the upload request to complete. Defaults to 300.
+        :type timeout: float
+        :return: The per-file result dictionary returned by the API.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or an invalid response.
+        """
+        response_json = await self.predict_files(
+            [file_path],
+            public_dashboard_link=public_dashboard_link,
+            timeout=timeout,
+        )
+        if not response_json:
+            raise ValueError("Error returned by API: empty file upload response")
+        return response_json[0]
+
+    async def check_plagiarism(self, text: str) -> Dict:
+        """
+        Check text for potential plagiarism.
+
+        See :meth:`pangram.PangramText.check_plagiarism`.
+
+        :param text: The text to check for plagiarism.
+        :type text: str
+        :return: A dictionary containing the plagiarism check results.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or if the response is invalid
+        """
+        response = await self._client.post(
+            self.plagiarism_endpoint,
+            content=self._json_codec.dumps(self._plagiarism_payload(text)),
+            headers=self._headers(),
+            timeout=PLAGIARISM_REQUEST_TIMEOUT_SECONDS,
+        )
+        return self._parse_plagiarism_response(response)
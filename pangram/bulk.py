@@ -0,0 +1,366 @@
+import heapq
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from pangram.dedup import DedupPlan
+from pangram.polling import PollingStrategy
+from pangram.text_classifier import (
+    BULK_TERMINAL_STATUSES,
+    DEFAULT_BULK_PAGE_WORKERS,
+    DEFAULT_BULK_TIMEOUT_SECONDS,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    MAX_BULK_PAGE_LIMIT,
+    PangramText,
+)
+
+MAX_BULK_BILLABLE_UNITS = 1000
+WORDS_PER_BILLABLE_UNIT = 1000
+DEFAULT_BULK_CHUNK_ITEMS = 1000
+DEFAULT_BULK_CHUNK_BYTES = 4 * 1024 * 1024
+DEFAULT_BULK_SUBMIT_WORKERS = 4
+
+
+def billable_units(text: str) -> int:
+    """
+    Return the Bulk API billable units for one item: one per started 1,000-word block, minimum one.
+
+    :param text: The item text.
+    :type text: str
+    :rtype: int
+    """
+    words = len(text.split()) if isinstance(text, str) else 0
+    return max(1, -(-words // WORDS_PER_BILLABLE_UNIT))
+
+
+def iter_bulk_chunks(
+    entries: Iterable[Union[str, Dict]],
+    max_items: int = DEFAULT_BULK_CHUNK_ITEMS,
+    max_bytes: int = DEFAULT_BULK_CHUNK_BYTES,
+    max_units: int = MAX_BULK_BILLABLE_UNITS,
+) -> Iterator[List[Union[str, Dict]]]:
+    """
+    Lazily group bulk entries into lists that each fit in one Bulk API request.
+
+    A chunk closes before it would exceed ``max_items`` entries, ``max_bytes``
+    of serialized JSON, or ``max_units`` billable units. An entry that is too
+    large on its own gets a chunk to itself and is left for the API to accept
+    or reject. Only the chunk being built is held in memory.
+
+    :param entries: Input texts, or item dictionaries with ``text`` and optional ``id``.
+    :type entries: Iterable[Union[str, Dict]]
+    :param max_items: Maximum entries per chunk.
+    :type max_items: int
+    :param max_bytes: Maximum serialized bytes per chunk.
+    :type max_bytes: int
+    :param max_units: Maximum billable units per chunk.
+    :type max_units: int
+    :return: An iterator of chunks, in input order.
+    :rtype: Iterator[List[Union[str, Dict]]]
+    :raises ValueError: If any limit is less than 1.
+    """
+    if max_items < 1 or max_bytes < 1 or max_units < 1:
+        raise ValueError("max_items, max_bytes, and max_units must be at least 1")
+    return _iter_bulk_chunks(entries, max_items, max_bytes, max_units)
+
+
+def _iter_bulk_chunks(
+    entries: Iterable[Union[str, Dict]], max_items: int, max_bytes: int, max_units: int
+) -> Iterator[List[Union[str, Dict]]]:
+    chunk = []
+    chunk_bytes = 0
+    chunk_units = 0
+    for entry in entries:
+        entry_bytes = len(json.dumps(entry).encode("utf-8")) + 1
+        entry_units = billable_units(entry.get("text") if isinstance(entry, dict) else entry)
+        if chunk and (
+            len(chunk) >= max_items
+            or chunk_bytes + entry_bytes > max_bytes
+            or chunk_units + entry_units > max_units
+        ):
+            yield chunk
+            chunk, chunk_bytes, chunk_units = [], 0, 0
+        chunk.append(entry)
+        chunk_bytes += entry_bytes
+        chunk_units += entry_units
+    if chunk:
+        yield chunk
+
+
+def chunk_bulk_entries(
+    entries: Sequence[Union[str, Dict]],
+    max_items: int = DEFAULT_BULK_CHUNK_ITEMS,
+    max_bytes: int = DEFAULT_BULK_CHUNK_BYTES,
+    max_units: int = MAX_BULK_BILLABLE_UNITS,
+) -> List[range]:
+    """
+    Split bulk entries into contiguous index ranges that each fit in one Bulk API request.
+
+    See :func:`iter_bulk_chunks` for the limits applied.
+
+    :param entries: Input texts, or item dictionaries with ``text`` and optional ``id``.
+    :type entries: Sequence[Union[str, Dict]]
+    :return: Index ranges into ``entries``, in order.
+    :rtype: List[range]
+    :raises ValueError: If any limit is less than 1.
+    """
+    ranges = []
+    start = 0
+    for chunk in iter_bulk_chunks(entries, max_items=max_items, max_bytes=max_bytes, max_units=max_units):
+        ranges.append(range(start, start + len(chunk)))
+        start += len(chunk)
+    return ranges
+
+
+def aggregate_bulk_status(statuses: List[Dict]) -> str:
+    """
+    Combine the statuses of several bulk jobs into one.
+
+    :param statuses: Status responses of the underlying jobs.
+    :type statuses: List[Dict]
+    :return: ``queued`` or ``running`` while any job is unfinished, otherwise
+             ``succeeded``, ``failed``, or ``partial``.
+    :rtype: str
+    """
+    values = [status.get("status") for status in statuses]
+    if any(value not in BULK_TERMINAL_STATUSES for value in values):
+        if all(value == "queued" for value in values):
+            return "queued"
+        return "running"
+    if all(value == "succeeded" for value in values):
+        return "succeeded"
+    if all(value == "failed" for value in values):
+        return "failed"
+    return "partial"
+
+
+class BulkChunk:
+    def __init__(
+        self,
+        bulk_id: Optional[str],
+        indices: List[int],
+        cached_items: List[Dict],
+        response: Dict,
+        dedup: Optional[DedupPlan] = None,
+    ) -> None:
+        """
+        One underlying bulk job of a :class:`ChunkedBulkJob`.
+
+        :param bulk_id: The job's ID, or None if every item in the chunk was answered from the cache.
+        :type bulk_id: str, optional
+        :param indices: Original input position of each item submitted in the job, by job item index.
+        :type indices: List[int]
+        :param cached_items: Result items answered from the cache, with original input positions.
+        :type cached_items: List[Dict]
+        :param response: The job's submission response, with item indices mapped to input positions.
+        :type response: Dict
+        :param dedup: The plan that removed duplicate inputs before submission, if any.
+        :type dedup: pangram.dedup.DedupPlan, optional
+        """
+        self.bulk_id = bulk_id
+        self.indices = indices
+        self.cached_items = cached_items
+        self.response = response
+        self.dedup = dedup
+
+    def remap(self, item: Dict) -> Dict:
+        index = item.get("index")
+        if isinstance(index, int) and 0 <= index < len(self.indices):
+            item["index"] = self.indices[index]
+        return item
+
+    def expand(self, items: Iterable[Dict]) -> Iterator[Dict]:
+        """Remap job items to input positions, followed by a copy for each duplicate input."""
+        for item in items:
+            item = self.remap(item)
+            if self.dedup is None:
+                yield item
+            else:
+                yield from self.dedup.fan_out_items([item])
+
+
+class ChunkedBulkJob:
+    def __init__(self, client, chunks: List[BulkChunk], total_items: int) -> None:
+        """
+        A handle for one logical bulk submission split across several Bulk API jobs.
+
+        Created by :meth:`pangram.PangramText.submit_bulk_chunked`. Status,
+        wait, and results calls aggregate across the underlying ``bulk_ids``.
+        Every ``index`` reported by the handle is the item's position in the
+        original input, and customer ``id`` values are passed through
+        unchanged.
+
+        :param client: The client used to query the underlying jobs.
+        :type client: pangram.PangramText
+        :param chunks: The underlying jobs in input order.
+        :type chunks: List[pangram.bulk.BulkChunk]
+        :param total_items: Number of items in the original input.
+        :type total_items: int
+        """
+        self._client = client
+        self.chunks = chunks
+        self.total_items = total_items
+
+    @property
+    def bulk_ids(self) -> List[str]:
+        """The IDs of the underlying bulk jobs, in input order."""
+        return [chunk.bulk_id for chunk in self.chunks if chunk.bulk_id is not None]
+
+    @property
+    def accepted_items(self) -> List[Dict]:
+        """Items accepted at submission, across all jobs."""
+        return [item for chunk in self.chunks for item in chunk.response.get("accepted_items") or []]
+
+    @property
+    def failed_items(self) -> List[Dict]:
+        """Items that failed immediate validation at submission, across all jobs."""
+        return [item for chunk in self.chunks for item in chunk.response.get("failed_items") or []]
+
+    @property
+    def cached_items(self) -> List[Dict]:
+        """Items answered from the client's result cache without being submitted."""
+        return [item for chunk in self.chunks for item in chunk.cached_items]
+
+    @property
+    def deduplicated(self) -> int:
+        """Number of duplicate inputs that were not submitted because an identical text was."""
+        return next((chunk.dedup.saved for chunk in self.chunks if chunk.dedup is not None), 0)
+
+    def status(self) -> Dict:
+        """
+        Fetch and combine the current status of every underlying job.
+
+        :return: Aggregate status with ``bulk_ids``, ``status``, ``total_items``,
+                 ``accepted``, ``succeeded``, ``failed``, ``cached``, ``deduplicated``, and the per-job
+                 ``jobs`` responses. Job counts do not include duplicate inputs.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error.
+        """
+        return self._aggregate(self._map(self._client.get_bulk_status, self.bulk_ids))
+
+    def wait(
+        self,
+        timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Dict:
+        """
+        Wait until every underlying job reaches a terminal status.
+
+        The timeout covers the whole group, not each job.
+
+        :param timeout: Maximum seconds to wait for all jobs. Defaults to 3600.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for the wait.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: Aggregate terminal status, as returned by :meth:`status`.
+        :rtype: Dict
+        :raises ValueError: If timeout or poll interval values are invalid, or if the API returns an error.
+        :raises TimeoutError: If the jobs do not all complete before timeout.
+        """
+        PangramText._validate_wait_args(timeout, poll_interval)
+        deadline = time.monotonic() + timeout
+        statuses = []
+        for bulk_id in self.bulk_ids:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s")
+            statuses.append(
+                self._client.wait_for_bulk(bulk_id, timeout=remaining, poll_interval=poll_interval, polling=polling)
+            )
+        return self._aggregate(statuses)
+
+    def results(self, page_size: int = MAX_BULK_PAGE_LIMIT, max_workers: int = DEFAULT_BULK_PAGE_WORKERS) -> Dict:
+        """
+        Fetch the results of every underlying job, in original input order.
+
+        Items answered from the cache are included with ``"cached": True``.
+
+        :param page_size: Number of item slots to request per API call.
+        :type page_size: int
+        :param max_workers: Maximum number of pages fetched at once per job.
+        :type max_workers: int
+        :return: Aggregated results containing ``bulk_ids``, ``total_items``, ``items``, and ``failed_items``.
+        :rtype: Dict
+        :raises ValueError: If the API returns an error or invalid response.
+        """
+        items = []
+        failed_items = []
+        for chunk in self.chunks:
+            items.extend(chunk.cached_items)
+            if chunk.bulk_id is None:
+                continue
+            chunk_results = self._client.get_bulk_results(chunk.bulk_id, page_size=page_size, max_workers=max_workers)
+            items.extend(chunk.expand(chunk_results["items"]))
+            failed_items.extend(chunk.expand(chunk_results["failed_items"]))
+        items.sort(key=self._index_key)
+        failed_items.sort(key=self._index_key)
+        return {
+            "bulk_ids": self.bulk_ids,
+            "total_items": self.total_items,
+            "items": items,
+            "failed_items": failed_items,
+        }
+
+    def iter_results(self, page_size: int = MAX_BULK_PAGE_LIMIT, prefetch: bool = True) -> Iterator[Dict]:
+        """
+        Stream the results of every underlying job, in original input order.
+
+        See :meth:`pangram.PangramText.iter_bulk_results`. Failed items carry
+        ``"failed": True`` and cached items ``"cached": True``. With
+        ``dedupe``, copies for duplicate inputs follow the item they were
+        copied from, so indices are only approximately in order.
+
+        :param page_size: Number of item slots to request per API call.
+        :type page_size: int
+        :param prefetch: Whether to fetch the next page while the current page is consumed.
+        :type prefetch: bool
+        :return: An iterator of result items.
+        :rtype: Iterator[Dict]
+        """
+        for chunk in self.chunks:
+            if chunk.bulk_id is None:
+                yield from chunk.cached_items
+                continue
+            job_items = chunk.expand(
+                self._client.iter_bulk_results(chunk.bulk_id, page_size=page_size, prefetch=prefetch)
+            )
+            yield from heapq.merge(chunk.cached_items, job_items, key=self._index_key)
+
+    def _aggregate(self, statuses: List[Dict]) -> Dict:
+        cached = len(self.cached_items)
+        if not statuses:
+            status = "succeeded"
+        else:
+            status = aggregate_bulk_status(statuses)
+        return {
+            "bulk_ids": self.bulk_ids,
+            "status": status,
+            "total_items": self.total_items,
+            "accepted": sum(self._count(job, "accepted") for job in statuses),
+            "succeeded": sum(self._count(job, "succeeded") for job in statuses) + cached,
+            "failed": sum(self._count(job, "failed") for job in statuses),
+            "cached": cached,
+            "deduplicated": self.deduplicated,
+            "jobs": statuses,
+        }
+
+    @staticmethod
+    def _count(status: Dict, key: str) -> int:
+        value = status.get(key)
+        return value if isinstance(value, int) else 0
+
+    @staticmethod
+    def _index_key(item: Dict) -> int:
+        index = item.get("index")
+        return index if isinstance(index, int) else -1
+
+    @staticmethod
+    def _map(function: Callable, arguments: List) -> List:
+        if len(arguments) <= 1:
+            return [function(argument) for argument in arguments]
+        with ThreadPoolExecutor(max_workers=min(len(arguments), DEFAULT_BULK_SUBMIT_WORKERS)) as executor:
+            return list(executor.map(function, arguments))
@@ -0,0 +1,279 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+CACHE_KEY_SCHEMA = 2
+DEFAULT_MEMORY_ENTRIES = 10000
+_WHITESPACE_CHARACTER = re.compile(r"\s")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Replace every whitespace character with a plain space before hashing.
+
+    Texts that differ only in the kind of whitespace, such as tabs or
+    non-breaking spaces, then share a cache entry. Every character keeps its
+    position, so the window offsets of a cached result stay valid for each
+    of them. Pass it as :class:`ResultCache`'s ``normalize`` to opt in.
+
+    :param text: The input text.
+    :type text: str
+    :return: The normalized text, the same length as ``text``.
+    :rtype: str
+    """
+    return _WHITESPACE_CHARACTER.sub(" ", text)
+
+
+class ResultCache:
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_disk_bytes: Optional[int] = None,
+        model_version: Optional[str] = None,
+        normalize: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        """
+        A content-addressed cache of Pangram results.
+
+        Entries are keyed by a SHA-256 hash of the exact input (text or file
+        bytes) and the request options, so resubmitting identical
+        content is answered locally. Results live in an in-memory LRU tier
+        and, when ``path`` is set, in a SQLite database that survives restarts
+        and can be shared by several processes.
+
+        Each entry records the model ``version`` of its result. Lookups only
+        return entries for ``model_version`` when it is set; otherwise they
+        follow the newest version seen in a stored result, so entries from an
+        older model stop matching once the API moves on.
+
+        :param max_entries: Maximum number of results kept in memory. Defaults to 10000.
+        :type max_entries: int
+        :param path: SQLite database file for the persistent tier. Defaults to memory only.
+        :type path: str, optional
+        :param ttl: Seconds after which persistent entries expire. Defaults to never.
+        :type ttl: float, optional
+        :param max_disk_bytes: Approximate cap on stored result bytes in the persistent tier.
+                               The least recently used entries are evicted first. Defaults to no cap.
+        :type max_disk_bytes: int, optional
+        :param model_version: Only return results produced by this model version.
+        :type model_version: str, optional
+        :param normalize: Function applied to text before hashing, such as :func:`normalize_text`. It must
+                          return text of the same length, because a hit is served with the stored result's
+                          window offsets. Defaults to hashing the exact text.
+        :type normalize: Callable[[str], str], optional
+        :raises ValueError: If max_entries, ttl, or max_disk_bytes is out of range.
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries cannot be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be greater than 0")
+        if max_disk_bytes is not None and max_disk_bytes <= 0:
+            raise ValueError("max_disk_bytes must be greater than 0")
+        self.max_entries = max_entries
+        self.path = path
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.model_version = model_version
+        self._normalize = normalize
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._current_version = model_version
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._open_database(path)
+
+    def key_for_text(self, text: str, **options) -> str:
+        """
+        Return the cache key for ``text`` submitted with ``options``.
+
+        :param text: The input text.
+        :type text: str
+        :return: A hex digest identifying the text and options.
+        :rtype: str
+        :raises ValueError: If the ``normalize`` function changed the length of the text.
+        """
+        if self._normalize is not None:
+            normalized = self._normalize(text)
+            if len(normalized) != len(text):
+                raise ValueError("normalize must not change the length of the text, or cached window offsets would be wrong")
+            text = normalized
+        return self._key(text.encode("utf-8", "surrogatepass"), "text", options)
+
+    def key_for_bytes(self, data: bytes, **options) -> str:
+        """
+        Return the cache key for uploaded file contents ``data`` submitted with ``options``.
+
+        :param data: The file contents.
+        :type data: bytes
+        :return: A hex digest identifying the bytes and options.
+        :rtype: str
+        """
+        return self._key(data, "bytes", options)
+
+    @staticmethod
+    def _key(content: bytes, kind: str, options: Dict) -> str:
+        digest = hashlib.sha256()
+        header = json.dumps({"schema": CACHE_KEY_SCHEMA, "kind": kind, "options": options}, sort_keys=True)
+        digest.update(header.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Return a copy of the cached result for ``key``, or None on a miss.
+
+        :param key: A key from :meth:`key_for_text` or :meth:`key_for_bytes`.
+        :type key: str
+        :rtype: Dict, optional
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                version, value = entry
+                if self._version_matches(version):
+                    self._memory.move_to_end(key)
+                    return json.loads(value)
+                del self._memory[key]
+            if self._db is None:
+                return None
+            entry = self._get_from_disk(key)
+            if entry is None:
+                return None
+            version, value = entry
+            self._remember(key, version, value)
+            return json.loads(value)
+
+    def set(self, key: str, result: Dict) -> None:
+        """
+        Store ``result`` under ``key``.
+
+        :param key: A key from :meth:`key_for_text` or :meth:`key_for_bytes`.
+        :type key: str
+        :param result: A completed result from the API.
+        :type result: Dict
+        """
+        version = result.get("version") if isinstance(result, dict) else None
+        self._store(key, version, json.dumps(result, separators=(",", ":")))
+
+    def set_json(self, key: str, data: bytes, version: Optional[str] = None) -> None:
+        """
+        Store a result given as its raw JSON response body, without decoding it.
+
+        :param key: A key from :meth:`key_for_text` or :meth:`key_for_bytes`.
+        :type key: str
+        :param data: The UTF-8 JSON of a completed result from the API.
+        :type data: bytes
+        :param version: The result's model ``version``. Defaults to unknown.
+        :type version: str, optional
+        """
+        self._store(key, version, data.decode("utf-8"))
+
+    def _store(self, key: str, version: Any, value: str) -> None:
+        version = None if version is None else str(version)
+        with self._lock:
+            if self.model_version is None and version is not None and version != self._current_version:
+                self._current_version = version
+                if self._db is not None:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO meta (name, value) VALUES ('current_version', ?)", (version,)
+                    )
+            self._remember(key, version, value)
+            if self._db is not None:
+                self._set_on_disk(key, version, value)
+
+    def clear(self) -> None:
+        """
+        Remove every entry from both tiers.
+        """
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        """
+        Close the persistent tier's database connection.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+
+    def _version_matches(self, version: Optional[str]) -> bool:
+        return self._current_version is None or version is None or version == self._current_version
+
+    def _remember(self, key: str, version: Optional[str], value: str) -> None:
+        if not self.max_entries:
+            return
+        self._memory[key] = (version, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _open_database(self, path: str) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, version TEXT, created REAL NOT NULL, accessed REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+        db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        if self.model_version is None:
+            row = db.execute("SELECT value FROM meta WHERE name = 'current_version'").fetchone()
+            if row is not None:
+                self._current_version = row[0]
+        self._disk_bytes = db.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM results").fetchone()[0]
+        self._db = db
+
+    def _get_from_disk(self, key: str) -> Optional[tuple]:
+        row = self._db.execute("SELECT version, created, value FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        version, created, value = row
+        now = time.time()
+        if (self.ttl is not None and now - created > self.ttl) or not self._version_matches(version):
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            return None
+        self._db.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+        return version, value
+
+    def _set_on_disk(self, key: str, version: Optional[str], value: str) -> None:
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, version, created, accessed, value) VALUES (?, ?, ?, ?, ?)",
+            (key, version, now, now, value),
+        )
+        self._disk_bytes += len(value)
+        if self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes:
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        # The running total drifts when entries are replaced or other processes
+        # write, so recount before deleting anything.
+        if self.ttl is not None:
+            self._db.execute("DELETE FROM results WHERE created < ?", (now - self.ttl,))
+        self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM results").fetchone()[0]
+        for key, size in self._db.execute("SELECT key, LENGTH(value) FROM results ORDER BY accessed").fetchall():
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self._disk_bytes -= size
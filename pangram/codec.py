@@ -0,0 +1,98 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is an optional dependency
+    msgspec = None
+
+
+class JSONCodec:
+    """
+    Encodes request bodies to, and decodes response bodies from, UTF-8 JSON bytes.
+
+    Subclass this to plug a different JSON library into the clients.
+    :meth:`loads` must raise ``ValueError`` on malformed input.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode ``obj`` as UTF-8 JSON.
+
+        :rtype: bytes
+        """
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Decode UTF-8 JSON ``data``.
+
+        :raises ValueError: If ``data`` is not valid JSON.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """
+        A :class:`JSONCodec` backed by ``orjson``.
+
+        :raises ImportError: If orjson is not installed.
+        """
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson. Install it with `pip install orjson`.")
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """
+        A :class:`JSONCodec` backed by ``msgspec.json``.
+
+        :raises ImportError: If msgspec is not installed.
+        """
+        if msgspec is None:
+            raise ImportError("MsgspecCodec requires msgspec. Install it with `pip install msgspec`.")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+
+def fastest_codec() -> JSONCodec:
+    """
+    Return the fastest installed codec: orjson, then msgspec, then the standard library.
+
+    :rtype: pangram.codec.JSONCodec
+    """
+    if orjson is not None:
+        return OrjsonCodec()
+    if msgspec is not None:
+        return MsgspecCodec()
+    return JSONCodec()
+
+
+DEFAULT_CODEC = JSONCodec()
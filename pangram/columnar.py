@@ -0,0 +1,365 @@
+import math
+from collections.abc import Mapping
+from enum import Enum
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+DOCUMENT_FLOAT_COLUMNS = ("fraction_ai", "fraction_ai_assisted", "fraction_human")
+DOCUMENT_INT_COLUMNS = ("num_ai_segments", "num_ai_assisted_segments", "num_human_segments")
+DOCUMENT_STRING_COLUMNS = ("id", "prediction_short", "error")
+WINDOW_FLOAT_COLUMNS = ("ai_assistance_score",)
+WINDOW_INT_COLUMNS = ("start_index", "end_index", "word_count", "token_length")
+WINDOW_STRING_COLUMNS = ("label", "confidence")
+MISSING_INT = -1
+
+
+# numpy and pyarrow are optional and slow to import, so they are imported on
+# first use rather than with the module.
+def _numpy() -> ModuleType:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Columnar results require numpy. Install it with `pip install numpy`.") from None
+    return numpy
+
+
+def _pyarrow() -> Tuple[ModuleType, ModuleType]:
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("Arrow and Parquet export require pyarrow. Install it with `pip install pyarrow`.") from None
+    return pyarrow, pyarrow.parquet
+
+
+def _float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return math.nan
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return MISSING_INT
+
+
+def _string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value.value if isinstance(value, Enum) else str(value)
+
+
+class _PageColumns:
+    """Column values for one page of results, as Python lists."""
+
+    def __init__(self, include_windows: bool) -> None:
+        self.include_windows = include_windows
+        self.documents: Dict[str, List[Any]] = {
+            name: []
+            for name in ("index", "failed", *DOCUMENT_STRING_COLUMNS, *DOCUMENT_FLOAT_COLUMNS, *DOCUMENT_INT_COLUMNS)
+        }
+        self.windows: Dict[str, List[Any]] = {
+            name: []
+            for name in ("index", "window", *WINDOW_STRING_COLUMNS, *WINDOW_FLOAT_COLUMNS, *WINDOW_INT_COLUMNS)
+        }
+
+    def add(self, index: int, item_id: Any, result: Optional[Mapping], failed: bool, error: Any) -> None:
+        documents = self.documents
+        documents["index"].append(index)
+        documents["failed"].append(failed)
+        documents["id"].append(_string(item_id))
+        documents["error"].append(_string(error))
+        documents["prediction_short"].append(_string(result.get("prediction_short")) if result is not None else None)
+        for name in DOCUMENT_FLOAT_COLUMNS:
+            documents[name].append(_float(result.get(name)) if result is not None else math.nan)
+        for name in DOCUMENT_INT_COLUMNS:
+            documents[name].append(_int(result.get(name)) if result is not None else MISSING_INT)
+        if not self.include_windows or result is None:
+            return
+        windows = self.windows
+        for position, window in enumerate(result.get("windows") or ()):
+            if not isinstance(window, Mapping):
+                continue
+            windows["index"].append(index)
+            windows["window"].append(position)
+            for name in WINDOW_STRING_COLUMNS:
+                windows[name].append(_string(window.get(name)))
+            for name in WINDOW_FLOAT_COLUMNS:
+                windows[name].append(_float(window.get(name)))
+            for name in WINDOW_INT_COLUMNS:
+                windows[name].append(_int(window.get(name)))
+
+    def add_items(self, items: Iterable[Mapping]) -> None:
+        for position, item in enumerate(items):
+            index = item.get("index")
+            result = item.get("result")
+            self.add(
+                index if isinstance(index, int) else position,
+                item.get("id"),
+                result if isinstance(result, Mapping) else None,
+                bool(item.get("failed")) or item.get("error") is not None,
+                item.get("error"),
+            )
+
+    def add_results(self, results: Iterable[Union[Mapping, Exception]], start: int) -> None:
+        for index, result in enumerate(results, start):
+            if isinstance(result, Exception):
+                self.add(index, None, None, True, str(result))
+            else:
+                self.add(index, None, result if isinstance(result, Mapping) else None, False, None)
+
+    @staticmethod
+    def _arrays(columns: Dict[str, List[Any]], floats: Sequence[str], ints: Sequence[str]) -> Dict[str, Any]:
+        np = _numpy()
+        arrays = {}
+        for name, values in columns.items():
+            if name in floats:
+                arrays[name] = np.array(values, dtype=np.float64)
+            elif name in ints or name == "index":
+                arrays[name] = np.array(values, dtype=np.int64)
+            elif name == "window":
+                arrays[name] = np.array(values, dtype=np.int32)
+            elif name == "failed":
+                arrays[name] = np.array(values, dtype=bool)
+            else:
+                arrays[name] = np.array(values, dtype=object)
+        return arrays
+
+    def document_arrays(self) -> Dict[str, Any]:
+        return self._arrays(self.documents, DOCUMENT_FLOAT_COLUMNS, DOCUMENT_INT_COLUMNS)
+
+    def window_arrays(self) -> Dict[str, Any]:
+        return self._arrays(self.windows, WINDOW_FLOAT_COLUMNS, WINDOW_INT_COLUMNS)
+
+
+def _arrow_table(arrays: Dict[str, Any]) -> Any:
+    # String columns are typed explicitly so a page where one is all None keeps the same schema.
+    pa, _ = _pyarrow()
+    return pa.table(
+        {
+            name: pa.array(values, type=pa.string()) if values.dtype == object else pa.array(values)
+            for name, values in arrays.items()
+        }
+    )
+
+
+class ResultColumns:
+    def __init__(self, include_windows: bool = True) -> None:
+        """
+        Columnar tables of prediction results, built page by page.
+
+        The document table has one row per item, keyed by ``index``: the
+        item index of a bulk job, or the position in a batch. It holds
+        ``id``, ``failed``, ``error``, ``prediction_short``, the
+        ``fraction_*`` scores, and the ``num_*_segments`` counts. The window
+        table has one row per window, with the ``index`` of its document,
+        its position ``window``, ``label``, ``confidence``,
+        ``ai_assistance_score``, ``start_index``, ``end_index``,
+        ``word_count``, and ``token_length``. Window text is not included.
+
+        Each call to :meth:`add_items` or :meth:`add_results` converts its
+        results to NumPy arrays right away, so only one page of result
+        dicts is alive at a time. Missing scores are ``nan`` and missing
+        counts are ``-1``.
+
+        :param include_windows: Whether to build the window table. Defaults to True.
+        :type include_windows: bool
+        :raises ImportError: If numpy is not installed.
+        """
+        _numpy()
+        self.include_windows = include_windows
+        self._document_chunks: List[Dict[str, Any]] = []
+        self._window_chunks: List[Dict[str, Any]] = []
+        self._size = 0
+
+    def _append(self, page: _PageColumns) -> None:
+        documents = page.document_arrays()
+        self._size += len(documents["index"])
+        self._document_chunks.append(documents)
+        if self.include_windows:
+            self._window_chunks.append(page.window_arrays())
+
+    def add_items(self, items: Iterable[Mapping]) -> None:
+        """
+        Add bulk result items, such as one page from :meth:`pangram.PangramText.iter_bulk_results`.
+
+        :param items: Items with ``index``, optional ``id``, and ``result``, or ``failed`` and ``error``.
+        :type items: Iterable[Mapping]
+        """
+        page = _PageColumns(self.include_windows)
+        page.add_items(items)
+        self._append(page)
+
+    def add_results(self, results: Iterable[Union[Mapping, Exception]], start: int = 0) -> None:
+        """
+        Add batch results, such as the list returned by :meth:`pangram.PangramText.predict_many`.
+
+        Exceptions are recorded as failed rows with their message in ``error``.
+
+        :param results: Prediction results in input order.
+        :type results: Iterable[Union[Mapping, Exception]]
+        :param start: Document index of the first result. Defaults to 0.
+        :type start: int
+        """
+        page = _PageColumns(self.include_windows)
+        page.add_results(results, start)
+        self._append(page)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def _concatenate(chunks: List[Dict[str, Any]], empty: Dict[str, Any]) -> Dict[str, Any]:
+        if len(chunks) > 1:
+            np = _numpy()
+            chunks[:] = [{name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}]
+        return dict(chunks[0]) if chunks else empty
+
+    def documents(self) -> Dict[str, Any]:
+        """
+        Return the document table as a dict of NumPy arrays.
+
+        :rtype: Dict[str, numpy.ndarray]
+        """
+        return self._concatenate(self._document_chunks, _PageColumns(False).document_arrays())
+
+    def windows(self) -> Dict[str, Any]:
+        """
+        Return the window table as a dict of NumPy arrays.
+
+        :rtype: Dict[str, numpy.ndarray]
+        :raises ValueError: If the window table was not built.
+        """
+        if not self.include_windows:
+            raise ValueError("Window columns were not collected; create ResultColumns with include_windows=True")
+        return self._concatenate(self._window_chunks, _PageColumns(True).window_arrays())
+
+    def to_arrow(self) -> Tuple[Any, Optional[Any]]:
+        """
+        Return the document and window tables as Arrow tables.
+
+        The window table is None when it was not built.
+
+        :rtype: Tuple[pyarrow.Table, Optional[pyarrow.Table]]
+        :raises ImportError: If pyarrow is not installed.
+        """
+        _pyarrow()
+        documents = _arrow_table(self.documents())
+        return documents, _arrow_table(self.windows()) if self.include_windows else None
+
+
+class ParquetResultWriter:
+    def __init__(self, documents_path: str, windows_path: Optional[str] = None) -> None:
+        """
+        Stream prediction results to Parquet files, one row group per page.
+
+        Takes the same :meth:`add_items` and :meth:`add_results` calls as
+        :class:`ResultColumns` and writes the same tables, without keeping
+        earlier pages in memory. Use it as a context manager, or call
+        :meth:`close` to finish the files.
+
+        :param documents_path: Parquet file for the document table.
+        :type documents_path: str
+        :param windows_path: Parquet file for the window table. Defaults to no window table.
+        :type windows_path: str, optional
+        :raises ImportError: If numpy or pyarrow is not installed.
+        """
+        _numpy()
+        self._parquet = _pyarrow()[1]
+        self.documents_path = documents_path
+        self.windows_path = windows_path
+        self.include_windows = windows_path is not None
+        self._documents_writer = None
+        self._windows_writer = None
+        self._size = 0
+
+    def _append(self, page: _PageColumns) -> None:
+        documents = _arrow_table(page.document_arrays())
+        if self._documents_writer is None:
+            self._documents_writer = self._parquet.ParquetWriter(self.documents_path, documents.schema)
+        self._documents_writer.write_table(documents)
+        self._size += documents.num_rows
+        if self.include_windows:
+            windows = _arrow_table(page.window_arrays())
+            if self._windows_writer is None:
+                self._windows_writer = self._parquet.ParquetWriter(self.windows_path, windows.schema)
+            self._windows_writer.write_table(windows)
+
+    def add_items(self, items: Iterable[Mapping]) -> None:
+        """
+        Write bulk result items. See :meth:`ResultColumns.add_items`.
+
+        :type items: Iterable[Mapping]
+        """
+        page = _PageColumns(self.include_windows)
+        page.add_items(items)
+        self._append(page)
+
+    def add_results(self, results: Iterable[Union[Mapping, Exception]], start: int = 0) -> None:
+        """
+        Write batch results. See :meth:`ResultColumns.add_results`.
+
+        :type results: Iterable[Union[Mapping, Exception]]
+        :type start: int
+        """
+        page = _PageColumns(self.include_windows)
+        page.add_results(results, start)
+        self._append(page)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        """
+        Finish both files. Files are created even if no results were written.
+        """
+        if self._documents_writer is None:
+            self._append(_PageColumns(self.include_windows))
+        self._documents_writer.close()
+        if self._windows_writer is not None:
+            self._windows_writer.close()
+
+    def __enter__(self) -> "ParquetResultWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def score_histogram(scores: Any, bins: int = 10, value_range: Tuple[float, float] = (0.0, 1.0)) -> Tuple[Any, Any]:
+    """
+    Count scores into equal-width bins, ignoring ``nan``.
+
+    :param scores: Scores, such as ``columns.documents()["fraction_ai"]`` or
+                   ``columns.windows()["ai_assistance_score"]``.
+    :type scores: numpy.ndarray
+    :param bins: Number of bins. Defaults to 10.
+    :type bins: int
+    :param value_range: Lower and upper edge of the bins. Defaults to ``(0.0, 1.0)``.
+    :type value_range: Tuple[float, float]
+    :return: The count in each bin and the ``bins + 1`` bin edges.
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    :raises ImportError: If numpy is not installed.
+    """
+    np = _numpy()
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.histogram(scores[~np.isnan(scores)], bins=bins, range=value_range)
+
+
+def threshold_counts(scores: Any, thresholds: Sequence[float]) -> Any:
+    """
+    Count the scores at or above each threshold, ignoring ``nan``.
+
+    :param scores: Scores to count.
+    :type scores: numpy.ndarray
+    :param thresholds: Thresholds, in any order.
+    :type thresholds: Sequence[float]
+    :return: One count per threshold.
+    :rtype: numpy.ndarray
+    :raises ImportError: If numpy is not installed.
+    """
+    np = _numpy()
+    scores = np.asarray(scores, dtype=np.float64)
+    ordered = np.sort(scores[~np.isnan(scores)])
+    return len(ordered) - np.searchsorted(ordered, np.asarray(thresholds, dtype=np.float64), side="left")
@@ -0,0 +1,54 @@
+import gzip
+from typing import Optional
+
+DEFAULT_COMPRESSION_MIN_BYTES = 4 * 1024
+DEFAULT_COMPRESSION_LEVEL = 6
+DEFAULT_ACCEPT_ENCODING = "gzip"
+
+
+class RequestCompression:
+    def __init__(
+        self,
+        min_size: int = DEFAULT_COMPRESSION_MIN_BYTES,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+        accept_encoding: str = DEFAULT_ACCEPT_ENCODING,
+    ) -> None:
+        """
+        Gzip request bodies sent to the prediction, bulk, and plagiarism endpoints.
+
+        JSON bodies of at least ``min_size`` bytes are compressed and sent
+        with ``Content-Encoding: gzip``. Smaller bodies, and bodies that do
+        not shrink, are sent as-is. Bulk results pages are requested with
+        ``Accept-Encoding: accept_encoding``. Bytes saved in both directions
+        are recorded in the client's metrics.
+
+        :param min_size: Smallest body, in bytes, worth compressing. Defaults to 4 KiB.
+        :type min_size: int
+        :param level: Gzip compression level from 1 (fastest) to 9 (smallest). Defaults to 6.
+        :type level: int
+        :param accept_encoding: ``Accept-Encoding`` header sent when fetching bulk results pages. Defaults to ``gzip``.
+        :type accept_encoding: str
+        :raises ValueError: If min_size is negative or level is not between 1 and 9.
+        """
+        if min_size < 0:
+            raise ValueError("min_size cannot be negative")
+        if level < 1 or level > 9:
+            raise ValueError("level must be between 1 and 9")
+        self.min_size = min_size
+        self.level = level
+        self.accept_encoding = accept_encoding
+
+    def compress(self, body: bytes) -> Optional[bytes]:
+        """
+        Return the gzipped ``body``, or None if it should be sent uncompressed.
+
+        :param body: The encoded request body.
+        :type body: bytes
+        :rtype: bytes, optional
+        """
+        if len(body) < self.min_size:
+            return None
+        compressed = gzip.compress(body, compresslevel=self.level, mtime=0)
+        if len(compressed) >= len(body):
+            return None
+        return compressed
@@ -0,0 +1,201 @@
+import hashlib
+import re
+import unicodedata
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+_WHITESPACE = re.compile(r"\s+")
+DIGEST_SIZE = 16
+
+
+class TextNormalizer:
+    def __init__(self, whitespace: bool = True, unicode_form: Optional[str] = "NFC", case: bool = False) -> None:
+        """
+        Decides which texts count as duplicates of each other.
+
+        Normalization only affects comparison. The text submitted for a
+        group of duplicates is always the first original, unchanged.
+
+        :param whitespace: Collapse runs of whitespace to one space and strip both ends. Defaults to True.
+        :type whitespace: bool
+        :param unicode_form: Unicode normalization form such as ``"NFC"`` or ``"NFKC"``, or None to skip it.
+                             Defaults to ``"NFC"``.
+        :type unicode_form: str, optional
+        :param case: Compare texts case-insensitively. Defaults to False.
+        :type case: bool
+        :raises ValueError: If unicode_form is not a Unicode normalization form.
+        """
+        if unicode_form is not None and unicode_form not in ("NFC", "NFD", "NFKC", "NFKD"):
+            raise ValueError('unicode_form must be "NFC", "NFD", "NFKC", "NFKD", or None')
+        self.whitespace = whitespace
+        self.unicode_form = unicode_form
+        self.case = case
+
+    def __call__(self, text: str) -> str:
+        if self.unicode_form is not None:
+            text = unicodedata.normalize(self.unicode_form, text)
+        if self.whitespace:
+            text = _WHITESPACE.sub(" ", text).strip()
+        if self.case:
+            text = text.casefold()
+        return text
+
+
+def resolve_normalizer(dedupe: Union[bool, Callable[[str], str], None]) -> Optional[Callable[[str], str]]:
+    """
+    Return the normalizer for a ``dedupe`` argument: a default :class:`TextNormalizer` for True,
+    None for False or None, and the argument itself otherwise.
+
+    :rtype: Callable[[str], str], optional
+    """
+    if dedupe is True:
+        return TextNormalizer()
+    if dedupe is None or dedupe is False:
+        return None
+    return dedupe
+
+
+class DedupPlan:
+    def __init__(self, entries: Sequence[Union[str, Mapping]], normalizer: Optional[Callable[[str], str]] = None) -> None:
+        """
+        Groups duplicate inputs so each unique text is submitted once.
+
+        Texts are compared by a hash of their normalized form, so only a
+        fixed-size digest is kept per unique text. Entries without a string
+        ``text`` are never merged and are left for the API to reject.
+
+        :param entries: Input texts, or item dictionaries with ``text`` and optional ``id``.
+        :type entries: Sequence[Union[str, Mapping]]
+        :param normalizer: Function applied to each text before comparison. Defaults to :class:`TextNormalizer`.
+        :type normalizer: Callable[[str], str], optional
+        """
+        normalizer = normalizer or TextNormalizer()
+        self.total = len(entries)
+        self.unique_indices: List[int] = []
+        self.groups: List[List[int]] = []
+        self._ids: Dict[int, object] = {}
+        seen: Dict[bytes, int] = {}
+        for index, entry in enumerate(entries):
+            text = entry.get("text") if isinstance(entry, Mapping) else entry
+            if isinstance(entry, Mapping) and "id" in entry:
+                self._ids[index] = entry["id"]
+            if isinstance(text, str):
+                normalized = normalizer(text).encode("utf-8", "surrogatepass")
+                digest = hashlib.blake2b(normalized, digest_size=DIGEST_SIZE).digest()
+                position = seen.setdefault(digest, len(self.groups))
+            else:
+                position = len(self.groups)
+            if position == len(self.groups):
+                self.unique_indices.append(index)
+                self.groups.append([index])
+            else:
+                self.groups[position].append(index)
+        self._duplicates = {group[0]: group[1:] for group in self.groups if len(group) > 1}
+
+    @property
+    def saved(self) -> int:
+        """Number of submissions avoided."""
+        return self.total - len(self.unique_indices)
+
+    def unique(self, entries: Sequence) -> List:
+        """
+        Return the entries to submit: the first occurrence of each unique text, in input order.
+
+        :param entries: The entries the plan was built from.
+        :type entries: Sequence
+        :rtype: List
+        """
+        return [entries[index] for index in self.unique_indices]
+
+    def fan_out(self, results: Sequence) -> List:
+        """
+        Expand one result per unique text into one result per input position.
+
+        Duplicates share the same result object.
+
+        :param results: Results in the order of :meth:`unique`.
+        :type results: Sequence
+        :return: A list with one result per input entry.
+        :rtype: List
+        """
+        expanded = [None] * self.total
+        for group, result in zip(self.groups, results):
+            for index in group:
+                expanded[index] = result
+        return expanded
+
+    @property
+    def duplicate_items(self) -> List[Dict]:
+        """
+        One dictionary per input that was not submitted, with its ``index``, its customer ``id``
+        if it had one, and ``duplicate_of``, the position of the submitted copy.
+        """
+        items = []
+        for first, duplicates in self._duplicates.items():
+            for index in duplicates:
+                item = {"index": index, "duplicate_of": first}
+                if index in self._ids:
+                    item["id"] = self._ids[index]
+                items.append(item)
+        items.sort(key=lambda item: item["index"])
+        return items
+
+    def fan_out_items(self, items: Iterable[Dict]) -> List[Dict]:
+        """
+        Copy result items, already indexed by input position, to every duplicate of their text.
+
+        Each copy carries the duplicate's own ``index`` and ``id``.
+
+        :param items: Result items whose ``index`` is the position of a submitted input.
+        :type items: Iterable[Dict]
+        :return: The items, each followed by its copies.
+        :rtype: List[Dict]
+        """
+        return _expand_duplicates(items, self._duplicates, self._ids)
+
+
+def _expand_duplicates(items: Iterable[Dict], duplicates: Dict[int, List[int]], ids: Dict[int, object]) -> List[Dict]:
+    expanded = []
+    for item in items:
+        expanded.append(item)
+        index = item.get("index") if isinstance(item, Mapping) else None
+        for duplicate in duplicates.get(index, ()):
+            copy = {key: value for key, value in item.items() if key != "id"}
+            copy["index"] = duplicate
+            if duplicate in ids:
+                copy["id"] = ids[duplicate]
+            expanded.append(copy)
+    return expanded
+
+
+def fan_out_bulk_items(items: Iterable[Dict], submission: Dict) -> List[Dict]:
+    """
+    Map results page items of a deduplicated :meth:`pangram.PangramText.submit_bulk` job to input positions.
+
+    Each item's job ``index`` is mapped through ``submitted_indices``, and
+    every input listed in the submission's ``duplicate_items`` gets a copy of
+    its submitted text's item with its own ``index`` and ``id``.
+
+    :param items: Items from :meth:`pangram.PangramText.get_bulk_results` or a results page.
+    :type items: Iterable[Dict]
+    :param submission: The response of :meth:`pangram.PangramText.submit_bulk` with ``dedupe`` set.
+    :type submission: Dict
+    :return: The items at their input positions, sorted by ``index``.
+    :rtype: List[Dict]
+    """
+    submitted = submission.get("submitted_indices")
+    duplicates: Dict[int, List[int]] = {}
+    ids = {}
+    for item in submission.get("duplicate_items") or []:
+        duplicates.setdefault(item["duplicate_of"], []).append(item["index"])
+        if "id" in item:
+            ids[item["index"]] = item["id"]
+    remapped = []
+    for item in items:
+        index = item.get("index")
+        if submitted is not None and isinstance(index, int) and 0 <= index < len(submitted):
+            item = {**item, "index": submitted[index]}
+        remapped.append(item)
+    expanded = _expand_duplicates(remapped, duplicates, ids)
+    expanded.sort(key=lambda item: item["index"] if isinstance(item.get("index"), int) else -1)
+    return expanded
@@ -0,0 +1,18 @@
+from typing import Optional
+
+
+class PangramAPIError(ValueError):
+    """
+    An error response from the Pangram API.
+
+    Subclasses ``ValueError`` so existing ``except ValueError`` handlers keep
+    working, while exposing the HTTP status and any ``Retry-After`` delay.
+
+    :ivar status_code: The HTTP status code, if the error came from an HTTP response.
+    :ivar retry_after: Seconds requested by the server's ``Retry-After`` header, if any.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
@@ -0,0 +1,371 @@
+import functools
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pangram.codec import DEFAULT_CODEC, JSONCodec
+from pangram.results import Prediction, Window
+
+LAZY_FIELDS = ("text", "windows")
+
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+_SCALAR = re.compile(rb"[^,\]}\s]+")
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_OPENERS = b"[{"
+
+# Decoding a deferred field is rare and fast; one lock keeps it safe across threads
+# without a lock per result.
+_DECODE_LOCK = threading.RLock()
+
+# Reads the value at an offset and returns it with the offset just past it.
+_Handler = Callable[[bytes, int], Tuple[Any, int]]
+
+
+class _Pending:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<pending>"
+
+
+_PENDING = _Pending()
+
+
+def _skip_whitespace(data: bytes, pos: int) -> int:
+    return _WHITESPACE.match(data, pos).end()
+
+
+def _string_end(data: bytes, pos: int) -> int:
+    """Return the offset just past the JSON string whose opening quote is at ``pos``."""
+    end = data.find(b'"', pos + 1)
+    while end >= 0:
+        backslash = end - 1
+        while data[backslash] == 0x5C:
+            backslash -= 1
+        # The quote closes the string unless an odd number of backslashes escapes it.
+        if (end - backslash) % 2:
+            return end + 1
+        end = data.find(b'"', end + 1)
+    raise ValueError(f"Unterminated JSON string at offset {pos}")
+
+
+def _flat_container_end(data: bytes, pos: int) -> int:
+    """
+    Find the end of the container at ``pos`` with byte counts alone, or return -1.
+
+    This covers containers without a nested container of the same kind and
+    without escaped backslashes, such as a list of windows: the first
+    closing bracket outside a string is then the end, and whether a bracket
+    is inside a string follows from the parity of the quotes before it.
+    """
+    opener = data[pos : pos + 1]
+    closer = b"]" if opener == b"[" else b"}"
+    end = data.find(closer, pos)
+    while end >= 0:
+        if data.count(opener, pos, end) != 1:
+            return -1
+        escaped = 0
+        if data.find(b"\\", pos, end) >= 0:
+            if data.find(b"\\\\", pos, end) >= 0:
+                return -1
+            escaped = data.count(b'\\"', pos, end)
+        if (data.count(b'"', pos, end) - escaped) % 2 == 0:
+            return end + 1
+        end = data.find(closer, end + 1)
+    return -1
+
+
+def _value_end(data: bytes, pos: int) -> int:
+    """
+    Return the offset just past the JSON value starting at ``pos``, without decoding it.
+
+    Only string and bracket boundaries are tracked. The skipped bytes are
+    validated when they are decoded.
+    """
+    if pos >= len(data):
+        raise ValueError(f"Expected a JSON value at offset {pos}")
+    first = data[pos]
+    if first == 0x22:
+        return _string_end(data, pos)
+    if first in _OPENERS:
+        end = _flat_container_end(data, pos)
+        if end >= 0:
+            return end
+        depth = 0
+        search = _STRUCTURAL.search
+        while True:
+            match = search(data, pos)
+            if match is None:
+                raise ValueError(f"Unterminated JSON container at offset {pos}")
+            pos = match.start()
+            char = data[pos]
+            if char == 0x22:
+                pos = _string_end(data, pos)
+                continue
+            depth += 1 if char in _OPENERS else -1
+            pos += 1
+            if depth == 0:
+                return pos
+    match = _SCALAR.match(data, pos)
+    if match is None:
+        raise ValueError(f"Expected a JSON value at offset {pos}")
+    return match.end()
+
+
+def _expect(data: bytes, pos: int, char: bytes) -> None:
+    if data[pos : pos + 1] != char:
+        raise ValueError(f"Expected {char.decode()!r} at offset {pos}")
+
+
+@functools.lru_cache(maxsize=None)
+def _scalar_run(keys: Tuple[str, ...]) -> "re.Pattern[bytes]":
+    """
+    Match a run of ``"key": scalar,`` members whose keys are not in ``keys``.
+
+    Most members of a response are short scalars; matching them in one
+    regular expression call keeps the Python-level loop to the members that
+    need handling.
+    """
+    excluded = b"|".join(re.escape(key.encode("utf-8")) for key in keys)
+    return re.compile(
+        rb'(?:"(?!(?:' + excluded + rb')")[^"\\]*"[ \t\n\r]*:[ \t\n\r]*'
+        rb'(?:"[^"\\]*(?:\\.[^"\\]*)*"|[^,{}\[\]"\s]+)[ \t\n\r]*,[ \t\n\r]*)*'
+    )
+
+
+def _scan_object(data: bytes, pos: int, handlers: Dict[str, _Handler]) -> Tuple[List[bytes], Dict[str, Any], int]:
+    """
+    Walk the members of the JSON object at ``pos`` in one pass.
+
+    Members with a handler are read by it. The others are skipped and
+    returned as raw ``"key":value`` bytes, to be decoded together.
+
+    :return: The raw members, the handled values by key, and the offset just past the object.
+    """
+    _expect(data, pos, b"{")
+    kept: List[bytes] = []
+    handled: Dict[str, Any] = {}
+    scalar_run = _scalar_run(tuple(handlers)).match
+    pos = _skip_whitespace(data, pos + 1)
+    if data[pos : pos + 1] == b"}":
+        return kept, handled, pos + 1
+    while True:
+        run_end = scalar_run(data, pos).end()
+        if run_end > pos:
+            kept.append(data[pos:run_end].rstrip()[:-1])
+            pos = run_end
+        _expect(data, pos, b'"')
+        key_start = pos
+        pos = _string_end(data, pos)
+        raw_key = data[key_start + 1 : pos - 1]
+        key = raw_key.decode("utf-8") if b"\\" not in raw_key else json.loads(data[key_start:pos])
+        pos = _skip_whitespace(data, pos)
+        _expect(data, pos, b":")
+        value_start = _skip_whitespace(data, pos + 1)
+        handler = handlers.get(key)
+        if handler is None:
+            pos = _value_end(data, value_start)
+            kept.append(data[key_start:pos])
+        else:
+            handled[key], pos = handler(data, value_start)
+        pos = _skip_whitespace(data, pos)
+        if data[pos : pos + 1] == b"}":
+            return kept, handled, pos + 1
+        _expect(data, pos, b",")
+        pos = _skip_whitespace(data, pos + 1)
+
+
+def _decode_members(kept: List[bytes], codec: JSONCodec) -> Dict[str, Any]:
+    return codec.loads(b"{" + b",".join(kept) + b"}")
+
+
+def _span(data: bytes, pos: int) -> Tuple[Tuple[int, int], int]:
+    end = _value_end(data, pos)
+    return (pos, end), end
+
+
+_TEXT = Prediction.__dict__["text"]
+_WINDOWS = Prediction.__dict__["windows"]
+_DEFERRED = {name: _span for name in LAZY_FIELDS}
+
+
+class LazyPrediction(Prediction):
+    """
+    A :class:`pangram.results.Prediction` whose ``windows`` and ``text`` are decoded on first access.
+
+    Top-level fields such as ``fraction_ai`` and ``prediction_short`` are
+    decoded when the result is built. The raw JSON of ``windows`` and the
+    echoed ``text`` is kept as bytes and parsed the first time either is
+    read, through attributes, ``result["windows"]``, or :meth:`to_dict`. The
+    raw bytes are released once both have been decoded. Malformed JSON in a
+    deferred field raises ``ValueError`` when it is first read.
+    """
+
+    __slots__ = ("_raw", "_spans", "_codec")
+
+    def __init__(self, data: bytes, codec: JSONCodec = DEFAULT_CODEC) -> None:
+        """
+        :param data: The raw JSON of one prediction result.
+        :type data: bytes
+        :param codec: Codec used to decode the result. Defaults to the standard library codec.
+        :type codec: pangram.codec.JSONCodec
+        :raises ValueError: If ``data`` is not a JSON object.
+        """
+        kept, spans, _ = _scan_object(data, _skip_whitespace(data, 0), _DEFERRED)
+        self._setup(data, _decode_members(kept, codec), spans, codec)
+
+    @classmethod
+    def _read(cls, data: bytes, pos: int, codec: JSONCodec) -> Tuple["LazyPrediction", int]:
+        """Build a result from the object at ``pos`` of a larger body, keeping only its own bytes."""
+        kept, spans, end = _scan_object(data, pos, _DEFERRED)
+        result = cls.__new__(cls)
+        spans = {name: (start - pos, stop - pos) for name, (start, stop) in spans.items()}
+        result._setup(data[pos:end], _decode_members(kept, codec), spans, codec)
+        return result, end
+
+    def _setup(self, raw: bytes, fields: Dict[str, Any], spans: Dict[str, Tuple[int, int]], codec: JSONCodec) -> None:
+        Prediction.__init__(self, **fields)
+        object.__setattr__(self, "_absent", tuple(name for name in self._absent if name not in spans))
+        for name in spans:
+            Prediction.__dict__[name].__set__(self, _PENDING)
+        object.__setattr__(self, "_raw", raw if spans else None)
+        object.__setattr__(self, "_spans", spans)
+        object.__setattr__(self, "_codec", codec)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Prediction:
+        return Prediction.from_dict(data)
+
+    def _decode(self, name: str) -> Any:
+        with _DECODE_LOCK:
+            slot = Prediction.__dict__[name]
+            value = slot.__get__(self)
+            if value is not _PENDING:
+                return value
+            start, end = self._spans[name]
+            value = self._codec.loads(self._raw[start:end])
+            if name == "windows" and isinstance(value, list):
+                source = self.text
+                value = tuple(Window.from_dict(window, source) if isinstance(window, dict) else window for window in value)
+            slot.__set__(self, value)
+            if all(Prediction.__dict__[deferred].__get__(self) is not _PENDING for deferred in self._spans):
+                object.__setattr__(self, "_raw", None)
+            return value
+
+    @property
+    def text(self) -> Any:
+        value = _TEXT.__get__(self)
+        return self._decode("text") if value is _PENDING else value
+
+    @text.setter
+    def text(self, value: Any) -> None:
+        _TEXT.__set__(self, value)
+
+    @property
+    def windows(self) -> Any:
+        value = _WINDOWS.__get__(self)
+        return self._decode("windows") if value is _PENDING else value
+
+    @windows.setter
+    def windows(self, value: Any) -> None:
+        _WINDOWS.__set__(self, value)
+
+    @property
+    def decoded(self) -> bool:
+        """Whether ``windows`` and ``text`` have been decoded."""
+        return self._raw is None
+
+    @property
+    def raw_json(self) -> Optional[bytes]:
+        """The undecoded JSON of the whole result, or None once ``windows`` and ``text`` have been decoded."""
+        return self._raw
+
+    def __reduce__(self):
+        return (Prediction.from_dict, (self.to_dict(),))
+
+
+def _is_object(data: bytes, pos: int) -> bool:
+    return data[pos : pos + 1] == b"{"
+
+
+def lazy_prediction(data: bytes, codec: JSONCodec = DEFAULT_CODEC) -> Any:
+    """
+    Decode a prediction response, deferring ``windows`` and ``text``.
+
+    Responses that are not JSON objects are decoded in full.
+
+    :param data: The raw response body.
+    :type data: bytes
+    :param codec: Codec used to decode the response. Defaults to the standard library codec.
+    :type codec: pangram.codec.JSONCodec
+    :rtype: Union[pangram.lazy.LazyPrediction, Any]
+    :raises ValueError: If ``data`` is not valid JSON.
+    """
+    start = _skip_whitespace(data, 0)
+    if not _is_object(data, start):
+        return codec.loads(data)
+    result, _ = LazyPrediction._read(data, start, codec)
+    return result
+
+
+def lazy_results_page(data: bytes, codec: JSONCodec = DEFAULT_CODEC) -> Any:
+    """
+    Decode a bulk results page, making each item's ``result`` a :class:`LazyPrediction`.
+
+    The page is scanned once. Each result keeps only its own slice of
+    ``data``, so the page body can be freed as soon as it is decoded. The
+    scan runs in Python, so it uses less memory but more CPU than
+    ``codec.loads`` except on very large pages. Responses that are not JSON
+    objects are decoded in full.
+
+    :param data: The raw response body.
+    :type data: bytes
+    :param codec: Codec used to decode the response. Defaults to the standard library codec.
+    :type codec: pangram.codec.JSONCodec
+    :rtype: Union[Dict, Any]
+    :raises ValueError: If ``data`` is not valid JSON.
+    """
+
+    def read_value(data: bytes, pos: int) -> Tuple[Any, int]:
+        end = _value_end(data, pos)
+        return codec.loads(data[pos:end]), end
+
+    def read_result(data: bytes, pos: int) -> Tuple[Any, int]:
+        if not _is_object(data, pos):
+            return read_value(data, pos)
+        return LazyPrediction._read(data, pos, codec)
+
+    item_handlers = {"result": read_result}
+
+    def read_item(data: bytes, pos: int) -> Tuple[Any, int]:
+        if not _is_object(data, pos):
+            return read_value(data, pos)
+        kept, handled, end = _scan_object(data, pos, item_handlers)
+        item = _decode_members(kept, codec)
+        item.update(handled)
+        return item, end
+
+    def read_items(data: bytes, pos: int) -> Tuple[Any, int]:
+        if data[pos : pos + 1] != b"[":
+            return read_value(data, pos)
+        items = []
+        pos = _skip_whitespace(data, pos + 1)
+        if data[pos : pos + 1] == b"]":
+            return items, pos + 1
+        while True:
+            item, pos = read_item(data, pos)
+            items.append(item)
+            pos = _skip_whitespace(data, pos)
+            if data[pos : pos + 1] == b"]":
+                return items, pos + 1
+            _expect(data, pos, b",")
+            pos = _skip_whitespace(data, pos + 1)
+
+    start = _skip_whitespace(data, 0)
+    if not _is_object(data, start):
+        return codec.loads(data)
+    kept, handled, _ = _scan_object(data, start, {"items": read_items, "failed_items": read_items})
+    page = _decode_members(kept, codec)
+    page.update(handled)
+    return page
@@ -0,0 +1,142 @@
+from collections.abc import Mapping
+from typing import Dict, List, Sequence, Tuple
+
+from pangram.windows import paragraph_spans, sentence_spans
+
+DEFAULT_LONG_CHUNK_CHARS = 10000
+FRACTION_FIELDS = ("fraction_ai", "fraction_ai_assisted", "fraction_human")
+SEGMENT_COUNT_FIELDS = ("num_ai_segments", "num_ai_assisted_segments", "num_human_segments")
+MIXED_PREDICTION = "Mixed"
+HEADLINES = {
+    "AI": "AI Detected",
+    "AI-Assisted": "AI-Assisted Writing Detected",
+    "Human": "Fully Human Written",
+    MIXED_PREDICTION: "Mixed AI and Human Writing",
+}
+
+
+def _hard_split(text: str, start: int, end: int, max_chars: int) -> List[Tuple[int, int]]:
+    pieces = []
+    while end - start > max_chars:
+        cut = text.rfind(" ", start + 1, start + max_chars + 1)
+        if cut <= start:
+            cut = start + max_chars
+        pieces.append((start, cut))
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    if start < end:
+        pieces.append((start, end))
+    return pieces
+
+
+def _units(text: str, max_chars: int) -> List[Tuple[int, int]]:
+    units = []
+    for paragraph in paragraph_spans(text):
+        if paragraph.end - paragraph.start <= max_chars:
+            units.append((paragraph.start, paragraph.end))
+            continue
+        paragraph_text = text[paragraph.start : paragraph.end]
+        for sentence in sentence_spans(paragraph_text):
+            start, end = paragraph.start + sentence.start, paragraph.start + sentence.end
+            if end - start <= max_chars:
+                units.append((start, end))
+            else:
+                units.extend(_hard_split(text, start, end, max_chars))
+    return units
+
+
+def split_text(text: str, max_chars: int = DEFAULT_LONG_CHUNK_CHARS) -> List[Tuple[int, int]]:
+    """
+    Split ``text`` into chunks of at most ``max_chars`` characters, preferring paragraph boundaries.
+
+    Whole paragraphs are packed into each chunk. A paragraph longer than
+    ``max_chars`` is split between sentences, and a sentence longer than
+    that is split at the last space that fits. Whitespace between chunks is
+    not part of any chunk.
+
+    :param text: The document text.
+    :type text: str
+    :param max_chars: Maximum characters per chunk. Defaults to 10000.
+    :type max_chars: int
+    :return: ``(start, end)`` character offsets of each chunk, in document order.
+    :rtype: List[Tuple[int, int]]
+    :raises ValueError: If max_chars is less than 1.
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+    chunks: List[Tuple[int, int]] = []
+    for start, end in _units(text, max_chars):
+        if chunks and end - chunks[-1][0] <= max_chars:
+            chunks[-1] = (chunks[-1][0], end)
+        else:
+            chunks.append((start, end))
+    return chunks
+
+
+def _agreed(results: Sequence[Mapping], field: str, disagreement=None):
+    values = {result.get(field) for result in results}
+    return values.pop() if len(values) == 1 else disagreement
+
+
+def merge_predictions(text: str, chunks: Sequence[Tuple[int, int]], results: Sequence[Mapping]) -> Dict:
+    """
+    Merge the predictions of the chunks of ``text`` into one prediction for the whole text.
+
+    Every window's ``start_index`` and ``end_index`` is shifted from its chunk
+    to ``text``. ``fraction_ai``, ``fraction_ai_assisted``, and
+    ``fraction_human`` are averaged with each chunk weighted by its length in
+    characters, and segment counts are summed. ``prediction_short``,
+    ``headline``, and ``prediction`` are kept when every chunk agrees;
+    otherwise ``prediction_short`` is ``"Mixed"`` and ``headline`` and
+    ``prediction`` are the headline for it, ``"Mixed AI and Human Writing"``.
+    The merged result also lists the ``chunks`` as ``start_index`` and
+    ``end_index`` pairs, with each chunk's ``dashboard_link`` when it has one.
+
+    :param text: The whole document text.
+    :type text: str
+    :param chunks: ``(start, end)`` offsets of each chunk, as returned by :func:`split_text`.
+    :type chunks: Sequence[Tuple[int, int]]
+    :param results: The prediction for each chunk, in the same order.
+    :type results: Sequence[Mapping]
+    :return: A prediction with the same fields as :meth:`pangram.PangramText.predict`.
+    :rtype: Dict
+    :raises ValueError: If chunks and results have different lengths.
+    """
+    if len(chunks) != len(results):
+        raise ValueError("chunks and results must have the same length")
+    weights = [end - start for start, end in chunks]
+    prediction_short = _agreed(results, "prediction_short", MIXED_PREDICTION)
+    headline = HEADLINES.get(prediction_short)
+    agreed = len({result.get("prediction_short") for result in results}) == 1
+    merged = {
+        "stage": _agreed(results, "stage"),
+        "text": text,
+        "version": next((result.get("version") for result in results if result.get("version") is not None), None),
+        "headline": _agreed(results, "headline", headline) if agreed else headline,
+        "prediction": _agreed(results, "prediction", headline) if agreed else headline,
+        "prediction_short": prediction_short,
+    }
+    for field in FRACTION_FIELDS:
+        values = [(result.get(field), weight) for result, weight in zip(results, weights)]
+        values = [(value, weight) for value, weight in values if isinstance(value, (int, float))]
+        total = sum(weight for _, weight in values)
+        merged[field] = sum(value * weight for value, weight in values) / total if total else None
+    for field in SEGMENT_COUNT_FIELDS:
+        merged[field] = sum(result.get(field) or 0 for result in results)
+    windows = []
+    for (start, _), result in zip(chunks, results):
+        for window in result.get("windows") or []:
+            window = window.to_dict() if hasattr(window, "to_dict") else dict(window)
+            for key in ("start_index", "end_index"):
+                if isinstance(window.get(key), int):
+                    window[key] += start
+            windows.append(window)
+    merged["windows"] = windows
+    merged["chunks"] = []
+    for (start, end), result in zip(chunks, results):
+        chunk = {"start_index": start, "end_index": end}
+        if result.get("dashboard_link") is not None:
+            chunk["dashboard_link"] = result.get("dashboard_link")
+        merged["chunks"].append(chunk)
+    return merged
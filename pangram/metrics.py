@@ -0,0 +1,41 @@
+import threading
+from collections import Counter
+from typing import Dict
+
+
+class ClientMetrics:
+    """
+    Thread-safe counters describing the work a client has done.
+
+    Counter names are plain strings such as ``requests``, ``retries``, and
+    ``retries.submit_prediction``. Missing counters read as 0.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def __getitem__(self, name: str) -> int:
+        with self._lock:
+            return self._counters[name]
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Return a copy of every counter.
+
+        :return: Counter values keyed by name.
+        :rtype: Dict[str, int]
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """
+        Reset every counter to 0.
+        """
+        with self._lock:
+            self._counters.clear()
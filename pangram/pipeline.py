@@ -0,0 +1,509 @@
+import csv
+import itertools
+import json
+import os
+import time
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Union
+
+from pangram.bulk import BULK_TERMINAL_STATUSES, iter_bulk_chunks
+from pangram.polling import FixedPolling, PollingStrategy, PollSchedule
+from pangram.text_classifier import (
+    DEFAULT_BULK_TIMEOUT_SECONDS,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    MAX_BULK_PAGE_LIMIT,
+    MIN_POLL_INTERVAL_SECONDS,
+    PangramText,
+)
+
+DEFAULT_PIPELINE_JOBS_IN_FLIGHT = 4
+MANIFEST_VERSION = 1
+JSONL_EXTENSIONS = (".jsonl", ".ndjson", ".json")
+CSV_EXTENSIONS = (".csv",)
+
+
+def read_records(
+    path: Union[str, os.PathLike],
+    text_field: str = "text",
+    id_field: Optional[str] = "id",
+    input_format: Optional[str] = None,
+) -> Iterator[Dict]:
+    """
+    Lazily read bulk items from a JSONL or CSV file.
+
+    Each record becomes a ``{"text": ..., "id": ...}`` item. ``id`` is only
+    set when the record has a non-empty ``id_field``. JSONL lines may also be
+    bare JSON strings. Records are read one at a time, so files of any size
+    can be streamed.
+
+    :param path: Path to the input file.
+    :type path: Union[str, os.PathLike]
+    :param text_field: Field or column holding the text. Defaults to ``text``.
+    :type text_field: str
+    :param id_field: Field or column holding the customer ID, or None to omit IDs. Defaults to ``id``.
+    :type id_field: str, optional
+    :param input_format: ``jsonl`` or ``csv``. Defaults to detecting the format from the file extension.
+    :type input_format: str, optional
+    :return: An iterator of item dictionaries.
+    :rtype: Iterator[Dict]
+    :raises ValueError: If the format is unknown or a record has no text.
+    """
+    path = os.fspath(path)
+    input_format = input_format or _detect_format(path)
+    if input_format not in ("jsonl", "csv"):
+        raise ValueError(f"input_format must be 'jsonl' or 'csv', got {input_format!r}")
+    return _read_records(path, text_field, id_field, input_format)
+
+
+def _detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension in JSONL_EXTENSIONS:
+        return "jsonl"
+    if extension in CSV_EXTENSIONS:
+        return "csv"
+    raise ValueError(f"Cannot detect input format of {path}; pass input_format='jsonl' or 'csv'")
+
+
+def _read_records(path: str, text_field: str, id_field: Optional[str], input_format: str) -> Iterator[Dict]:
+    with open(path, "r", encoding="utf-8", newline="") as input_file:
+        if input_format == "csv":
+            rows = enumerate(csv.DictReader(input_file), start=2)
+        else:
+            rows = ((line_number, json.loads(line)) for line_number, line in enumerate(input_file, start=1) if line.strip())
+        for line_number, record in rows:
+            if isinstance(record, str):
+                yield {"text": record}
+                continue
+            text = record.get(text_field) if isinstance(record, dict) else None
+            if not isinstance(text, str):
+                raise ValueError(f"{path}:{line_number}: record has no {text_field!r} text field")
+            item = {"text": text}
+            if id_field is not None and record.get(id_field) not in (None, ""):
+                item["id"] = record[id_field]
+            yield item
+
+
+class _PipelineJob:
+    __slots__ = ("bulk_id", "start", "count", "submitted_indices", "next_offset", "deadline", "schedule", "next_poll")
+
+    def __init__(
+        self,
+        bulk_id: str,
+        start: int,
+        count: int,
+        submitted_indices: Optional[List[int]],
+        deadline: float,
+        schedule: PollSchedule,
+        next_offset: int = 0,
+    ) -> None:
+        self.bulk_id = bulk_id
+        self.start = start
+        self.count = count
+        self.submitted_indices = submitted_indices
+        self.deadline = deadline
+        # Each job keeps its own schedule for its whole life, so adaptive backoff
+        # and progress estimates carry over from one status check to the next.
+        self.schedule = schedule
+        self.next_poll = 0.0
+        self.next_offset = next_offset
+
+    def to_dict(self) -> Dict:
+        return {
+            "bulk_id": self.bulk_id,
+            "start": self.start,
+            "count": self.count,
+            "submitted_indices": self.submitted_indices,
+            "next_offset": self.next_offset,
+        }
+
+    @classmethod
+    def from_dict(cls, job: Dict, deadline: float, schedule: PollSchedule) -> "_PipelineJob":
+        return cls(
+            job["bulk_id"], job["start"], job["count"], job["submitted_indices"], deadline, schedule, job["next_offset"]
+        )
+
+    def input_index(self, job_index: int) -> int:
+        if self.submitted_indices is not None:
+            job_index = self.submitted_indices[job_index]
+        return self.start + job_index
+
+
+class BulkPipeline:
+    def __init__(
+        self,
+        client: PangramText,
+        max_jobs_in_flight: int = DEFAULT_PIPELINE_JOBS_IN_FLIGHT,
+        max_items_per_job: Optional[int] = None,
+        max_bytes_per_job: Optional[int] = None,
+        target_items_per_second: Optional[float] = None,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        job_timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> None:
+        """
+        Stream a JSONL or CSV file through the Bulk API into a JSONL results file.
+
+        Input records are read lazily and grouped into bulk jobs by
+        :func:`pangram.bulk.iter_bulk_chunks`. At most ``max_jobs_in_flight``
+        jobs run at once; as each finishes, its results are streamed page by
+        page to the output file and the next chunk is submitted. Memory use is
+        bounded by the chunks in flight and one results page, not by the size
+        of the input.
+
+        Raise ``max_jobs_in_flight`` to push throughput up, and set
+        ``target_items_per_second`` to cap the submission rate so a run stays
+        within a quota or leaves capacity for other traffic.
+
+        :param client: The client used to submit and read jobs.
+        :type client: pangram.PangramText
+        :param max_jobs_in_flight: Maximum number of unfinished bulk jobs at once. Defaults to 4.
+        :type max_jobs_in_flight: int
+        :param max_items_per_job: Maximum items per job. Defaults to 1000.
+        :type max_items_per_job: int, optional
+        :param max_bytes_per_job: Maximum serialized request size per job. Defaults to 4 MiB.
+        :type max_bytes_per_job: int, optional
+        :param target_items_per_second: Upper bound on the average submission rate. Defaults to no cap.
+        :type target_items_per_second: float, optional
+        :param page_size: Number of item slots to request per results page. Defaults to 1000.
+        :type page_size: int
+        :param job_timeout: Maximum seconds each job may take after submission. Defaults to 3600.
+        :type job_timeout: float
+        :param poll_interval: Seconds to wait between status checks. Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for status checks. Defaults to the client's strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :raises ValueError: If any parameter is out of range.
+        """
+        if max_jobs_in_flight < 1:
+            raise ValueError("max_jobs_in_flight must be at least 1")
+        if target_items_per_second is not None and target_items_per_second <= 0:
+            raise ValueError("target_items_per_second must be greater than 0")
+        if page_size < 1 or page_size > MAX_BULK_PAGE_LIMIT:
+            raise ValueError(f"page_size must be between 1 and {MAX_BULK_PAGE_LIMIT}")
+        if job_timeout <= 0:
+            raise ValueError("job_timeout must be greater than 0")
+        if poll_interval < 0:
+            raise ValueError("poll_interval cannot be negative")
+        self.client = client
+        self.max_jobs_in_flight = max_jobs_in_flight
+        self.chunk_limits = {}
+        if max_items_per_job is not None:
+            self.chunk_limits["max_items"] = max_items_per_job
+        if max_bytes_per_job is not None:
+            self.chunk_limits["max_bytes"] = max_bytes_per_job
+        self.target_items_per_second = target_items_per_second
+        self.page_size = page_size
+        self.job_timeout = job_timeout
+        self.poll_interval = poll_interval
+        self.polling = polling
+
+    def run(
+        self,
+        input_path: Union[str, os.PathLike],
+        output_path: Union[str, os.PathLike],
+        text_field: str = "text",
+        id_field: Optional[str] = "id",
+        input_format: Optional[str] = None,
+        manifest_path: Optional[Union[str, os.PathLike]] = None,
+    ) -> Dict:
+        """
+        Classify every record of ``input_path`` and write one JSON line per item to ``output_path``.
+
+        Output lines are bulk result items, written in job completion order.
+        Each line's ``index`` is the record's zero-based position in the input,
+        its ``id`` is passed through, failed items carry ``"failed": True``,
+        and items answered from the client's result cache carry
+        ``"cached": True``.
+
+        Status checks keep polling through transient errors (connection
+        failures and API statuses the client's retry policy treats as
+        retryable) until the job's ``job_timeout``.
+
+        With ``manifest_path``, the run's progress (records submitted, the
+        ``bulk_id`` and item range of every unfinished job, the results offset
+        reached in each, completed jobs, and the committed size of the output
+        file) is rewritten atomically after every submission and results page.
+        If the process dies, :meth:`resume` picks up from the last checkpoint
+        without resubmitting jobs or duplicating output lines.
+
+        :param input_path: JSONL or CSV input file.
+        :type input_path: Union[str, os.PathLike]
+        :param output_path: JSONL output file. Overwritten if it exists.
+        :type output_path: Union[str, os.PathLike]
+        :param text_field: Field or column holding the text. Defaults to ``text``.
+        :type text_field: str
+        :param id_field: Field or column holding the customer ID, or None to omit IDs. Defaults to ``id``.
+        :type id_field: str, optional
+        :param input_format: ``jsonl`` or ``csv``. Defaults to detecting the format from the file extension.
+        :type input_format: str, optional
+        :param manifest_path: File to checkpoint progress to. Defaults to no checkpointing.
+        :type manifest_path: Union[str, os.PathLike], optional
+        :return: Run summary with ``items``, ``jobs``, ``succeeded``, ``failed``, ``cached``,
+                 ``elapsed_seconds``, and ``items_per_second``.
+        :rtype: Dict
+        :raises ValueError: If the input is invalid or the API returns an error.
+        :raises TimeoutError: If a job does not finish within ``job_timeout``.
+        """
+        input_path = os.path.abspath(os.fspath(input_path))
+        input_format = input_format or _detect_format(input_path)
+        state = {
+            "version": MANIFEST_VERSION,
+            "input_path": input_path,
+            "output_path": os.path.abspath(os.fspath(output_path)),
+            "text_field": text_field,
+            "id_field": id_field,
+            "input_format": input_format,
+            "settings": self._settings(),
+            "records_submitted": 0,
+            "output_bytes": 0,
+            "finished": False,
+            "summary": {"items": 0, "jobs": 0, "succeeded": 0, "failed": 0, "cached": 0},
+            "jobs": [],
+            "completed_jobs": [],
+        }
+        with open(state["output_path"], "wb") as output:
+            return self._run(state, output, [], manifest_path)
+
+    @classmethod
+    def resume(cls, manifest_path: Union[str, os.PathLike], client: Optional[PangramText] = None) -> Dict:
+        """
+        Continue a run from its manifest after an interruption.
+
+        Unfinished jobs are reattached by ``bulk_id`` and their results are
+        read from the recorded offsets. Output written after the last
+        checkpoint is truncated first, so every item appears exactly once.
+        Input records already submitted are skipped, and the rest are
+        submitted as new jobs. Calling this on a finished run returns its
+        summary.
+
+        :param manifest_path: The ``manifest_path`` passed to :meth:`run`.
+        :type manifest_path: Union[str, os.PathLike]
+        :param client: The client to use. Defaults to a new :class:`pangram.PangramText`
+                       using the ``PANGRAM_API_KEY`` environment variable.
+        :type client: pangram.PangramText, optional
+        :return: Summary of the whole run, as returned by :meth:`run`.
+        :rtype: Dict
+        :raises ValueError: If the manifest is missing, unreadable, or from an unsupported version.
+        """
+        state = read_manifest(manifest_path)
+        if state["finished"]:
+            return dict(state["summary"])
+        pipeline = cls(client if client is not None else PangramText(), **state["settings"])
+        deadline = time.monotonic() + pipeline.job_timeout
+        in_flight = [_PipelineJob.from_dict(job, deadline, pipeline._schedule()) for job in state["jobs"]]
+        with open(state["output_path"], "r+b") as output:
+            output.truncate(state["output_bytes"])
+            output.seek(state["output_bytes"])
+            return pipeline._run(state, output, in_flight, manifest_path)
+
+    def _settings(self) -> Dict:
+        return {
+            "max_jobs_in_flight": self.max_jobs_in_flight,
+            "max_items_per_job": self.chunk_limits.get("max_items"),
+            "max_bytes_per_job": self.chunk_limits.get("max_bytes"),
+            "target_items_per_second": self.target_items_per_second,
+            "page_size": self.page_size,
+            "job_timeout": self.job_timeout,
+            "poll_interval": self.poll_interval,
+        }
+
+    def _run(
+        self,
+        state: Dict,
+        output: BinaryIO,
+        in_flight: List[_PipelineJob],
+        manifest_path: Optional[Union[str, os.PathLike]],
+    ) -> Dict:
+        records = read_records(
+            state["input_path"],
+            text_field=state["text_field"],
+            id_field=state["id_field"],
+            input_format=state["input_format"],
+        )
+        records = itertools.islice(records, state["records_submitted"], None)
+        summary = state["summary"]
+        started = time.monotonic()
+        items_this_run = 0
+
+        def checkpoint() -> None:
+            if manifest_path is None:
+                return
+            output.flush()
+            os.fsync(output.fileno())
+            state["output_bytes"] = output.tell()
+            state["jobs"] = [job.to_dict() for job in in_flight]
+            write_manifest(manifest_path, state)
+
+        checkpoint()
+        for chunk in iter_bulk_chunks(records, **self.chunk_limits):
+            while len(in_flight) >= self.max_jobs_in_flight:
+                self._drain(in_flight, output, state, checkpoint)
+            self._pace(started, items_this_run)
+            job = self._submit(chunk, state["records_submitted"], output, summary)
+            state["records_submitted"] += len(chunk)
+            summary["items"] += len(chunk)
+            items_this_run += len(chunk)
+            if job is not None:
+                in_flight.append(job)
+            checkpoint()
+        while in_flight:
+            self._drain(in_flight, output, state, checkpoint)
+        state["finished"] = True
+        checkpoint()
+
+        elapsed = time.monotonic() - started
+        result = dict(summary)
+        result["elapsed_seconds"] = elapsed
+        result["items_per_second"] = items_this_run / elapsed if elapsed > 0 else 0.0
+        return result
+
+    def _schedule(self) -> PollSchedule:
+        strategy = self.polling or self.client.polling or FixedPolling(max(MIN_POLL_INTERVAL_SECONDS, self.poll_interval))
+        return strategy.schedule()
+
+    def _pace(self, started: float, items_submitted: int) -> None:
+        if self.target_items_per_second is None:
+            return
+        wait = items_submitted / self.target_items_per_second - (time.monotonic() - started)
+        if wait > 0:
+            time.sleep(wait)
+
+    def _submit(self, chunk: List[Dict], start: int, output: BinaryIO, summary: Dict) -> Optional[_PipelineJob]:
+        response = self.client.submit_bulk(items=chunk)
+        for cached_item in response.get("cached_items") or []:
+            cached_item["index"] += start
+            self._write(output, {**cached_item, "stage": "STAGE_SUCCESS", "error": None, "cached": True}, summary)
+        output.flush()
+        bulk_id = response.get("bulk_id")
+        if bulk_id is None:
+            return None
+        summary["jobs"] += 1
+        return _PipelineJob(
+            bulk_id,
+            start,
+            len(chunk),
+            response.get("submitted_indices"),
+            time.monotonic() + self.job_timeout,
+            self._schedule(),
+        )
+
+    def _drain(
+        self, in_flight: List[_PipelineJob], output: BinaryIO, state: Dict, checkpoint: Callable[[], None]
+    ) -> None:
+        """Wait until at least one in-flight job finishes, then write out every finished job."""
+        while True:
+            finished = []
+            for job in in_flight:
+                if time.monotonic() < job.next_poll:
+                    continue
+                try:
+                    last_status = self.client.get_bulk_status(job.bulk_id)
+                except ValueError as exc:
+                    if not self.client.is_transient_error(exc):
+                        raise
+                    now = time.monotonic()
+                    if now >= job.deadline:
+                        raise TimeoutError(
+                            f"Pangram bulk job {job.bulk_id} did not complete within {self.job_timeout:.0f}s; "
+                            f"last status check failed: {exc}"
+                        ) from exc
+                    retry_after = getattr(exc, "retry_after", None)
+                    job.next_poll = min(now + job.schedule.next_interval(retry_after=retry_after), job.deadline)
+                    continue
+                now = time.monotonic()
+                if last_status.get("status") in BULK_TERMINAL_STATUSES:
+                    finished.append(job)
+                elif now >= job.deadline:
+                    raise TimeoutError(
+                        f"Pangram bulk job {job.bulk_id} did not complete within {self.job_timeout:.0f}s; "
+                        f"last status={last_status.get('status')}"
+                    )
+                else:
+                    job.next_poll = min(now + job.schedule.next_interval(status=last_status), job.deadline)
+            if finished:
+                for job in finished:
+                    self._harvest(job, output, state["summary"], checkpoint)
+                    in_flight.remove(job)
+                    state["completed_jobs"].append(job.bulk_id)
+                    checkpoint()
+                return
+            wait = min(job.next_poll for job in in_flight) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+
+    def _harvest(self, job: _PipelineJob, output: BinaryIO, summary: Dict, checkpoint: Callable[[], None]) -> None:
+        if job.next_offset >= job.count:
+            return
+        for items in self.client.iter_bulk_results_pages(job.bulk_id, self.page_size, job.next_offset):
+            for item in items:
+                if isinstance(item.get("index"), int):
+                    item["index"] = job.input_index(item["index"])
+                self._write(output, item, summary)
+            job.next_offset += self.page_size
+            checkpoint()
+
+    @staticmethod
+    def _write(output: BinaryIO, item: Dict, summary: Dict) -> None:
+        output.write(json.dumps(item, separators=(",", ":")).encode("utf-8") + b"\n")
+        if item.get("cached"):
+            summary["cached"] += 1
+        elif item.get("failed"):
+            summary["failed"] += 1
+        else:
+            summary["succeeded"] += 1
+
+
+def write_manifest(path: Union[str, os.PathLike], state: Dict) -> None:
+    """
+    Atomically replace the manifest at ``path`` with ``state``.
+
+    The new contents are written and synced to a temporary file in the same
+    directory, then renamed over the old manifest, so a reader always sees
+    either the previous or the new checkpoint.
+
+    :param path: The manifest path.
+    :type path: Union[str, os.PathLike]
+    :param state: The manifest contents.
+    :type state: Dict
+    """
+    path = os.fspath(path)
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+        json.dump(state, manifest_file, separators=(",", ":"))
+        manifest_file.flush()
+        os.fsync(manifest_file.fileno())
+    os.replace(temporary_path, path)
+
+
+def read_manifest(path: Union[str, os.PathLike]) -> Dict:
+    """
+    Load a pipeline manifest written by :meth:`BulkPipeline.run`.
+
+    :param path: The manifest path.
+    :type path: Union[str, os.PathLike]
+    :return: The manifest contents.
+    :rtype: Dict
+    :raises ValueError: If the manifest is missing, unreadable, or from an unsupported version.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as manifest_file:
+            state = json.load(manifest_file)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"Cannot read pipeline manifest {os.fspath(path)}: {exc}") from exc
+    if not isinstance(state, dict) or state.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported pipeline manifest {os.fspath(path)}")
+    return state
+
+
+def resume(manifest_path: Union[str, os.PathLike], client: Optional[PangramText] = None) -> Dict:
+    """
+    Continue an interrupted :class:`BulkPipeline` run. See :meth:`BulkPipeline.resume`.
+
+    :param manifest_path: The ``manifest_path`` passed to :meth:`BulkPipeline.run`.
+    :type manifest_path: Union[str, os.PathLike]
+    :param client: The client to use. Defaults to a new :class:`pangram.PangramText`.
+    :type client: pangram.PangramText, optional
+    :return: Summary of the whole run.
+    :rtype: Dict
+    """
+    return BulkPipeline.resume(manifest_path, client)
@@ -0,0 +1,191 @@
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from pangram.polling import PollSchedule
+
+DEFAULT_POLLER_WORKERS = 4
+
+
+class _PolledTask:
+    __slots__ = ("task_id", "deadline", "timeout", "schedule", "future")
+
+    def __init__(self, task_id: str, deadline: float, timeout: float, schedule: PollSchedule, future: Future) -> None:
+        self.task_id = task_id
+        self.deadline = deadline
+        self.timeout = timeout
+        self.schedule = schedule
+        self.future = future
+
+
+class TaskPoller:
+    def __init__(
+        self,
+        check_task: Callable[[str, float], Tuple[Optional[Dict], Optional[float]]],
+        max_workers: int = DEFAULT_POLLER_WORKERS,
+        is_retryable: Optional[Callable[[BaseException], bool]] = None,
+    ) -> None:
+        """
+        Poll many outstanding async prediction tasks from a small set of threads.
+
+        Registered tasks are kept in a heap ordered by when they are next due.
+        A scheduler thread hands each due task to one of ``max_workers`` worker
+        threads, which issues a single status check and either resolves the
+        task's future or puts it back in the heap for its next poll. Each task
+        keeps its own deadline, so thousands of predictions can be tracked
+        without a sleeping thread per task.
+
+        :param check_task: Called as ``check_task(task_id, deadline)``. Returns a
+                           ``(result, retry_after)`` pair, where ``result`` is the
+                           completed result or ``None`` if the task is still running
+                           and ``retry_after`` is the server's requested delay, if any.
+                           Raises if the task failed.
+        :type check_task: Callable[[str, float], Tuple[Optional[Dict], Optional[float]]]
+        :param max_workers: Number of worker threads issuing status checks. Defaults to 4.
+        :type max_workers: int
+        :param is_retryable: Returns whether an exception from ``check_task`` is transient.
+                             Transient errors are retried at the next poll until the deadline,
+                             honoring any ``retry_after`` attribute on the exception.
+                             By default every exception fails the task.
+        :type is_retryable: Callable[[BaseException], bool], optional
+        :raises ValueError: If max_workers is less than 1.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._check_task = check_task
+        self._is_retryable = is_retryable
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pangram-poller")
+        self._heap: List[Tuple[float, int, _PolledTask]] = []
+        # Tasks handed to the executor but not yet finished with. They are
+        # tracked so close() can cancel the ones whose work items it drops.
+        self._dispatched: Set[_PolledTask] = set()
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._scheduler = threading.Thread(target=self._run, name="pangram-poller-scheduler", daemon=True)
+        self._scheduler.start()
+
+    def submit(self, task_id: str, deadline: float, timeout: float, schedule: PollSchedule) -> Future:
+        """
+        Start polling a task and return a future for its result.
+
+        The first status check is issued immediately. The future resolves with
+        the completed result, raises the error from a failed task, or raises
+        ``TimeoutError`` once ``deadline`` (a ``time.monotonic()`` value) passes.
+
+        :param task_id: The task ID returned when the prediction was submitted.
+        :type task_id: str
+        :param deadline: ``time.monotonic()`` value after which the task times out.
+        :type deadline: float
+        :param timeout: The task's total timeout in seconds, used in error messages.
+        :type timeout: float
+        :param schedule: Decides the wait between status checks for this task.
+        :type schedule: pangram.polling.PollSchedule
+        :return: A future resolved when the task reaches a terminal stage.
+        :rtype: concurrent.futures.Future
+        :raises RuntimeError: If the poller has been closed.
+        """
+        future = Future()
+        self._schedule(_PolledTask(task_id, deadline, timeout, schedule, future), time.monotonic())
+        return future
+
+    def close(self) -> None:
+        """
+        Stop polling and cancel every outstanding task future.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            pending = [task for _, _, task in self._heap]
+            pending.extend(self._dispatched)
+            self._heap.clear()
+            self._dispatched.clear()
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for task in pending:
+            task.future.cancel()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def _schedule(self, task: _PolledTask, due: float) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("TaskPoller is closed")
+            heapq.heappush(self._heap, (due, next(self._counter), task))
+            self._condition.notify()
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                while not self._closed:
+                    if self._heap:
+                        wait_for = self._heap[0][0] - time.monotonic()
+                        if wait_for <= 0:
+                            break
+                    else:
+                        wait_for = None
+                    self._condition.wait(wait_for)
+                if self._closed:
+                    return
+                _, _, task = heapq.heappop(self._heap)
+                self._dispatched.add(task)
+                self._executor.submit(self._poll_once, task)
+
+    def _poll_once(self, task: _PolledTask) -> None:
+        try:
+            self._poll(task)
+        finally:
+            with self._condition:
+                self._dispatched.discard(task)
+
+    def _poll(self, task: _PolledTask) -> None:
+        if task.future.cancelled():
+            return
+        if time.monotonic() >= task.deadline:
+            self._fail(task, self._timeout_error(task))
+            return
+
+        try:
+            result, retry_after = self._check_task(task.task_id, task.deadline)
+        except Exception as exc:
+            if self._is_retryable is None or not self._is_retryable(exc):
+                self._fail(task, exc)
+            elif time.monotonic() >= task.deadline:
+                timeout_error = self._timeout_error(task)
+                timeout_error.__cause__ = exc
+                self._fail(task, timeout_error)
+            else:
+                self._reschedule(task, getattr(exc, "retry_after", None))
+            return
+
+        if result is None:
+            self._reschedule(task, retry_after)
+            return
+        try:
+            task.future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _reschedule(self, task: _PolledTask, retry_after: Optional[float] = None) -> None:
+        due = min(time.monotonic() + task.schedule.next_interval(retry_after=retry_after), task.deadline)
+        try:
+            self._schedule(task, due)
+        except RuntimeError:
+            task.future.cancel()
+
+    @staticmethod
+    def _timeout_error(task: _PolledTask) -> TimeoutError:
+        return TimeoutError(f"Pangram prediction task {task.task_id} did not complete within {task.timeout:.0f}s")
+
+    @staticmethod
+    def _fail(task: _PolledTask, exc: BaseException) -> None:
+        try:
+            task.future.set_exception(exc)
+        except InvalidStateError:
+            pass
@@ -0,0 +1,198 @@
+import random
+import time
+from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+DEFAULT_ADAPTIVE_INITIAL_INTERVAL_SECONDS = 0.5
+DEFAULT_ADAPTIVE_MAX_INTERVAL_SECONDS = 10.0
+DEFAULT_ADAPTIVE_MULTIPLIER = 1.5
+DEFAULT_ADAPTIVE_JITTER = 0.1
+ETA_STATUS_KEYS = ("retry_after", "eta_seconds", "estimated_seconds_remaining")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header value into seconds.
+
+    :param value: The header value, either delta-seconds or an HTTP date.
+    :type value: str, optional
+    :return: Seconds to wait, or None if the value is missing or invalid.
+    :rtype: float, optional
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class PollSchedule(ABC):
+    """
+    Per-wait polling state created by :meth:`PollingStrategy.schedule`.
+    """
+
+    @abstractmethod
+    def next_interval(self, status: Optional[Dict] = None, retry_after: Optional[float] = None) -> float:
+        """
+        Return the number of seconds to wait before the next status check.
+
+        :param status: The latest status payload, or None if the last check failed.
+        :type status: Dict, optional
+        :param retry_after: Seconds requested by the server's ``Retry-After`` header, if any.
+        :type retry_after: float, optional
+        :return: Seconds to wait.
+        :rtype: float
+        """
+
+
+class PollingStrategy(ABC):
+    """
+    Decides how often :meth:`pangram.PangramText.predict`,
+    :meth:`pangram.PangramText.wait_for_bulk`, and the shared task poller
+    check for completion.
+
+    A strategy is shareable configuration. Each wait calls :meth:`schedule`
+    to get its own :class:`PollSchedule`.
+    """
+
+    @abstractmethod
+    def schedule(self) -> PollSchedule:
+        """
+        Return a fresh :class:`PollSchedule` for one wait.
+
+        :rtype: pangram.polling.PollSchedule
+        """
+
+
+class _FixedSchedule(PollSchedule):
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+
+    def next_interval(self, status: Optional[Dict] = None, retry_after: Optional[float] = None) -> float:
+        if retry_after is not None:
+            return max(self._interval, retry_after)
+        return self._interval
+
+
+class FixedPolling(PollingStrategy):
+    def __init__(self, interval: float) -> None:
+        """
+        Poll at a constant interval, waiting longer only when the server sends ``Retry-After``.
+
+        :param interval: Seconds to wait between status checks.
+        :type interval: float
+        :raises ValueError: If interval is negative.
+        """
+        if interval < 0:
+            raise ValueError("interval cannot be negative")
+        self.interval = interval
+
+    def schedule(self) -> PollSchedule:
+        return _FixedSchedule(self.interval)
+
+
+class _AdaptiveSchedule(PollSchedule):
+    def __init__(self, strategy: "AdaptivePolling") -> None:
+        self._strategy = strategy
+        self._attempt = 0
+        self._first_progress: Optional[tuple] = None
+
+    def next_interval(self, status: Optional[Dict] = None, retry_after: Optional[float] = None) -> float:
+        strategy = self._strategy
+        interval = min(
+            strategy.max_interval,
+            strategy.initial_interval * strategy.multiplier ** self._attempt,
+        )
+        self._attempt += 1
+
+        remaining = self._estimate_remaining(status)
+        if remaining is not None:
+            interval = min(strategy.max_interval, max(strategy.initial_interval, remaining * strategy.estimate_fraction))
+
+        if strategy.jitter:
+            interval *= random.uniform(1 - strategy.jitter, 1 + strategy.jitter)
+        if retry_after is not None:
+            interval = max(interval, retry_after)
+        return interval
+
+    def _estimate_remaining(self, status: Optional[Dict]) -> Optional[float]:
+        if not isinstance(status, dict):
+            return None
+        for key in ETA_STATUS_KEYS:
+            value = status.get(key)
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+                return float(value)
+
+        total = status.get("total_items")
+        succeeded = status.get("succeeded")
+        failed = status.get("failed")
+        if not all(isinstance(value, int) for value in (total, succeeded, failed)):
+            return None
+
+        done = succeeded + failed
+        now = time.monotonic()
+        if self._first_progress is None:
+            self._first_progress = (now, done)
+            return None
+        first_time, first_done = self._first_progress
+        if done <= first_done or now <= first_time:
+            return None
+        rate = (done - first_done) / (now - first_time)
+        return max(0, total - done) / rate
+
+
+class AdaptivePolling(PollingStrategy):
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_ADAPTIVE_INITIAL_INTERVAL_SECONDS,
+        max_interval: float = DEFAULT_ADAPTIVE_MAX_INTERVAL_SECONDS,
+        multiplier: float = DEFAULT_ADAPTIVE_MULTIPLIER,
+        jitter: float = DEFAULT_ADAPTIVE_JITTER,
+        estimate_fraction: float = 0.5,
+    ) -> None:
+        """
+        Poll quickly at first, then back off exponentially up to a cap.
+
+        Short tasks are still checked promptly, while long waits cost far
+        fewer status requests. When a status payload carries a completion hint,
+        the next check is scheduled at ``estimate_fraction`` of the estimated
+        time remaining instead. Hints are read from ``retry_after``,
+        ``eta_seconds``, or ``estimated_seconds_remaining`` fields, or
+        estimated from the progress rate of bulk ``succeeded`` and ``failed``
+        counters. A server ``Retry-After`` is always honored.
+
+        :param initial_interval: Seconds to wait before the second status check. Defaults to 0.5.
+        :type initial_interval: float
+        :param max_interval: Upper bound on the wait between checks. Defaults to 10.
+        :type max_interval: float
+        :param multiplier: Growth factor applied to the interval after each check. Defaults to 1.5.
+        :type multiplier: float
+        :param jitter: Fractional random jitter applied to each interval, e.g. 0.1 for +/-10%. Defaults to 0.1.
+        :type jitter: float
+        :param estimate_fraction: Fraction of an estimated remaining time to wait before the next check. Defaults to 0.5.
+        :type estimate_fraction: float
+        :raises ValueError: If any parameter is out of range.
+        """
+        if initial_interval <= 0 or max_interval < initial_interval:
+            raise ValueError("initial_interval must be greater than 0 and no larger than max_interval")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if not 0 < estimate_fraction <= 1:
+            raise ValueError("estimate_fraction must be between 0 and 1")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.estimate_fraction = estimate_fraction
+
+    def schedule(self) -> PollSchedule:
+        return _AdaptiveSchedule(self)
@@ -0,0 +1,248 @@
+import os
+import struct
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - fcntl is unavailable on Windows
+    fcntl = None
+
+SUBMIT = "submit"
+POLL = "poll"
+BULK_PAGE = "bulk_page"
+RATE_LIMIT_CATEGORIES = (SUBMIT, POLL, BULK_PAGE)
+
+_STATE_FORMAT = "dd"
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        """
+        A thread-safe token bucket that paces callers to ``rate`` requests per second.
+
+        Up to ``burst`` requests can go out back to back after an idle
+        period. Callers that find the bucket empty reserve their token and
+        sleep until it refills, so waiting threads are served in the order
+        they arrived without holding a lock while they sleep.
+
+        :param rate: Tokens added per second.
+        :type rate: float
+        :param burst: Bucket capacity. Defaults to ``max(1, rate)``.
+        :type burst: float, optional
+        :raises ValueError: If rate or burst is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst is None:
+            burst = max(1.0, rate)
+        if burst <= 0:
+            raise ValueError("burst must be greater than 0")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take ``tokens`` from the bucket, sleeping until they are available.
+
+        :param tokens: Number of tokens to take. Defaults to 1.
+        :type tokens: float
+        :param timeout: Longest acceptable wait in seconds. Defaults to waiting as long as needed.
+        :type timeout: float, optional
+        :return: True once the tokens are taken, or False without taking any if the wait would exceed ``timeout``.
+        :rtype: bool
+        :raises ValueError: If tokens is not positive or larger than the burst size.
+        """
+        self._validate_tokens(tokens)
+        with self._lock:
+            now = time.monotonic()
+            available, wait = self._reserve(self._tokens, self._updated, now, tokens, timeout)
+            if wait is None:
+                return False
+            self._tokens, self._updated = available, now
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def _validate_tokens(self, tokens: float) -> None:
+        if tokens <= 0 or tokens > self.burst:
+            raise ValueError(f"tokens must be between 0 and the burst size ({self.burst})")
+
+    def _reserve(
+        self, available: float, updated: float, now: float, tokens: float, timeout: Optional[float]
+    ) -> tuple:
+        available = min(self.burst, available + max(0.0, now - updated) * self.rate)
+        wait = max(0.0, (tokens - available) / self.rate)
+        if timeout is not None and wait > timeout:
+            return available, None
+        return available - tokens, wait
+
+
+class FileTokenBucket(TokenBucket):
+    def __init__(self, path: str, rate: float, burst: Optional[float] = None) -> None:
+        """
+        A token bucket whose state lives in a file, shared by every process on the host that opens it.
+
+        Each acquire takes an exclusive ``flock`` on ``path``, refills and
+        reserves tokens, and releases the lock before sleeping. All processes
+        sharing a file should use the same ``rate`` and ``burst``. Instances
+        can be pickled, e.g. to hand a limiter to ``multiprocessing`` workers.
+
+        :param path: File holding the bucket state. Created if missing.
+        :type path: str
+        :param rate: Tokens added per second.
+        :type rate: float
+        :param burst: Bucket capacity. Defaults to ``max(1, rate)``.
+        :type burst: float, optional
+        :raises ImportError: If the platform has no ``fcntl`` module.
+        :raises ValueError: If rate or burst is not positive.
+        """
+        if fcntl is None:
+            raise ImportError("FileTokenBucket requires fcntl, which is not available on this platform.")
+        super().__init__(rate, burst)
+        self.path = path
+        self._fd: Optional[int] = None
+        self._pid: Optional[int] = None
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        self._validate_tokens(tokens)
+        with self._lock:
+            fd = self._file_descriptor()
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                state = os.pread(fd, _STATE_SIZE, 0)
+                if len(state) == _STATE_SIZE:
+                    available, updated = struct.unpack(_STATE_FORMAT, state)
+                else:
+                    available, updated = float(self.burst), now
+                available, wait = self._reserve(available, updated, now, tokens, timeout)
+                if wait is None:
+                    return False
+                os.pwrite(fd, struct.pack(_STATE_FORMAT, available, now), 0)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    def close(self) -> None:
+        """
+        Close the state file. It is reopened on the next acquire.
+        """
+        with self._lock:
+            if self._fd is not None and self._pid == os.getpid():
+                os.close(self._fd)
+            self._fd = None
+
+    def _file_descriptor(self) -> int:
+        # A forked child shares the parent's open file description, and flock
+        # does not exclude holders of the same description, so reopen per process.
+        if self._fd is None or self._pid != os.getpid():
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            self._pid = os.getpid()
+        return self._fd
+
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_fd"] = None
+        state["_pid"] = None
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        submits: Optional[TokenBucket] = None,
+        polls: Optional[TokenBucket] = None,
+        bulk_pages: Optional[TokenBucket] = None,
+    ) -> None:
+        """
+        Client-side request budgets for :class:`pangram.PangramText`.
+
+        Submits (prediction tasks, bulk jobs, file uploads, plagiarism
+        checks), status polls, and bulk result page fetches each draw from
+        their own bucket, so heavy polling cannot starve submissions. A
+        category without a bucket is not limited. Share one limiter between
+        clients and threads to pace them against a single quota.
+
+        :param submits: Bucket for requests that create work.
+        :type submits: pangram.rate_limit.TokenBucket, optional
+        :param polls: Bucket for task and bulk status checks.
+        :type polls: pangram.rate_limit.TokenBucket, optional
+        :param bulk_pages: Bucket for bulk result page fetches.
+        :type bulk_pages: pangram.rate_limit.TokenBucket, optional
+        """
+        self.buckets: Dict[str, TokenBucket] = {}
+        for category, bucket in ((SUBMIT, submits), (POLL, polls), (BULK_PAGE, bulk_pages)):
+            if bucket is not None:
+                self.buckets[category] = bucket
+
+    @classmethod
+    def per_second(
+        cls,
+        submits: Optional[float] = None,
+        polls: Optional[float] = None,
+        bulk_pages: Optional[float] = None,
+    ) -> "RateLimiter":
+        """
+        Build an in-process limiter from per-second rates.
+
+        :return: A limiter shared by every thread that uses it.
+        :rtype: pangram.rate_limit.RateLimiter
+        """
+        return cls(*(TokenBucket(rate) if rate is not None else None for rate in (submits, polls, bulk_pages)))
+
+    @classmethod
+    def shared(
+        cls,
+        directory: str,
+        submits: Optional[float] = None,
+        polls: Optional[float] = None,
+        bulk_pages: Optional[float] = None,
+    ) -> "RateLimiter":
+        """
+        Build a limiter from per-second rates whose buckets are shared by every process using ``directory``.
+
+        :param directory: Directory for the bucket state files. Created if missing.
+        :type directory: str
+        :return: A limiter backed by :class:`FileTokenBucket` state files.
+        :rtype: pangram.rate_limit.RateLimiter
+        """
+        os.makedirs(directory, exist_ok=True)
+        buckets = []
+        for category, rate in ((SUBMIT, submits), (POLL, polls), (BULK_PAGE, bulk_pages)):
+            if rate is None:
+                buckets.append(None)
+            else:
+                buckets.append(FileTokenBucket(os.path.join(directory, f"{category}.bucket"), rate))
+        return cls(*buckets)
+
+    def acquire(self, category: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for one request's worth of budget in ``category``.
+
+        :param category: One of ``submit``, ``poll``, or ``bulk_page``.
+        :type category: str
+        :param timeout: Longest acceptable wait in seconds. Defaults to waiting as long as needed.
+        :type timeout: float, optional
+        :return: False if the wait would exceed ``timeout``, otherwise True.
+        :rtype: bool
+        :raises ValueError: If category is unknown.
+        """
+        if category not in RATE_LIMIT_CATEGORIES:
+            raise ValueError(f"Unknown rate limit category: {category}")
+        bucket = self.buckets.get(category)
+        if bucket is None:
+            return True
+        return bucket.acquire(timeout=timeout)
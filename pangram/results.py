@@ -0,0 +1,334 @@
+import sys
+from collections.abc import Mapping
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+
+class Confidence(str, Enum):
+    """Confidence level of a window classification."""
+
+    HIGH = "High"
+    MEDIUM = "Medium"
+    LOW = "Low"
+
+
+class PredictionShort(str, Enum):
+    """Short-form document prediction."""
+
+    AI = "AI"
+    AI_ASSISTED = "AI-Assisted"
+    HUMAN = "Human"
+    MIXED = "Mixed"
+
+
+class Stage(str, Enum):
+    """Terminal stage of a prediction task or bulk item."""
+
+    SUCCESS = "STAGE_SUCCESS"
+    FAILED = "STAGE_FAILED"
+
+
+MAX_CACHED_SHAPES = 64
+
+
+def _intern(value: Any) -> Any:
+    """Return an interned copy of a string value."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _enum_field(enum: Type[Enum]) -> Callable[[Any], Any]:
+    """Return a converter to the member of ``enum`` for a value, or an interned copy of an unknown string."""
+    members = {member.value: member for member in enum}
+
+    def convert(value: Any) -> Any:
+        member = members.get(value) if isinstance(value, str) else None
+        return member if member is not None else _intern(value)
+
+    return convert
+
+
+def _tuple_field(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+class _Absent:
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "<absent>"
+
+
+_ABSENT = _Absent()
+
+
+class ResultObject(Mapping):
+    """
+    Base class for compact, read-only result objects.
+
+    Fields are stored in ``__slots__`` and read as attributes. For backward
+    compatibility every object is also a read-only mapping with the same keys
+    as the API response dict it was built from, so ``result["fraction_ai"]``,
+    ``result.get("dashboard_link")``, and ``dict(result)`` keep working.
+    Fields missing from the response read as ``None`` through attributes and
+    are absent from the mapping. Response keys the class does not know are
+    kept in :attr:`extra`.
+    """
+
+    __slots__ = ("extra", "_absent")
+    _fields: Tuple[str, ...] = ()
+    #: Converters applied to a field's response value; every other field is stored as is.
+    _converters: Dict[str, Callable[[Any], Any]] = {}
+    _shapes: Dict[Tuple[str, ...], Tuple[Tuple[Tuple[str, Optional[Callable[[Any], Any]]], ...], Tuple[str, ...], Tuple[str, ...]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._shapes = {}
+
+    def __init__(self, **fields: Any) -> None:
+        self._fill(fields)
+
+    def _fill(self, fields: Dict[str, Any]) -> None:
+        # Responses of one kind nearly always carry the same keys in the same
+        # order, so which keys are fields, how they are converted, and which
+        # fields are absent is worked out once per key order. Absent fields are
+        # left unset and read as None through __getattr__.
+        keys = tuple(fields)
+        shape = self._shapes.get(keys)
+        if shape is None:
+            shape = self._shape(keys)
+        known, absent, extra_keys = shape
+        set_field = object.__setattr__
+        for name, convert in known:
+            set_field(self, name, fields[name] if convert is None else convert(fields[name]))
+        set_field(self, "_absent", absent)
+        set_field(self, "extra", {key: fields[key] for key in extra_keys} if extra_keys else None)
+
+    @classmethod
+    def _shape(cls, keys: Tuple[str, ...]):
+        present = set(keys)
+        shape = (
+            tuple((key, cls._converters.get(key)) for key in keys if key in cls._fields),
+            tuple(name for name in cls._fields if name not in present),
+            tuple(key for key in keys if key not in cls._fields),
+        )
+        if len(cls._shapes) < MAX_CACHED_SHAPES:
+            cls._shapes[keys] = shape
+        return shape
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResultObject":
+        """
+        Build a result object from an API response dict.
+
+        :param data: The response dict.
+        :type data: Dict[str, Any]
+        :rtype: pangram.results.ResultObject
+        """
+        result = cls.__new__(cls)
+        result._fill(data)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        if name in type(self)._fields:
+            return None
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def _present(self) -> Iterator[str]:
+        for name in self._fields:
+            if name not in self._absent:
+                yield name
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            if key not in self._absent:
+                value = getattr(self, key)
+                return list(value) if isinstance(value, tuple) else value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._present()
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    @staticmethod
+    def _plain(value: Any) -> Any:
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, ResultObject):
+            return value.to_dict()
+        if isinstance(value, tuple):
+            return [ResultObject._plain(item) for item in value]
+        return value
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the result as a plain dict shaped like the API response.
+
+        :rtype: Dict[str, Any]
+        """
+        data = {name: self._plain(getattr(self, name)) for name in self._present()}
+        if self.extra is not None:
+            data.update(self.extra)
+        return data
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._present() if name not in ("text", "windows"))
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self):
+        return (type(self).from_dict, (self.to_dict(),))
+
+
+class Window(ResultObject):
+    """
+    One classified window of a :class:`Prediction`.
+
+    When a window's text is the slice ``[start_index:end_index]`` of its
+    document, it is not stored separately but sliced on access.
+    """
+
+    __slots__ = (
+        "label",
+        "ai_assistance_score",
+        "confidence",
+        "start_index",
+        "end_index",
+        "word_count",
+        "token_length",
+        "_text",
+        "_source",
+    )
+    _fields = ("label", "ai_assistance_score", "confidence", "start_index", "end_index", "word_count", "token_length")
+    _converters = {"label": _intern, "confidence": _enum_field(Confidence)}
+
+    def __init__(self, source: Optional[str] = None, **fields: Any) -> None:
+        text = fields.pop("text", _ABSENT)
+        super().__init__(**fields)
+        start, end = self.start_index, self.end_index
+        if not (
+            isinstance(text, str)
+            and isinstance(source, str)
+            and isinstance(start, int)
+            and isinstance(end, int)
+            and source[start:end] == text
+        ):
+            source = None
+        object.__setattr__(self, "_text", None if source is not None else text)
+        object.__setattr__(self, "_source", source)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], source: Optional[str] = None) -> "Window":
+        return cls(source, **data)
+
+    @property
+    def text(self) -> Optional[str]:
+        if self._source is not None:
+            return self._source[self.start_index:self.end_index]
+        return None if self._text is _ABSENT else self._text
+
+    def _present(self) -> Iterator[str]:
+        if self._text is not _ABSENT:
+            yield "text"
+        yield from super()._present()
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "text" and self._text is not _ABSENT:
+            return self.text
+        return super().__getitem__(key)
+
+
+class Prediction(ResultObject):
+    """A completed prediction, as returned by :meth:`pangram.PangramText.predict`."""
+
+    __slots__ = (
+        "stage",
+        "text",
+        "version",
+        "headline",
+        "prediction",
+        "prediction_short",
+        "fraction_ai",
+        "fraction_ai_assisted",
+        "fraction_human",
+        "num_ai_segments",
+        "num_ai_assisted_segments",
+        "num_human_segments",
+        "dashboard_link",
+        "windows",
+    )
+    _fields = __slots__
+    _converters = {
+        "stage": _enum_field(Stage),
+        "prediction_short": _enum_field(PredictionShort),
+        "version": _intern,
+        "headline": _intern,
+        "prediction": _intern,
+    }
+
+    def _fill(self, fields: Dict[str, Any]) -> None:
+        super()._fill(fields)
+        if isinstance(self.windows, list):
+            source = self.text
+            windows = tuple(
+                Window.from_dict(window, source) if isinstance(window, dict) else window for window in self.windows
+            )
+            object.__setattr__(self, "windows", windows)
+
+
+class BulkItem(ResultObject):
+    """One item of a Bulk API results page. ``result`` is a :class:`Prediction` once the item has finished."""
+
+    __slots__ = ("index", "id", "stage", "task_id", "error", "result", "failed", "cached")
+    _fields = __slots__
+    _converters = {
+        "result": lambda value: Prediction.from_dict(value) if isinstance(value, dict) else value,
+        "stage": _enum_field(Stage),
+        "error": _intern,
+    }
+
+
+class BulkStatus(ResultObject):
+    """The status of a Bulk API job, as returned by :meth:`pangram.PangramText.get_bulk_status`."""
+
+    __slots__ = ("bulk_id", "status", "total_items", "succeeded", "failed", "created_at", "updated_at")
+    _fields = __slots__
+    _converters = {"status": _intern}
+
+
+class PlagiarismResult(ResultObject):
+    """A plagiarism check result, as returned by :meth:`pangram.PangramText.check_plagiarism`."""
+
+    __slots__ = (
+        "text",
+        "plagiarism_detected",
+        "plagiarized_content",
+        "total_sentences",
+        "plagiarized_sentences",
+        "percent_plagiarized",
+    )
+    _fields = __slots__
+    _converters = {"plagiarized_content": _tuple_field, "plagiarized_sentences": _tuple_field}
+
+
+def typed_bulk_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert the ``items`` and ``failed_items`` of a bulk results response to :class:`BulkItem` objects.
+
+    :param results: A response from :meth:`pangram.PangramText.get_bulk_results`.
+    :type results: Dict[str, Any]
+    :return: The same response with typed items.
+    :rtype: Dict[str, Any]
+    """
+    converted = dict(results)
+    for key in ("items", "failed_items"):
+        items: List[Union[Dict, BulkItem]] = results.get(key) or []
+        converted[key] = [BulkItem.from_dict(item) if isinstance(item, dict) else item for item in items]
+    return converted
@@ -0,0 +1,108 @@
+import random
+from typing import Iterable, Optional
+
+DEFAULT_RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_NON_IDEMPOTENT_RETRY_STATUS_CODES = frozenset({429, 503})
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS = 20.0
+DEFAULT_BACKOFF_JITTER = 0.5
+DEFAULT_MAX_ELAPSED_SECONDS = 60.0
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        jitter: float = DEFAULT_BACKOFF_JITTER,
+        retry_status_codes: Iterable[int] = DEFAULT_RETRY_STATUS_CODES,
+        non_idempotent_retry_status_codes: Iterable[int] = DEFAULT_NON_IDEMPOTENT_RETRY_STATUS_CODES,
+        respect_retry_after: bool = True,
+        max_elapsed: float = DEFAULT_MAX_ELAPSED_SECONDS,
+    ) -> None:
+        """
+        Decide whether and when a failed API request is retried.
+
+        Idempotent calls (status and results fetches) are retried on any
+        status in ``retry_status_codes`` and on connection errors and read
+        timeouts. Calls that create work (task and bulk submissions, file
+        uploads, plagiarism checks) are only retried when the server cannot
+        have acted on them: statuses in ``non_idempotent_retry_status_codes``
+        and connect timeouts.
+
+        The wait before retry ``n`` is ``backoff_base * 2 ** (n - 1)``, capped
+        at ``backoff_max`` and reduced by up to ``jitter`` of its value. A
+        longer ``Retry-After`` from the server wins when
+        ``respect_retry_after`` is set. A retry is skipped if it would start
+        after the call's deadline, or ``max_elapsed`` seconds after the first
+        attempt for calls without one.
+
+        :param max_attempts: Total attempts per call, including the first. Use 1 to disable retries. Defaults to 3.
+        :type max_attempts: int
+        :param backoff_base: Seconds to wait before the first retry. Defaults to 0.5.
+        :type backoff_base: float
+        :param backoff_max: Upper bound on the wait between attempts. Defaults to 20.
+        :type backoff_max: float
+        :param jitter: Fraction of each wait that is randomized, between 0 and 1. Defaults to 0.5.
+        :type jitter: float
+        :param retry_status_codes: HTTP statuses retried for idempotent calls.
+        :type retry_status_codes: Iterable[int]
+        :param non_idempotent_retry_status_codes: HTTP statuses retried for calls that create work.
+        :type non_idempotent_retry_status_codes: Iterable[int]
+        :param respect_retry_after: Whether to wait at least as long as the server's ``Retry-After``. Defaults to True.
+        :type respect_retry_after: bool
+        :param max_elapsed: Retry budget in seconds for calls without their own deadline. Defaults to 60.
+        :type max_elapsed: float
+        :raises ValueError: If any parameter is out of range.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if backoff_base < 0 or backoff_max < backoff_base:
+            raise ValueError("backoff_base cannot be negative or larger than backoff_max")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        if max_elapsed <= 0:
+            raise ValueError("max_elapsed must be greater than 0")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.non_idempotent_retry_status_codes = frozenset(non_idempotent_retry_status_codes)
+        self.respect_retry_after = respect_retry_after
+        self.max_elapsed = max_elapsed
+
+    def should_retry_status(self, status_code: int, idempotent: bool) -> bool:
+        """
+        Return whether a response with ``status_code`` may be retried.
+
+        :param status_code: The HTTP status code of the response.
+        :type status_code: int
+        :param idempotent: Whether the request is safe to repeat.
+        :type idempotent: bool
+        :rtype: bool
+        """
+        if idempotent:
+            return status_code in self.retry_status_codes
+        return status_code in self.non_idempotent_retry_status_codes
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Return the seconds to wait after failed attempt number ``attempt``.
+
+        :param attempt: The 1-based number of the attempt that just failed.
+        :type attempt: int
+        :param retry_after: Seconds requested by the server's ``Retry-After`` header, if any.
+        :type retry_after: float, optional
+        :rtype: float
+        """
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        delay -= delay * self.jitter * random.random()
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
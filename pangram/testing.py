@@ -0,0 +1,724 @@
+import email.parser
+import email.policy
+import gzip
+import hashlib
+import heapq
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from pangram.async_client import AsyncPangramText
+from pangram.long_text import HEADLINES
+from pangram.metrics import ClientMetrics
+from pangram.text_classifier import ASYNC_FAILED_STAGE, ASYNC_SUCCESS_STAGE, MAX_BULK_PAGE_LIMIT, PangramText
+from pangram.windows import sentence_spans
+
+Latency = Callable[[random.Random], float]
+
+DEFAULT_PROCESSING_SECONDS = 0.05
+DEFAULT_WORKERS = 8
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+DEFAULT_WINDOW_WORDS = 100
+MAX_BULK_ITEMS = 1000
+FAKE_MODEL_VERSION = "3.0"
+FAKE_AI_SCORE = 0.7
+FAKE_AI_ASSISTED_SCORE = 0.3
+PENDING_STAGE = "STAGE_PENDING"
+RUNNING_STAGE = "STAGE_RUNNING"
+ROUTES = (
+    ("POST", re.compile(r"/task"), "submit_task"),
+    ("GET", re.compile(r"/task/(?P<task_id>[^/]+)"), "get_task"),
+    ("POST", re.compile(r"/bulk"), "submit_bulk"),
+    ("GET", re.compile(r"/bulk/(?P<bulk_id>[^/]+)"), "get_bulk_status"),
+    ("GET", re.compile(r"/bulk/(?P<bulk_id>[^/]+)/items"), "get_bulk_items"),
+    ("GET", re.compile(r"/bulk/(?P<bulk_id>[^/]+)/results"), "get_bulk_results"),
+    ("POST", re.compile(r"/upload"), "upload_files"),
+    ("POST", re.compile(r"/plagiarism"), "check_plagiarism"),
+)
+_WORD = re.compile(r"\S+")
+
+
+def fixed_latency(seconds: float) -> Latency:
+    """
+    A latency of exactly ``seconds``.
+
+    :rtype: Callable[[random.Random], float]
+    """
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> Latency:
+    """
+    A latency drawn uniformly between ``low`` and ``high`` seconds.
+
+    :rtype: Callable[[random.Random], float]
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5, maximum: Optional[float] = None) -> Latency:
+    """
+    A long-tailed latency with the given ``median`` seconds, optionally capped at ``maximum``.
+
+    :param median: Median latency in seconds.
+    :type median: float
+    :param sigma: Standard deviation of the latency's logarithm. Larger values give a longer tail. Defaults to 0.5.
+    :type sigma: float
+    :param maximum: Upper bound in seconds. Defaults to no bound.
+    :type maximum: float, optional
+    :rtype: Callable[[random.Random], float]
+    """
+
+    def sample(rng: random.Random) -> float:
+        value = rng.lognormvariate(math.log(median), sigma)
+        return value if maximum is None else min(value, maximum)
+
+    return sample
+
+
+def text_score(text: str) -> float:
+    """
+    A deterministic stand-in AI assistance score in ``[0, 1)`` derived from a hash of ``text``.
+
+    :rtype: float
+    """
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2 ** 64
+
+
+def _label(score: float) -> Tuple[str, str]:
+    if score >= FAKE_AI_SCORE:
+        return "AI-Generated", "AI"
+    if score >= FAKE_AI_ASSISTED_SCORE:
+        return "Moderately AI-Assisted", "AI-Assisted"
+    return "Human Written", "Human"
+
+
+def _confidence(score: float) -> str:
+    distance = abs(score - 0.5)
+    if distance > 0.35:
+        return "High"
+    if distance > 0.15:
+        return "Medium"
+    return "Low"
+
+
+def fake_prediction(
+    text: str,
+    score: Callable[[str], float] = text_score,
+    window_words: int = DEFAULT_WINDOW_WORDS,
+) -> Dict:
+    """
+    Build a successful task result for ``text`` with the same fields as the API.
+
+    The text is cut into windows of ``window_words`` words, each scored with
+    ``score``. Fractions are weighted by word count.
+
+    :param text: The input text.
+    :type text: str
+    :param score: Returns the AI assistance score of a window's text. Defaults to :func:`text_score`.
+    :type score: Callable[[str], float]
+    :param window_words: Words per window. Defaults to 100.
+    :type window_words: int
+    :return: A result shaped like :meth:`pangram.PangramText.predict`'s.
+    :rtype: Dict
+    """
+    words = [match.span() for match in _WORD.finditer(text)]
+    windows = []
+    fractions = {"AI": 0, "AI-Assisted": 0, "Human": 0}
+    counts = dict(fractions)
+    for first in range(0, len(words), window_words):
+        span = words[first : first + window_words]
+        start, end = span[0][0], span[-1][1]
+        window_score = float(score(text[start:end]))
+        label, kind = _label(window_score)
+        fractions[kind] += len(span)
+        counts[kind] += 1
+        windows.append(
+            {
+                "text": text[start:end],
+                "label": label,
+                "ai_assistance_score": window_score,
+                "confidence": _confidence(window_score),
+                "start_index": start,
+                "end_index": end,
+                "word_count": len(span),
+                "token_length": round(len(span) * 1.3),
+            }
+        )
+    kinds = [kind for kind, count in counts.items() if count]
+    prediction_short = kinds[0] if len(kinds) == 1 else "Mixed"
+    total = max(1, len(words))
+    return {
+        "stage": ASYNC_SUCCESS_STAGE,
+        "text": text,
+        "version": FAKE_MODEL_VERSION,
+        "headline": HEADLINES[prediction_short],
+        "prediction": HEADLINES[prediction_short],
+        "prediction_short": prediction_short,
+        "fraction_ai": fractions["AI"] / total,
+        "fraction_ai_assisted": fractions["AI-Assisted"] / total,
+        "fraction_human": fractions["Human"] / total if words else 1.0,
+        "num_ai_segments": counts["AI"],
+        "num_ai_assisted_segments": counts["AI-Assisted"],
+        "num_human_segments": counts["Human"],
+        "windows": windows,
+    }
+
+
+def fake_plagiarism(text: str, rate: float = 0.1) -> Dict:
+    """
+    Build a plagiarism result for ``text`` in which a deterministic ``rate`` of sentences are flagged.
+
+    :param text: The input text.
+    :type text: str
+    :param rate: Share of sentences reported as plagiarized. Defaults to 0.1.
+    :type rate: float
+    :rtype: Dict
+    """
+    sentences = [text[span.start : span.end] for span in sentence_spans(text)]
+    flagged = [sentence for sentence in sentences if text_score("plagiarism:" + sentence) < rate]
+    return {
+        "text": text,
+        "plagiarism_detected": bool(flagged),
+        "plagiarized_content": [
+            {"text": sentence, "source_url": f"https://example.com/source/{hashlib.blake2b(sentence.encode(), digest_size=4).hexdigest()}"}
+            for sentence in flagged
+        ],
+        "total_sentences": len(sentences),
+        "plagiarized_sentences": flagged,
+        "percent_plagiarized": 100.0 * len(flagged) / len(sentences) if sentences else 0.0,
+    }
+
+
+def _timestamp(wall_time: float) -> str:
+    return datetime.fromtimestamp(wall_time, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class _Task:
+    __slots__ = ("task_id", "text", "started_at", "ready_at", "fails", "public_dashboard_link", "result")
+
+    def __init__(self, task_id: str, text: str, started_at: float, ready_at: float, fails: bool, public_dashboard_link: bool) -> None:
+        self.task_id = task_id
+        self.text = text
+        self.started_at = started_at
+        self.ready_at = ready_at
+        self.fails = fails
+        self.public_dashboard_link = public_dashboard_link
+        self.result: Optional[Dict] = None
+
+    def stage(self, now: float) -> str:
+        if now < self.started_at:
+            return PENDING_STAGE
+        if now < self.ready_at:
+            return RUNNING_STAGE
+        return ASYNC_FAILED_STAGE if self.fails else ASYNC_SUCCESS_STAGE
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    timeout = 60
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.fake.metrics.increment("connections")
+
+    def do_GET(self) -> None:
+        self.server.fake._handle(self, "GET")
+
+    def do_POST(self) -> None:
+        self.server.fake._handle(self, "POST")
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class FakePangramServer:
+    def __init__(
+        self,
+        latency: Union[Latency, Dict[str, Latency], None] = None,
+        processing_time: Latency = fixed_latency(DEFAULT_PROCESSING_SECONDS),
+        workers: int = DEFAULT_WORKERS,
+        error_rate: Union[float, Dict[str, float]] = 0.0,
+        error_status: int = 503,
+        rate_limit_rate: float = 0.0,
+        retry_after: float = DEFAULT_RETRY_AFTER_SECONDS,
+        max_requests_per_second: Optional[float] = None,
+        task_failure_rate: float = 0.0,
+        score: Callable[[str], float] = text_score,
+        api_key: Optional[str] = None,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        A local, in-process HTTP server that imitates the Pangram API for tests and benchmarks.
+
+        It serves ``/task``, ``/task/{id}``, ``/bulk``, ``/bulk/{id}``,
+        ``/bulk/{id}/items``, ``/bulk/{id}/results``, ``/upload`` (file
+        upload), and ``/plagiarism`` over real sockets with HTTP/1.1
+        keep-alive, so connection pooling, concurrency, retries, and timing
+        behave as they do against the API. Use :meth:`client` or
+        :attr:`endpoints` to point a client at it.
+
+        Prediction tasks and bulk items queue for ``workers`` simulated
+        workers, each taking ``processing_time`` per item, so a burst of
+        submissions waits in line as it would on a loaded service. Results
+        are generated by :func:`fake_prediction`.
+
+        Faults are injected per request, before it is routed. Requests
+        beyond ``max_requests_per_second`` get a 429 with ``Retry-After``.
+        A ``rate_limit_rate`` share of requests also get a 429, and an
+        ``error_rate`` share get ``error_status``. Counters of requests,
+        routes, status codes, injected faults, and TCP connections are kept
+        in :attr:`metrics`.
+
+        :param latency: Delay added to every response, or a dict of delays by route name
+                        (``submit_task``, ``get_task``, ``submit_bulk``, ``get_bulk_status``, ``get_bulk_items``,
+                        ``get_bulk_results``, ``upload_files``, ``check_plagiarism``). Defaults to none.
+        :type latency: Union[Callable[[random.Random], float], Dict[str, Callable[[random.Random], float]]], optional
+        :param processing_time: Time one worker spends on one task, bulk item, uploaded file, or plagiarism check.
+                                Defaults to 50 ms.
+        :type processing_time: Callable[[random.Random], float]
+        :param workers: Number of items processed at once. Defaults to 8.
+        :type workers: int
+        :param error_rate: Share of requests answered with ``error_status``, or a dict of shares by route name.
+                           Defaults to 0.
+        :type error_rate: Union[float, Dict[str, float]]
+        :param error_status: Status code of injected errors. Defaults to 503.
+        :type error_status: int
+        :param rate_limit_rate: Share of requests answered with 429. Defaults to 0.
+        :type rate_limit_rate: float
+        :param retry_after: ``Retry-After`` seconds sent with injected 429 responses. Defaults to 1.
+        :type retry_after: float
+        :param max_requests_per_second: Requests accepted per second across all routes, with bursts up to one
+                                        second's worth. Defaults to no cap.
+        :type max_requests_per_second: float, optional
+        :param task_failure_rate: Share of tasks and bulk items that end in ``STAGE_FAILED``. Defaults to 0.
+        :type task_failure_rate: float
+        :param score: Returns the AI assistance score of a window's text. Defaults to :func:`text_score`.
+        :type score: Callable[[str], float]
+        :param api_key: Reject requests without this ``x-api-key`` with 401. Defaults to accepting any key.
+        :type api_key: str, optional
+        :param seed: Seed for latency and fault sampling. Defaults to a random seed.
+        :type seed: int, optional
+        :param host: Interface to listen on. Defaults to ``127.0.0.1``.
+        :type host: str
+        :param port: Port to listen on. Defaults to a free port.
+        :type port: int
+        :raises ValueError: If workers is less than 1, a rate is not between 0 and 1, or the request cap is not positive.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        error_rates = error_rate.values() if isinstance(error_rate, dict) else [error_rate]
+        rates = [("error_rate", rate) for rate in error_rates]
+        rates += [("rate_limit_rate", rate_limit_rate), ("task_failure_rate", task_failure_rate)]
+        for name, rate in rates:
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if max_requests_per_second is not None and max_requests_per_second <= 0:
+            raise ValueError("max_requests_per_second must be greater than 0")
+        self.latency = latency
+        self.processing_time = processing_time
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.max_requests_per_second = max_requests_per_second
+        self.task_failure_rate = task_failure_rate
+        self.score = score
+        self.api_key = api_key
+        self.host = host
+        self.port = port
+        self.metrics = ClientMetrics()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._workers = [0.0] * workers
+        self._tokens = max(1.0, max_requests_per_second or 0.0)
+        self._tokens_at = time.monotonic()
+        self._tasks: Dict[str, _Task] = {}
+        self._bulk_jobs: Dict[str, Dict] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "FakePangramServer":
+        """
+        Start serving on a background thread.
+
+        :return: The server, for chaining.
+        :rtype: pangram.testing.FakePangramServer
+        """
+        if self._httpd is not None:
+            return self
+        self._httpd = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="pangram-fake-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self) -> "FakePangramServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server, e.g. ``http://127.0.0.1:54321``."""
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def endpoints(self) -> Dict[str, str]:
+        """
+        Keyword arguments that point :class:`pangram.PangramText` or
+        :class:`pangram.AsyncPangramText` at this server.
+        """
+        return {
+            "api_endpoint": self.url,
+            "file_upload_endpoint": f"{self.url}/upload",
+            "plagiarism_endpoint": f"{self.url}/plagiarism",
+        }
+
+    def client(self, **kwargs) -> PangramText:
+        """
+        Create a :class:`pangram.PangramText` that sends every request to this server.
+
+        :param kwargs: Other :class:`pangram.PangramText` arguments. ``api_key`` defaults to the server's key.
+        :rtype: pangram.PangramText
+        """
+        kwargs.setdefault("api_key", self.api_key or "fake-key")
+        return PangramText(**{**self.endpoints, **kwargs})
+
+    def async_client(self, **kwargs) -> AsyncPangramText:
+        """
+        Create a :class:`pangram.AsyncPangramText` that sends every request to this server.
+
+        :param kwargs: Other :class:`pangram.AsyncPangramText` arguments. ``api_key`` defaults to the server's key.
+        :rtype: pangram.AsyncPangramText
+        """
+        kwargs.setdefault("api_key", self.api_key or "fake-key")
+        return AsyncPangramText(**{**self.endpoints, **kwargs})
+
+    # Simulation
+
+    def _sample(self, latency: Optional[Latency]) -> float:
+        if latency is None:
+            return 0.0
+        with self._lock:
+            return max(0.0, float(latency(self._rng)))
+
+    def _schedule(self, now: float) -> Tuple[float, float, bool]:
+        """Queue one item for the next free worker and return its start time, finish time, and whether it fails."""
+        with self._lock:
+            free_at = heapq.heappop(self._workers)
+            started_at = max(now, free_at)
+            ready_at = started_at + max(0.0, float(self.processing_time(self._rng)))
+            heapq.heappush(self._workers, ready_at)
+            return started_at, ready_at, self._rng.random() < self.task_failure_rate
+
+    def _new_task(self, text: str, now: float, public_dashboard_link: bool = False) -> _Task:
+        started_at, ready_at, fails = self._schedule(now)
+        task = _Task(uuid.uuid4().hex, text, started_at, ready_at, fails, public_dashboard_link)
+        with self._lock:
+            self._tasks[task.task_id] = task
+        return task
+
+    def _task_result(self, task: _Task) -> Dict:
+        if task.result is None:
+            result = fake_prediction(task.text, self.score)
+            if task.public_dashboard_link:
+                result["dashboard_link"] = f"{self.url}/dashboard/{task.task_id}"
+            task.result = result
+        return task.result
+
+    def _fault(self, route: str, now: float) -> Optional[Tuple[int, Dict, Dict[str, str]]]:
+        with self._lock:
+            if self.max_requests_per_second is not None:
+                capacity = max(1.0, self.max_requests_per_second)
+                self._tokens = min(capacity, self._tokens + (now - self._tokens_at) * self.max_requests_per_second)
+                self._tokens_at = now
+                if self._tokens < 1:
+                    wait = (1 - self._tokens) / self.max_requests_per_second
+                    self.metrics.increment("throttled")
+                    return 429, {"error": "rate limit exceeded"}, {"Retry-After": f"{wait:.3f}"}
+                self._tokens -= 1
+            draw = self._rng.random()
+        if draw < self.rate_limit_rate:
+            self.metrics.increment("injected.rate_limited")
+            return 429, {"error": "rate limit exceeded"}, {"Retry-After": f"{self.retry_after:g}"}
+        error_rate = self.error_rate.get(route, 0.0) if isinstance(self.error_rate, dict) else self.error_rate
+        if draw < self.rate_limit_rate + error_rate:
+            self.metrics.increment("injected.errors")
+            return self.error_status, {"error": "injected server error"}, {}
+        return None
+
+    # HTTP
+
+    @staticmethod
+    def _read_body(handler: BaseHTTPRequestHandler) -> bytes:
+        if handler.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(handler.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    handler.rfile.readline()
+                    break
+                chunks.append(handler.rfile.read(size))
+                handler.rfile.readline()
+            body = b"".join(chunks)
+        else:
+            body = handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+        if handler.headers.get("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return body
+
+    def _route(self, method: str, path: str) -> Tuple[Optional[str], Dict[str, str]]:
+        for route_method, pattern, name in ROUTES:
+            match = pattern.fullmatch(path)
+            if match and route_method == method:
+                return name, match.groupdict()
+        return None, {}
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        received = time.monotonic()
+        url = urlsplit(handler.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        route, params = self._route(method, url.path.rstrip("/") or "/")
+        self.metrics.increment("requests")
+        try:
+            body = self._read_body(handler)
+        except (OSError, ValueError):
+            status, payload, headers = 400, {"error": "invalid request body"}, {}
+        else:
+            if route is None:
+                status, payload, headers = 404, {"error": f"no route for {method} {url.path}"}, {}
+            elif self.api_key is not None and handler.headers.get("x-api-key") != self.api_key:
+                status, payload, headers = 401, {"error": "invalid API key"}, {}
+            else:
+                self.metrics.increment(f"requests.{route}")
+                fault = self._fault(route, received)
+                if fault is not None:
+                    status, payload, headers = fault
+                else:
+                    status, payload, headers = getattr(self, f"_{route}")(handler, body, query, received, **params)
+        latency = self.latency.get(route) if isinstance(self.latency, dict) else self.latency
+        delay = self._sample(latency) - (time.monotonic() - received)
+        if delay > 0:
+            time.sleep(delay)
+        self._respond(handler, status, payload, headers, route)
+
+    def _respond(self, handler: BaseHTTPRequestHandler, status: int, payload, headers: Dict[str, str], route: Optional[str]) -> None:
+        self.metrics.increment(f"status.{status}")
+        body = json.dumps(payload).encode("utf-8")
+        if route == "get_bulk_results" and "gzip" in handler.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, mtime=0)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        handler.send_response(status)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    @staticmethod
+    def _json(body: bytes):
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    # Endpoints
+
+    def _submit_task(self, handler, body: bytes, query: Dict, now: float):
+        payload = self._json(body)
+        text = payload.get("text") if isinstance(payload, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            return 400, {"error": "text must be a non-empty string"}, {}
+        task = self._new_task(text, now, bool(payload.get("public_dashboard_link")))
+        return 200, {"task_id": task.task_id}, {}
+
+    def _get_task(self, handler, body: bytes, query: Dict, now: float, task_id: str):
+        task = self._tasks.get(task_id)
+        if task is None:
+            return 404, {"error": f"task {task_id} not found"}, {}
+        stage = task.stage(now)
+        if stage == ASYNC_SUCCESS_STAGE:
+            return 200, {"task_id": task_id, **self._task_result(task)}, {}
+        if stage == ASYNC_FAILED_STAGE:
+            return 200, {"task_id": task_id, "stage": stage, "headline": "processing failed"}, {}
+        return 200, {"task_id": task_id, "stage": stage}, {}
+
+    def _submit_bulk(self, handler, body: bytes, query: Dict, now: float):
+        payload = self._json(body)
+        if not isinstance(payload, dict) or ("text" in payload) == ("items" in payload):
+            return 400, {"error": "provide exactly one of text or items"}, {}
+        entries = payload.get("text") if "text" in payload else payload.get("items")
+        if not isinstance(entries, list) or not entries:
+            return 400, {"error": "bulk input must be a non-empty list"}, {}
+        if len(entries) > MAX_BULK_ITEMS:
+            return 400, {"error": f"bulk jobs accept at most {MAX_BULK_ITEMS} items"}, {}
+        bulk_id = f"blk_{uuid.uuid4().hex}"
+        items, accepted, failed = [], [], []
+        for index, entry in enumerate(entries):
+            item_id = entry.get("id") if isinstance(entry, dict) else None
+            text = entry.get("text") if isinstance(entry, dict) else entry
+            item = {"index": index, "id": item_id, "task": None, "error": None}
+            if isinstance(text, str) and text.strip():
+                item["task"] = self._new_task(text, now)
+                accepted.append({"index": index, "id": item_id, "task_id": item["task"].task_id})
+            else:
+                item["error"] = "text must be a non-empty string"
+                failed.append({"index": index, "id": item_id, "error": item["error"]})
+            items.append(item)
+        with self._lock:
+            self._bulk_jobs[bulk_id] = {"items": items, "created_at": time.time(), "created": now}
+        response = {
+            "bulk_id": bulk_id,
+            "status": "queued",
+            "total_items": len(entries),
+            "accepted_items": accepted,
+            "failed_items": failed,
+        }
+        return 202, response, {}
+
+    def _bulk_job(self, bulk_id: str):
+        job = self._bulk_jobs.get(bulk_id)
+        if job is None:
+            return None, (404, {"error": f"bulk job {bulk_id} not found"}, {})
+        return job, None
+
+    def _get_bulk_status(self, handler, body: bytes, query: Dict, now: float, bulk_id: str):
+        job, missing = self._bulk_job(bulk_id)
+        if missing:
+            return missing
+        tasks = [item["task"] for item in job["items"] if item["task"] is not None]
+        stages = [task.stage(now) for task in tasks]
+        succeeded = stages.count(ASYNC_SUCCESS_STAGE)
+        failed = stages.count(ASYNC_FAILED_STAGE) + len(job["items"]) - len(tasks)
+        finished = [task.ready_at for task in tasks if task.ready_at <= now]
+        if succeeded + failed == len(job["items"]):
+            status = "succeeded" if not failed else "failed" if not succeeded else "partial"
+        elif any(stage != PENDING_STAGE for stage in stages):
+            status = "running"
+        else:
+            status = "queued"
+        updated = job["created_at"] + (max(finished) - job["created"] if finished else 0.0)
+        return 200, {
+            "bulk_id": bulk_id,
+            "status": status,
+            "total_items": len(job["items"]),
+            "accepted": len(tasks),
+            "succeeded": succeeded,
+            "failed": failed,
+            "created_at": _timestamp(job["created_at"]),
+            "updated_at": _timestamp(updated),
+        }, {}
+
+    @staticmethod
+    def _page(query: Dict, total: int) -> Optional[range]:
+        try:
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", 100))
+        except ValueError:
+            return None
+        if offset < 0 or not 1 <= limit <= MAX_BULK_PAGE_LIMIT:
+            return None
+        return range(offset, min(offset + limit, total))
+
+    def _get_bulk_items(self, handler, body: bytes, query: Dict, now: float, bulk_id: str):
+        job, missing = self._bulk_job(bulk_id)
+        if missing:
+            return missing
+        page = self._page(query, len(job["items"]))
+        if page is None:
+            return 400, {"error": f"offset must be at least 0 and limit between 1 and {MAX_BULK_PAGE_LIMIT}"}, {}
+        items = []
+        for index in page:
+            item = job["items"][index]
+            task = item["task"]
+            items.append({
+                "index": index,
+                "id": item["id"],
+                "task_id": task.task_id if task else None,
+                "stage": task.stage(now) if task else ASYNC_FAILED_STAGE,
+                "error": item["error"] or ("processing failed" if task and task.stage(now) == ASYNC_FAILED_STAGE else None),
+            })
+        return 200, {"bulk_id": bulk_id, "total_items": len(job["items"]), "items": items}, {}
+
+    def _get_bulk_results(self, handler, body: bytes, query: Dict, now: float, bulk_id: str):
+        job, missing = self._bulk_job(bulk_id)
+        if missing:
+            return missing
+        page = self._page(query, len(job["items"]))
+        if page is None:
+            return 400, {"error": f"offset must be at least 0 and limit between 1 and {MAX_BULK_PAGE_LIMIT}"}, {}
+        items, failed_items = [], []
+        for index in page:
+            item = job["items"][index]
+            task = item["task"]
+            stage = task.stage(now) if task else ASYNC_FAILED_STAGE
+            entry = {"index": index, "id": item["id"], "task_id": task.task_id if task else None, "stage": stage}
+            if stage == ASYNC_FAILED_STAGE:
+                failed_items.append({**entry, "error": item["error"] or "processing failed"})
+            else:
+                result = self._task_result(task) if stage == ASYNC_SUCCESS_STAGE else None
+                items.append({**entry, "error": None, "result": result})
+        return 200, {"bulk_id": bulk_id, "total_items": len(job["items"]), "items": items, "failed_items": failed_items}, {}
+
+    def _upload_files(self, handler, body: bytes, query: Dict, now: float):
+        content_type = handler.headers.get("Content-Type", "")
+        if not content_type.startswith("multipart/form-data"):
+            return 400, {"error": "expected multipart/form-data"}, {}
+        message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+        )
+        public_dashboard_link = False
+        results = []
+        processing = 0.0
+        for part in message.iter_parts():
+            filename = part.get_filename()
+            content = part.get_payload(decode=True) or b""
+            if filename is None:
+                if part.get_param("name", header="content-disposition") == "public_dashboard_link":
+                    public_dashboard_link = content.strip() == b"true"
+                continue
+            processing += self._sample(self.processing_time)
+            result = fake_prediction(content.decode("utf-8", "replace"), self.score)
+            result["filename"] = filename
+            results.append(result)
+        if not results:
+            return 400, {"error": "no files uploaded"}, {}
+        if public_dashboard_link:
+            for result in results:
+                result["dashboard_link"] = f"{self.url}/dashboard/{uuid.uuid4().hex}"
+        time.sleep(processing)
+        return 200, results, {}
+
+    def _check_plagiarism(self, handler, body: bytes, query: Dict, now: float):
+        payload = self._json(body)
+        text = payload.get("text") if isinstance(payload, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            return 400, {"error": "text must be a non-empty string"}, {}
+        time.sleep(self._sample(self.processing_time))
+        return 200, fake_plagiarism(text), {}
@@ -1,8 +1,40 @@
+import bisect
+import functools
+import itertools
 import requests
 import os
 import time
+import queue
+import threading
 import warnings
-from typing import List, Dict, Optional, Tuple, Union
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union
+
+from pangram.cache import ResultCache
+from pangram.codec import DEFAULT_CODEC, JSONCodec
+from pangram.compression import RequestCompression
+from pangram.dedup import DedupPlan, TextNormalizer, resolve_normalizer
+from pangram.errors import PangramAPIError
+from pangram.lazy import LazyPrediction, lazy_prediction, lazy_results_page
+from pangram.long_text import DEFAULT_LONG_CHUNK_CHARS, merge_predictions, split_text
+from pangram.metrics import ClientMetrics
+from pangram.poller import DEFAULT_POLLER_WORKERS, TaskPoller
+from pangram.polling import FixedPolling, PollingStrategy, PollSchedule, parse_retry_after
+from pangram.rate_limit import BULK_PAGE, POLL, SUBMIT, RateLimiter
+from pangram.results import BulkItem, BulkStatus, PlagiarismResult, Prediction, ResultObject, typed_bulk_results
+from pangram.retry import RetryPolicy
+from pangram.upload import (
+    DEFAULT_UPLOAD_BYTES_PER_REQUEST,
+    DEFAULT_UPLOAD_FILES_PER_REQUEST,
+    DEFAULT_UPLOAD_WORKERS,
+    MultipartFileStream,
+    batch_files,
+)
+
+if TYPE_CHECKING:
+    from pangram.bulk import ChunkedBulkJob
+    from pangram.columnar import ParquetResultWriter, ResultColumns
 
 SOURCE_VERSION = "python_sdk_0.3.1"
 
@@ -18,22 +50,44 @@ DEFAULT_POLL_INTERVAL_SECONDS = 0.5
 MIN_POLL_INTERVAL_SECONDS = 0.1
 HTTP_REQUEST_TIMEOUT_SECONDS = 10
 MAX_BULK_PAGE_LIMIT = 1000
-
-class PangramText:
-    def __init__(self, api_key: Optional[str] = None) -> None:
-        """
-        A classifier for text inputs using the Pangram Labs API.
-
-        :param api_key: Your API key for the Pangram Labs. If not provided, the environment variable PANGRAM_API_KEY will be used.
-        :type api_key: str, optional
-        :raises ValueError: If the API key is not provided and not set in the environment.
-        """
+PLAGIARISM_REQUEST_TIMEOUT_SECONDS = 90
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_CONCURRENCY = 8
+MAX_SUBMIT_WORKERS = 8
+DEFAULT_BULK_PAGE_WORKERS = 4
+
+class _PangramClientBase:
+    """Request-building and response-validation logic shared by the sync and async clients."""
+
+    _json_codec: JSONCodec = DEFAULT_CODEC
+    _retry_policy: RetryPolicy = RetryPolicy()
+    #: Exceptions the HTTP library raises when a request fails before a response arrives.
+    _request_errors: Tuple[type, ...] = ()
+    api_endpoint: str = API_ENDPOINT
+    file_upload_endpoint: str = FILE_UPLOAD_API_ENDPOINT
+    plagiarism_endpoint: str = PLAGIARISM_API_ENDPOINT
+
+    def _init_api_key(self, api_key: Optional[str]) -> None:
         if api_key is None:
             self.api_key = os.getenv('PANGRAM_API_KEY')
         else:
             self.api_key = api_key
         if self.api_key is None:
-            raise ValueError("API key is required. Set the environment variable PANGRAM_API_KEY or pass it as an argument to PangramText.")
+            raise ValueError(f"API key is required. Set the environment variable PANGRAM_API_KEY or pass it as an argument to {type(self).__name__}.")
+
+    def _init_endpoints(
+        self,
+        api_endpoint: Optional[str],
+        file_upload_endpoint: Optional[str],
+        plagiarism_endpoint: Optional[str],
+    ) -> None:
+        if api_endpoint is not None:
+            self.api_endpoint = api_endpoint.rstrip("/")
+        if file_upload_endpoint is not None:
+            self.file_upload_endpoint = file_upload_endpoint
+        if plagiarism_endpoint is not None:
+            self.plagiarism_endpoint = plagiarism_endpoint
 
     def _auth_headers(self) -> Dict[str, str]:
         return {
@@ -50,21 +104,534 @@ class PangramText:
         remaining = deadline - time.monotonic()
         return max(0.1, min(HTTP_REQUEST_TIMEOUT_SECONDS, remaining))
 
-    def _parse_response_json(self, response: requests.Response, expected_status_codes: Tuple[int, ...] = (200,)):
+    def _polling_schedule(self, polling: Optional[PollingStrategy], poll_interval: float) -> PollSchedule:
+        strategy = polling or self._polling or FixedPolling(max(MIN_POLL_INTERVAL_SECONDS, poll_interval))
+        return strategy.schedule()
+
+    @staticmethod
+    def _sleep_interval(
+        schedule: PollSchedule,
+        deadline: float,
+        status: Optional[Dict] = None,
+        retry_after: Optional[float] = None,
+    ) -> float:
+        interval = schedule.next_interval(status=status, retry_after=retry_after)
+        return min(interval, max(0.0, deadline - time.monotonic()))
+
+    @staticmethod
+    def _retry_after(response) -> Optional[float]:
+        return parse_retry_after(response.headers.get("Retry-After"))
+
+    def is_transient_error(self, exc: BaseException) -> bool:
+        """
+        Return whether an error from a status check is worth polling through.
+
+        A failed poll only loses one observation, so the client's waits keep
+        polling through transport errors and API errors whose status code the
+        retry policy treats as retryable. An error raised from a transient
+        error, such as the ``ValueError`` that :meth:`get_bulk_status` raises
+        for a failed request, is transient too.
+
+        :param exc: The error raised by a status check.
+        :type exc: BaseException
+        :rtype: bool
+        """
+        if exc.__cause__ is not None and self.is_transient_error(exc.__cause__):
+            return True
+        if isinstance(exc, self._request_errors):
+            return True
+        return isinstance(exc, PangramAPIError) and exc.status_code in self._retry_policy.retry_status_codes
+
+    def _parse_response_json(
+        self,
+        response: requests.Response,
+        expected_status_codes: Tuple[int, ...] = (200,),
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ):
         if response.status_code not in expected_status_codes:
-            raise ValueError(f"Error returned by API: [{response.status_code}] {response.text}")
+            raise PangramAPIError(
+                f"Error returned by API: [{response.status_code}] {response.text}",
+                status_code=response.status_code,
+                retry_after=self._retry_after(response),
+            )
         try:
-            response_json = response.json()
+            response_json = (decode or self._json_codec.loads)(response.content)
         except ValueError as exc:
-            raise ValueError(f"Error returned by API: non-JSON response: {response.text}") from exc
-        if isinstance(response_json, dict) and "error" in response_json:
-            raise ValueError(f"Error returned by API: {response_json['error']}")
+            raise PangramAPIError(
+                f"Error returned by API: non-JSON response: {response.text}",
+                status_code=response.status_code,
+            ) from exc
+        if isinstance(response_json, Mapping) and "error" in response_json:
+            raise PangramAPIError(f"Error returned by API: {response_json['error']}", status_code=response.status_code)
+        return response_json
+
+    @staticmethod
+    def _require_dict(response_json, description: str) -> Dict:
+        if not isinstance(response_json, dict):
+            raise ValueError(f"Error returned by API: invalid {description}: {response_json}")
         return response_json
 
+    @staticmethod
+    def _validate_wait_args(timeout: float, poll_interval: float) -> None:
+        if timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+        if poll_interval < 0:
+            raise ValueError("poll_interval cannot be negative")
+
+    @staticmethod
+    def _bulk_payload(text: Optional[List[str]], items: Optional[List[Dict[str, str]]]) -> Dict:
+        if (text is None and items is None) or (text is not None and items is not None):
+            raise ValueError("Provide exactly one of text or items")
+        return {"items": items} if items is not None else {"text": text}
+
+    @staticmethod
+    def _task_id_from_response(response_json) -> str:
+        if not isinstance(response_json, dict):
+            raise ValueError(f"Error returned by API: invalid task response: {response_json}")
+        task_id = response_json.get("task_id")
+        if not isinstance(task_id, str) or not task_id:
+            raise ValueError(f"Error returned by API: missing task_id in response: {response_json}")
+        return task_id
+
+    @staticmethod
+    def _completed_task_result(task_id: str, response_json) -> Optional[Dict]:
+        """Return the task result if it succeeded, None if it is still running, or raise if it failed."""
+        if not isinstance(response_json, Mapping):
+            raise ValueError(f"Error returned by API: invalid task result: {response_json}")
+
+        stage = response_json.get("stage")
+        if stage == ASYNC_SUCCESS_STAGE:
+            return response_json
+        if stage == ASYNC_FAILED_STAGE:
+            message = response_json.get("headline") or response_json.get("detail") or "task failed"
+            raise ValueError(f"Error returned by API: task {task_id} failed: {message}")
+        if stage is None:
+            raise ValueError(f"Error returned by API: missing stage for task {task_id}")
+        return None
+
+    @staticmethod
+    def _validate_page_size(page_size: int) -> None:
+        if page_size < 1 or page_size > MAX_BULK_PAGE_LIMIT:
+            raise ValueError(f"page_size must be between 1 and {MAX_BULK_PAGE_LIMIT}")
+
+    @staticmethod
+    def _unpack_results_page(page: Dict) -> Tuple[int, List[Dict], List[Dict]]:
+        page_total = page.get("total_items")
+        if not isinstance(page_total, int):
+            raise ValueError(f"Error returned by API: invalid bulk results total_items: {page}")
+
+        page_items = page.get("items")
+        page_failed_items = page.get("failed_items")
+        if not isinstance(page_items, list) or not isinstance(page_failed_items, list):
+            raise ValueError(f"Error returned by API: invalid bulk results page: {page}")
+        return page_total, page_items, page_failed_items
+
+    @staticmethod
+    def _validate_offset(offset: int) -> None:
+        if offset < 0:
+            raise ValueError("offset cannot be negative")
+
+    @staticmethod
+    def _tagged_results_page(page_items: List[Dict], page_failed_items: List[Dict]) -> List[Dict]:
+        for failed_item in page_failed_items:
+            failed_item["failed"] = True
+        merged = page_items + page_failed_items
+        if all(isinstance(item.get("index"), int) for item in merged):
+            merged.sort(key=lambda item: item["index"])
+        return merged
+
+    def _merge_results_pages(self, bulk_id: str, pages: List[Dict]) -> Dict:
+        total_items = None
+        items = []
+        failed_items = []
+        response_bulk_id = bulk_id
+
+        for page in pages:
+            response_bulk_id = page.get("bulk_id", response_bulk_id)
+            total_items, page_items, page_failed_items = self._unpack_results_page(page)
+
+            items.extend(page_items)
+            failed_items.extend(page_failed_items)
+
+        return {
+            "bulk_id": response_bulk_id,
+            "total_items": total_items or 0,
+            "items": items,
+            "failed_items": failed_items,
+        }
+
+    @staticmethod
+    def _file_upload_data(public_dashboard_link: bool) -> Dict[str, str]:
+        return {"public_dashboard_link": str(public_dashboard_link).lower()}
+
+    @staticmethod
+    def _plagiarism_payload(text: str) -> Dict[str, str]:
+        return {
+            "text": text,
+            "source": SOURCE_VERSION,
+        }
+
+    def _parse_plagiarism_response(self, response) -> Dict:
+        if response.status_code != 200:
+            raise PangramAPIError(
+                f"Error returned by API: [{response.status_code}] {response.text}",
+                status_code=response.status_code,
+                retry_after=self._retry_after(response),
+            )
+        try:
+            response_json = self._json_codec.loads(response.content)
+        except ValueError as exc:
+            raise PangramAPIError(
+                f"Error returned by API: non-JSON response: {response.text}",
+                status_code=response.status_code,
+            ) from exc
+        if "error" in response_json:
+            raise PangramAPIError(f"Error returned by API: {response_json['error']}", status_code=response.status_code)
+        return response_json
+
+
+class _BulkHarvest:
+    """Tracks which items of a running bulk job have been delivered, for :meth:`PangramText.iter_bulk_completed`."""
+
+    def __init__(self, page_size: int) -> None:
+        self.page_size = page_size
+        self.total_items: Optional[int] = None
+        self.delivered = bytearray()
+        self.delivered_count = 0
+        self.pending_offsets = [0]
+
+    def finished_count(self, status: Dict) -> Optional[int]:
+        succeeded = status.get("succeeded")
+        failed = status.get("failed")
+        if isinstance(succeeded, int) and isinstance(failed, int):
+            return succeeded + failed
+        return None
+
+    def needs_pages(self, status: Dict, terminal: bool) -> bool:
+        """Whether the status reports finished items that have not been delivered yet."""
+        if terminal or self.total_items is None:
+            return True
+        finished = self.finished_count(status)
+        return finished is None or finished > self.delivered_count
+
+    def caught_up(self, status: Dict, terminal: bool) -> bool:
+        """Whether every item the status reports as finished has been delivered."""
+        if terminal:
+            return False
+        finished = self.finished_count(status)
+        return finished is not None and self.delivered_count >= finished
+
+    def next_offset(self, after: int) -> Optional[int]:
+        """Return the first page offset past ``after`` that still has undelivered items."""
+        position = bisect.bisect_right(self.pending_offsets, after)
+        if position < len(self.pending_offsets):
+            return self.pending_offsets[position]
+        return None
+
+    def take(self, offset: int, page: Dict) -> List[Dict]:
+        """Return the newly finished items of the page at ``offset`` and mark them delivered."""
+        total_items, page_items, page_failed_items = _PangramClientBase._unpack_results_page(page)
+        if self.total_items is None:
+            self.total_items = total_items
+            self.delivered = bytearray(total_items)
+            self.pending_offsets = list(range(0, total_items, self.page_size))
+        finished = []
+        for position, item in enumerate(_PangramClientBase._tagged_results_page(page_items, page_failed_items)):
+            index = item.get("index")
+            if not isinstance(index, int):
+                index = offset + position
+            if not item.get("failed") and item.get("result") is None:
+                continue
+            if index >= len(self.delivered):
+                self.delivered.extend(bytes(index + 1 - len(self.delivered)))
+            if self.delivered[index]:
+                continue
+            self.delivered[index] = 1
+            self.delivered_count += 1
+            finished.append(item)
+        page_end = min(offset + self.page_size, self.total_items)
+        if offset in self.pending_offsets and all(self.delivered[offset:page_end]):
+            self.pending_offsets.remove(offset)
+        return finished
+
+
+class PangramText(_PangramClientBase):
+    _request_errors = (requests.RequestException,)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        session: Optional[requests.Session] = None,
+        poller_workers: int = DEFAULT_POLLER_WORKERS,
+        polling: Optional[PollingStrategy] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResultCache] = None,
+        compression: Optional[RequestCompression] = None,
+        json_codec: Optional[JSONCodec] = None,
+        api_endpoint: Optional[str] = None,
+        file_upload_endpoint: Optional[str] = None,
+        plagiarism_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        A classifier for text inputs using the Pangram Labs API.
+
+        The client owns a pooled, keep-alive HTTP session that is shared by every
+        call, so repeated submits and polls reuse open connections instead of
+        paying a new TCP and TLS handshake each time. The session is safe to
+        share across threads. Call :meth:`close` or use the client as a context
+        manager to release pooled connections.
+
+        :param api_key: Your API key for the Pangram Labs. If not provided, the environment variable PANGRAM_API_KEY will be used.
+        :type api_key: str, optional
+        :param pool_connections: Number of per-host connection pools to keep. Defaults to 10.
+        :type pool_connections: int
+        :param pool_maxsize: Maximum number of kept-alive connections per host. Defaults to 10.
+        :type pool_maxsize: int
+        :param pool_block: Whether to block when a host's pool is exhausted instead of opening
+                           extra, non-pooled connections. Set this to enforce ``pool_maxsize`` as a hard per-host limit.
+        :type pool_block: bool
+        :param session: An existing ``requests.Session`` to use instead of creating one. The client
+                        does not close sessions it did not create.
+        :type session: requests.Session, optional
+        :param poller_workers: Number of threads the shared task poller uses to check outstanding
+                               predictions for :meth:`submit_prediction` and :meth:`predict_many`. Defaults to 4.
+        :type poller_workers: int
+        :param polling: Default polling strategy for :meth:`predict`, :meth:`wait_for_bulk`, and the
+                        task poller, e.g. :class:`pangram.polling.AdaptivePolling`. When unset, calls poll at
+                        their fixed ``poll_interval``.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param retry: Retry policy for transient failures (429, 5xx, connection errors) on submits,
+                      uploads, and result fetches. Defaults to :class:`pangram.retry.RetryPolicy` with 3 attempts;
+                      pass ``pangram.retry.NO_RETRY`` to disable. Retry counts are recorded in :attr:`metrics`.
+        :type retry: pangram.retry.RetryPolicy, optional
+        :param rate_limiter: Client-side request budgets for submits, status polls, and bulk result pages.
+                             Every request (including retries) waits for its budget before it is sent. Share one
+                             limiter between clients, or use :meth:`pangram.rate_limit.RateLimiter.shared` to share
+                             it between processes. Defaults to no client-side limit.
+        :type rate_limiter: pangram.rate_limit.RateLimiter, optional
+        :param cache: Result cache consulted by :meth:`predict`, :meth:`submit_prediction`,
+                      :meth:`predict_many`, :meth:`batch_predict`, :meth:`predict_files`, and
+                      :meth:`submit_bulk`. Cache hits are answered without a request, and completed
+                      results (including bulk results pages) are stored. Defaults to no cache.
+        :type cache: pangram.cache.ResultCache, optional
+        :param compression: Gzip large JSON bodies sent to the prediction, bulk, and plagiarism endpoints,
+                            and request compressed bulk results pages. Bytes saved are recorded in
+                            :attr:`metrics` as ``compression.bytes_saved`` and ``compression.response_bytes_saved``.
+                            Defaults to uncompressed requests.
+        :type compression: pangram.compression.RequestCompression, optional
+        :param json_codec: Codec used to encode every request body and decode every response, working
+                           directly on bytes. Pass :func:`pangram.codec.fastest_codec` to use orjson or
+                           msgspec when installed. Defaults to the standard library ``json`` module.
+        :type json_codec: pangram.codec.JSONCodec, optional
+        :param api_endpoint: Base URL of the prediction and Bulk API endpoints, e.g. a
+                             :class:`pangram.testing.FakePangramServer`. Defaults to Pangram's API.
+        :type api_endpoint: str, optional
+        :param file_upload_endpoint: URL of the file upload endpoint. Defaults to Pangram's API.
+        :type file_upload_endpoint: str, optional
+        :param plagiarism_endpoint: URL of the plagiarism endpoint. Defaults to Pangram's API.
+        :type plagiarism_endpoint: str, optional
+        :raises ValueError: If the API key is not provided and not set in the environment, or if pool or poller sizes are invalid.
+        """
+        self._init_api_key(api_key)
+        self._init_endpoints(api_endpoint, file_upload_endpoint, plagiarism_endpoint)
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError("pool_connections and pool_maxsize must be at least 1")
+        if poller_workers < 1:
+            raise ValueError("poller_workers must be at least 1")
+        self._poller_workers = poller_workers
+        self._polling = polling
+        self._retry_policy = retry if retry is not None else RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self.cache = cache
+        self._compression = compression
+        if json_codec is not None:
+            self._json_codec = json_codec
+        self.metrics = ClientMetrics()
+        self._poller: Optional[TaskPoller] = None
+        self._poller_lock = threading.Lock()
+
+        if session is None:
+            self._session = self._build_session(pool_connections, pool_maxsize, pool_block)
+            self._owns_session = True
+        else:
+            self._session = session
+            self._owns_session = False
+
+    @staticmethod
+    def _build_session(pool_connections: int, pool_maxsize: int, pool_block: bool) -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close the client's pooled HTTP connections.
+
+        Outstanding futures from :meth:`submit_prediction` are cancelled.
+        Sessions passed in by the caller are left open.
+        """
+        with self._poller_lock:
+            poller, self._poller = self._poller, None
+        if poller is not None:
+            poller.close()
+        if self._owns_session:
+            self._session.close()
+
+    def _get_poller(self) -> TaskPoller:
+        with self._poller_lock:
+            if self._poller is None:
+                self._poller = TaskPoller(
+                    self._check_prediction_task,
+                    max_workers=self._poller_workers,
+                    is_retryable=self.is_transient_error,
+                )
+            return self._poller
+
+    @property
+    def polling(self) -> Optional[PollingStrategy]:
+        """The client's default polling strategy, or None when calls poll at their fixed ``poll_interval``."""
+        return self._polling
+
+    def __enter__(self) -> "PangramText":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _is_retryable_exception(self, exc: requests.RequestException, idempotent: bool) -> bool:
+        if idempotent:
+            return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+        return isinstance(exc, requests.ConnectTimeout)
+
+    def _wait_for_rate_limit(self, category: str, operation: str, deadline: Optional[float]) -> None:
+        if self._rate_limiter is None:
+            return
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self._rate_limiter.acquire(category, timeout=timeout):
+            raise TimeoutError(f"Pangram client rate limit left no budget for {operation} before the deadline")
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        operation: str,
+        idempotent: bool,
+        rate_limit: str,
+        deadline: Optional[float] = None,
+        retry: bool = True,
+        on_retry: Optional[Callable[[], None]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Send a request over the shared session, retrying transient failures per the retry policy.
+
+        When ``deadline`` is given, each attempt's timeout is derived from the
+        time remaining and no retry starts after it. Each attempt first waits
+        for budget in the ``rate_limit`` category when a rate limiter is set.
+        The final response is returned as-is for the caller to validate.
+        """
+        send = self._session.get if method == "GET" else self._session.post
+        policy = self._retry_policy
+        retry_deadline = deadline if deadline is not None else time.monotonic() + policy.max_elapsed
+        attempt = 0
+        while True:
+            attempt += 1
+            self._wait_for_rate_limit(rate_limit, operation, deadline)
+            if deadline is not None:
+                kwargs["timeout"] = self._request_timeout(deadline)
+            self.metrics.increment("requests")
+            try:
+                response = send(url, **kwargs)
+            except requests.RequestException as exc:
+                if not retry or attempt >= policy.max_attempts or not self._is_retryable_exception(exc, idempotent):
+                    raise
+                delay = policy.backoff(attempt)
+                if time.monotonic() + delay >= retry_deadline:
+                    raise
+            else:
+                if not retry or attempt >= policy.max_attempts or not policy.should_retry_status(response.status_code, idempotent):
+                    return response
+                delay = policy.backoff(attempt, self._retry_after(response))
+                if time.monotonic() + delay >= retry_deadline:
+                    return response
+
+            self.metrics.increment("retries")
+            self.metrics.increment(f"retries.{operation}")
+            time.sleep(delay)
+            if on_retry is not None:
+                on_retry()
+
+    def _json_body(self, payload: Dict) -> Dict:
+        """Return the ``_send`` keyword arguments carrying ``payload``, gzipped when compression applies."""
+        body = self._json_codec.dumps(payload)
+        compressed = self._compression.compress(body) if self._compression is not None else None
+        if compressed is None:
+            return {"data": body, "headers": self._headers()}
+        self.metrics.increment("compression.requests")
+        self.metrics.increment("compression.bytes_saved", len(body) - len(compressed))
+        return {"data": compressed, "headers": {**self._headers(), "Content-Encoding": "gzip"}}
+
+    def _record_response_compression(self, response: requests.Response) -> None:
+        headers = getattr(response, "headers", None) or {}
+        encoded_length = headers.get("Content-Length")
+        if headers.get("Content-Encoding") not in ("gzip", "deflate") or not str(encoded_length).isdigit():
+            return
+        saved = len(response.content) - int(encoded_length)
+        if saved > 0:
+            self.metrics.increment("compression.response_bytes_saved", saved)
+
+    def _cache_key(self, text: str, public_dashboard_link: bool) -> Optional[str]:
+        if self.cache is None:
+            return None
+        return self.cache.key_for_text(text, public_dashboard_link=public_dashboard_link)
+
+    def _cached_result(self, key: Optional[str], text: Optional[str] = None) -> Optional[Dict]:
+        if key is None:
+            return None
+        result = self.cache.get(key)
+        self.metrics.increment("cache.hits" if result is not None else "cache.misses")
+        if result is not None and text is not None and result.get("text") != text:
+            # A normalizing cache matched a same-length variant; echo the caller's text at the same offsets.
+            result["text"] = text
+            for window in result.get("windows") or []:
+                if isinstance(window, dict) and isinstance(window.get("start_index"), int) and isinstance(window.get("end_index"), int):
+                    window["text"] = text[window["start_index"] : window["end_index"]]
+        return result
+
+    def _store_result(self, key: Optional[str], result: Union[Dict, ResultObject]) -> None:
+        if key is None:
+            return
+        # A lazy result is stored from its raw JSON, so caching it does not decode its windows.
+        raw = result.raw_json if isinstance(result, LazyPrediction) else None
+        if raw is not None:
+            self.cache.set_json(key, raw, version=result.version)
+        else:
+            self.cache.set(key, result.to_dict() if isinstance(result, ResultObject) else result)
+
+    def _store_bulk_page(self, page: Dict) -> None:
+        # Bulk tasks never create dashboard links, so their results answer plain predict() calls.
+        if self.cache is None:
+            return
+        for item in page.get("items") or []:
+            result = item.get("result") if isinstance(item, dict) else None
+            if isinstance(result, Mapping) and isinstance(result.get("text"), str):
+                self._store_result(self._cache_key(result["text"], False), result)
+
     def submit_bulk(
         self,
         text: Optional[List[str]] = None,
         items: Optional[List[Dict[str, str]]] = None,
+        dedupe: Union[bool, TextNormalizer] = False,
     ) -> Dict:
         """
         Submit a Bulk API job for asynchronous AI detection.
@@ -74,60 +641,278 @@ class PangramText:
         ``id``. The response includes a ``bulk_id`` for polling and immediate
         per-item validation failures, if any.
 
+        When the client has a result cache, items whose text is cached are
+        not submitted. They are returned in ``cached_items`` as dictionaries
+        with ``index``, optional ``id``, and ``result``. Only the remaining
+        items are sent; ``index`` values in ``accepted_items`` and
+        ``failed_items`` are mapped back to positions in the original input,
+        and ``submitted_indices[i]`` gives the original position of the job's
+        item ``i`` for joining results pages. If every item is cached, no
+        job is created and ``bulk_id`` is ``None``.
+
+        With ``dedupe``, inputs whose normalized text matches an earlier
+        input are not submitted. They are listed in ``duplicate_items`` with
+        their ``index``, optional ``id``, and ``duplicate_of``, the position
+        of the submitted copy; ``accepted_items``, ``failed_items``, and
+        ``cached_items`` are copied to each duplicate, and ``deduplicated``
+        counts the submissions saved. Pass the response and the job's results
+        to :func:`pangram.dedup.fan_out_bulk_items` to get one result item per
+        input.
+
         :param text: A list of input texts to analyze.
         :type text: List[str], optional
         :param items: A list of item dictionaries. Each item must include
                       ``text`` and may include ``id``.
         :type items: List[Dict[str, str]], optional
+        :param dedupe: Submit each unique text once. Pass a :class:`pangram.dedup.TextNormalizer`
+                       to choose how texts are compared; True collapses whitespace and applies
+                       Unicode NFC. Defaults to False.
+        :type dedupe: Union[bool, pangram.dedup.TextNormalizer]
         :return: Bulk submission response containing ``bulk_id``, ``status``,
-                 ``total_items``, ``accepted_items``, and ``failed_items``.
+                 ``total_items``, ``accepted_items``, and ``failed_items``, plus
+                 ``cached_items`` and ``submitted_indices`` when a cache is set and
+                 ``duplicate_items``, ``deduplicated``, and ``submitted_indices`` with ``dedupe``.
         :rtype: Dict
         :raises ValueError: If both or neither payload shapes are provided, or
                             if the API returns an error.
         """
-        if (text is None and items is None) or (text is not None and items is not None):
-            raise ValueError("Provide exactly one of text or items")
+        payload = self._bulk_payload(text, items)
+        normalizer = resolve_normalizer(dedupe)
+        if normalizer is not None:
+            return self._submit_bulk_deduplicated(payload, normalizer)
+        return self._submit_bulk_payload(payload)
+
+    def _submit_bulk_payload(self, payload: Dict) -> Dict:
+        if self.cache is not None:
+            return self._submit_bulk_with_cache(payload)
+        return self._post_bulk(payload)
+
+    def _submit_bulk_deduplicated(self, payload: Dict, normalizer: Callable[[str], str]) -> Dict:
+        key = "text" if "text" in payload else "items"
+        plan = DedupPlan(payload[key], normalizer)
+        self.metrics.increment("dedup.saved", plan.saved)
+        response_json = self._submit_bulk_payload({key: plan.unique(payload[key])})
+        # Indices in the response are positions in the unique list; map them to input positions.
+        for item_key in ("accepted_items", "failed_items", "cached_items"):
+            if item_key not in response_json:
+                continue
+            items = response_json.get(item_key) or []
+            for item in items:
+                index = item.get("index") if isinstance(item, dict) else None
+                if isinstance(index, int) and 0 <= index < len(plan.unique_indices):
+                    item["index"] = plan.unique_indices[index]
+            response_json[item_key] = plan.fan_out_items(items)
+        submitted = response_json.get("submitted_indices", range(len(plan.unique_indices)))
+        response_json["submitted_indices"] = [plan.unique_indices[index] for index in submitted]
+        response_json["duplicate_items"] = plan.duplicate_items
+        response_json["deduplicated"] = plan.saved
+        return response_json
+
+    def _submit_bulk_with_cache(self, payload: Dict) -> Dict:
+        if "text" in payload:
+            entries = [{"text": entry} for entry in payload["text"]]
+        else:
+            entries = payload["items"]
+
+        cached_items = []
+        submitted_indices = []
+        for index, entry in enumerate(entries):
+            entry_text = entry.get("text") if isinstance(entry, dict) else None
+            result = self._cached_result(self._cache_key(entry_text, False), entry_text) if isinstance(entry_text, str) else None
+            if result is None:
+                submitted_indices.append(index)
+                continue
+            cached_item = {"index": index, "result": result}
+            if "id" in entry:
+                cached_item["id"] = entry["id"]
+            cached_items.append(cached_item)
+
+        if not submitted_indices:
+            return {
+                "bulk_id": None,
+                "status": "succeeded",
+                "total_items": 0,
+                "accepted_items": [],
+                "failed_items": [],
+                "cached_items": cached_items,
+                "submitted_indices": [],
+            }
+
+        if "text" in payload:
+            submitted_payload = {"text": [payload["text"][index] for index in submitted_indices]}
+        else:
+            submitted_payload = {"items": [payload["items"][index] for index in submitted_indices]}
+        response_json = self._post_bulk(submitted_payload)
+        for key in ("accepted_items", "failed_items"):
+            for item in response_json.get(key) or []:
+                if isinstance(item, dict) and isinstance(item.get("index"), int) and item["index"] < len(submitted_indices):
+                    item["index"] = submitted_indices[item["index"]]
+        response_json["cached_items"] = cached_items
+        response_json["submitted_indices"] = submitted_indices
+        return response_json
+
+    def submit_bulk_chunked(
+        self,
+        text: Optional[List[str]] = None,
+        items: Optional[List[Dict[str, str]]] = None,
+        max_items_per_job: Optional[int] = None,
+        max_bytes_per_job: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        dedupe: Union[bool, TextNormalizer] = False,
+    ) -> "ChunkedBulkJob":
+        """
+        Submit a large Bulk API payload as several jobs and return one handle for all of them.
+
+        The input is split into contiguous chunks by item count, serialized
+        size, and billable units (at most 1,000 per job), and the chunks are
+        submitted concurrently with :meth:`submit_bulk`. The returned
+        :class:`pangram.bulk.ChunkedBulkJob` aggregates status, waiting, and
+        results across the underlying ``bulk_id`` values, reporting every item
+        at its position in the original input with its ``id`` unchanged.
+
+        With ``dedupe``, duplicates are found across the whole input before
+        it is split, each unique text is submitted once, and its results are
+        copied to every duplicate with the duplicate's own ``index`` and ``id``.
+
+        :param text: A list of input texts to analyze.
+        :type text: List[str], optional
+        :param items: A list of item dictionaries. Each item must include
+                      ``text`` and may include ``id``.
+        :type items: List[Dict[str, str]], optional
+        :param max_items_per_job: Maximum items per job. Defaults to 1000.
+        :type max_items_per_job: int, optional
+        :param max_bytes_per_job: Maximum serialized request size per job. Defaults to 4 MiB.
+        :type max_bytes_per_job: int, optional
+        :param max_workers: Maximum number of jobs submitted at once. Defaults to 4.
+        :type max_workers: int, optional
+        :param dedupe: Submit each unique text once. See :meth:`submit_bulk`. Defaults to False.
+        :type dedupe: Union[bool, pangram.dedup.TextNormalizer]
+        :return: A handle for the submitted jobs.
+        :rtype: pangram.bulk.ChunkedBulkJob
+        :raises ValueError: If both or neither payload shapes are provided, if a limit is
+                            invalid, or if any job fails to submit. The error lists the
+                            ``bulk_id`` values of jobs that were already created.
+        """
+        from pangram.bulk import (
+            DEFAULT_BULK_CHUNK_BYTES,
+            DEFAULT_BULK_CHUNK_ITEMS,
+            DEFAULT_BULK_SUBMIT_WORKERS,
+            BulkChunk,
+            ChunkedBulkJob,
+            chunk_bulk_entries,
+        )
 
-        payload = {"items": items} if items is not None else {"text": text}
+        payload = self._bulk_payload(text, items)
+        entries = payload.get("items") if "items" in payload else payload["text"]
+        total_items = len(entries)
+        normalizer = resolve_normalizer(dedupe)
+        plan = DedupPlan(entries, normalizer) if normalizer is not None else None
+        if plan is not None:
+            self.metrics.increment("dedup.saved", plan.saved)
+            entries = plan.unique(entries)
+            positions = plan.unique_indices
+        else:
+            positions = range(total_items)
+        max_workers = DEFAULT_BULK_SUBMIT_WORKERS if max_workers is None else max_workers
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        ranges = chunk_bulk_entries(
+            entries,
+            max_items=DEFAULT_BULK_CHUNK_ITEMS if max_items_per_job is None else max_items_per_job,
+            max_bytes=DEFAULT_BULK_CHUNK_BYTES if max_bytes_per_job is None else max_bytes_per_job,
+        )
+
+        def submit_chunk(chunk_range: range) -> BulkChunk:
+            chunk_entries = entries[chunk_range.start:chunk_range.stop]
+            if "items" in payload:
+                response_json = self.submit_bulk(items=chunk_entries)
+            else:
+                response_json = self.submit_bulk(text=chunk_entries)
+            submitted = response_json.get("submitted_indices", range(len(chunk_entries)))
+            for key in ("accepted_items", "failed_items", "cached_items"):
+                for item in response_json.get(key) or []:
+                    index = item.get("index") if isinstance(item, dict) else None
+                    if isinstance(index, int) and 0 <= index < len(chunk_range):
+                        item["index"] = positions[chunk_range[index]]
+                if plan is not None and response_json.get(key):
+                    response_json[key] = plan.fan_out_items(response_json[key])
+            cached_items = [
+                {**item, "stage": ASYNC_SUCCESS_STAGE, "error": None, "cached": True}
+                for item in response_json.get("cached_items") or []
+            ]
+            return BulkChunk(
+                response_json.get("bulk_id"),
+                [positions[chunk_range[index]] for index in submitted],
+                cached_items,
+                response_json,
+                plan,
+            )
+
+        chunks: List[Optional[BulkChunk]] = [None] * len(ranges)
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(max_workers, max(1, len(ranges)))) as executor:
+            futures = {executor.submit(submit_chunk, chunk_range): position for position, chunk_range in enumerate(ranges)}
+            for future, position in futures.items():
+                try:
+                    chunks[position] = future.result()
+                except Exception as exc:
+                    errors.append((ranges[position], exc))
+        if errors:
+            created = [chunk.bulk_id for chunk in chunks if chunk is not None and chunk.bulk_id is not None]
+            failed_range, first_error = errors[0]
+            raise ValueError(
+                f"Pangram bulk chunk for items {positions[failed_range.start]}-{positions[failed_range.stop - 1]} failed to submit "
+                f"({len(errors)} of {len(ranges)} chunks failed): {first_error}; already submitted bulk jobs: {created}"
+            ) from first_error
+        return ChunkedBulkJob(self, chunks, total_items)
+
+    def _post_bulk(self, payload: Dict) -> Dict:
         try:
-            response = requests.post(
-                f"{API_ENDPOINT}/bulk",
-                json=payload,
-                headers=self._headers(),
+            response = self._send(
+                "POST",
+                f"{self.api_endpoint}/bulk",
+                operation="submit_bulk",
+                idempotent=False,
+                rate_limit=SUBMIT,
                 timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
+                **self._json_body(payload),
             )
         except requests.RequestException as exc:
             raise ValueError(f"Pangram API request failed while submitting bulk job: {exc}") from exc
         response_json = self._parse_response_json(response, expected_status_codes=(202,))
-        if not isinstance(response_json, dict):
-            raise ValueError(f"Error returned by API: invalid bulk response: {response_json}")
-        return response_json
-
-    def _fetch_bulk_status(self, bulk_id: str, request_timeout: float) -> Dict:
-        response = requests.get(
-            f"{API_ENDPOINT}/bulk/{bulk_id}",
+        return self._require_dict(response_json, "bulk response")
+
+    def _fetch_bulk_status(self, bulk_id: str, request_timeout: float, retry: bool = False) -> Dict:
+        response = self._send(
+            "GET",
+            f"{self.api_endpoint}/bulk/{bulk_id}",
+            operation="get_bulk_status",
+            idempotent=True,
+            rate_limit=POLL,
+            retry=retry,
             headers=self._headers(),
             timeout=request_timeout,
         )
         response_json = self._parse_response_json(response)
-        if not isinstance(response_json, dict):
-            raise ValueError(f"Error returned by API: invalid bulk status response: {response_json}")
-        return response_json
+        return self._require_dict(response_json, "bulk status response")
 
-    def get_bulk_status(self, bulk_id: str) -> Dict:
+    def get_bulk_status(self, bulk_id: str, typed: bool = False) -> Union[Dict, BulkStatus]:
         """
         Fetch the current status for a Bulk API job.
 
         :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
         :type bulk_id: str
+        :param typed: Return a :class:`pangram.results.BulkStatus` instead of a dict. Defaults to False.
+        :type typed: bool
         :return: Bulk status response containing counters and timestamps.
-        :rtype: Dict
+        :rtype: Union[Dict, pangram.results.BulkStatus]
         :raises ValueError: If the API returns an error or an invalid response.
         """
         try:
-            return self._fetch_bulk_status(bulk_id, HTTP_REQUEST_TIMEOUT_SECONDS)
+            status = self._fetch_bulk_status(bulk_id, HTTP_REQUEST_TIMEOUT_SECONDS, retry=True)
         except requests.RequestException as exc:
             raise ValueError(f"Pangram API request failed while fetching bulk status: {exc}") from exc
+        return BulkStatus.from_dict(status) if typed else status
 
     def get_bulk_items(self, bulk_id: str, offset: int = 0, limit: int = 100) -> Dict:
         """
@@ -144,8 +929,12 @@ class PangramText:
         :raises ValueError: If the API returns an error or an invalid response.
         """
         try:
-            response = requests.get(
-                f"{API_ENDPOINT}/bulk/{bulk_id}/items",
+            response = self._send(
+                "GET",
+                f"{self.api_endpoint}/bulk/{bulk_id}/items",
+                operation="get_bulk_items",
+                idempotent=True,
+                rate_limit=POLL,
                 params={"offset": offset, "limit": limit},
                 headers=self._headers(),
                 timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
@@ -153,11 +942,9 @@ class PangramText:
         except requests.RequestException as exc:
             raise ValueError(f"Pangram API request failed while fetching bulk items: {exc}") from exc
         response_json = self._parse_response_json(response)
-        if not isinstance(response_json, dict):
-            raise ValueError(f"Error returned by API: invalid bulk items response: {response_json}")
-        return response_json
+        return self._require_dict(response_json, "bulk items response")
 
-    def get_bulk_results_page(self, bulk_id: str, offset: int = 0, limit: int = 100) -> Dict:
+    def get_bulk_results_page(self, bulk_id: str, offset: int = 0, limit: int = 100, lazy: bool = False) -> Dict:
         """
         Fetch one page of results for a Bulk API job.
 
@@ -172,83 +959,269 @@ class PangramText:
         :type offset: int
         :param limit: Maximum number of items to return. The API allows up to 1000.
         :type limit: int
+        :param lazy: Return each ``result`` as a :class:`pangram.lazy.LazyPrediction`, which decodes
+                     ``windows`` and ``text`` only when they are read. Defaults to False.
+        :type lazy: bool
         :return: Paginated bulk result response.
         :rtype: Dict
         :raises ValueError: If the API returns an error or an invalid response.
         """
+        headers = self._headers()
+        if self._compression is not None:
+            headers["Accept-Encoding"] = self._compression.accept_encoding
         try:
-            response = requests.get(
-                f"{API_ENDPOINT}/bulk/{bulk_id}/results",
+            response = self._send(
+                "GET",
+                f"{self.api_endpoint}/bulk/{bulk_id}/results",
+                operation="get_bulk_results_page",
+                idempotent=True,
+                rate_limit=BULK_PAGE,
                 params={"offset": offset, "limit": limit},
-                headers=self._headers(),
+                headers=headers,
                 timeout=HTTP_REQUEST_TIMEOUT_SECONDS,
             )
         except requests.RequestException as exc:
             raise ValueError(f"Pangram API request failed while fetching bulk results: {exc}") from exc
-        response_json = self._parse_response_json(response)
-        if not isinstance(response_json, dict):
-            raise ValueError(f"Error returned by API: invalid bulk results response: {response_json}")
-        return response_json
-
-    def get_bulk_results(self, bulk_id: str, page_size: int = MAX_BULK_PAGE_LIMIT) -> Dict:
+        if self._compression is not None:
+            self._record_response_compression(response)
+        decode = functools.partial(lazy_results_page, codec=self._json_codec) if lazy else None
+        response_json = self._parse_response_json(response, decode=decode)
+        page = self._require_dict(response_json, "bulk results response")
+        self._store_bulk_page(page)
+        return page
+
+    def _results_page_fetcher(self, lazy: bool, typed: bool = False) -> Callable[..., Dict]:
+        fetch_page = functools.partial(self.get_bulk_results_page, lazy=True) if lazy else self.get_bulk_results_page
+        if not typed:
+            return fetch_page
+
+        # Convert each page as soon as it arrives, so at most one dict page per worker is alive at a time.
+        def fetch_typed_page(*args, **kwargs) -> Dict:
+            return typed_bulk_results(fetch_page(*args, **kwargs))
+
+        return fetch_typed_page
+
+    def get_bulk_results(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        max_workers: int = DEFAULT_BULK_PAGE_WORKERS,
+        typed: bool = False,
+        lazy: bool = False,
+    ) -> Dict:
         """
         Fetch all available results for a Bulk API job.
 
         This helper follows the paginated ``/bulk/{bulk_id}/results`` endpoint
-        until every submitted item index has been covered. Failed items are
-        returned separately in ``failed_items``. If the job is still running,
-        unfinished accepted items are included in ``items`` with ``result`` set
-        to ``None``.
+        until every submitted item index has been covered. The first page
+        reports ``total_items``; the remaining pages are then fetched
+        concurrently by up to ``max_workers`` threads and reassembled in
+        offset order. Each page request is retried on its own under the
+        client's retry policy, so one slow or failed page does not restart the
+        download. Failed items are returned separately in ``failed_items``. If
+        the job is still running, unfinished accepted items are included in
+        ``items`` with ``result`` set to ``None``.
 
         :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
         :type bulk_id: str
         :param page_size: Number of submitted item slots to request per API call.
                           The API allows up to 1000.
         :type page_size: int
+        :param max_workers: Maximum number of pages fetched at once. Use 1 to fetch pages sequentially. Defaults to 4.
+        :type max_workers: int
+        :param typed: Return ``items`` and ``failed_items`` as compact :class:`pangram.results.BulkItem`
+                      objects, which use a fraction of the memory of dicts. Defaults to False.
+        :type typed: bool
+        :param lazy: Decode each item's ``windows`` and ``text`` only when they are read.
+                     See :meth:`get_bulk_results_page`. Defaults to False.
+        :type lazy: bool
         :return: Aggregated bulk result response containing ``bulk_id``,
                  ``total_items``, ``items``, and ``failed_items``.
         :rtype: Dict
-        :raises ValueError: If page_size is invalid, or if the API returns an
+        :raises ValueError: If page_size or max_workers is invalid, or if the API returns an
                             error or invalid response.
         """
-        if page_size < 1 or page_size > MAX_BULK_PAGE_LIMIT:
-            raise ValueError(f"page_size must be between 1 and {MAX_BULK_PAGE_LIMIT}")
+        self._validate_page_size(page_size)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        fetch_page = self._results_page_fetcher(lazy, typed)
+        first_page = fetch_page(bulk_id, offset=0, limit=page_size)
+        total_items, _, _ = self._unpack_results_page(first_page)
+        offsets = range(page_size, total_items, page_size)
+        pages = [first_page]
+        if max_workers == 1 or len(offsets) <= 1:
+            pages.extend(fetch_page(bulk_id, offset=offset, limit=page_size) for offset in offsets)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(offsets)), thread_name_prefix="pangram-bulk-pages"
+            ) as executor:
+                pages.extend(executor.map(lambda offset: fetch_page(bulk_id, offset=offset, limit=page_size), offsets))
+        return self._merge_results_pages(bulk_id, pages)
 
-        offset = 0
-        total_items = None
-        items = []
-        failed_items = []
-        response_bulk_id = bulk_id
+    def iter_bulk_results(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        offset: int = 0,
+        prefetch: bool = True,
+        typed: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[Union[Dict, BulkItem]]:
+        """
+        Stream the results of a Bulk API job one item at a time.
 
-        while total_items is None or offset < total_items:
-            page = self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
-            response_bulk_id = page.get("bulk_id", response_bulk_id)
-            page_total = page.get("total_items")
-            if not isinstance(page_total, int):
-                raise ValueError(f"Error returned by API: invalid bulk results total_items: {page}")
-            total_items = page_total
+        Unlike :meth:`get_bulk_results`, at most two pages are held in memory
+        at once, so jobs of any size can be processed as they are read. Items
+        are yielded in submitted item order. Failed items are yielded in
+        place with ``"failed": True`` added; other items have the same shape
+        as in :meth:`get_bulk_results`. To resume an interrupted read, pass
+        the ``index`` of the next unprocessed item as ``offset``.
 
-            page_items = page.get("items")
-            page_failed_items = page.get("failed_items")
-            if not isinstance(page_items, list) or not isinstance(page_failed_items, list):
-                raise ValueError(f"Error returned by API: invalid bulk results page: {page}")
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param offset: Zero-based item offset to start from. Defaults to 0.
+        :type offset: int
+        :param prefetch: Whether to fetch the next page in a background thread while
+                         the current page is consumed. Defaults to True.
+        :type prefetch: bool
+        :param typed: Yield :class:`pangram.results.BulkItem` objects instead of dicts. Defaults to False.
+        :type typed: bool
+        :param lazy: Decode each item's ``windows`` and ``text`` only when they are read.
+                     See :meth:`get_bulk_results_page`. Defaults to False.
+        :type lazy: bool
+        :return: An iterator of result items.
+        :rtype: Iterator[Union[Dict, pangram.results.BulkItem]]
+        :raises ValueError: If page_size or offset is invalid, or if the API returns an
+                            error or invalid response while iterating.
+        """
+        pages = self.iter_bulk_results_pages(bulk_id, page_size, offset, prefetch, typed, lazy)
+        return itertools.chain.from_iterable(pages)
 
-            items.extend(page_items)
-            failed_items.extend(page_failed_items)
-            offset += page_size
+    def iter_bulk_results_pages(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        offset: int = 0,
+        prefetch: bool = True,
+        typed: bool = False,
+        lazy: bool = False,
+    ) -> Iterator[List[Union[Dict, BulkItem]]]:
+        """
+        Stream the results of a Bulk API job one page at a time.
 
-        return {
-            "bulk_id": response_bulk_id,
-            "total_items": total_items or 0,
-            "items": items,
-            "failed_items": failed_items,
-        }
+        Each page is a list of the items :meth:`iter_bulk_results` yields for
+        it, in the same order. The ``n``-th page covers item slots from
+        ``offset + n * page_size``, so a reader that records its progress
+        after each page can resume by passing the next page's start as
+        ``offset``.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param offset: Zero-based item offset to start from. Defaults to 0.
+        :type offset: int
+        :param prefetch: Whether to fetch the next page in a background thread while
+                         the current page is consumed. Defaults to True.
+        :type prefetch: bool
+        :param typed: Return :class:`pangram.results.BulkItem` objects instead of dicts. Defaults to False.
+        :type typed: bool
+        :param lazy: Decode each item's ``windows`` and ``text`` only when they are read.
+                     See :meth:`get_bulk_results_page`. Defaults to False.
+        :type lazy: bool
+        :return: An iterator of pages, each a list of result items.
+        :rtype: Iterator[List[Union[Dict, pangram.results.BulkItem]]]
+        :raises ValueError: If page_size or offset is invalid, or if the API returns an
+                            error or invalid response while iterating.
+        """
+        self._validate_page_size(page_size)
+        self._validate_offset(offset)
+        pages = self._iter_tagged_results_pages(bulk_id, page_size, offset, prefetch, lazy)
+        return ([BulkItem.from_dict(item) for item in items] for items in pages) if typed else pages
+
+    def _iter_tagged_results_pages(
+        self, bulk_id: str, page_size: int, offset: int, prefetch: bool, lazy: bool = False
+    ) -> Iterator[List[Dict]]:
+        for page in self._iter_bulk_results_pages(bulk_id, page_size, offset, prefetch, lazy):
+            _, page_items, page_failed_items = self._unpack_results_page(page)
+            yield self._tagged_results_page(page_items, page_failed_items)
+
+    def _iter_bulk_results_pages(
+        self, bulk_id: str, page_size: int, offset: int, prefetch: bool, lazy: bool = False
+    ) -> Iterator[Dict]:
+        fetch_page = self._results_page_fetcher(lazy)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pangram-prefetch") if prefetch else None
+        try:
+            page = fetch_page(bulk_id, offset=offset, limit=page_size)
+            while True:
+                total_items, _, _ = self._unpack_results_page(page)
+                offset += page_size
+                next_page = None
+                if executor is not None and offset < total_items:
+                    next_page = executor.submit(fetch_page, bulk_id, offset=offset, limit=page_size)
+                yield page
+                if offset >= total_items:
+                    return
+                if next_page is not None:
+                    page = next_page.result()
+                else:
+                    page = fetch_page(bulk_id, offset=offset, limit=page_size)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def export_bulk_results(
+        self,
+        bulk_id: str,
+        sink: Optional[Union["ResultColumns", "ParquetResultWriter"]] = None,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        prefetch: bool = True,
+    ) -> Union["ResultColumns", "ParquetResultWriter"]:
+        """
+        Stream the results of a Bulk API job into columnar tables.
+
+        Each results page is converted to columns as soon as it arrives, so
+        result dicts for at most two pages are held at once. When the sink
+        does not collect windows, pages are decoded lazily and window JSON is
+        never parsed.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param sink: Where to add the results: a :class:`pangram.columnar.ResultColumns` or a
+                     :class:`pangram.columnar.ParquetResultWriter`. Defaults to a new ``ResultColumns``.
+        :type sink: Union[pangram.columnar.ResultColumns, pangram.columnar.ParquetResultWriter], optional
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param prefetch: Whether to fetch the next page in a background thread while
+                         the current page is converted. Defaults to True.
+        :type prefetch: bool
+        :return: The sink.
+        :rtype: Union[pangram.columnar.ResultColumns, pangram.columnar.ParquetResultWriter]
+        :raises ImportError: If numpy is not installed and no sink is given.
+        :raises ValueError: If page_size is invalid, or if the API returns an error or invalid response.
+        """
+        self._validate_page_size(page_size)
+        if sink is None:
+            from pangram.columnar import ResultColumns
+
+            sink = ResultColumns()
+        lazy = not sink.include_windows
+        for items in self._iter_tagged_results_pages(bulk_id, page_size, 0, prefetch, lazy):
+            sink.add_items(items)
+        return sink
 
     def wait_for_bulk(
         self,
         bulk_id: str,
         timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
         poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
     ) -> Dict:
         """
         Poll a Bulk API job until it reaches a terminal status.
@@ -262,21 +1235,24 @@ class PangramText:
         :param timeout: Maximum seconds to wait for terminal completion.
         :type timeout: float
         :param poll_interval: Seconds to wait between polling attempts. Values
-                              below 0.1 are clamped to 0.1.
+                              below 0.1 are clamped to 0.1. Ignored when a
+                              polling strategy is set.
         :type poll_interval: float
+        :param polling: Polling strategy for this wait. Defaults to the client's
+                        ``polling`` strategy. :class:`pangram.polling.AdaptivePolling`
+                        backs off on long jobs and uses the job's progress rate
+                        to estimate when to check next.
+        :type polling: pangram.polling.PollingStrategy, optional
         :return: Terminal bulk status response.
         :rtype: Dict
         :raises ValueError: If timeout or poll interval values are invalid, or
                             if the API returns an error.
         :raises TimeoutError: If the bulk job does not complete before timeout.
         """
-        if timeout <= 0:
-            raise ValueError("timeout must be greater than 0")
-        if poll_interval < 0:
-            raise ValueError("poll_interval cannot be negative")
+        self._validate_wait_args(timeout, poll_interval)
 
         deadline = time.monotonic() + timeout
-        effective_poll_interval = max(MIN_POLL_INTERVAL_SECONDS, poll_interval)
+        schedule = self._polling_schedule(polling, poll_interval)
         last_status = None
 
         while True:
@@ -290,12 +1266,14 @@ class PangramText:
                     bulk_id,
                     self._request_timeout(deadline),
                 )
-            except requests.RequestException as exc:
+            except (requests.RequestException, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
                 if time.monotonic() >= deadline:
                     raise TimeoutError(
                         f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s; last status={last_status}"
                     ) from exc
-                sleep_for = min(effective_poll_interval, max(0.0, deadline - time.monotonic()))
+                sleep_for = self._sleep_interval(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
                 if sleep_for > 0:
                     time.sleep(sleep_for)
                 continue
@@ -304,69 +1282,205 @@ class PangramText:
             if last_status in BULK_TERMINAL_STATUSES:
                 return status_response
 
-            sleep_for = min(effective_poll_interval, max(0.0, deadline - time.monotonic()))
+            sleep_for = self._sleep_interval(schedule, deadline, status=status_response)
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+
+    def iter_bulk_completed(
+        self,
+        bulk_id: str,
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Iterator[Dict]:
+        """
+        Yield each item of a Bulk API job as soon as it finishes, while the job is still running.
+
+        This polls the job's status like :meth:`wait_for_bulk`. Whenever the
+        status reports more finished items (``succeeded`` plus ``failed``)
+        than have been yielded so far, results pages are fetched and the newly
+        finished items are yielded. Pages whose items have all been yielded
+        are not fetched again, and every item is yielded exactly once, in the
+        order it was seen to finish. Items have the same shape as in
+        :meth:`iter_bulk_results`: failed items carry ``"failed": True``.
+        Iteration ends after the job reaches a terminal status and its
+        remaining items have been yielded.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param timeout: Maximum seconds to wait for terminal completion.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values
+                              below 0.1 are clamped to 0.1. Ignored when a
+                              polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this wait. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: An iterator of finished result items.
+        :rtype: Iterator[Dict]
+        :raises ValueError: If page_size, timeout, or poll interval values are invalid,
+                            or if the API returns an error while iterating.
+        :raises TimeoutError: If the bulk job does not complete before timeout.
+        """
+        self._validate_page_size(page_size)
+        self._validate_wait_args(timeout, poll_interval)
+        return self._iter_bulk_completed(bulk_id, page_size, timeout, poll_interval, polling)
+
+    def harvest_bulk(
+        self,
+        bulk_id: str,
+        on_item: Callable[[Dict], None],
+        page_size: int = MAX_BULK_PAGE_LIMIT,
+        timeout: float = DEFAULT_BULK_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Dict:
+        """
+        Wait for a Bulk API job, calling ``on_item`` with each item as soon as it finishes.
+
+        This is the callback form of :meth:`iter_bulk_completed`: ``on_item``
+        is called exactly once per item, from the calling thread.
+
+        :param bulk_id: The bulk job ID returned by :meth:`submit_bulk`.
+        :type bulk_id: str
+        :param on_item: Called with each finished result item.
+        :type on_item: Callable[[Dict], None]
+        :param page_size: Number of submitted item slots to request per API call.
+                          The API allows up to 1000.
+        :type page_size: int
+        :param timeout: Maximum seconds to wait for terminal completion.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values
+                              below 0.1 are clamped to 0.1. Ignored when a
+                              polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this wait. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: Terminal bulk status response.
+        :rtype: Dict
+        :raises ValueError: If page_size, timeout, or poll interval values are invalid,
+                            or if the API returns an error.
+        :raises TimeoutError: If the bulk job does not complete before timeout.
+        """
+        self._validate_page_size(page_size)
+        self._validate_wait_args(timeout, poll_interval)
+        items = self._iter_bulk_completed(bulk_id, page_size, timeout, poll_interval, polling)
+        while True:
+            try:
+                item = next(items)
+            except StopIteration as stop:
+                return stop.value
+            on_item(item)
+
+    def _iter_bulk_completed(
+        self,
+        bulk_id: str,
+        page_size: int,
+        timeout: float,
+        poll_interval: float,
+        polling: Optional[PollingStrategy],
+    ) -> Iterator[Dict]:
+        deadline = time.monotonic() + timeout
+        schedule = self._polling_schedule(polling, poll_interval)
+        harvest = _BulkHarvest(page_size)
+        last_status = None
+
+        while True:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(
+                    f"Pangram bulk job {bulk_id} did not complete within {timeout:.0f}s; last status={last_status}"
+                )
+
+            try:
+                status_response = self._fetch_bulk_status(bulk_id, self._request_timeout(deadline))
+            except (requests.RequestException, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
+                sleep_for = self._sleep_interval(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
+                if sleep_for > 0:
+                    time.sleep(sleep_for)
+                continue
+
+            last_status = status_response.get("status")
+            terminal = last_status in BULK_TERMINAL_STATUSES
+            if harvest.needs_pages(status_response, terminal):
+                offset = harvest.next_offset(-1)
+                while offset is not None and not harvest.caught_up(status_response, terminal):
+                    page = self.get_bulk_results_page(bulk_id, offset=offset, limit=page_size)
+                    yield from harvest.take(offset, page)
+                    offset = harvest.next_offset(offset)
+            if terminal:
+                return status_response
+
+            sleep_for = self._sleep_interval(schedule, deadline, status=status_response)
             if sleep_for > 0:
                 time.sleep(sleep_for)
 
     def _submit_prediction_task(self, text: str, deadline: float, public_dashboard_link: bool) -> str:
         try:
-            response = requests.post(
-                f"{API_ENDPOINT}/task",
-                json={"text": text, "public_dashboard_link": public_dashboard_link},
-                headers=self._headers(),
-                timeout=self._request_timeout(deadline),
+            response = self._send(
+                "POST",
+                f"{self.api_endpoint}/task",
+                operation="submit_prediction",
+                idempotent=False,
+                rate_limit=SUBMIT,
+                deadline=deadline,
+                **self._json_body({"text": text, "public_dashboard_link": public_dashboard_link}),
             )
         except requests.RequestException as exc:
             raise ValueError(f"Pangram API request failed while submitting prediction task: {exc}") from exc
-        response_json = self._parse_response_json(response)
-        if not isinstance(response_json, dict):
-            raise ValueError(f"Error returned by API: invalid task response: {response_json}")
-
-        task_id = response_json.get("task_id")
-        if not isinstance(task_id, str) or not task_id:
-            raise ValueError(f"Error returned by API: missing task_id in response: {response_json}")
-        return task_id
+        return self._task_id_from_response(self._parse_response_json(response))
+
+    def _check_prediction_task(
+        self, task_id: str, deadline: float, lazy: bool = False
+    ) -> Tuple[Optional[Union[Dict, LazyPrediction]], Optional[float]]:
+        response = self._send(
+            "GET",
+            f"{self.api_endpoint}/task/{task_id}",
+            operation="get_task",
+            idempotent=True,
+            rate_limit=POLL,
+            retry=False,
+            headers=self._headers(),
+            timeout=self._request_timeout(deadline),
+        )
+        decode = functools.partial(lazy_prediction, codec=self._json_codec) if lazy else None
+        result = self._completed_task_result(task_id, self._parse_response_json(response, decode=decode))
+        return result, self._retry_after(response)
 
     def _poll_prediction_task(
         self,
         task_id: str,
         deadline: float,
         timeout: float,
-        poll_interval: float,
-    ) -> Dict:
+        schedule: PollSchedule,
+        lazy: bool = False,
+    ) -> Union[Dict, LazyPrediction]:
         while True:
             if time.monotonic() >= deadline:
                 raise TimeoutError(f"Pangram prediction task {task_id} did not complete within {timeout:.0f}s")
 
             try:
-                response = requests.get(
-                    f"{API_ENDPOINT}/task/{task_id}",
-                    headers=self._headers(),
-                    timeout=self._request_timeout(deadline),
-                )
-            except requests.RequestException as exc:
+                result, retry_after = self._check_prediction_task(task_id, deadline, lazy=lazy)
+            except (requests.RequestException, PangramAPIError) as exc:
+                if not self.is_transient_error(exc):
+                    raise
                 if time.monotonic() >= deadline:
                     raise TimeoutError(
                         f"Pangram prediction task {task_id} did not complete within {timeout:.0f}s"
                     ) from exc
-                sleep_for = min(poll_interval, max(0.0, deadline - time.monotonic()))
+                sleep_for = self._sleep_interval(schedule, deadline, retry_after=getattr(exc, "retry_after", None))
                 if sleep_for > 0:
                     time.sleep(sleep_for)
                 continue
-            response_json = self._parse_response_json(response)
-            if not isinstance(response_json, dict):
-                raise ValueError(f"Error returned by API: invalid task result: {response_json}")
-
-            stage = response_json.get("stage")
-            if stage == ASYNC_SUCCESS_STAGE:
-                return response_json
-            if stage == ASYNC_FAILED_STAGE:
-                message = response_json.get("headline") or response_json.get("detail") or "task failed"
-                raise ValueError(f"Error returned by API: task {task_id} failed: {message}")
-            if stage is None:
-                raise ValueError(f"Error returned by API: missing stage for task {task_id}")
+            if result is not None:
+                return result
 
-            sleep_for = min(poll_interval, max(0.0, deadline - time.monotonic()))
+            sleep_for = self._sleep_interval(schedule, deadline, retry_after=retry_after)
             if sleep_for > 0:
                 time.sleep(sleep_for)
 
@@ -376,7 +1490,10 @@ class PangramText:
         public_dashboard_link: bool = False,
         timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
         poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
-    ) -> Dict:
+        polling: Optional[PollingStrategy] = None,
+        typed: bool = False,
+        lazy: bool = False,
+    ) -> Union[Dict, Prediction]:
         """
         Classify text as AI-, AI-assisted, or human-written.
 
@@ -390,7 +1507,16 @@ class PangramText:
         :param timeout: Maximum seconds to wait for the async task to complete. Defaults to 300.
         :type timeout: float
         :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
         :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param typed: Return a compact :class:`pangram.results.Prediction` instead of a dict. It supports
+                      the same ``result["field"]`` access. Defaults to False.
+        :type typed: bool
+        :param lazy: Return a :class:`pangram.lazy.LazyPrediction`, a typed result that decodes ``windows``
+                     and ``text`` only when they are read. Implies ``typed``. Defaults to False.
+        :type lazy: bool
         :return: Pangram analysis with AI-assistance detection as a dict with the following fields:
 
                 - stage (str): The terminal async task stage, normally "STAGE_SUCCESS".
@@ -415,23 +1541,366 @@ class PangramText:
                     - end_index (int): Ending character index in the original text.
                     - word_count (int): Number of words in the window.
                     - token_length (int): Token length of the window.
-        :rtype: Dict
+        :rtype: Union[Dict, pangram.results.Prediction]
         :raises ValueError: If the API returns an error or if the response is invalid
         :raises TimeoutError: If the async task does not complete before timeout
         """
-        if timeout <= 0:
-            raise ValueError("timeout must be greater than 0")
-        if poll_interval < 0:
-            raise ValueError("poll_interval cannot be negative")
+        self._validate_wait_args(timeout, poll_interval)
+
+        cache_key = self._cache_key(text, public_dashboard_link)
+        cached = self._cached_result(cache_key, text)
+        if cached is not None:
+            return Prediction.from_dict(cached) if typed or lazy else cached
+
+        deadline = time.monotonic() + timeout
+        task_id = self._submit_prediction_task(text, deadline, public_dashboard_link)
+        result = self._poll_prediction_task(
+            task_id,
+            deadline,
+            timeout,
+            self._polling_schedule(polling, poll_interval),
+            lazy=lazy,
+        )
+        self._store_result(cache_key, result)
+        if lazy:
+            return result
+        return Prediction.from_dict(result) if typed else result
+
+    def predict_long(
+        self,
+        text: str,
+        public_dashboard_link: bool = False,
+        max_chunk_chars: int = DEFAULT_LONG_CHUNK_CHARS,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+        typed: bool = False,
+    ) -> Union[Dict, Prediction]:
+        """
+        Classify a long text by scoring chunks of it concurrently.
+
+        The text is split on paragraph and then sentence boundaries into
+        chunks of at most ``max_chunk_chars`` characters with
+        :func:`pangram.long_text.split_text`. The chunks are classified with
+        :meth:`predict_many`, so latency depends on the longest chunk rather
+        than the whole text. The chunk results are merged with
+        :func:`pangram.long_text.merge_predictions`:
+
+        - Window offsets refer to the whole text.
+        - Fractions are weighted by chunk length.
+        - Segment counts are summed.
+        - ``headline`` and ``prediction`` follow ``prediction_short``, which is
+          ``"Mixed"`` when the chunks disagree.
+        - ``chunks`` lists each chunk's offsets and, with
+          ``public_dashboard_link``, its dashboard link.
+
+        Text that fits in one chunk is sent to :meth:`predict` unchanged.
+        There is no ``lazy`` option, because merging reads every chunk's
+        windows.
+
+        :param text: The text to be classified.
+        :type text: str
+        :param public_dashboard_link: Whether to include a public dashboard link for each chunk. Defaults to False.
+        :type public_dashboard_link: bool
+        :param max_chunk_chars: Maximum characters per chunk. Defaults to 10000.
+        :type max_chunk_chars: int
+        :param max_concurrency: Maximum number of chunks in flight at once. Defaults to 8.
+        :type max_concurrency: int
+        :param timeout: Maximum seconds to wait for each chunk to complete. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param typed: Return a compact :class:`pangram.results.Prediction` instead of a dict. Defaults to False.
+        :type typed: bool
+        :return: The merged classification, with the same fields as :meth:`predict` plus ``chunks``.
+        :rtype: Union[Dict, pangram.results.Prediction]
+        :raises ValueError: If max_chunk_chars is less than 1, if any chunk fails, or if
+                            the API returns an error. The first failed chunk's error is raised.
+        :raises TimeoutError: If a chunk does not complete before timeout.
+        """
+        chunks = split_text(text, max_chunk_chars)
+        if len(chunks) <= 1:
+            return self.predict(
+                text,
+                public_dashboard_link=public_dashboard_link,
+                timeout=timeout,
+                poll_interval=poll_interval,
+                polling=polling,
+                typed=typed,
+            )
+        results = self.predict_many(
+            [text[start:end] for start, end in chunks],
+            public_dashboard_link=public_dashboard_link,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            polling=polling,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        merged = merge_predictions(text, chunks, results)
+        return Prediction.from_dict(merged) if typed else merged
+
+    def submit_prediction(
+        self,
+        text: str,
+        public_dashboard_link: bool = False,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+    ) -> Future:
+        """
+        Submit text for classification and return a future for the result.
+
+        The task is submitted before this method returns. Polling is handed to
+        the client's shared task poller, which checks every outstanding task
+        from a small pool of ``poller_workers`` threads, so many predictions
+        can be awaited without a thread per prediction.
 
+        :param text: The text to be classified.
+        :type text: str
+        :param public_dashboard_link: Whether to include a public dashboard link in the completed response. Defaults to False.
+        :type public_dashboard_link: bool
+        :param timeout: Maximum seconds to wait for the async task to complete. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :return: A future that resolves to the same result as :meth:`predict`, or raises
+                 ``ValueError`` if the task fails or ``TimeoutError`` if it does not complete in time.
+        :rtype: concurrent.futures.Future
+        :raises ValueError: If the timeout or poll interval is invalid, or if submission fails.
+        """
+        self._validate_wait_args(timeout, poll_interval)
         deadline = time.monotonic() + timeout
+        return self._submit_and_poll(text, deadline, timeout, poll_interval, polling, public_dashboard_link)
+
+    def _submit_and_poll(
+        self,
+        text: str,
+        deadline: float,
+        timeout: float,
+        poll_interval: float,
+        polling: Optional[PollingStrategy],
+        public_dashboard_link: bool,
+    ) -> Future:
+        cache_key = self._cache_key(text, public_dashboard_link)
+        cached = self._cached_result(cache_key, text)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
         task_id = self._submit_prediction_task(text, deadline, public_dashboard_link)
-        return self._poll_prediction_task(
+        future = self._get_poller().submit(
             task_id,
             deadline,
             timeout,
-            max(MIN_POLL_INTERVAL_SECONDS, poll_interval),
+            self._polling_schedule(polling, poll_interval),
         )
+        if cache_key is not None:
+            future.add_done_callback(lambda done: self._store_future_result(cache_key, done))
+        return future
+
+    def _store_future_result(self, cache_key: str, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self._store_result(cache_key, future.result())
+
+    def predict_as_completed(
+        self,
+        texts: Iterable[str],
+        public_dashboard_link: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+        dedupe: Union[bool, TextNormalizer] = False,
+    ) -> Iterator[Tuple[int, Union[Dict, Exception]]]:
+        """
+        Classify many texts concurrently and yield each result as soon as it completes.
+
+        Up to ``max_concurrency`` predictions are kept in flight at once.
+        Tasks are submitted over the client's shared connection pool and
+        polled by the shared task poller. Results are yielded in completion
+        order as ``(index, result)`` pairs, where ``index`` is the position of
+        the text in ``texts``. A prediction that fails yields its exception in
+        place of the result instead of aborting the batch. If iteration stops
+        early, predictions still in flight stop being polled.
+
+        With ``dedupe``, texts whose normalized form matches an earlier text
+        are not submitted. When a unique text completes, its result is
+        yielded once for every position it appears at, and the number of
+        submissions saved is added to the ``dedup.saved`` metric.
+
+        :param texts: The texts to be classified.
+        :type texts: Iterable[str]
+        :param public_dashboard_link: Whether to include a public dashboard link in each completed response. Defaults to False.
+        :type public_dashboard_link: bool
+        :param max_concurrency: Maximum number of predictions in flight at once. Defaults to 8.
+        :type max_concurrency: int
+        :param timeout: Maximum seconds to wait for each prediction to complete, measured from its submission. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param dedupe: Submit each unique text once. Pass a :class:`pangram.dedup.TextNormalizer`
+                       to choose how texts are compared; True collapses whitespace and applies
+                       Unicode NFC. Duplicates share one result object. Defaults to False.
+        :type dedupe: Union[bool, pangram.dedup.TextNormalizer]
+        :return: An iterator of ``(index, result_or_exception)`` pairs.
+        :rtype: Iterator[Tuple[int, Union[Dict, Exception]]]
+        :raises ValueError: If max_concurrency, timeout, or poll interval values are invalid.
+        """
+        self._validate_wait_args(timeout, poll_interval)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        texts = list(texts)
+        normalizer = resolve_normalizer(dedupe)
+        if normalizer is None:
+            return self._predict_as_completed(texts, public_dashboard_link, max_concurrency, timeout, poll_interval, polling)
+        plan = DedupPlan(texts, normalizer)
+        self.metrics.increment("dedup.saved", plan.saved)
+        completed = self._predict_as_completed(
+            plan.unique(texts),
+            public_dashboard_link,
+            max_concurrency,
+            timeout,
+            poll_interval,
+            polling,
+        )
+        return ((index, outcome) for position, outcome in completed for index in plan.groups[position])
+
+    def _predict_as_completed(
+        self,
+        texts: List[str],
+        public_dashboard_link: bool,
+        max_concurrency: int,
+        timeout: float,
+        poll_interval: float,
+        polling: Optional[PollingStrategy],
+    ) -> Iterator[Tuple[int, Union[Dict, Exception]]]:
+        if not texts:
+            return
+
+        completed = queue.Queue()
+        # Futures still being polled, so they can be cancelled if the caller stops iterating early.
+        launched = set()
+        launch_lock = threading.Lock()
+        stopped = False
+
+        def launch(index: int, text: str) -> None:
+            try:
+                future = self._submit_and_poll(
+                    text,
+                    time.monotonic() + timeout,
+                    timeout,
+                    poll_interval,
+                    polling,
+                    public_dashboard_link,
+                )
+            except Exception as exc:
+                completed.put((index, exc))
+                return
+            with launch_lock:
+                if stopped:
+                    future.cancel()
+                    return
+                launched.add(future)
+            future.add_done_callback(lambda done: completed.put((index, done)))
+
+        submit_executor = ThreadPoolExecutor(max_workers=min(max_concurrency, len(texts), MAX_SUBMIT_WORKERS))
+        pending = enumerate(texts)
+        in_flight = 0
+        remaining = len(texts)
+        try:
+            while remaining:
+                while in_flight < max_concurrency:
+                    next_item = next(pending, None)
+                    if next_item is None:
+                        break
+                    submit_executor.submit(launch, *next_item)
+                    in_flight += 1
+
+                index, outcome = completed.get()
+                in_flight -= 1
+                remaining -= 1
+                if isinstance(outcome, Future):
+                    with launch_lock:
+                        launched.discard(outcome)
+                    try:
+                        outcome = outcome.result()
+                    except (CancelledError, Exception) as exc:
+                        outcome = exc
+                yield index, outcome
+        finally:
+            submit_executor.shutdown(wait=False, cancel_futures=True)
+            with launch_lock:
+                stopped = True
+                unfinished = list(launched)
+                launched.clear()
+            for future in unfinished:
+                future.cancel()
+
+    def predict_many(
+        self,
+        texts: Iterable[str],
+        public_dashboard_link: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
+        dedupe: Union[bool, TextNormalizer] = False,
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Classify many texts concurrently and return results in input order.
+
+        This runs :meth:`predict_as_completed` to completion. Each entry of the
+        returned list is either the :meth:`predict` result for the text at the
+        same position or the exception raised for that text, so one failed
+        prediction does not discard the rest of the batch.
+
+        :param texts: The texts to be classified.
+        :type texts: Iterable[str]
+        :param public_dashboard_link: Whether to include a public dashboard link in each completed response. Defaults to False.
+        :type public_dashboard_link: bool
+        :param max_concurrency: Maximum number of predictions in flight at once. Defaults to 8.
+        :type max_concurrency: int
+        :param timeout: Maximum seconds to wait for each prediction to complete. Defaults to 300.
+        :type timeout: float
+        :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
+        :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
+        :param dedupe: Submit each unique text once and share its result between duplicates.
+                       See :meth:`predict_as_completed`. Defaults to False.
+        :type dedupe: Union[bool, pangram.dedup.TextNormalizer]
+        :return: One result dict or exception per input text, in input order.
+        :rtype: List[Union[Dict, Exception]]
+        :raises ValueError: If max_concurrency, timeout, or poll interval values are invalid.
+        """
+        texts = list(texts)
+        results = [None] * len(texts)
+        for index, result in self.predict_as_completed(
+            texts,
+            public_dashboard_link=public_dashboard_link,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            polling=polling,
+            dedupe=dedupe,
+        ):
+            results[index] = result
+        return results
 
     def predict_files(
         self,
@@ -447,7 +1916,8 @@ class PangramText:
         Each returned result includes the extracted text, prediction fields,
         window-level analysis, and the uploaded ``filename``. When
         ``public_dashboard_link`` is true, each result also includes a
-        ``dashboard_link`` URL.
+        ``dashboard_link`` URL. With a result cache, files whose contents are
+        cached are answered locally and only the rest are uploaded.
 
         :param file_paths: Paths to files to upload and analyze.
         :type file_paths: List[Union[str, os.PathLike]]
@@ -475,11 +1945,37 @@ class PangramText:
                 opened_files.append(file_obj)
                 files_payload.append(("files", (os.path.basename(path), file_obj)))
 
+            results: List[Optional[Dict]] = [None] * len(files_payload)
+            cache_keys: List[Optional[str]] = [None] * len(files_payload)
+            if self.cache is not None:
+                for index, (_, (filename, file_obj)) in enumerate(files_payload):
+                    cache_keys[index] = self.cache.key_for_bytes(
+                        file_obj.read(), public_dashboard_link=public_dashboard_link
+                    )
+                    file_obj.seek(0)
+                    cached = self._cached_result(cache_keys[index])
+                    if cached is not None:
+                        cached["filename"] = filename
+                        results[index] = cached
+            upload_indices = [index for index, result in enumerate(results) if result is None]
+            if not upload_indices:
+                return results
+            files_payload = [files_payload[index] for index in upload_indices]
+
+            def rewind_files() -> None:
+                for opened_file in opened_files:
+                    opened_file.seek(0)
+
             try:
-                response = requests.post(
-                    FILE_UPLOAD_API_ENDPOINT,
+                response = self._send(
+                    "POST",
+                    self.file_upload_endpoint,
+                    operation="upload_files",
+                    idempotent=False,
+                    rate_limit=SUBMIT,
+                    on_retry=rewind_files,
                     files=files_payload,
-                    data={"public_dashboard_link": str(public_dashboard_link).lower()},
+                    data=self._file_upload_data(public_dashboard_link),
                     headers=self._auth_headers(),
                     timeout=timeout,
                 )
@@ -489,11 +1985,136 @@ class PangramText:
             response_json = self._parse_response_json(response)
             if not isinstance(response_json, list):
                 raise ValueError(f"Error returned by API: invalid file upload response: {response_json}")
-            return response_json
+            if self.cache is None:
+                return response_json
+            if len(response_json) != len(upload_indices):
+                raise ValueError(
+                    f"Error returned by API: expected {len(upload_indices)} file results, got {len(response_json)}"
+                )
+            for index, result in zip(upload_indices, response_json):
+                if isinstance(result, dict):
+                    self._store_result(cache_keys[index], result)
+                results[index] = result
+            return results
         finally:
             for file_obj in opened_files:
                 file_obj.close()
 
+    def predict_files_batched(
+        self,
+        file_paths: Iterable[Union[str, os.PathLike]],
+        public_dashboard_link: bool = False,
+        timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
+        max_files_per_request: int = DEFAULT_UPLOAD_FILES_PER_REQUEST,
+        max_bytes_per_request: int = DEFAULT_UPLOAD_BYTES_PER_REQUEST,
+        max_workers: int = DEFAULT_UPLOAD_WORKERS,
+    ) -> List[Union[Dict, Exception]]:
+        """
+        Upload many files for AI detection in bounded batches.
+
+        Files are grouped into upload requests of at most
+        ``max_files_per_request`` files and ``max_bytes_per_request`` bytes (a
+        larger file is sent on its own), and up to ``max_workers`` requests
+        run at once. Each request body is streamed from disk with one file
+        open at a time, so neither memory use nor open file descriptors grow
+        with the number of files. A failed request only affects the files in
+        its batch. With a result cache, cached files are answered locally.
+
+        :param file_paths: Paths to files to upload and analyze.
+        :type file_paths: Iterable[Union[str, os.PathLike]]
+        :param public_dashboard_link: Whether to create public dashboard links for the uploaded files. Defaults to False.
+        :type public_dashboard_link: bool
+        :param timeout: Maximum seconds to wait for each upload request to complete. Defaults to 300.
+        :type timeout: float
+        :param max_files_per_request: Maximum files per upload request. Defaults to 20.
+        :type max_files_per_request: int
+        :param max_bytes_per_request: Maximum file bytes per upload request. Defaults to 32 MiB.
+        :type max_bytes_per_request: int
+        :param max_workers: Maximum upload requests in flight at once. Defaults to 4.
+        :type max_workers: int
+        :return: One result dict or exception per input path, in input order. Unreadable
+                 files get the ``OSError`` raised when reading them.
+        :rtype: List[Union[Dict, Exception]]
+        :raises ValueError: If timeout or any limit is invalid.
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be greater than 0")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_files_per_request < 1 or max_bytes_per_request < 1:
+            raise ValueError("max_files_per_request and max_bytes_per_request must be at least 1")
+
+        paths = [os.fspath(file_path) for file_path in file_paths]
+        results: List[Union[Dict, Exception, None]] = [None] * len(paths)
+        cache_keys: List[Optional[str]] = [None] * len(paths)
+        sizes = []
+        for index, path in enumerate(paths):
+            try:
+                size = os.path.getsize(path)
+                if self.cache is not None:
+                    with open(path, "rb") as file_obj:
+                        cache_keys[index] = self.cache.key_for_bytes(
+                            file_obj.read(), public_dashboard_link=public_dashboard_link
+                        )
+            except OSError as exc:
+                results[index] = exc
+                continue
+            cached = self._cached_result(cache_keys[index])
+            if cached is not None:
+                cached["filename"] = os.path.basename(path)
+                results[index] = cached
+                continue
+            sizes.append((index, size))
+
+        batches = batch_files(sizes, max_files=max_files_per_request, max_bytes=max_bytes_per_request)
+        if not batches:
+            return results
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(batches)), thread_name_prefix="pangram-upload"
+        ) as executor:
+            futures = [
+                executor.submit(self._upload_file_batch, [paths[index] for index in batch], public_dashboard_link, timeout)
+                for batch in batches
+            ]
+            for batch, future in zip(batches, futures):
+                try:
+                    batch_results = future.result()
+                except Exception as exc:
+                    for index in batch:
+                        results[index] = exc
+                    continue
+                for index, result in zip(batch, batch_results):
+                    if isinstance(result, dict):
+                        self._store_result(cache_keys[index], result)
+                    results[index] = result
+        return results
+
+    def _upload_file_batch(self, paths: List[str], public_dashboard_link: bool, timeout: float) -> List[Dict]:
+        body = MultipartFileStream(self._file_upload_data(public_dashboard_link), paths)
+        try:
+            response = self._send(
+                "POST",
+                self.file_upload_endpoint,
+                operation="upload_files",
+                idempotent=False,
+                rate_limit=SUBMIT,
+                on_retry=body.rewind,
+                data=body,
+                headers={**self._auth_headers(), "Content-Type": body.content_type},
+                timeout=timeout,
+            )
+        except requests.RequestException as exc:
+            raise ValueError(f"Pangram API request failed while uploading files: {exc}") from exc
+        finally:
+            body.rewind()
+
+        response_json = self._parse_response_json(response)
+        if not isinstance(response_json, list):
+            raise ValueError(f"Error returned by API: invalid file upload response: {response_json}")
+        if len(response_json) != len(paths):
+            raise ValueError(f"Error returned by API: expected {len(paths)} file results, got {len(response_json)}")
+        return response_json
+
     def predict_file(
         self,
         file_path: Union[str, os.PathLike],
@@ -549,35 +2170,38 @@ class PangramText:
         return self.predict(text)
 
 
-    def batch_predict(self, text_batch: List[str]) -> List[Dict]:
+    def batch_predict(self, text_batch: List[str], dedupe: Union[bool, TextNormalizer] = False) -> List[Dict]:
         """
         Classify a batch of text as AI-, AI-assisted, or human-written.
 
-        This method iterates through the batch and calls predict() for each text.
+        This method classifies the batch concurrently with :meth:`predict_many`
+        and raises the first error, in input order, if any prediction fails.
 
         .. deprecated::
-           This compatibility method forwards to :meth:`predict` once per
-           input text. Use :meth:`submit_bulk` for asynchronous bulk jobs or
-           :meth:`predict` for one-off calls. This method may be removed on
-           August 1, 2026.
+           This compatibility method forwards to :meth:`predict_many`. Use
+           :meth:`predict_many` for per-item error reporting,
+           :meth:`submit_bulk` for asynchronous bulk jobs, or :meth:`predict`
+           for one-off calls. This method may be removed on August 1, 2026.
 
         :param text_batch: A list of strings to be classified.
         :type text_batch: List[str]
+        :param dedupe: Submit each unique text once. See :meth:`predict_as_completed`. Defaults to False.
+        :type dedupe: Union[bool, pangram.dedup.TextNormalizer]
         :return: A list of classification results from the API for each text in the batch.
                  Each result is a dict with the same fields as returned by predict().
         :rtype: List[Dict]
         """
         warnings.warn(
-            "batch_predict() is deprecated and forwards to predict() once per input text. "
-            "Use submit_bulk() for asynchronous bulk jobs or predict() for one-off calls. "
+            "batch_predict() is deprecated and forwards to predict_many(). "
+            "Use predict_many(), submit_bulk() for asynchronous bulk jobs, or predict() for one-off calls. "
             "This method may be removed on August 1, 2026.",
             DeprecationWarning,
             stacklevel=2,
         )
-        results = []
-        for text in text_batch:
-            result = self.predict(text)
-            results.append(result)
+        results = self.predict_many(text_batch, dedupe=dedupe)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
         return results
 
 
@@ -586,6 +2210,7 @@ class PangramText:
         text: str,
         timeout: float = DEFAULT_PREDICT_TIMEOUT_SECONDS,
         poll_interval: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        polling: Optional[PollingStrategy] = None,
     ) -> Dict:
         """
         Classify text as AI-, AI-assisted, or human-written.
@@ -598,7 +2223,10 @@ class PangramText:
         :param timeout: Maximum seconds to wait for the async task to complete. Defaults to 300.
         :type timeout: float
         :param poll_interval: Seconds to wait between polling attempts. Values below 0.1 are clamped to 0.1. Defaults to 0.5.
+                              Ignored when a polling strategy is set.
         :type poll_interval: float
+        :param polling: Polling strategy for this call. Defaults to the client's ``polling`` strategy.
+        :type polling: pangram.polling.PollingStrategy, optional
         :return: The classification result from the API, as a dict with the following fields:
 
                 - text (string): The classified text.
@@ -619,14 +2247,17 @@ class PangramText:
             public_dashboard_link=True,
             timeout=timeout,
             poll_interval=poll_interval,
+            polling=polling,
         )
 
-    def check_plagiarism(self, text: str) -> Dict:
+    def check_plagiarism(self, text: str, typed: bool = False) -> Union[Dict, PlagiarismResult]:
         """
         Check text for potential plagiarism by comparing it against a vast database of online content.
 
         :param text: The text to check for plagiarism.
         :type text: str
+        :param typed: Return a :class:`pangram.results.PlagiarismResult` instead of a dict. Defaults to False.
+        :type typed: bool
         :return: A dictionary containing the plagiarism check results, including:
 
                 - text (str): The input text.
@@ -635,22 +2266,17 @@ class PangramText:
                 - total_sentences (int): Total number of sentences checked
                 - plagiarized_sentences (List): List of sentences detected as plagiarized
                 - percent_plagiarized (float): Percentage of text detected as plagiarized
-        :rtype: Dict
+        :rtype: Union[Dict, pangram.results.PlagiarismResult]
         :raises ValueError: If the API returns an error or if the response is invalid
         """
-        headers = {
-            'Content-Type': 'application/json',
-            'x-api-key': self.api_key,
-        }
-        input_json = {
-            "text": text,
-            "source": SOURCE_VERSION,
-        }
-
-        response = requests.post(PLAGIARISM_API_ENDPOINT, json=input_json, headers=headers, timeout=90)
-        if response.status_code != 200:
-            raise ValueError(f"Error returned by API: [{response.status_code}] {response.text}")
-        response_json = response.json()
-        if "error" in response_json:
-            raise ValueError(f"Error returned by API: {response_json['error']}")
-        return response_json
+        response = self._send(
+            "POST",
+            self.plagiarism_endpoint,
+            operation="check_plagiarism",
+            idempotent=False,
+            rate_limit=SUBMIT,
+            timeout=PLAGIARISM_REQUEST_TIMEOUT_SECONDS,
+            **self._json_body(self._plagiarism_payload(text)),
+        )
+        result = self._parse_plagiarism_response(response)
+        return PlagiarismResult.from_dict(result) if typed else result
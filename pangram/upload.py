@@ -0,0 +1,139 @@
+import mimetypes
+import os
+import uuid
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_UPLOAD_FILES_PER_REQUEST = 20
+DEFAULT_UPLOAD_BYTES_PER_REQUEST = 32 * 1024 * 1024
+DEFAULT_UPLOAD_WORKERS = 4
+UPLOAD_READ_SIZE = 64 * 1024
+# Percent-encoding applied to file names in part headers, as browsers do for form uploads.
+FILENAME_ESCAPES = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+
+def batch_files(
+    sizes: Sequence[Tuple[int, int]],
+    max_files: int = DEFAULT_UPLOAD_FILES_PER_REQUEST,
+    max_bytes: int = DEFAULT_UPLOAD_BYTES_PER_REQUEST,
+) -> List[List[int]]:
+    """
+    Group files into upload requests by count and total size.
+
+    A batch closes before it would exceed ``max_files`` files or
+    ``max_bytes`` bytes. A file larger than ``max_bytes`` is uploaded on its
+    own.
+
+    :param sizes: ``(index, size_in_bytes)`` pairs, in upload order.
+    :type sizes: Sequence[Tuple[int, int]]
+    :param max_files: Maximum files per request.
+    :type max_files: int
+    :param max_bytes: Maximum file bytes per request.
+    :type max_bytes: int
+    :return: Lists of indices, one per request.
+    :rtype: List[List[int]]
+    :raises ValueError: If either limit is less than 1.
+    """
+    if max_files < 1 or max_bytes < 1:
+        raise ValueError("max_files and max_bytes must be at least 1")
+    batches = []
+    batch: List[int] = []
+    batch_bytes = 0
+    for index, size in sizes:
+        if batch and (len(batch) >= max_files or batch_bytes + size > max_bytes):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(index)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class MultipartFileStream:
+    def __init__(self, fields: Dict[str, str], file_paths: Sequence[str], file_field: str = "files") -> None:
+        """
+        A ``multipart/form-data`` request body that reads files from disk as it is sent.
+
+        Only one file is open at a time, and only one read buffer of it is in
+        memory. The body length is computed up front from the file sizes so
+        the request carries a ``Content-Length`` rather than being chunked.
+        Call :meth:`rewind` before sending the body again.
+
+        :param fields: Plain form fields, sent before the files.
+        :type fields: Dict[str, str]
+        :param file_paths: Files to send, one part each.
+        :type file_paths: Sequence[str]
+        :param file_field: Form field name for the file parts. Defaults to ``files``.
+        :type file_field: str
+        :raises OSError: If a file cannot be read.
+        """
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self._parts: List[Tuple[bytes, Optional[str], int]] = []
+        for name, value in fields.items():
+            header = self._part_header(f'form-data; name="{name}"', None)
+            self._parts.append((header + value.encode("utf-8") + b"\r\n", None, 0))
+        for path in file_paths:
+            filename = os.path.basename(path).translate(FILENAME_ESCAPES)
+            content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            header = self._part_header(f'form-data; name="{file_field}"; filename="{filename}"', content_type)
+            self._parts.append((header, path, os.path.getsize(path)))
+        self._closing = f"--{self.boundary}--\r\n".encode("ascii")
+        self._length = sum(len(header) + size + (2 if path is not None else 0) for header, path, size in self._parts)
+        self._length += len(self._closing)
+        self._chunks: Optional[Iterator[bytes]] = None
+        self._buffer = b""
+
+    def _part_header(self, disposition: str, content_type: Optional[str]) -> bytes:
+        lines = [f"--{self.boundary}", f"Content-Disposition: {disposition}"]
+        if content_type is not None:
+            lines.append(f"Content-Type: {content_type}")
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        self.rewind()
+        return self._iter_chunks()
+
+    def _iter_chunks(self) -> Iterator[bytes]:
+        for header, path, _ in self._parts:
+            yield header
+            if path is None:
+                continue
+            with open(path, "rb") as file_obj:
+                while True:
+                    block = file_obj.read(UPLOAD_READ_SIZE)
+                    if not block:
+                        break
+                    yield block
+            yield b"\r\n"
+        yield self._closing
+
+    def read(self, size: int = -1) -> bytes:
+        """
+        Return up to ``size`` bytes of the body, or the rest of it if ``size`` is negative.
+
+        :rtype: bytes
+        """
+        if self._chunks is None:
+            self._chunks = self._iter_chunks()
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def rewind(self) -> None:
+        """
+        Restart the body from the beginning, closing any file still open.
+        """
+        if self._chunks is not None:
+            self._chunks.close()
+        self._chunks = None
+        self._buffer = b""
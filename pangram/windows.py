@@ -0,0 +1,430 @@
+import bisect
+import heapq
+import html
+import re
+from collections.abc import Mapping
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+OVERLAP_MAX = "max"
+OVERLAP_MEAN = "mean"
+ANSI_RESET = "\x1b[0m"
+ANSI_AI = "\x1b[1;31m"
+ANSI_AI_ASSISTED = "\x1b[33m"
+AI_SCORE = 0.5
+AI_ASSISTED_SCORE = 0.2
+
+_PARAGRAPH_BREAK = re.compile(r"\n[ \t\r\f\v]*\n\s*")
+_SENTENCE = re.compile(r"\S.*?(?:[.!?]+[\"'”’)\]]*(?=\s|$)|$)", re.S)
+_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+class Span(NamedTuple):
+    """A character range ``[start, end)`` of a document with its AI assistance score and label."""
+
+    start: int
+    end: int
+    score: Optional[float]
+    label: Optional[str]
+
+
+def paragraph_spans(text: str) -> List[Span]:
+    """
+    Split ``text`` into paragraphs separated by blank lines.
+
+    :param text: The document text.
+    :type text: str
+    :return: One span per paragraph, without surrounding whitespace. Scores and labels are None.
+    :rtype: List[pangram.windows.Span]
+    """
+    spans = []
+    start = 0
+    for match in _PARAGRAPH_BREAK.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(text)))
+    result = []
+    for start, end in spans:
+        chunk = text[start:end]
+        stripped = chunk.strip()
+        if stripped:
+            offset = start + len(chunk) - len(chunk.lstrip())
+            result.append(Span(offset, offset + len(stripped), None, None))
+    return result
+
+
+def sentence_spans(text: str) -> List[Span]:
+    """
+    Split ``text`` into sentences ending in ``.``, ``!``, or ``?`` followed by whitespace.
+
+    Paragraph breaks also end a sentence.
+
+    :param text: The document text.
+    :type text: str
+    :return: One span per sentence. Scores and labels are None.
+    :rtype: List[pangram.windows.Span]
+    """
+    spans = []
+    for paragraph in paragraph_spans(text):
+        for match in _SENTENCE.finditer(text, paragraph.start, paragraph.end):
+            end = match.end()
+            while end > match.start() and text[end - 1].isspace():
+                end -= 1
+            spans.append(Span(match.start(), end, None, None))
+    return spans
+
+
+class WindowIndex:
+    def __init__(self, windows: Iterable[Mapping], overlap: str = OVERLAP_MAX) -> None:
+        """
+        An interval index over the classified windows of one prediction.
+
+        The windows' ``[start_index, end_index)`` ranges are cut into
+        non-overlapping segments at every window boundary. Where windows
+        overlap, a segment takes the highest ``ai_assistance_score`` of the
+        windows covering it, or their mean with ``overlap="mean"``, and the
+        label of the highest-scoring one. Building the index takes
+        O(n log n) time for n windows; offset and range queries take
+        O(log n). Windows without integer indices or a numeric score are
+        ignored.
+
+        :param windows: The ``windows`` of a prediction result, as dicts or
+                        :class:`pangram.results.Window` objects.
+        :type windows: Iterable[Mapping]
+        :param overlap: How overlapping windows are scored: ``"max"`` or ``"mean"``. Defaults to ``"max"``.
+        :type overlap: str
+        :raises ValueError: If overlap is not ``"max"`` or ``"mean"``.
+        """
+        if overlap not in (OVERLAP_MAX, OVERLAP_MEAN):
+            raise ValueError('overlap must be "max" or "mean"')
+        self.overlap = overlap
+        valid = []
+        for window in windows:
+            start, end = window.get("start_index"), window.get("end_index")
+            score = window.get("ai_assistance_score")
+            if not (isinstance(start, int) and isinstance(end, int) and start < end):
+                continue
+            if not isinstance(score, (int, float)) or isinstance(score, bool):
+                continue
+            label = window.get("label")
+            valid.append((start, end, float(score), None if label is None else str(label)))
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._scores: List[float] = []
+        self._labels: List[Optional[str]] = []
+        self._build(valid)
+        self._max_table: Optional[List[List[float]]] = None
+
+    @classmethod
+    def from_result(cls, result: Mapping, overlap: str = OVERLAP_MAX) -> "WindowIndex":
+        """
+        Build an index over the ``windows`` of a prediction result.
+
+        :param result: A result from :meth:`pangram.PangramText.predict` or a bulk item's ``result``.
+        :type result: Mapping
+        :param overlap: How overlapping windows are scored. See :class:`WindowIndex`.
+        :type overlap: str
+        :rtype: pangram.windows.WindowIndex
+        """
+        return cls(result.get("windows") or (), overlap=overlap)
+
+    def _build(self, windows: List[tuple]) -> None:
+        boundaries = sorted({offset for start, end, _, _ in windows for offset in (start, end)})
+        by_start = sorted(range(len(windows)), key=lambda i: windows[i][0])
+        by_end = sorted(range(len(windows)), key=lambda i: windows[i][1])
+        next_start = next_end = 0
+        active = 0
+        score_sum = 0.0
+        # (-score, end, position) of every started window; ended ones are dropped lazily from the top.
+        heap: List[tuple] = []
+        for left, right in zip(boundaries, boundaries[1:]):
+            while next_start < len(by_start) and windows[by_start[next_start]][0] == left:
+                position = by_start[next_start]
+                heapq.heappush(heap, (-windows[position][2], windows[position][1], position))
+                score_sum += windows[position][2]
+                active += 1
+                next_start += 1
+            while next_end < len(by_end) and windows[by_end[next_end]][1] == left:
+                score_sum -= windows[by_end[next_end]][2]
+                active -= 1
+                next_end += 1
+            while heap and heap[0][1] <= left:
+                heapq.heappop(heap)
+            if not active:
+                continue
+            top = windows[heap[0][2]]
+            score = top[2] if self.overlap == OVERLAP_MAX else score_sum / active
+            if self._ends and self._ends[-1] == left and self._scores[-1] == score and self._labels[-1] == top[3]:
+                self._ends[-1] = right
+                continue
+            self._starts.append(left)
+            self._ends.append(right)
+            self._scores.append(score)
+            self._labels.append(top[3])
+        # Prefix sums of score * length and of covered length, for range means.
+        self._weighted = [0.0]
+        self._covered = [0]
+        for start, end, score in zip(self._starts, self._ends, self._scores):
+            self._weighted.append(self._weighted[-1] + score * (end - start))
+            self._covered.append(self._covered[-1] + end - start)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def segments(self) -> List[Span]:
+        """
+        The non-overlapping scored segments, in document order.
+
+        :rtype: List[pangram.windows.Span]
+        """
+        return [Span(*segment) for segment in zip(self._starts, self._ends, self._scores, self._labels)]
+
+    def _segment_at(self, offset: int) -> int:
+        position = bisect.bisect_right(self._starts, offset) - 1
+        if position >= 0 and offset < self._ends[position]:
+            return position
+        return -1
+
+    def span_at(self, offset: int) -> Optional[Span]:
+        """
+        Return the segment containing character ``offset``, or None if no window covers it.
+
+        :param offset: Character offset into the document.
+        :type offset: int
+        :rtype: pangram.windows.Span, optional
+        """
+        position = self._segment_at(offset)
+        if position < 0:
+            return None
+        return Span(self._starts[position], self._ends[position], self._scores[position], self._labels[position])
+
+    def score_at(self, offset: int) -> Optional[float]:
+        """
+        Return the AI assistance score at character ``offset``, or None if no window covers it.
+
+        :param offset: Character offset into the document.
+        :type offset: int
+        :rtype: float, optional
+        """
+        position = self._segment_at(offset)
+        return self._scores[position] if position >= 0 else None
+
+    def label_at(self, offset: int) -> Optional[str]:
+        """
+        Return the window label at character ``offset``, or None if no window covers it.
+
+        :param offset: Character offset into the document.
+        :type offset: int
+        :rtype: str, optional
+        """
+        position = self._segment_at(offset)
+        return self._labels[position] if position >= 0 else None
+
+    def _prefix(self, sums: List[float], offset: int, weighted: bool) -> float:
+        position = bisect.bisect_right(self._starts, offset) - 1
+        if position < 0:
+            return 0.0
+        partial = min(offset, self._ends[position]) - self._starts[position]
+        return sums[position] + partial * (self._scores[position] if weighted else 1)
+
+    def _range_max(self, start: int, end: int) -> Optional[float]:
+        first = bisect.bisect_right(self._ends, start)
+        last = bisect.bisect_left(self._starts, end)
+        if first >= last:
+            return None
+        if self._max_table is None:
+            # Sparse table: level k holds the max of each run of 2**k segments.
+            table = [self._scores]
+            width = 1
+            while width * 2 <= len(self._scores):
+                previous = table[-1]
+                table.append([max(previous[i], previous[i + width]) for i in range(len(previous) - width)])
+                width *= 2
+            self._max_table = table
+        level = (last - first).bit_length() - 1
+        row = self._max_table[level]
+        return max(row[first], row[last - (1 << level)])
+
+    def score_for_range(self, start: int, end: int, reduce: str = "mean") -> Optional[float]:
+        """
+        Return the score of the characters in ``[start, end)``.
+
+        :param start: First character offset.
+        :type start: int
+        :param end: Offset just past the last character.
+        :type end: int
+        :param reduce: ``"mean"`` for the mean score per covered character, or ``"max"``
+                       for the highest score. Defaults to ``"mean"``.
+        :type reduce: str
+        :return: The score, or None if no window covers the range.
+        :rtype: float, optional
+        :raises ValueError: If reduce is not ``"mean"`` or ``"max"``.
+        """
+        if reduce == "max":
+            return self._range_max(start, end)
+        if reduce != "mean":
+            raise ValueError('reduce must be "mean" or "max"')
+        if start >= end:
+            return None
+        covered = self._prefix(self._covered, end, False) - self._prefix(self._covered, start, False)
+        if covered <= 0:
+            return None
+        return (self._prefix(self._weighted, end, True) - self._prefix(self._weighted, start, True)) / covered
+
+    def _scored(self, spans: List[Span], reduce: str) -> List[Span]:
+        return [span._replace(score=self.score_for_range(span.start, span.end, reduce)) for span in spans]
+
+    def sentence_scores(self, text: str, reduce: str = "mean") -> List[Span]:
+        """
+        Score each sentence of ``text``. See :func:`sentence_spans` and :meth:`score_for_range`.
+
+        :param text: The document text the windows were computed on.
+        :type text: str
+        :param reduce: ``"mean"`` or ``"max"``. Defaults to ``"mean"``.
+        :type reduce: str
+        :rtype: List[pangram.windows.Span]
+        """
+        return self._scored(sentence_spans(text), reduce)
+
+    def paragraph_scores(self, text: str, reduce: str = "mean") -> List[Span]:
+        """
+        Score each paragraph of ``text``. See :func:`paragraph_spans` and :meth:`score_for_range`.
+
+        :param text: The document text the windows were computed on.
+        :type text: str
+        :param reduce: ``"mean"`` or ``"max"``. Defaults to ``"mean"``.
+        :type reduce: str
+        :rtype: List[pangram.windows.Span]
+        """
+        return self._scored(paragraph_spans(text), reduce)
+
+    def merged_spans(self, min_score: Optional[float] = None) -> List[Span]:
+        """
+        Merge touching segments that share a label into single spans.
+
+        A merged span's score is the mean score per character of its segments.
+
+        :param min_score: Only return spans scoring at least this much. Defaults to all spans.
+        :type min_score: float, optional
+        :rtype: List[pangram.windows.Span]
+        """
+        merged: List[Span] = []
+        for start, end, score, label in zip(self._starts, self._ends, self._scores, self._labels):
+            if merged and merged[-1].end == start and merged[-1].label == label:
+                previous = merged[-1]
+                total = previous.score * (previous.end - previous.start) + score * (end - start)
+                merged[-1] = Span(previous.start, end, total / (end - previous.start), label)
+            else:
+                merged.append(Span(start, end, score, label))
+        if min_score is not None:
+            merged = [span for span in merged if span.score >= min_score]
+        return merged
+
+    def render_html(self, text: str, min_score: Optional[float] = None, class_prefix: str = "pangram") -> str:
+        """
+        Render ``text`` as HTML with the merged spans highlighted. See :func:`render_html`.
+
+        :param text: The document text the windows were computed on.
+        :type text: str
+        :param min_score: Only highlight spans scoring at least this much. Defaults to all spans.
+        :type min_score: float, optional
+        :param class_prefix: Prefix of the CSS classes. Defaults to ``pangram``.
+        :type class_prefix: str
+        :rtype: str
+        """
+        return render_html(text, self.merged_spans(min_score), class_prefix=class_prefix)
+
+    def render_ansi(self, text: str, min_score: Optional[float] = None) -> str:
+        """
+        Render ``text`` for a terminal with the merged spans colored. See :func:`render_ansi`.
+
+        :param text: The document text the windows were computed on.
+        :type text: str
+        :param min_score: Only color spans scoring at least this much. Defaults to all spans.
+        :type min_score: float, optional
+        :rtype: str
+        """
+        return render_ansi(text, self.merged_spans(min_score))
+
+
+def _css_class(prefix: str, label: Optional[str]) -> str:
+    slug = _SLUG.sub("-", (label or "unlabeled").lower()).strip("-")
+    return f"{prefix}-window {prefix}-{slug}"
+
+
+def _render(text: str, spans: Iterable[Span], open_tag: Callable[[Span], Optional[str]], close_tag: str,
+            escape: Callable[[str], str]) -> str:
+    parts = []
+    position = 0
+    for span in spans:
+        start = max(span.start, position)
+        end = min(span.end, len(text))
+        if start >= end:
+            continue
+        tag = open_tag(span)
+        if tag is None:
+            continue
+        parts.append(escape(text[position:start]))
+        parts.append(tag)
+        parts.append(escape(text[start:end]))
+        parts.append(close_tag)
+        position = end
+    parts.append(escape(text[position:]))
+    return "".join(parts)
+
+
+def render_html(text: str, spans: Iterable[Span], class_prefix: str = "pangram") -> str:
+    """
+    Render ``text`` as escaped HTML with each span wrapped in a ``<mark>`` element, in one pass.
+
+    Each ``<mark>`` has the classes ``{class_prefix}-window`` and
+    ``{class_prefix}-{label}``, with the label lowercased and hyphenated, a
+    ``data-score`` attribute, and a ``title`` with the label and score.
+    Spans must be in document order; overlapping parts are skipped.
+
+    :param text: The document text.
+    :type text: str
+    :param spans: Spans to highlight, such as :meth:`WindowIndex.merged_spans`.
+    :type spans: Iterable[pangram.windows.Span]
+    :param class_prefix: Prefix of the CSS classes. Defaults to ``pangram``.
+    :type class_prefix: str
+    :rtype: str
+    """
+
+    def open_tag(span: Span) -> str:
+        score = "" if span.score is None else f"{span.score:.2f}"
+        title = html.escape(f"{span.label or 'Unlabeled'} ({score})" if score else span.label or "Unlabeled")
+        return f'<mark class="{_css_class(class_prefix, span.label)}" data-score="{score}" title="{title}">'
+
+    return _render(text, spans, open_tag, "</mark>", html.escape)
+
+
+def ansi_style(span: Span) -> Optional[str]:
+    """
+    The default terminal style of a span: bold red at or above 0.5, yellow at or above 0.2, otherwise none.
+
+    :rtype: str, optional
+    """
+    if span.score is None:
+        return None
+    if span.score >= AI_SCORE:
+        return ANSI_AI
+    if span.score >= AI_ASSISTED_SCORE:
+        return ANSI_AI_ASSISTED
+    return None
+
+
+def render_ansi(text: str, spans: Iterable[Span], style: Callable[[Span], Optional[str]] = ansi_style) -> str:
+    """
+    Render ``text`` for a terminal with each span colored by ``style``, in one pass.
+
+    :param text: The document text.
+    :type text: str
+    :param spans: Spans to color, in document order.
+    :type spans: Iterable[pangram.windows.Span]
+    :param style: Returns the ANSI escape sequence that starts a span, or None to leave it plain.
+                  Defaults to :func:`ansi_style`.
+    :type style: Callable[[pangram.windows.Span], Optional[str]]
+    :rtype: str
+    """
+    return _render(text, spans, style, ANSI_RESET, lambda chunk: chunk)
@@ -0,0 +1,246 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from pangram import AsyncPangram, AsyncPangramText
+from pangram.text_classifier import API_ENDPOINT, FILE_UPLOAD_API_ENDPOINT, MIN_POLL_INTERVAL_SECONDS
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def make_client(handler):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncPangram(api_key="test-key", client=http_client)
+
+
+@unittest.skipUnless(httpx, "requires httpx")
+class TestAsyncPredict(unittest.IsolatedAsyncioTestCase):
+    async def test_predict_polls_with_async_sleep(self):
+        success_response = {"stage": "STAGE_SUCCESS", "text": "hello", "windows": []}
+        poll_responses = [
+            {"task_id": "task-1", "stage": "STAGE_PREPROCESSING"},
+            success_response,
+        ]
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            if request.method == "POST":
+                return httpx.Response(200, json={"task_id": "task-1"})
+            return httpx.Response(200, json=poll_responses.pop(0))
+
+        pangram_client = make_client(handler)
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await pangram_client.predict("hello", poll_interval=0)
+
+        self.assertEqual(str(requests_seen[0].url), f"{API_ENDPOINT}/task")
+        self.assertEqual(json.loads(requests_seen[0].content), {"text": "hello", "public_dashboard_link": False})
+        self.assertEqual(requests_seen[0].headers["x-api-key"], "test-key")
+        self.assertEqual(str(requests_seen[1].url), f"{API_ENDPOINT}/task/task-1")
+        mock_sleep.assert_awaited_once_with(MIN_POLL_INTERVAL_SECONDS)
+        self.assertEqual(result, success_response)
+
+    async def test_predict_raises_when_async_task_fails(self):
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(200, json={"task_id": "task-1"})
+            return httpx.Response(200, json={"stage": "STAGE_FAILED", "headline": "processing failed"})
+
+        pangram_client = make_client(handler)
+        with self.assertRaisesRegex(ValueError, "processing failed"):
+            await pangram_client.predict("hello", poll_interval=0)
+
+    async def test_predict_keeps_polling_through_retryable_statuses(self):
+        success_response = {"stage": "STAGE_SUCCESS", "text": "hello", "windows": []}
+        poll_responses = [
+            httpx.Response(503, text="unavailable", headers={"Retry-After": "2"}),
+            httpx.Response(200, json=success_response),
+        ]
+
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(200, json={"task_id": "task-1"})
+            return poll_responses.pop(0)
+
+        pangram_client = make_client(handler)
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await pangram_client.predict("hello", poll_interval=0)
+
+        self.assertEqual(result, success_response)
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    async def test_predict_raises_non_retryable_poll_errors(self):
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(200, json={"task_id": "task-1"})
+            return httpx.Response(404, text="not found")
+
+        pangram_client = make_client(handler)
+        with self.assertRaisesRegex(ValueError, r"\[404\] not found"):
+            await pangram_client.predict("hello", poll_interval=0)
+
+    async def test_predict_wraps_submit_request_errors(self):
+        def handler(request):
+            raise httpx.ConnectTimeout("timed out")
+
+        pangram_client = make_client(handler)
+        with self.assertRaisesRegex(ValueError, "submitting prediction task: timed out"):
+            await pangram_client.predict("hello")
+
+
+@unittest.skipUnless(httpx, "requires httpx")
+class TestAsyncBulkAPI(unittest.IsolatedAsyncioTestCase):
+    async def test_submit_bulk_and_wait(self):
+        statuses = [{"bulk_id": "blk_123", "status": "running"}, {"bulk_id": "blk_123", "status": "succeeded"}]
+
+        def handler(request):
+            if request.method == "POST":
+                return httpx.Response(202, json={"bulk_id": "blk_123", "status": "queued"})
+            return httpx.Response(200, json=statuses.pop(0))
+
+        pangram_client = make_client(handler)
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            bulk = await pangram_client.submit_bulk(text=["hello", "world"])
+            status = await pangram_client.wait_for_bulk(bulk["bulk_id"], timeout=10, poll_interval=0)
+
+        self.assertEqual(status["status"], "succeeded")
+        mock_sleep.assert_awaited_once_with(MIN_POLL_INTERVAL_SECONDS)
+
+    async def test_wait_for_bulk_keeps_polling_through_retryable_statuses(self):
+        responses = [
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(429, text="slow down", headers={"Retry-After": "3"}),
+            httpx.Response(200, json={"bulk_id": "blk_123", "status": "succeeded"}),
+        ]
+
+        pangram_client = make_client(lambda request: responses.pop(0))
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            status = await pangram_client.wait_for_bulk("blk_123", timeout=10, poll_interval=0)
+
+        self.assertEqual(status["status"], "succeeded")
+        self.assertEqual([call.args[0] for call in mock_sleep.await_args_list], [MIN_POLL_INTERVAL_SECONDS, 3.0])
+
+    async def test_iter_bulk_completed_keeps_polling_through_retryable_statuses(self):
+        responses = [
+            httpx.Response(502, text="bad gateway"),
+            httpx.Response(200, json={"status": "succeeded", "succeeded": 1, "failed": 0}),
+            httpx.Response(200, json={"total_items": 1, "items": [{"index": 0, "result": {}}], "failed_items": []}),
+        ]
+
+        pangram_client = make_client(lambda request: responses.pop(0))
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock):
+            items = [item async for item in pangram_client.iter_bulk_completed("blk_123", poll_interval=0)]
+
+        self.assertEqual(items, [{"index": 0, "result": {}}])
+
+    async def test_get_bulk_results_fetches_all_pages(self):
+        pages = {
+            "0": {"bulk_id": "blk_123", "total_items": 3, "items": [{"index": 0}], "failed_items": [{"index": 1}]},
+            "2": {"bulk_id": "blk_123", "total_items": 3, "items": [{"index": 2}], "failed_items": []},
+        }
+
+        def handler(request):
+            self.assertEqual(request.url.path, "/bulk/blk_123/results")
+            return httpx.Response(200, json=pages[request.url.params["offset"]])
+
+        pangram_client = make_client(handler)
+        results = await pangram_client.get_bulk_results("blk_123", page_size=2)
+
+        self.assertEqual([item["index"] for item in results["items"]], [0, 2])
+        self.assertEqual([item["index"] for item in results["failed_items"]], [1])
+
+    async def test_iter_bulk_results_streams_tagged_items_from_offset(self):
+        pages = {
+            "1": {"bulk_id": "blk_123", "total_items": 4, "items": [{"index": 2}], "failed_items": [{"index": 1}]},
+            "3": {"bulk_id": "blk_123", "total_items": 4, "items": [{"index": 3}], "failed_items": []},
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[request.url.params["offset"]])
+
+        pangram_client = make_client(handler)
+        items = [item async for item in pangram_client.iter_bulk_results("blk_123", page_size=2, offset=1)]
+
+        self.assertEqual(items, [{"index": 1, "failed": True}, {"index": 2}, {"index": 3}])
+
+    async def test_iter_bulk_completed_yields_items_as_they_finish(self):
+        statuses = [
+            {"status": "running", "succeeded": 1, "failed": 0},
+            {"status": "succeeded", "succeeded": 2, "failed": 0},
+        ]
+        state = {"round": -1}
+
+        def handler(request):
+            if request.url.path.endswith("/results"):
+                done = state["round"] + 1
+                items = [{"index": index, "result": {} if index < done else None} for index in range(2)]
+                return httpx.Response(200, json={"total_items": 2, "items": items, "failed_items": []})
+            state["round"] += 1
+            return httpx.Response(200, json=statuses[state["round"]])
+
+        pangram_client = make_client(handler)
+        with patch("pangram.async_client.asyncio.sleep", new_callable=AsyncMock):
+            items = [item async for item in pangram_client.iter_bulk_completed("blk_123", poll_interval=0)]
+
+        self.assertEqual(items, [{"index": 0, "result": {}}, {"index": 1, "result": {}}])
+
+
+@unittest.skipUnless(httpx, "requires httpx")
+class TestAsyncFileUpload(unittest.IsolatedAsyncioTestCase):
+    async def test_predict_file_uploads_multipart_file(self):
+        requests_seen = []
+
+        def handler(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json=[{"filename": "document.docx"}])
+
+        pangram_client = make_client(handler)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "document.docx")
+            with open(path, "wb") as file_obj:
+                file_obj.write(b"test file contents")
+            result = await pangram_client.predict_file(path, public_dashboard_link=True)
+
+        self.assertEqual(str(requests_seen[0].url), FILE_UPLOAD_API_ENDPOINT)
+        self.assertIn(b'filename="document.docx"', requests_seen[0].content)
+        self.assertIn(b"test file contents", requests_seen[0].content)
+        self.assertEqual(result, {"filename": "document.docx"})
+
+
+@unittest.skipUnless(httpx, "requires httpx")
+class TestAsyncLifecycle(unittest.IsolatedAsyncioTestCase):
+    async def test_context_manager_closes_owned_client(self):
+        async with AsyncPangramText(api_key="test-key") as pangram_client:
+            http_client = pangram_client._client
+        self.assertTrue(http_client.is_closed)
+
+    async def test_aclose_leaves_caller_client_open(self):
+        http_client = httpx.AsyncClient()
+        await AsyncPangramText(api_key="test-key", client=http_client).aclose()
+        self.assertFalse(http_client.is_closed)
+        await http_client.aclose()
+
+
+class TestOptionalHttpx(unittest.TestCase):
+    def test_importing_pangram_does_not_import_httpx(self):
+        script = "import sys, pangram; print('httpx' in sys.modules, 'pangram.async_client' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", script], cwd=root, check=True, capture_output=True, text=True)
+
+        self.assertEqual(output.stdout.strip(), "False False")
+
+    def test_missing_httpx_raises_import_error_on_use(self):
+        with patch("pangram.async_client.httpx", None):
+            with self.assertRaisesRegex(ImportError, r"pangram-sdk\[async\]"):
+                AsyncPangramText(api_key="test-key")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from benchmarks.cases import BENCHMARKS, StubAdapter, setup_bulk_results, setup_predict, stub_client
+from benchmarks.harness import Benchmark, compare, format_report
+
+
+def report(results, quick=False):
+    return {"format": 1, "quick": quick, "environment": {"pangram": "0.3.1"}, "results": results}
+
+
+class TestHarness(unittest.TestCase):
+    def test_measure(self):
+        calls = []
+        result = Benchmark("noop", lambda quick: lambda: calls.append(1), number=4, repeat=3, memory=True).measure()
+
+        self.assertEqual(len(calls), 1 + 4 * 3 + 1)
+        self.assertEqual(result["samples"], 3)
+        self.assertLessEqual(result["min_s"], result["median_s"])
+        self.assertIn("peak_bytes", result)
+        self.assertEqual(Benchmark("timed", lambda quick: lambda: 2.0, self_timed=True).measure(quick=True)["median_s"], 2.0)
+
+    def test_compare_flags_regressions(self):
+        baseline = report({
+            "fast": {"median_s": 1.0},
+            "slow": {"median_s": 1.0},
+            "noisy": {"median_s": 1.0},
+            "memory": {"median_s": 1.0, "peak_bytes": 100},
+            "gone": {"median_s": 1.0},
+        })
+        current = report({
+            "fast": {"median_s": 0.5},
+            "slow": {"median_s": 1.3},
+            "noisy": {"median_s": 1.3},
+            "memory": {"median_s": 1.0, "peak_bytes": 120},
+            "added": {"median_s": 1.0},
+        })
+        rows = compare(baseline, current, time_thresholds={"noisy": 0.5})
+
+        self.assertEqual(
+            {row["name"]: row["status"] for row in rows},
+            {"fast": "improved", "slow": "regressed", "noisy": "ok", "memory": "regressed", "added": "new", "gone": "missing"},
+        )
+        self.assertIn("2 regression(s): slow, memory", format_report(current, rows, baseline))
+        with self.assertRaises(ValueError):
+            compare(baseline, report({}, quick=True))
+
+
+class TestCases(unittest.TestCase):
+    def test_names_are_unique(self):
+        names = [benchmark.name for benchmark in BENCHMARKS]
+        self.assertEqual(len(names), len(set(names)))
+
+    def test_stub_client_runs_predict(self):
+        result = setup_predict(quick=True)()
+        self.assertEqual(result["stage"], "STAGE_SUCCESS")
+
+        client = stub_client([])
+        self.assertIsInstance(client._session.get_adapter("https://example.com"), StubAdapter)
+        with self.assertRaisesRegex(ValueError, "no stub route"):
+            client.check_plagiarism("text")
+
+    def test_bulk_results_fixture_covers_every_item(self):
+        results = setup_bulk_results(typed=False)(quick=True)()
+        self.assertEqual(len(results["items"]), results["total_items"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import MagicMock
+
+from pangram.bulk import BulkChunk, ChunkedBulkJob, aggregate_bulk_status, billable_units, chunk_bulk_entries
+
+
+class TestChunkBulkEntries(unittest.TestCase):
+    def test_splits_by_item_count(self):
+        self.assertEqual(chunk_bulk_entries(["a"] * 5, max_items=2), [range(0, 2), range(2, 4), range(4, 5)])
+
+    def test_splits_by_serialized_size(self):
+        entries = [{"id": str(index), "text": "x" * 20} for index in range(4)]
+        chunks = chunk_bulk_entries(entries, max_bytes=90)
+        self.assertEqual(chunks, [range(0, 2), range(2, 4)])
+
+    def test_splits_by_billable_units(self):
+        long_text = " ".join(["word"] * 1500)
+        self.assertEqual(billable_units(long_text), 2)
+        self.assertEqual(billable_units(""), 1)
+        self.assertEqual(chunk_bulk_entries([long_text] * 3, max_units=4), [range(0, 2), range(2, 3)])
+
+    def test_oversized_entry_gets_its_own_chunk(self):
+        self.assertEqual(chunk_bulk_entries(["a", "x" * 100, "b"], max_bytes=10), [range(0, 1), range(1, 2), range(2, 3)])
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            chunk_bulk_entries(["a"], max_items=0)
+
+
+class TestAggregateBulkStatus(unittest.TestCase):
+    def test_combines_statuses(self):
+        self.assertEqual(aggregate_bulk_status([{"status": "queued"}, {"status": "queued"}]), "queued")
+        self.assertEqual(aggregate_bulk_status([{"status": "succeeded"}, {"status": "queued"}]), "running")
+        self.assertEqual(aggregate_bulk_status([{"status": "succeeded"}, {"status": "succeeded"}]), "succeeded")
+        self.assertEqual(aggregate_bulk_status([{"status": "failed"}, {"status": "failed"}]), "failed")
+        self.assertEqual(aggregate_bulk_status([{"status": "succeeded"}, {"status": "failed"}]), "partial")
+
+
+class TestChunkedBulkJob(unittest.TestCase):
+    def _job(self, client):
+        cached = {"index": 1, "result": {"text": "cached"}, "cached": True}
+        return ChunkedBulkJob(
+            client,
+            [
+                BulkChunk("blk_1", [0, 2], [cached], {"accepted_items": [{"index": 0}, {"index": 2}]}),
+                BulkChunk("blk_2", [3], [], {"accepted_items": [{"index": 3}]}),
+            ],
+            total_items=4,
+        )
+
+    def test_status_aggregates_counts(self):
+        client = MagicMock()
+        client.get_bulk_status.side_effect = lambda bulk_id: {
+            "blk_1": {"status": "succeeded", "accepted": 2, "succeeded": 2, "failed": 0},
+            "blk_2": {"status": "running", "accepted": 1, "succeeded": 0, "failed": 0},
+        }[bulk_id]
+
+        status = self._job(client).status()
+
+        self.assertEqual(status["bulk_ids"], ["blk_1", "blk_2"])
+        self.assertEqual(status["status"], "running")
+        self.assertEqual(status["accepted"], 3)
+        self.assertEqual(status["succeeded"], 3)
+        self.assertEqual(status["cached"], 1)
+
+    def test_wait_shares_one_deadline(self):
+        client = MagicMock()
+        client.wait_for_bulk.return_value = {"status": "succeeded"}
+
+        status = self._job(client).wait(timeout=60, poll_interval=1)
+
+        self.assertEqual(status["status"], "succeeded")
+        self.assertEqual([call.args[0] for call in client.wait_for_bulk.call_args_list], ["blk_1", "blk_2"])
+        for call in client.wait_for_bulk.call_args_list:
+            self.assertLessEqual(call.kwargs["timeout"], 60)
+
+    def test_wait_rejects_invalid_arguments(self):
+        client = MagicMock()
+        job = ChunkedBulkJob(client, [BulkChunk(None, [], [{"index": 0, "cached": True}], {})], total_items=1)
+
+        with self.assertRaisesRegex(ValueError, "timeout must be greater than 0"):
+            self._job(client).wait(timeout=0)
+        with self.assertRaisesRegex(ValueError, "poll_interval cannot be negative"):
+            job.wait(poll_interval=-1)
+        client.wait_for_bulk.assert_not_called()
+
+    def test_results_are_remapped_to_input_order(self):
+        client = MagicMock()
+        client.get_bulk_results.side_effect = lambda bulk_id, **kwargs: {
+            "blk_1": {"items": [{"index": 0, "id": "a"}], "failed_items": [{"index": 1, "id": "c"}]},
+            "blk_2": {"items": [{"index": 0, "id": "d"}], "failed_items": []},
+        }[bulk_id]
+
+        results = self._job(client).results()
+
+        self.assertEqual([item["index"] for item in results["items"]], [0, 1, 3])
+        self.assertEqual([item.get("id") for item in results["items"]], ["a", None, "d"])
+        self.assertEqual(results["failed_items"], [{"index": 2, "id": "c"}])
+        self.assertEqual(results["total_items"], 4)
+
+    def test_iter_results_merges_cached_items_in_order(self):
+        client = MagicMock()
+        client.iter_bulk_results.side_effect = lambda bulk_id, **kwargs: iter(
+            {
+                "blk_1": [{"index": 0}, {"index": 1, "failed": True}],
+                "blk_2": [{"index": 0}],
+            }[bulk_id]
+        )
+
+        items = list(self._job(client).iter_results())
+
+        self.assertEqual([item["index"] for item in items], [0, 1, 2, 3])
+        self.assertTrue(items[1]["cached"])
+        self.assertTrue(items[2]["failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pangram.cache import ResultCache, normalize_text
+
+
+class TestResultCache(unittest.TestCase):
+    def test_keys_use_exact_text_and_include_options(self):
+        cache = ResultCache()
+        self.assertNotEqual(cache.key_for_text("  café\r\n"), cache.key_for_text("café"))
+        self.assertNotEqual(
+            cache.key_for_text("hello", public_dashboard_link=True),
+            cache.key_for_text("hello", public_dashboard_link=False),
+        )
+        self.assertNotEqual(cache.key_for_text("hello"), cache.key_for_bytes(b"hello"))
+
+    def test_normalize_must_preserve_length(self):
+        cache = ResultCache(normalize=normalize_text)
+        self.assertEqual(normalize_text("a\tb\u00a0c\r\n"), "a b c  ")
+        self.assertEqual(cache.key_for_text("a\tb"), cache.key_for_text("a b"))
+        with self.assertRaises(ValueError):
+            ResultCache(normalize=str.strip).key_for_text(" a ")
+
+    def test_returns_copies(self):
+        cache = ResultCache()
+        cache.set("key", {"version": "3.1", "windows": []})
+        cache.get("key")["windows"].append("mutated")
+        self.assertEqual(cache.get("key"), {"version": "3.1", "windows": []})
+
+    def test_stores_raw_json_with_its_version(self):
+        cache = ResultCache()
+        cache.set_json("a", '{"version": "3.1", "text": "caf\u00e9"}'.encode("utf-8"), version="3.1")
+        self.assertEqual(cache.get("a"), {"version": "3.1", "text": "caf\u00e9"})
+        cache.set_json("b", b'{"version": "3.2"}', version="3.2")
+        self.assertIsNone(cache.get("a"))
+
+    def test_evicts_least_recently_used_entries_from_memory(self):
+        cache = ResultCache(max_entries=2)
+        cache.set("a", {"value": 1})
+        cache.set("b", {"value": 2})
+        cache.get("a")
+        cache.set("c", {"value": 3})
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"value": 1})
+        self.assertEqual(len(cache), 2)
+
+    def test_newer_model_version_invalidates_older_results(self):
+        cache = ResultCache()
+        cache.set("a", {"version": "3.1"})
+        cache.set("b", {"version": "3.2"})
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), {"version": "3.2"})
+
+    def test_pinned_model_version(self):
+        cache = ResultCache(model_version="3.1")
+        cache.set("a", {"version": "3.1"})
+        cache.set("b", {"version": "3.2"})
+        self.assertEqual(cache.get("a"), {"version": "3.1"})
+        self.assertIsNone(cache.get("b"))
+
+    def test_persistent_tier_survives_new_cache_instance(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.sqlite")
+            cache = ResultCache(path=path)
+            cache.set("a", {"version": "3.2", "fraction_ai": 0.5})
+            cache.close()
+
+            reopened = ResultCache(path=path)
+            self.assertEqual(reopened.get("a"), {"version": "3.2", "fraction_ai": 0.5})
+            reopened.set("b", {"version": "3.3"})
+            self.assertIsNone(reopened.get("a"))
+            reopened.close()
+
+    def test_persistent_entries_expire_after_ttl(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(max_entries=0, path=os.path.join(directory, "results.sqlite"), ttl=60)
+            with patch("pangram.cache.time.time", return_value=1000.0):
+                cache.set("a", {"value": 1})
+            with patch("pangram.cache.time.time", return_value=1030.0):
+                self.assertEqual(cache.get("a"), {"value": 1})
+            with patch("pangram.cache.time.time", return_value=1061.0):
+                self.assertIsNone(cache.get("a"))
+            cache.close()
+
+    def test_persistent_tier_evicts_least_recently_used_over_size_cap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(max_entries=0, path=os.path.join(directory, "results.sqlite"), max_disk_bytes=40)
+            with patch("pangram.cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+                cache.set("a", {"text": "aaaaaaaa"})
+                cache.set("b", {"text": "bbbbbbbb"})
+                cache.get("a")
+                cache.set("c", {"text": "cccccccc"})
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNotNone(cache.get("c"))
+            cache.close()
+
+    def test_rejects_invalid_parameters(self):
+        with self.assertRaisesRegex(ValueError, "ttl"):
+            ResultCache(ttl=0)
+        with self.assertRaisesRegex(ValueError, "max_disk_bytes"):
+            ResultCache(max_disk_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+
+from pangram import Pangram
+from pangram.codec import JSONCodec, MsgspecCodec, OrjsonCodec, fastest_codec, msgspec, orjson
+
+
+class RecordingCodec(JSONCodec):
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, obj):
+        self.calls.append("dumps")
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.calls.append(("loads", type(data)))
+        return super().loads(data)
+
+
+class FakeResponse:
+    status_code = 202
+    headers = {}
+    content = b'{"bulk_id": "blk_123", "status": "queued"}'
+    text = content.decode("utf-8")
+
+
+class TestJSONCodec(unittest.TestCase):
+    def _assert_round_trip(self, codec):
+        value = {"text": "café ☃", "items": [1, 2.5, None, True]}
+        encoded = codec.dumps(value)
+
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(codec.loads(encoded), value)
+        with self.assertRaises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_stdlib_codec_round_trips_bytes(self):
+        self._assert_round_trip(JSONCodec())
+
+    @unittest.skipUnless(orjson, "requires orjson")
+    def test_orjson_codec_round_trips_bytes(self):
+        self._assert_round_trip(OrjsonCodec())
+        self.assertIsInstance(fastest_codec(), OrjsonCodec)
+
+    @unittest.skipUnless(msgspec, "requires msgspec")
+    def test_msgspec_codec_round_trips_bytes(self):
+        self._assert_round_trip(MsgspecCodec())
+
+    def test_client_encodes_and_decodes_with_codec(self):
+        codec = RecordingCodec()
+        pangram_client = Pangram(api_key="test-key", json_codec=codec)
+
+        with patch("pangram.text_classifier.requests.Session.post", return_value=FakeResponse()) as mock_post:
+            result = pangram_client.submit_bulk(text=["hello"])
+
+        self.assertEqual(result["bulk_id"], "blk_123")
+        self.assertEqual(mock_post.call_args.kwargs["data"], b'{"text":["hello"]}')
+        self.assertEqual(codec.calls, ["dumps", ("loads", bytes)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pangram import Pangram, PangramText
+from pangram.columnar import ParquetResultWriter, ResultColumns, score_histogram, threshold_counts
+from pangram.lazy import LazyPrediction
+from pangram.results import Prediction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def prediction(fraction_ai, scores):
+    return {
+        "prediction_short": "AI" if fraction_ai > 0.5 else "Human",
+        "fraction_ai": fraction_ai,
+        "fraction_ai_assisted": 0.0,
+        "fraction_human": 1.0 - fraction_ai,
+        "num_ai_segments": sum(score > 0.5 for score in scores),
+        "windows": [
+            {"text": "t", "label": "x", "confidence": "High", "ai_assistance_score": score, "start_index": i * 10, "end_index": i * 10 + 9}
+            for i, score in enumerate(scores)
+        ],
+    }
+
+
+PAGE_ONE = [
+    {"index": 0, "id": "a", "stage": "STAGE_SUCCESS", "result": prediction(0.9, [0.8, 0.95])},
+    {"index": 1, "id": "b", "error": "too short", "failed": True},
+]
+PAGE_TWO = [
+    {"index": 2, "id": "c", "stage": "STAGE_SUCCESS", "result": Prediction.from_dict(prediction(0.1, [0.05]))},
+    {"index": 3, "id": "d", "stage": "STAGE_RUNNING", "result": None},
+]
+
+
+class TestOptionalDependencies(unittest.TestCase):
+    def test_importing_pangram_does_not_import_numpy_or_pyarrow(self):
+        script = "import sys, pangram; print(sorted({'numpy', 'pyarrow'} & set(sys.modules)))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", script], cwd=root, check=True, capture_output=True, text=True)
+
+        self.assertEqual(output.stdout.strip(), "[]")
+
+    def test_missing_numpy_raises_import_error_on_use(self):
+        with patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaisesRegex(ImportError, "pip install numpy"):
+                ResultColumns()
+            with self.assertRaisesRegex(ImportError, "pip install numpy"):
+                Pangram(api_key="test-key").export_bulk_results("blk")
+
+
+@unittest.skipUnless(np, "requires numpy")
+class TestResultColumns(unittest.TestCase):
+    def test_builds_document_and_window_tables_page_by_page(self):
+        columns = ResultColumns()
+        columns.add_items(PAGE_ONE)
+        columns.add_items(PAGE_TWO)
+
+        documents = columns.documents()
+        windows = columns.windows()
+
+        self.assertEqual(len(columns), 4)
+        self.assertEqual(documents["index"].tolist(), [0, 1, 2, 3])
+        self.assertEqual(documents["id"].tolist(), ["a", "b", "c", "d"])
+        self.assertEqual(documents["failed"].tolist(), [False, True, False, False])
+        self.assertEqual(documents["error"].tolist(), [None, "too short", None, None])
+        self.assertEqual(documents["prediction_short"].tolist(), ["AI", None, "Human", None])
+        np.testing.assert_array_equal(documents["fraction_ai"], [0.9, np.nan, 0.1, np.nan])
+        self.assertEqual(documents["num_ai_segments"].tolist(), [2, -1, 0, -1])
+        self.assertEqual(documents["num_human_segments"].tolist(), [-1, -1, -1, -1])
+        self.assertEqual(windows["index"].tolist(), [0, 0, 2])
+        self.assertEqual(windows["window"].tolist(), [0, 1, 0])
+        self.assertEqual(windows["confidence"].tolist(), ["High", "High", "High"])
+        self.assertEqual(windows["ai_assistance_score"].tolist(), [0.8, 0.95, 0.05])
+        self.assertEqual(windows["end_index"].tolist(), [9, 19, 9])
+        self.assertEqual(windows["ai_assistance_score"].dtype, np.float64)
+
+    def test_batch_results_and_empty_tables(self):
+        columns = ResultColumns(include_windows=False)
+        self.assertEqual(columns.documents()["fraction_ai"].shape, (0,))
+
+        columns.add_results([prediction(0.5, [0.5]), ValueError("Error returned by API: boom")], start=10)
+
+        documents = columns.documents()
+        self.assertEqual(documents["index"].tolist(), [10, 11])
+        self.assertEqual(documents["error"].tolist(), [None, "Error returned by API: boom"])
+        with self.assertRaises(ValueError):
+            columns.windows()
+
+    def test_aggregates_ignore_missing_scores(self):
+        scores = np.array([0.05, 0.5, 0.95, np.nan, 1.0])
+
+        counts, edges = score_histogram(scores, bins=2)
+
+        self.assertEqual(counts.tolist(), [1, 3])
+        self.assertEqual(edges.tolist(), [0.0, 0.5, 1.0])
+        self.assertEqual(threshold_counts(scores, [0.9, 0.5, 0.0, 1.5]).tolist(), [2, 3, 4, 0])
+
+    def test_export_bulk_results_streams_pages(self):
+        pangram_client = Pangram(api_key="test-key")
+        pages = [
+            {"bulk_id": "blk", "total_items": 4, "items": PAGE_ONE[:1], "failed_items": PAGE_ONE[1:]},
+            {"bulk_id": "blk", "total_items": 4, "items": PAGE_TWO, "failed_items": []},
+        ]
+
+        with patch.object(PangramText, "get_bulk_results_page", side_effect=pages) as mock_page:
+            columns = pangram_client.export_bulk_results("blk", page_size=2, prefetch=False)
+
+        self.assertEqual([call.kwargs for call in mock_page.call_args_list], [{"offset": 0, "limit": 2}, {"offset": 2, "limit": 2}])
+        self.assertEqual(columns.documents()["index"].tolist(), [0, 1, 2, 3])
+        self.assertEqual(columns.windows()["index"].tolist(), [0, 0, 2])
+
+    def test_export_without_windows_decodes_lazily(self):
+        pangram_client = Pangram(api_key="test-key")
+        results = []
+
+        def get_page(bulk_id, offset, limit, lazy=False):
+            result = LazyPrediction(b'{"fraction_ai": 0.75, "windows": [{"ai_assistance_score": 1.0}]}')
+            results.append((lazy, result))
+            return {"total_items": 1, "items": [{"index": 0, "result": result}], "failed_items": []}
+
+        with patch.object(PangramText, "get_bulk_results_page", side_effect=get_page):
+            columns = pangram_client.export_bulk_results("blk", sink=ResultColumns(include_windows=False))
+
+        self.assertEqual(columns.documents()["fraction_ai"].tolist(), [0.75])
+        self.assertTrue(results[0][0])
+        self.assertFalse(results[0][1].decoded)
+
+
+@unittest.skipUnless(np is not None and pa is not None, "requires numpy and pyarrow")
+class TestArrowExport(unittest.TestCase):
+    def test_to_arrow(self):
+        columns = ResultColumns()
+        columns.add_items(PAGE_ONE)
+
+        documents, windows = columns.to_arrow()
+
+        self.assertEqual(documents.num_rows, 2)
+        self.assertEqual(windows.column("ai_assistance_score").to_pylist(), [0.8, 0.95])
+
+    def test_parquet_writer_streams_row_groups(self):
+        directory = tempfile.mkdtemp()
+        documents_path = os.path.join(directory, "documents.parquet")
+        windows_path = os.path.join(directory, "windows.parquet")
+
+        with ParquetResultWriter(documents_path, windows_path) as writer:
+            writer.add_items(PAGE_ONE)
+            writer.add_items(PAGE_TWO)
+
+        documents = pq.read_table(documents_path)
+        self.assertEqual(documents.column("id").to_pylist(), ["a", "b", "c", "d"])
+        self.assertEqual(pq.ParquetFile(documents_path).num_row_groups, 2)
+        self.assertEqual(pq.read_table(windows_path).column("index").to_pylist(), [0, 0, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
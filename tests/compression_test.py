@@ -0,0 +1,29 @@
+import gzip
+import unittest
+
+from pangram.compression import RequestCompression
+
+
+class TestRequestCompression(unittest.TestCase):
+    def test_compresses_bodies_above_threshold(self):
+        body = b'{"text": "' + b"repetitive text " * 500 + b'"}'
+        compressed = RequestCompression(min_size=100, level=9).compress(body)
+
+        self.assertLess(len(compressed), len(body) // 4)
+        self.assertEqual(gzip.decompress(compressed), body)
+
+    def test_skips_small_and_incompressible_bodies(self):
+        compression = RequestCompression(min_size=100)
+
+        self.assertIsNone(compression.compress(b"x" * 99))
+        self.assertIsNone(compression.compress(bytes(range(256))))
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaisesRegex(ValueError, "min_size"):
+            RequestCompression(min_size=-1)
+        with self.assertRaisesRegex(ValueError, "level"):
+            RequestCompression(level=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+from unittest.mock import patch
+
+from pangram import Pangram, PangramText
+from pangram.dedup import DedupPlan, TextNormalizer, fan_out_bulk_items, resolve_normalizer
+
+
+class TestTextNormalizer(unittest.TestCase):
+    def test_options(self):
+        self.assertEqual(TextNormalizer()("  Café\n\n is  open "), "Café is open")
+        self.assertEqual(TextNormalizer(whitespace=False)(" a  b"), " a  b")
+        self.assertEqual(TextNormalizer(unicode_form=None)("é"), "é")
+        self.assertEqual(TextNormalizer(case=True)("Hello WORLD"), "hello world")
+        with self.assertRaises(ValueError):
+            TextNormalizer(unicode_form="NFX")
+
+    def test_resolve_normalizer(self):
+        self.assertIsNone(resolve_normalizer(False))
+        self.assertIsInstance(resolve_normalizer(True), TextNormalizer)
+        self.assertIs(resolve_normalizer(str.lower), str.lower)
+
+
+class TestDedupPlan(unittest.TestCase):
+    def test_groups_duplicates_and_fans_out(self):
+        entries = [
+            {"id": "a", "text": "Hello world"},
+            {"id": "b", "text": "Other"},
+            {"id": "c", "text": "Hello   world\n"},
+            {"text": "Hello world"},
+            {"id": "e", "text": None},
+            {"id": "f", "text": None},
+        ]
+        plan = DedupPlan(entries)
+
+        self.assertEqual(plan.unique_indices, [0, 1, 4, 5])
+        self.assertEqual(plan.groups, [[0, 2, 3], [1], [4], [5]])
+        self.assertEqual(plan.saved, 2)
+        self.assertEqual([entry.get("id") for entry in plan.unique(entries)], ["a", "b", "e", "f"])
+        self.assertEqual(plan.fan_out(["r0", "r1", "r4", "r5"]), ["r0", "r1", "r0", "r0", "r4", "r5"])
+        self.assertEqual(plan.duplicate_items, [{"index": 2, "duplicate_of": 0, "id": "c"}, {"index": 3, "duplicate_of": 0}])
+        self.assertEqual(
+            plan.fan_out_items([{"index": 0, "id": "a", "result": "r0"}, {"index": 1, "id": "b"}]),
+            [
+                {"index": 0, "id": "a", "result": "r0"},
+                {"index": 2, "id": "c", "result": "r0"},
+                {"index": 3, "result": "r0"},
+                {"index": 1, "id": "b"},
+            ],
+        )
+
+    def test_case_insensitive_plan(self):
+        plan = DedupPlan(["Hi", "hi", "HI "], TextNormalizer(case=True))
+        self.assertEqual(plan.saved, 2)
+        self.assertEqual(DedupPlan(["Hi", "hi"]).saved, 0)
+
+
+class TestClientDedup(unittest.TestCase):
+    def test_predict_many_submits_each_unique_text_once(self):
+        pangram_client = Pangram(api_key="test-key")
+        submitted = []
+
+        def fake_submit(text, deadline, public_dashboard_link):
+            submitted.append(text)
+            return f"task-{text}"
+
+        def fake_check(task_id, deadline):
+            return {"stage": "STAGE_SUCCESS", "text": task_id[len("task-"):]}, None
+
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=fake_submit), \
+                patch.object(PangramText, "_check_prediction_task", side_effect=fake_check):
+            results = pangram_client.predict_many(["a b", "c", "a  b ", "c"], dedupe=True)
+        pangram_client.close()
+
+        self.assertEqual(sorted(submitted), ["a b", "c"])
+        self.assertEqual([result["text"] for result in results], ["a b", "c", "a b", "c"])
+        self.assertIs(results[0], results[2])
+        self.assertEqual(pangram_client.metrics["dedup.saved"], 2)
+
+    def test_submit_bulk_dedupes_and_maps_indices(self):
+        pangram_client = Pangram(api_key="test-key")
+        bulk_response = {
+            "bulk_id": "blk_1",
+            "status": "queued",
+            "total_items": 2,
+            "accepted_items": [{"index": 0, "id": "a"}],
+            "failed_items": [{"index": 1, "id": "b", "error": "too short"}],
+        }
+        items = [{"id": "a", "text": "x y"}, {"id": "b", "text": "z"}, {"id": "c", "text": "x  y"}, {"id": "d", "text": "z"}]
+
+        with patch.object(PangramText, "_post_bulk", return_value=bulk_response) as mock_post:
+            submission = pangram_client.submit_bulk(items=items, dedupe=True)
+
+        mock_post.assert_called_once_with({"items": items[:2]})
+        self.assertEqual(submission["submitted_indices"], [0, 1])
+        self.assertEqual(submission["deduplicated"], 2)
+        self.assertEqual([(item["index"], item["id"]) for item in submission["accepted_items"]], [(0, "a"), (2, "c")])
+        self.assertEqual([(item["index"], item["id"]) for item in submission["failed_items"]], [(1, "b"), (3, "d")])
+        self.assertEqual(
+            submission["duplicate_items"],
+            [{"index": 2, "duplicate_of": 0, "id": "c"}, {"index": 3, "duplicate_of": 1, "id": "d"}],
+        )
+
+        results = fan_out_bulk_items([{"index": 0, "id": "a", "result": {"fraction_ai": 1.0}}], submission)
+        self.assertEqual([(item["index"], item["id"]) for item in results], [(0, "a"), (2, "c")])
+        self.assertIs(results[0]["result"], results[1]["result"])
+
+    def test_submit_bulk_chunked_dedupes_across_chunks(self):
+        pangram_client = Pangram(api_key="test-key")
+        items = [{"id": f"row-{index}", "text": f"text {index % 3}"} for index in range(6)]
+        submitted = []
+
+        def submit_bulk(items):
+            submitted.append([item["id"] for item in items])
+            return {
+                "bulk_id": f"blk_{items[0]['id']}",
+                "accepted_items": [{"index": index, "id": item["id"]} for index, item in enumerate(items)],
+                "failed_items": [],
+            }
+
+        def get_bulk_results(bulk_id, page_size, max_workers):
+            return {"items": [{"index": 0, "id": bulk_id[4:], "result": bulk_id}], "failed_items": []}
+
+        with patch.object(PangramText, "submit_bulk", side_effect=submit_bulk):
+            job = pangram_client.submit_bulk_chunked(items=items, max_items_per_job=2, dedupe=True)
+        with patch.object(PangramText, "get_bulk_results", side_effect=get_bulk_results):
+            results = job.results()
+
+        self.assertEqual(sorted(submitted), [["row-0", "row-1"], ["row-2"]])
+        self.assertEqual(job.deduplicated, 3)
+        self.assertEqual(job.total_items, 6)
+        self.assertEqual([(item["index"], item["id"]) for item in job.accepted_items][:2], [(0, "row-0"), (3, "row-3")])
+        self.assertEqual(
+            [(item["index"], item["id"], item["result"]) for item in results["items"]],
+            [(0, "row-0", "blk_row-0"), (2, "row-2", "blk_row-2"), (3, "row-3", "blk_row-0"), (5, "row-5", "blk_row-2")],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
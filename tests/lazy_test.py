@@ -0,0 +1,142 @@
+import json
+import pickle
+import unittest
+
+from pangram.codec import JSONCodec
+from pangram.lazy import LazyPrediction, _value_end, lazy_prediction, lazy_results_page
+from pangram.results import Prediction, Stage
+
+TEXT = 'He said "hi" [twice] {really}.\nThen a path: C:\\temp\\new.'
+PREDICTION = {
+    "stage": "STAGE_SUCCESS",
+    "text": TEXT,
+    "version": "3.1",
+    "prediction_short": "AI",
+    "fraction_ai": 0.75,
+    "windows": [
+        {"text": 'He said "hi" [twice] {really}.', "label": "AI-Generated", "confidence": "High", "start_index": 0, "end_index": 30},
+        {"text": "Then a path: C:\\temp\\new.", "label": "Human", "confidence": "Low", "start_index": 31, "end_index": 56},
+    ],
+    "future_field": {"nested": [1, {"a": "]"}]},
+}
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.decoded = []
+
+    def loads(self, data):
+        self.decoded.append(bytes(data))
+        return super().loads(data)
+
+
+class TestValueEnd(unittest.TestCase):
+    def test_finds_the_end_of_every_kind_of_value(self):
+        values = [
+            '"plain"',
+            '"escaped \\" quote \\\\"',
+            "-12.5e3",
+            "true",
+            "null",
+            "[]",
+            '[{"a": "]"}, {"b": [1, [2]]}]',
+            '{"k": "}", "l": {"m": "\\\\"}}',
+            '["\\\\", "]"]',
+            '[{"text": "x \\"[y]\\" z"}]',
+        ]
+        for value in values:
+            data = f'{{"v": {value} , "after": 1}}'.encode("utf-8")
+            start = data.index(b":") + 2
+            with self.subTest(value=value):
+                self.assertEqual(data[start : _value_end(data, start)].decode("utf-8"), value)
+
+    def test_rejects_unterminated_values(self):
+        for data in (b'"open', b"[1, 2", b'{"a": "b}'):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                _value_end(data, 0)
+
+
+class TestLazyPrediction(unittest.TestCase):
+    def test_decodes_windows_and_text_on_first_access(self):
+        codec = CountingCodec()
+        prediction = LazyPrediction(json.dumps(PREDICTION, indent=2).encode("utf-8"), codec)
+
+        self.assertEqual(len(codec.decoded), 1)
+        self.assertNotIn(b"windows", codec.decoded[0])
+        self.assertIs(prediction.stage, Stage.SUCCESS)
+        self.assertEqual(prediction["fraction_ai"], 0.75)
+        self.assertEqual(prediction.extra, {"future_field": {"nested": [1, {"a": "]"}]}})
+        self.assertFalse(prediction.decoded)
+        self.assertEqual(len(codec.decoded), 1)
+
+        windows = prediction.windows
+        self.assertTrue(prediction.decoded)
+        self.assertIs(prediction.windows, windows)
+        self.assertEqual(windows[0].text, 'He said "hi" [twice] {really}.')
+        self.assertIs(windows[0]._source, prediction.text)
+        self.assertEqual(len(codec.decoded), 3)
+
+    def test_behaves_like_a_typed_prediction(self):
+        prediction = lazy_prediction(json.dumps(PREDICTION).encode("utf-8"))
+
+        self.assertIsInstance(prediction, Prediction)
+        self.assertEqual(prediction, PREDICTION)
+        self.assertEqual(prediction.to_dict(), PREDICTION)
+        self.assertEqual(prediction, Prediction.from_dict(PREDICTION))
+        with self.assertRaises(AttributeError):
+            prediction.windows = ()
+        restored = pickle.loads(pickle.dumps(lazy_prediction(json.dumps(PREDICTION).encode("utf-8"))))
+        self.assertEqual(type(restored), Prediction)
+        self.assertEqual(restored.to_dict(), PREDICTION)
+
+    def test_missing_deferred_fields_stay_absent(self):
+        prediction = lazy_prediction(b'{"stage": "STAGE_RUNNING"}')
+
+        self.assertTrue(prediction.decoded)
+        self.assertIsNone(prediction.windows)
+        self.assertNotIn("windows", prediction)
+        self.assertEqual(prediction.to_dict(), {"stage": "STAGE_RUNNING"})
+
+    def test_malformed_windows_raise_on_access(self):
+        prediction = lazy_prediction(b'{"fraction_ai": 1.0, "windows": [{"text": oops}]}')
+
+        self.assertEqual(prediction.fraction_ai, 1.0)
+        with self.assertRaises(ValueError):
+            prediction.windows
+
+    def test_non_objects_are_decoded_in_full(self):
+        self.assertEqual(lazy_prediction(b" [1, 2]"), [1, 2])
+        with self.assertRaises(ValueError):
+            lazy_prediction(b'{"stage": }')
+
+
+class TestLazyResultsPage(unittest.TestCase):
+    def test_defers_each_result_and_keeps_only_its_bytes(self):
+        page = {
+            "bulk_id": "blk_123",
+            "total_items": 3,
+            "items": [
+                {"index": 0, "id": "a", "stage": "STAGE_SUCCESS", "result": PREDICTION},
+                {"index": 1, "id": "b", "stage": "STAGE_RUNNING", "result": None},
+            ],
+            "failed_items": [{"index": 2, "stage": "STAGE_FAILED", "error": "too short"}],
+        }
+        data = json.dumps(page, ensure_ascii=False).encode("utf-8")
+
+        decoded = lazy_results_page(data)
+        result = decoded["items"][0]["result"]
+
+        self.assertIsInstance(result, LazyPrediction)
+        self.assertFalse(result.decoded)
+        self.assertLess(len(result._raw), len(data))
+        self.assertIsNone(decoded["items"][1]["result"])
+        self.assertEqual(decoded, page)
+
+    def test_empty_pages(self):
+        self.assertEqual(lazy_results_page(b'{"items": [], "failed_items": []}'), {"items": [], "failed_items": []})
+        self.assertEqual(lazy_results_page(b'{"items": null}'), {"items": None})
+        self.assertEqual(lazy_results_page(b'{"error": "bad"}'), {"error": "bad"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import patch
+
+from pangram import Pangram, PangramText
+from pangram.long_text import merge_predictions, split_text
+from pangram.results import Prediction
+
+TEXT = "Alpha one. Alpha two.\n\nBeta paragraph here.\n\nGamma is a much longer paragraph. It has two sentences."
+
+
+def chunk_result(text, fraction_ai, label):
+    return {
+        "stage": "STAGE_SUCCESS",
+        "text": text,
+        "version": "3.0",
+        "prediction_short": label,
+        "fraction_ai": fraction_ai,
+        "fraction_ai_assisted": 0.0,
+        "fraction_human": 1.0 - fraction_ai,
+        "num_ai_segments": 1 if fraction_ai else 0,
+        "num_ai_assisted_segments": 0,
+        "num_human_segments": 0 if fraction_ai else 1,
+        "windows": [{"text": text, "label": label, "ai_assistance_score": fraction_ai, "start_index": 0, "end_index": len(text)}],
+    }
+
+
+class TestSplitText(unittest.TestCase):
+    def test_packs_paragraphs_then_sentences(self):
+        chunks = split_text(TEXT, max_chars=45)
+
+        self.assertEqual(
+            [TEXT[start:end] for start, end in chunks],
+            ["Alpha one. Alpha two.\n\nBeta paragraph here.", "Gamma is a much longer paragraph.", "It has two sentences."],
+        )
+        self.assertTrue(all(end - start <= 45 for start, end in chunks))
+        self.assertEqual(split_text(TEXT), [(0, len(TEXT))])
+        self.assertEqual(split_text("   "), [])
+
+    def test_splits_oversized_sentences_at_spaces(self):
+        text = "word " * 10 + "x" * 12
+        chunks = split_text(text, max_chars=10)
+
+        self.assertTrue(all(end - start <= 10 for start, end in chunks))
+        self.assertEqual(
+            [text[start:end] for start, end in chunks],
+            ["word word"] * 5 + ["x" * 10, "xx"],
+        )
+        with self.assertRaises(ValueError):
+            split_text(text, max_chars=0)
+
+
+class TestMergePredictions(unittest.TestCase):
+    def test_remaps_windows_and_weights_fractions(self):
+        chunks = [(0, 10), (20, 50)]
+        merged = merge_predictions(
+            "x" * 50,
+            chunks,
+            [chunk_result("a" * 10, 1.0, "AI"), Prediction.from_dict(chunk_result("b" * 30, 0.0, "Human"))],
+        )
+
+        self.assertEqual([(w["start_index"], w["end_index"]) for w in merged["windows"]], [(0, 10), (20, 50)])
+        self.assertAlmostEqual(merged["fraction_ai"], 0.25)
+        self.assertAlmostEqual(merged["fraction_human"], 0.75)
+        self.assertEqual(merged["num_ai_segments"], 1)
+        self.assertEqual(merged["num_human_segments"], 1)
+        self.assertEqual(merged["prediction_short"], "Mixed")
+        self.assertEqual(merged["headline"], "Mixed AI and Human Writing")
+        self.assertEqual(merged["prediction"], "Mixed AI and Human Writing")
+        self.assertEqual(merged["version"], "3.0")
+        self.assertEqual(merged["stage"], "STAGE_SUCCESS")
+        self.assertEqual(merged["chunks"], [{"start_index": 0, "end_index": 10}, {"start_index": 20, "end_index": 50}])
+        with self.assertRaises(ValueError):
+            merge_predictions("x", chunks, [])
+
+    def test_keeps_agreed_headline_and_chunk_dashboard_links(self):
+        results = [chunk_result("a", 1.0, "AI"), chunk_result("b", 1.0, "AI")]
+        results[0].update(headline="AI Detected", prediction="We are confident this is AI", dashboard_link="https://x/1")
+        results[1].update(headline="AI Detected", prediction="We believe this is AI", dashboard_link="https://x/2")
+
+        merged = merge_predictions("a b", [(0, 1), (2, 3)], results)
+
+        self.assertEqual(merged["prediction_short"], "AI")
+        self.assertEqual(merged["headline"], "AI Detected")
+        self.assertEqual(merged["prediction"], "AI Detected")
+        self.assertEqual([chunk["dashboard_link"] for chunk in merged["chunks"]], ["https://x/1", "https://x/2"])
+
+
+class TestPredictLong(unittest.TestCase):
+    def test_scores_chunks_and_merges(self):
+        pangram_client = Pangram(api_key="test-key")
+
+        def predict_many(texts, **kwargs):
+            return [chunk_result(text, 1.0 if text.startswith("Gamma") else 0.0, "AI" if text.startswith("Gamma") else "Human") for text in texts]
+
+        with patch.object(PangramText, "predict_many", side_effect=predict_many) as mock_many:
+            result = pangram_client.predict_long(
+                TEXT, public_dashboard_link=True, max_chunk_chars=45, max_concurrency=2, typed=True
+            )
+
+        self.assertEqual(len(mock_many.call_args.args[0]), 3)
+        self.assertEqual(mock_many.call_args.kwargs["max_concurrency"], 2)
+        self.assertTrue(mock_many.call_args.kwargs["public_dashboard_link"])
+        self.assertEqual(result.headline, "Mixed AI and Human Writing")
+        self.assertIsInstance(result, Prediction)
+        self.assertEqual(result.text, TEXT)
+        for window in result.windows:
+            self.assertEqual(TEXT[window.start_index : window.end_index], window.text)
+        self.assertAlmostEqual(result.fraction_ai, 33 / (43 + 33 + 21))
+
+    def test_short_text_and_failures(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(PangramText, "predict", return_value={"text": "short"}) as mock_predict:
+            self.assertEqual(pangram_client.predict_long("short"), {"text": "short"})
+        self.assertEqual(mock_predict.call_args.args, ("short",))
+
+        with patch.object(PangramText, "predict_many", return_value=[{}, ValueError("Error returned by API: boom"), {}]):
+            with self.assertRaisesRegex(ValueError, "boom"):
+                pangram_client.predict_long(TEXT, max_chunk_chars=45)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,39 @@
+import gzip
+import json
 import unittest
 import requests
 from pangram import Pangram, PangramText
+from pangram.cache import ResultCache, normalize_text
+from pangram.codec import DEFAULT_CODEC
+from pangram.compression import RequestCompression
+from pangram.errors import PangramAPIError
+from pangram.lazy import LazyPrediction
+from pangram.poller import TaskPoller
+from pangram.polling import AdaptivePolling
+from pangram.rate_limit import RateLimiter
+from pangram.results import BulkItem, Prediction
+from pangram.retry import NO_RETRY, RetryPolicy
 from pangram.text_classifier import API_ENDPOINT, FILE_UPLOAD_API_ENDPOINT, MIN_POLL_INTERVAL_SECONDS
 import os
+import re
 import tempfile
+import threading
+import time
 from unittest.mock import patch
 
 
 class MockResponse:
-    def __init__(self, status_code=200, json_data=None, text=""):
+    def __init__(self, status_code=200, json_data=None, text="", headers=None):
         self.status_code = status_code
         self._json_data = json_data
         self.text = text
+        self.headers = headers or {}
+
+    @property
+    def content(self):
+        if self._json_data is not None:
+            return json.dumps(self._json_data).encode("utf-8")
+        return self.text.encode("utf-8")
 
     def json(self):
         return self._json_data
@@ -49,10 +71,10 @@ class TestPredict(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(json_data={"task_id": "task-1"}),
         ) as mock_post, patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             side_effect=[
                 MockResponse(json_data={"task_id": "task-1", "stage": "STAGE_PREPROCESSING"}),
                 MockResponse(json_data=success_response),
@@ -61,18 +83,61 @@ class TestPredict(unittest.TestCase):
             result = pangram_client.predict(text, poll_interval=0)
 
         self.assertEqual(mock_post.call_args.args[0], f"{API_ENDPOINT}/task")
-        self.assertEqual(mock_post.call_args.kwargs["json"], {"text": text, "public_dashboard_link": False})
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"text": text, "public_dashboard_link": False})
         self.assertEqual(mock_post.call_args.kwargs["headers"]["x-api-key"], "test-key")
         mock_sleep.assert_called_once_with(MIN_POLL_INTERVAL_SECONDS)
         self.assertEqual(result, success_response)
 
+    def test_predict_returns_typed_result(self):
+        pangram_client = Pangram(api_key="test-key")
+        success_response = {"stage": "STAGE_SUCCESS", "text": "hello", "fraction_ai": 0.25, "windows": []}
+
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ), patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(json_data=success_response),
+        ):
+            result = pangram_client.predict("hello", typed=True)
+
+        self.assertIsInstance(result, Prediction)
+        self.assertEqual(result.fraction_ai, 0.25)
+        self.assertEqual(result, success_response)
+
+    def test_predict_returns_lazy_result_and_caches_it_without_decoding(self):
+        pangram_client = Pangram(api_key="test-key", cache=ResultCache())
+        success_response = {
+            "stage": "STAGE_SUCCESS",
+            "text": "hello",
+            "fraction_ai": 0.25,
+            "windows": [{"text": "hello", "label": "Human", "start_index": 0, "end_index": 5}],
+        }
+
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ), patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[MockResponse(json_data={"stage": "STAGE_RUNNING"}), MockResponse(json_data=success_response)],
+        ), patch("pangram.text_classifier.time.sleep"):
+            result = pangram_client.predict("hello", lazy=True)
+        cached = pangram_client.predict("hello", lazy=True)
+
+        self.assertIsInstance(result, LazyPrediction)
+        self.assertFalse(result.decoded)
+        self.assertEqual(result.fraction_ai, 0.25)
+        self.assertEqual(result, success_response)
+        self.assertIsInstance(cached, Prediction)
+        self.assertEqual(cached, success_response)
+
     def test_predict_raises_when_async_task_fails(self):
         pangram_client = Pangram(api_key="test-key")
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(json_data={"task_id": "task-1"}),
         ), patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             return_value=MockResponse(json_data={
                 "task_id": "task-1",
                 "stage": "STAGE_FAILED",
@@ -90,7 +155,7 @@ class TestPredict(unittest.TestCase):
     def test_predict_wraps_submit_request_errors(self):
         pangram_client = Pangram(api_key="test-key")
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             side_effect=requests.exceptions.Timeout("timed out"),
         ):
             with self.assertRaisesRegex(ValueError, "submitting prediction task: timed out"):
@@ -105,10 +170,10 @@ class TestPredict(unittest.TestCase):
             "windows": [],
         }
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(json_data={"task_id": "task-1"}),
         ), patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             side_effect=[
                 requests.exceptions.ConnectionError("connection dropped"),
                 MockResponse(json_data=success_response),
@@ -119,6 +184,26 @@ class TestPredict(unittest.TestCase):
         mock_sleep.assert_called_once_with(MIN_POLL_INTERVAL_SECONDS)
         self.assertEqual(result, success_response)
 
+    def test_predict_with_polling_strategy_honors_retry_after(self):
+        pangram_client = Pangram(api_key="test-key", polling=AdaptivePolling(initial_interval=0.2, jitter=0))
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ), patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[
+                MockResponse(json_data={"task_id": "task-1", "stage": "STAGE_PREPROCESSING"}),
+                MockResponse(
+                    json_data={"task_id": "task-1", "stage": "STAGE_PREPROCESSING"},
+                    headers={"Retry-After": "2"},
+                ),
+                MockResponse(json_data={"stage": "STAGE_SUCCESS", "windows": []}),
+            ],
+        ), patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            pangram_client.predict("hello", timeout=60)
+
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.2, 2.0])
+
     def test_predict_short_forwards_to_predict(self):
         text = "hello!"
         pangram_client = Pangram(api_key="test-key")
@@ -135,11 +220,131 @@ class TestBatchPredict(unittest.TestCase):
         text2 = "i'm a human"
         text_batch = [text1, text2]
         pangram_client = Pangram(api_key="test-key")
-        with patch.object(PangramText, "predict", side_effect=[{"text": text1}, {"text": text2}]):
+        with patch.object(PangramText, "predict_many", return_value=[{"text": text1}, {"text": text2}]) as mock_many:
             with self.assertWarnsRegex(DeprecationWarning, "batch_predict"):
                 results = pangram_client.batch_predict(text_batch)
+        mock_many.assert_called_once_with(text_batch, dedupe=False)
         self.assertEqual(len(results), len(text_batch))
 
+    def test_batch_predict_raises_first_error(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(PangramText, "predict_many", return_value=[{"text": "a"}, ValueError("bad input")]):
+            with self.assertWarns(DeprecationWarning):
+                with self.assertRaisesRegex(ValueError, "bad input"):
+                    pangram_client.batch_predict(["a", "b"])
+
+class TestPredictMany(unittest.TestCase):
+    @staticmethod
+    def _fake_submit(text, deadline, public_dashboard_link):
+        if text == "rejected":
+            raise ValueError("Error returned by API: [400] rejected")
+        return f"task-{text}"
+
+    @staticmethod
+    def _fake_check(task_id, deadline):
+        if task_id == "task-bad":
+            raise ValueError(f"Error returned by API: task {task_id} failed: processing failed")
+        return {"stage": "STAGE_SUCCESS", "text": task_id[len("task-"):]}, None
+
+    def test_predict_many_preserves_order_and_reports_errors(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=self._fake_submit) as mock_submit, \
+                patch.object(PangramText, "_check_prediction_task", side_effect=self._fake_check):
+            results = pangram_client.predict_many(["a", "bad", "rejected", "c"], max_concurrency=2, timeout=5)
+        pangram_client.close()
+
+        self.assertEqual(results[0]["text"], "a")
+        self.assertRegex(str(results[1]), "processing failed")
+        self.assertRegex(str(results[2]), "rejected")
+        self.assertEqual(results[3]["text"], "c")
+        self.assertEqual(mock_submit.call_count, 4)
+
+    def test_predict_as_completed_yields_indexed_results(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=self._fake_submit), \
+                patch.object(PangramText, "_check_prediction_task", side_effect=self._fake_check):
+            results = dict(pangram_client.predict_as_completed(["a", "b"]))
+        pangram_client.close()
+
+        self.assertEqual({index: result["text"] for index, result in results.items()}, {0: "a", 1: "b"})
+
+    def test_predict_as_completed_cancels_unfinished_tasks_when_closed_early(self):
+        pangram_client = Pangram(api_key="test-key")
+        futures = []
+        all_submitted = threading.Event()
+        submit = TaskPoller.submit
+
+        def record_submit(poller, *args):
+            future = submit(poller, *args)
+            futures.append(future)
+            if len(futures) == 3:
+                all_submitted.set()
+            return future
+
+        def fake_check(task_id, deadline):
+            if task_id == "task-a" and all_submitted.wait(5):
+                return {"stage": "STAGE_SUCCESS", "text": "a"}, None
+            return None, None
+
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=self._fake_submit), \
+                patch.object(PangramText, "_check_prediction_task", side_effect=fake_check), \
+                patch.object(TaskPoller, "submit", autospec=True, side_effect=record_submit):
+            completed = pangram_client.predict_as_completed(["a", "b", "c"], poll_interval=0.1)
+            index, result = next(completed)
+            completed.close()
+            give_up = time.monotonic() + 5
+            while not all(future.done() for future in futures) and time.monotonic() < give_up:
+                time.sleep(0.01)
+            cancelled = sorted(future.cancelled() for future in futures)
+        pangram_client.close()
+
+        self.assertEqual((index, result["text"]), (0, "a"))
+        self.assertEqual(cancelled, [False, True, True])
+
+    def test_predict_many_bounds_tasks_in_flight(self):
+        pangram_client = Pangram(api_key="test-key")
+        in_flight = set()
+        max_seen = []
+        lock = threading.Lock()
+
+        def fake_submit(text, deadline, public_dashboard_link):
+            with lock:
+                in_flight.add(text)
+                max_seen.append(len(in_flight))
+            return f"task-{text}"
+
+        def fake_check(task_id, deadline):
+            with lock:
+                in_flight.discard(task_id[len("task-"):])
+            return {"stage": "STAGE_SUCCESS", "text": task_id}, None
+
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=fake_submit), \
+                patch.object(PangramText, "_check_prediction_task", side_effect=fake_check):
+            results = pangram_client.predict_many([str(i) for i in range(20)], max_concurrency=3)
+        pangram_client.close()
+
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(max(max_seen), 3)
+
+    def test_submit_prediction_returns_future(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(PangramText, "_submit_prediction_task", side_effect=self._fake_submit), \
+                patch.object(PangramText, "_check_prediction_task", side_effect=self._fake_check):
+            future = pangram_client.submit_prediction("a", timeout=5)
+            result = future.result(timeout=5)
+        pangram_client.close()
+
+        self.assertEqual(result["text"], "a")
+
+    def test_predict_many_handles_empty_input(self):
+        pangram_client = Pangram(api_key="test-key")
+        self.assertEqual(pangram_client.predict_many([]), [])
+
+    def test_predict_many_rejects_invalid_concurrency(self):
+        pangram_client = Pangram(api_key="test-key")
+        with self.assertRaisesRegex(ValueError, "max_concurrency"):
+            pangram_client.predict_many(["a"], max_concurrency=0)
+
 class TestBulkAPI(unittest.TestCase):
     def test_submit_bulk_with_text_list(self):
         pangram_client = Pangram(api_key="test-key")
@@ -155,13 +360,13 @@ class TestBulkAPI(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(status_code=202, json_data=bulk_response),
         ) as mock_post:
             result = pangram_client.submit_bulk(text=["hello", "world"])
 
         self.assertEqual(mock_post.call_args.args[0], f"{API_ENDPOINT}/bulk")
-        self.assertEqual(mock_post.call_args.kwargs["json"], {"text": ["hello", "world"]})
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"text": ["hello", "world"]})
         self.assertEqual(mock_post.call_args.kwargs["headers"]["x-api-key"], "test-key")
         self.assertEqual(result, bulk_response)
 
@@ -180,7 +385,7 @@ class TestBulkAPI(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(status_code=202, json_data=bulk_response),
         ) as mock_post:
             result = pangram_client.submit_bulk(items=[
@@ -188,7 +393,7 @@ class TestBulkAPI(unittest.TestCase):
                 {"id": "row-2", "text": ""},
             ])
 
-        self.assertEqual(mock_post.call_args.kwargs["json"], {
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {
             "items": [
                 {"id": "row-1", "text": "hello"},
                 {"id": "row-2", "text": ""},
@@ -206,7 +411,7 @@ class TestBulkAPI(unittest.TestCase):
     def test_submit_bulk_wraps_request_errors(self):
         pangram_client = Pangram(api_key="test-key")
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             side_effect=requests.exceptions.Timeout("timed out"),
         ):
             with self.assertRaisesRegex(ValueError, "submitting bulk job: timed out"):
@@ -226,7 +431,7 @@ class TestBulkAPI(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             return_value=MockResponse(json_data=status_response),
         ) as mock_get:
             result = pangram_client.get_bulk_status("blk_123")
@@ -254,7 +459,7 @@ class TestBulkAPI(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             side_effect=[
                 MockResponse(json_data=items_response),
                 MockResponse(json_data=results_response),
@@ -309,11 +514,175 @@ class TestBulkAPI(unittest.TestCase):
         self.assertEqual([item["index"] for item in results["items"]], [0, 2])
         self.assertEqual([item["index"] for item in results["failed_items"]], [1])
 
+    def test_get_bulk_results_fetches_remaining_pages_concurrently_in_order(self):
+        pangram_client = Pangram(api_key="test-key")
+        later_pages_started = threading.Barrier(3, timeout=5)
+
+        def get_page(bulk_id, offset, limit):
+            if offset:
+                later_pages_started.wait()
+            return {
+                "total_items": 7,
+                "items": [{"index": index} for index in range(offset, min(offset + limit, 7))],
+                "failed_items": [],
+            }
+
+        with patch.object(PangramText, "get_bulk_results_page", side_effect=get_page) as mock_page:
+            results = pangram_client.get_bulk_results("blk_123", page_size=2, max_workers=3)
+
+        self.assertEqual(mock_page.call_count, 4)
+        self.assertEqual(mock_page.call_args_list[0].kwargs, {"offset": 0, "limit": 2})
+        self.assertEqual([item["index"] for item in results["items"]], list(range(7)))
+        self.assertEqual(results["total_items"], 7)
+
+    def test_get_bulk_results_rejects_invalid_max_workers(self):
+        pangram_client = Pangram(api_key="test-key")
+        with self.assertRaisesRegex(ValueError, "max_workers must be at least 1"):
+            pangram_client.get_bulk_results("blk_123", max_workers=0)
+
+    def test_iter_bulk_results_streams_pages_in_item_order(self):
+        pangram_client = Pangram(api_key="test-key")
+        pages = [
+            {
+                "total_items": 3,
+                "items": [{"index": 0, "result": {}}],
+                "failed_items": [{"index": 1, "error": "invalid text"}],
+            },
+            {"total_items": 3, "items": [{"index": 2, "result": {}}], "failed_items": []},
+        ]
+
+        with patch.object(PangramText, "get_bulk_results_page", side_effect=pages) as mock_page:
+            items = pangram_client.iter_bulk_results("blk_123", page_size=2)
+            first = next(items)
+            rest = list(items)
+
+        self.assertEqual(first, {"index": 0, "result": {}})
+        self.assertEqual(rest, [{"index": 1, "error": "invalid text", "failed": True}, {"index": 2, "result": {}}])
+        self.assertEqual([call.kwargs for call in mock_page.call_args_list], [{"offset": 0, "limit": 2}, {"offset": 2, "limit": 2}])
+
+    def test_iter_bulk_results_pages_yields_one_list_per_page(self):
+        pangram_client = Pangram(api_key="test-key")
+        pages = [
+            {"total_items": 3, "items": [{"index": 0}], "failed_items": [{"index": 1, "error": "invalid text"}]},
+            {"total_items": 3, "items": [{"index": 2}], "failed_items": []},
+        ]
+
+        with patch.object(PangramText, "get_bulk_results_page", side_effect=pages):
+            results = list(pangram_client.iter_bulk_results_pages("blk_123", page_size=2, typed=True))
+
+        self.assertEqual([[item.index for item in page] for page in results], [[0, 1], [2]])
+        self.assertTrue(results[0][1].failed)
+        with self.assertRaisesRegex(ValueError, "page_size must be between"):
+            pangram_client.iter_bulk_results_pages("blk_123", page_size=0)
+
+    def test_get_bulk_results_returns_typed_items(self):
+        pangram_client = Pangram(api_key="test-key")
+        page = {
+            "bulk_id": "blk_123",
+            "total_items": 2,
+            "items": [{"index": 0, "result": {"fraction_ai": 1.0}}],
+            "failed_items": [{"index": 1, "error": "invalid text"}],
+        }
+
+        with patch.object(PangramText, "get_bulk_results_page", return_value=page):
+            results = pangram_client.get_bulk_results("blk_123", typed=True)
+            items = list(pangram_client.iter_bulk_results("blk_123", typed=True))
+
+        self.assertIsInstance(results["items"][0], BulkItem)
+        self.assertEqual(results["items"][0].result.fraction_ai, 1.0)
+        self.assertEqual(results["failed_items"][0].error, "invalid text")
+        self.assertEqual([item.index for item in items], [0, 1])
+        self.assertTrue(items[1].failed)
+
+    def test_bulk_results_decode_windows_lazily(self):
+        pangram_client = Pangram(api_key="test-key")
+        result = {"fraction_ai": 1.0, "text": "ab", "windows": [{"text": "ab", "start_index": 0, "end_index": 2}]}
+        page = {"bulk_id": "blk_123", "total_items": 1, "items": [{"index": 0, "result": result}], "failed_items": []}
+
+        with patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[MockResponse(json_data=page), MockResponse(json_data=page), MockResponse(json_data=page)],
+        ):
+            fetched = pangram_client.get_bulk_results_page("blk_123", lazy=True)
+            merged = pangram_client.get_bulk_results("blk_123", lazy=True)
+            items = list(pangram_client.iter_bulk_results("blk_123", lazy=True, typed=True))
+
+        for lazy_result in (fetched["items"][0]["result"], merged["items"][0]["result"], items[0].result):
+            self.assertIsInstance(lazy_result, LazyPrediction)
+            self.assertFalse(lazy_result.decoded)
+            self.assertEqual(lazy_result.fraction_ai, 1.0)
+            self.assertEqual(lazy_result, result)
+
+    def test_iter_bulk_results_resumes_from_offset_without_prefetch(self):
+        pangram_client = Pangram(api_key="test-key")
+        page = {"total_items": 5, "items": [{"index": 3}, {"index": 4}], "failed_items": []}
+
+        with patch.object(PangramText, "get_bulk_results_page", return_value=page) as mock_page:
+            items = list(pangram_client.iter_bulk_results("blk_123", page_size=2, offset=3, prefetch=False))
+
+        mock_page.assert_called_once_with("blk_123", offset=3, limit=2)
+        self.assertEqual([item["index"] for item in items], [3, 4])
+
+    def test_iter_bulk_results_rejects_negative_offset(self):
+        pangram_client = Pangram(api_key="test-key")
+        with self.assertRaisesRegex(ValueError, "offset cannot be negative"):
+            pangram_client.iter_bulk_results("blk_123", offset=-1)
+
     def test_get_bulk_results_rejects_invalid_page_size(self):
         pangram_client = Pangram(api_key="test-key")
         with self.assertRaisesRegex(ValueError, "page_size must be between"):
             pangram_client.get_bulk_results("blk_123", page_size=0)
 
+    def test_iter_bulk_completed_yields_each_item_once_as_it_finishes(self):
+        pangram_client = Pangram(api_key="test-key")
+        rounds = [
+            ({"status": "running", "succeeded": 1, "failed": 0}, {0}, set()),
+            ({"status": "running", "succeeded": 1, "failed": 0}, {0}, set()),
+            ({"status": "running", "succeeded": 2, "failed": 1}, {0, 1}, {3}),
+            ({"status": "partial", "succeeded": 3, "failed": 1}, {0, 1, 2}, {3}),
+        ]
+        state = {"round": -1}
+
+        def fetch_status(bulk_id, request_timeout):
+            state["round"] += 1
+            return rounds[state["round"]][0]
+
+        def results_page(bulk_id, offset=0, limit=100):
+            _, done, failed = rounds[state["round"]]
+            indices = range(offset, min(offset + limit, 4))
+            return {
+                "total_items": 4,
+                "items": [
+                    {"index": index, "result": {"n": index} if index in done else None}
+                    for index in indices
+                    if index not in failed
+                ],
+                "failed_items": [{"index": index, "error": "invalid text"} for index in indices if index in failed],
+            }
+
+        with patch.object(PangramText, "_fetch_bulk_status", side_effect=fetch_status), patch.object(
+            PangramText, "get_bulk_results_page", side_effect=results_page
+        ) as mock_page, patch("pangram.text_classifier.time.sleep"):
+            seen = []
+            status = pangram_client.harvest_bulk("blk_123", seen.append, page_size=2, poll_interval=0)
+
+        self.assertEqual(status["status"], "partial")
+        self.assertEqual([item["index"] for item in seen], [0, 1, 3, 2])
+        self.assertTrue(seen[2]["failed"])
+        # Round 1 stops after the first page, round 2 fetches nothing new, and
+        # the page holding items 0 and 1 is not fetched again once delivered.
+        self.assertEqual(
+            [call.kwargs["offset"] for call in mock_page.call_args_list],
+            [0, 0, 2, 2],
+        )
+
+    def test_iter_bulk_completed_validates_arguments(self):
+        pangram_client = Pangram(api_key="test-key")
+        with self.assertRaisesRegex(ValueError, "page_size must be between"):
+            pangram_client.iter_bulk_completed("blk_123", page_size=0)
+        with self.assertRaisesRegex(ValueError, "timeout"):
+            pangram_client.iter_bulk_completed("blk_123", timeout=0)
+
     def test_wait_for_bulk_returns_terminal_status(self):
         pangram_client = Pangram(api_key="test-key")
         with patch.object(
@@ -332,6 +701,26 @@ class TestBulkAPI(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 2)
         mock_sleep.assert_called_with(MIN_POLL_INTERVAL_SECONDS)
 
+    def test_wait_for_bulk_uses_polling_strategy(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch.object(
+            PangramText,
+            "_fetch_bulk_status",
+            side_effect=[
+                {"bulk_id": "blk_123", "status": "running", "eta_seconds": 8},
+                {"bulk_id": "blk_123", "status": "running"},
+                {"bulk_id": "blk_123", "status": "succeeded"},
+            ],
+        ), patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            result = pangram_client.wait_for_bulk(
+                "blk_123",
+                timeout=60,
+                polling=AdaptivePolling(initial_interval=1, multiplier=2, jitter=0),
+            )
+
+        self.assertEqual(result["status"], "succeeded")
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [4, 2])
+
     def test_wait_for_bulk_uses_remaining_deadline_for_poll_request_timeout(self):
         pangram_client = Pangram(api_key="test-key")
         terminal_response = {
@@ -346,7 +735,7 @@ class TestBulkAPI(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             return_value=MockResponse(json_data=terminal_response),
         ) as mock_get:
             result = pangram_client.wait_for_bulk("blk_123", timeout=1, poll_interval=0)
@@ -375,6 +764,58 @@ class TestBulkAPI(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "timeout must be greater than 0"):
             pangram_client.wait_for_bulk("blk_123", timeout=0)
 
+class TestChunkedBulk(unittest.TestCase):
+    def test_submit_bulk_chunked_splits_and_preserves_ids(self):
+        pangram_client = Pangram(api_key="test-key")
+        items = [{"id": f"row-{index}", "text": f"text {index}"} for index in range(5)]
+        submitted = []
+
+        def submit_bulk(items):
+            submitted.append([item["id"] for item in items])
+            bulk_id = f"blk_{items[0]['id']}"
+            return {
+                "bulk_id": bulk_id,
+                "status": "queued",
+                "total_items": len(items),
+                "accepted_items": [{"index": index, "id": item["id"]} for index, item in enumerate(items)],
+                "failed_items": [],
+            }
+
+        with patch.object(PangramText, "submit_bulk", side_effect=submit_bulk):
+            job = pangram_client.submit_bulk_chunked(items=items, max_items_per_job=2)
+
+        self.assertEqual(sorted(submitted), [["row-0", "row-1"], ["row-2", "row-3"], ["row-4"]])
+        self.assertEqual(job.bulk_ids, ["blk_row-0", "blk_row-2", "blk_row-4"])
+        self.assertEqual([(item["index"], item["id"]) for item in job.accepted_items], [(index, f"row-{index}") for index in range(5)])
+        self.assertEqual(job.chunks[1].indices, [2, 3])
+
+    def test_submit_bulk_chunked_reports_created_jobs_on_failure(self):
+        pangram_client = Pangram(api_key="test-key")
+
+        def submit_bulk(text):
+            if text[0] == "bad":
+                raise ValueError("Error returned by API: [413] too large")
+            return {"bulk_id": "blk_ok", "accepted_items": [], "failed_items": []}
+
+        with patch.object(PangramText, "submit_bulk", side_effect=submit_bulk):
+            with self.assertRaisesRegex(ValueError, r"items 1-1 failed to submit.*\['blk_ok'\]"):
+                pangram_client.submit_bulk_chunked(text=["good", "bad"], max_items_per_job=1)
+
+    def test_submit_bulk_chunked_includes_cached_items(self):
+        cache = ResultCache()
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        cache.set(cache.key_for_text("known", public_dashboard_link=False), {"text": "known"})
+        bulk_response = {"bulk_id": "blk_1", "accepted_items": [{"index": 0, "task_id": "task-1"}], "failed_items": []}
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(status_code=202, json_data=bulk_response),
+        ):
+            job = pangram_client.submit_bulk_chunked(text=["new", "known"])
+
+        self.assertEqual(job.chunks[0].indices, [0])
+        self.assertEqual(job.cached_items[0]["index"], 1)
+        self.assertTrue(job.cached_items[0]["cached"])
+
 class TestDashboard(unittest.TestCase):
     def test_dashboard(self):
         text = "hello!"
@@ -387,10 +828,10 @@ class TestDashboard(unittest.TestCase):
         }
 
         with patch(
-            "pangram.text_classifier.requests.post",
+            "pangram.text_classifier.requests.Session.post",
             return_value=MockResponse(json_data={"task_id": "task-1"}),
         ) as mock_post, patch(
-            "pangram.text_classifier.requests.get",
+            "pangram.text_classifier.requests.Session.get",
             side_effect=[
                 MockResponse(json_data={"task_id": "task-1", "stage": "STAGE_PREPROCESSING"}),
                 MockResponse(json_data=success_response),
@@ -399,7 +840,7 @@ class TestDashboard(unittest.TestCase):
             result = pangram_client.predict_with_dashboard_link(text, timeout=1, poll_interval=0)
 
         self.assertEqual(mock_post.call_args.args[0], f"{API_ENDPOINT}/task")
-        self.assertEqual(mock_post.call_args.kwargs["json"], {"text": text, "public_dashboard_link": True})
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"text": text, "public_dashboard_link": True})
         self.assertLessEqual(mock_post.call_args.kwargs["timeout"], 1.0)
         mock_sleep.assert_called_once_with(MIN_POLL_INTERVAL_SECONDS)
         self.assertEqual(result, success_response)
@@ -420,7 +861,7 @@ class TestFileUpload(unittest.TestCase):
         with tempfile.TemporaryDirectory() as directory:
             file_path = self._write_test_file(directory, "document.docx")
             with patch(
-                "pangram.text_classifier.requests.post",
+                "pangram.text_classifier.requests.Session.post",
                 return_value=MockResponse(json_data=upload_response),
             ) as mock_post:
                 result = pangram_client.predict_file(
@@ -451,7 +892,7 @@ class TestFileUpload(unittest.TestCase):
             first_path = self._write_test_file(directory, "first.pdf")
             second_path = self._write_test_file(directory, "second.rtf")
             with patch(
-                "pangram.text_classifier.requests.post",
+                "pangram.text_classifier.requests.Session.post",
                 return_value=MockResponse(json_data=upload_response),
             ) as mock_post:
                 result = pangram_client.predict_files([first_path, second_path])
@@ -479,7 +920,7 @@ class TestFileUpload(unittest.TestCase):
         with tempfile.TemporaryDirectory() as directory:
             file_path = self._write_test_file(directory, "document.docx")
             with patch(
-                "pangram.text_classifier.requests.post",
+                "pangram.text_classifier.requests.Session.post",
                 side_effect=requests.exceptions.Timeout("timed out"),
             ):
                 with self.assertRaisesRegex(ValueError, "uploading files: timed out"):
@@ -490,12 +931,52 @@ class TestFileUpload(unittest.TestCase):
         with tempfile.TemporaryDirectory() as directory:
             file_path = self._write_test_file(directory, "document.docx")
             with patch(
-                "pangram.text_classifier.requests.post",
+                "pangram.text_classifier.requests.Session.post",
                 return_value=MockResponse(json_data={"unexpected": "shape"}),
             ):
                 with self.assertRaisesRegex(ValueError, "invalid file upload response"):
                     pangram_client.predict_file(file_path)
 
+    def test_predict_files_batched_maps_results_and_errors_to_paths(self):
+        pangram_client = Pangram(api_key="test-key")
+        bodies = []
+
+        def upload(url, data=None, headers=None, timeout=None):
+            body = data.read()
+            bodies.append(body)
+            filenames = re.findall(rb'filename="([^"]+)"', body)
+            if b"broken.pdf" in filenames:
+                return MockResponse(status_code=400, text="bad file")
+            return MockResponse(json_data=[{"filename": name.decode()} for name in filenames])
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [self._write_test_file(directory, name) for name in ("a.pdf", "b.pdf", "broken.pdf", "c.pdf")]
+            paths.insert(1, os.path.join(directory, "missing.pdf"))
+            with patch("pangram.text_classifier.requests.Session.post", side_effect=upload):
+                results = pangram_client.predict_files_batched(paths, max_files_per_request=2, max_workers=2)
+
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(results[0], {"filename": "a.pdf"})
+        self.assertIsInstance(results[1], FileNotFoundError)
+        self.assertEqual(results[2], {"filename": "b.pdf"})
+        self.assertRegex(str(results[3]), r"\[400\] bad file")
+        self.assertRegex(str(results[4]), "bad file")
+        self.assertIn(b"test file contents", bodies[0])
+
+    def test_predict_files_batched_answers_cached_files_locally(self):
+        pangram_client = Pangram(api_key="test-key", cache=ResultCache())
+        with tempfile.TemporaryDirectory() as directory:
+            path = self._write_test_file(directory, "a.pdf")
+            pangram_client.cache.set(
+                pangram_client.cache.key_for_bytes(b"test file contents", public_dashboard_link=False),
+                {"fraction_ai": 0.5},
+            )
+            with patch("pangram.text_classifier.requests.Session.post") as mock_post:
+                results = pangram_client.predict_files_batched([path])
+
+        mock_post.assert_not_called()
+        self.assertEqual(results, [{"fraction_ai": 0.5, "filename": "a.pdf"}])
+
 class TestPlagiarism(unittest.TestCase):
     @unittest.skipUnless(os.getenv('PANGRAM_API_KEY'), "requires PANGRAM_API_KEY")
     def test_plagiarism(self):
@@ -508,6 +989,371 @@ class TestPlagiarism(unittest.TestCase):
         self.assertIn('plagiarized_sentences', result)
         self.assertIn('percent_plagiarized', result)
 
+class TestSession(unittest.TestCase):
+    def test_client_mounts_pooled_adapter(self):
+        pangram_client = Pangram(api_key="test-key", pool_connections=3, pool_maxsize=7, pool_block=True)
+        adapter = pangram_client._session.get_adapter(API_ENDPOINT)
+        self.assertEqual(adapter._pool_connections, 3)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertTrue(adapter._pool_block)
+        pangram_client.close()
+
+    def test_predict_reuses_one_session_for_submit_and_poll(self):
+        pangram_client = Pangram(api_key="test-key")
+        session = pangram_client._session
+        with patch.object(
+            session,
+            "post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ) as mock_post, patch.object(
+            session,
+            "get",
+            side_effect=[
+                MockResponse(json_data={"task_id": "task-1", "stage": "STAGE_PREPROCESSING"}),
+                MockResponse(json_data={"stage": "STAGE_SUCCESS", "windows": []}),
+            ],
+        ) as mock_get, patch("pangram.text_classifier.time.sleep"):
+            pangram_client.predict("hello", poll_interval=0)
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_context_manager_closes_owned_session(self):
+        with patch.object(requests.Session, "close") as mock_close:
+            with Pangram(api_key="test-key") as pangram_client:
+                self.assertIsInstance(pangram_client, PangramText)
+        mock_close.assert_called_once()
+
+    def test_close_leaves_caller_session_open(self):
+        session = requests.Session()
+        with patch.object(session, "close") as mock_close:
+            Pangram(api_key="test-key", session=session).close()
+        mock_close.assert_not_called()
+
+    def test_rejects_invalid_pool_size(self):
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            Pangram(api_key="test-key", pool_maxsize=0)
+
+class TestRetry(unittest.TestCase):
+    def test_submit_retries_throttled_request_with_retry_after(self):
+        pangram_client = Pangram(api_key="test-key", retry=RetryPolicy(backoff_base=0.1, jitter=0))
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            side_effect=[
+                MockResponse(status_code=429, text="slow down", headers={"Retry-After": "2"}),
+                MockResponse(json_data={"task_id": "task-1"}),
+            ],
+        ) as mock_post, patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(json_data={"stage": "STAGE_SUCCESS", "windows": []}),
+        ), patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            result = pangram_client.predict("hello")
+
+        self.assertEqual(result["stage"], "STAGE_SUCCESS")
+        self.assertEqual(mock_post.call_count, 2)
+        mock_sleep.assert_called_once_with(2)
+        self.assertEqual(pangram_client.metrics["retries"], 1)
+        self.assertEqual(pangram_client.metrics["retries.submit_prediction"], 1)
+        self.assertEqual(pangram_client.metrics["requests"], 3)
+
+    def test_submit_does_not_retry_ambiguous_server_error(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(status_code=500, text="boom"),
+        ) as mock_post, patch("pangram.text_classifier.time.sleep"):
+            with self.assertRaises(PangramAPIError) as context:
+                pangram_client.predict("hello")
+
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertEqual(mock_post.call_count, 1)
+
+    def test_results_page_retries_server_errors_and_connection_errors(self):
+        pangram_client = Pangram(api_key="test-key", retry=RetryPolicy(max_attempts=3, jitter=0))
+        page = {"total_items": 0, "items": [], "failed": []}
+        with patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[
+                requests.exceptions.ConnectionError("reset"),
+                MockResponse(status_code=502, text="bad gateway"),
+                MockResponse(json_data=page),
+            ],
+        ) as mock_get, patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            result = pangram_client.get_bulk_results_page("bulk-1")
+
+        self.assertEqual(result, page)
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0])
+        self.assertEqual(pangram_client.metrics["retries.get_bulk_results_page"], 2)
+
+    def test_gives_up_after_max_attempts(self):
+        pangram_client = Pangram(api_key="test-key", retry=RetryPolicy(max_attempts=2, jitter=0))
+        with patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(status_code=503, text="unavailable"),
+        ) as mock_get, patch("pangram.text_classifier.time.sleep"):
+            with self.assertRaisesRegex(ValueError, r"\[503\] unavailable"):
+                pangram_client.get_bulk_status("bulk-1")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_no_retry_policy_disables_retries(self):
+        pangram_client = Pangram(api_key="test-key", retry=NO_RETRY)
+        with patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(status_code=503, text="unavailable"),
+        ) as mock_get, patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            with self.assertRaises(PangramAPIError):
+                pangram_client.get_bulk_status("bulk-1")
+
+        self.assertEqual(mock_get.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    def test_upload_rewinds_files_before_retrying(self):
+        pangram_client = Pangram(api_key="test-key", retry=RetryPolicy(jitter=0))
+        upload_response = [{"dashboard_link": "https://www.pangram.com/history/query-1"}]
+        positions = []
+
+        def post(url, files, **kwargs):
+            file_obj = files[0][1][1]
+            positions.append(file_obj.tell())
+            file_obj.read()
+            if len(positions) == 1:
+                return MockResponse(status_code=503, text="unavailable")
+            return MockResponse(json_data=upload_response)
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "document.docx")
+            with open(file_path, "wb") as file_obj:
+                file_obj.write(b"test file contents")
+            with patch.object(pangram_client._session, "post", side_effect=post), patch(
+                "pangram.text_classifier.time.sleep"
+            ):
+                result = pangram_client.predict_file(file_path)
+
+        self.assertEqual(result, upload_response[0])
+        self.assertEqual(positions, [0, 0])
+
+    def test_predict_keeps_polling_through_throttled_status_checks(self):
+        pangram_client = Pangram(api_key="test-key")
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ), patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[
+                MockResponse(status_code=429, text="slow down", headers={"Retry-After": "3"}),
+                MockResponse(json_data={"stage": "STAGE_SUCCESS", "windows": []}),
+            ],
+        ), patch("pangram.text_classifier.time.sleep") as mock_sleep:
+            result = pangram_client.predict("hello", poll_interval=0)
+
+        self.assertEqual(result["stage"], "STAGE_SUCCESS")
+        mock_sleep.assert_called_once_with(3)
+
+class TestCompression(unittest.TestCase):
+    def test_gzips_large_bodies_and_records_bytes_saved(self):
+        pangram_client = Pangram(api_key="test-key", compression=RequestCompression(min_size=1024))
+        texts = ["the same sentence again and again. " * 20] * 10
+
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(status_code=202, json_data={"bulk_id": "blk_123"}),
+        ) as mock_post:
+            pangram_client.submit_bulk(text=texts)
+
+        kwargs = mock_post.call_args.kwargs
+        self.assertNotIn("json", kwargs)
+        self.assertEqual(kwargs["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertEqual(json.loads(gzip.decompress(kwargs["data"])), {"text": texts})
+        raw_size = len(DEFAULT_CODEC.dumps({"text": texts}))
+        self.assertEqual(pangram_client.metrics["compression.requests"], 1)
+        self.assertEqual(pangram_client.metrics["compression.bytes_saved"], raw_size - len(kwargs["data"]))
+
+    def test_sends_small_bodies_uncompressed(self):
+        pangram_client = Pangram(api_key="test-key", compression=RequestCompression(min_size=1024))
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(status_code=202, json_data={"bulk_id": "blk_123"}),
+        ) as mock_post:
+            pangram_client.submit_bulk(text=["short"])
+
+        kwargs = mock_post.call_args.kwargs
+        self.assertNotIn("Content-Encoding", kwargs["headers"])
+        self.assertEqual(json.loads(kwargs["data"]), {"text": ["short"]})
+        self.assertEqual(pangram_client.metrics["compression.requests"], 0)
+
+    def test_requests_compressed_results_pages(self):
+        pangram_client = Pangram(api_key="test-key", compression=RequestCompression())
+        page = {"bulk_id": "blk_123", "total_items": 0, "items": [], "failed_items": []}
+        response = MockResponse(json_data=page, headers={"Content-Encoding": "gzip", "Content-Length": "40"})
+
+        with patch("pangram.text_classifier.requests.Session.get", return_value=response) as mock_get:
+            pangram_client.get_bulk_results_page("blk_123")
+
+        self.assertEqual(mock_get.call_args.kwargs["headers"]["Accept-Encoding"], "gzip")
+        self.assertEqual(pangram_client.metrics["compression.response_bytes_saved"], len(response.content) - 40)
+
+class TestRateLimit(unittest.TestCase):
+    def test_requests_draw_from_their_category_budget(self):
+        limiter = RateLimiter()
+        pangram_client = Pangram(api_key="test-key", rate_limiter=limiter)
+        with patch.object(limiter, "acquire", return_value=True) as mock_acquire, patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ), patch(
+            "pangram.text_classifier.requests.Session.get",
+            side_effect=[
+                MockResponse(json_data={"stage": "STAGE_SUCCESS", "windows": []}),
+                MockResponse(json_data={"total_items": 0, "items": [], "failed": []}),
+            ],
+        ):
+            pangram_client.predict("hello")
+            pangram_client.get_bulk_results_page("bulk-1")
+
+        self.assertEqual([call.args[0] for call in mock_acquire.call_args_list], ["submit", "poll", "bulk_page"])
+
+    def test_raises_timeout_when_budget_is_not_available_before_deadline(self):
+        limiter = RateLimiter()
+        pangram_client = Pangram(api_key="test-key", rate_limiter=limiter)
+        with patch.object(limiter, "acquire", return_value=False), patch(
+            "pangram.text_classifier.requests.Session.post"
+        ) as mock_post:
+            with self.assertRaisesRegex(TimeoutError, "rate limit"):
+                pangram_client.predict("hello")
+
+        mock_post.assert_not_called()
+
+class TestResultCache(unittest.TestCase):
+    def test_predict_answers_repeated_text_from_cache(self):
+        pangram_client = Pangram(api_key="test-key", cache=ResultCache())
+        result = {"stage": "STAGE_SUCCESS", "text": "hello", "version": "3.1", "windows": []}
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(json_data={"task_id": "task-1"}),
+        ) as mock_post, patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(json_data=result),
+        ):
+            first = pangram_client.predict("hello")
+            second = pangram_client.predict("hello")
+            pangram_client.predict("hello \r\n")
+            pangram_client.predict("hello", public_dashboard_link=True)
+
+        self.assertEqual(first, result)
+        self.assertEqual(second, result)
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(pangram_client.metrics["cache.hits"], 1)
+
+    def test_normalized_hit_returns_callers_text_at_same_offsets(self):
+        pangram_client = Pangram(api_key="test-key", cache=ResultCache(normalize=normalize_text))
+        result = {
+            "stage": "STAGE_SUCCESS",
+            "text": "Hello world.\tMore",
+            "windows": [{"text": "world.\tMore", "start_index": 6, "end_index": 17}],
+        }
+        with patch.object(PangramText, "_submit_prediction_task", return_value="task-1") as mock_submit, \
+                patch.object(PangramText, "_check_prediction_task", return_value=(result, None)):
+            pangram_client.predict("Hello world.\tMore")
+            cached = pangram_client.predict("Hello\u00a0world. More")
+
+        mock_submit.assert_called_once()
+        self.assertEqual(cached["text"], "Hello\u00a0world. More")
+        self.assertEqual(cached["windows"][0]["text"], "world. More")
+
+    def test_predict_many_skips_cached_texts(self):
+        cache = ResultCache()
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        cache.set(cache.key_for_text("cached", public_dashboard_link=False), {"text": "cached"})
+        with patch.object(
+            PangramText, "_submit_prediction_task", return_value="task-1"
+        ) as mock_submit, patch.object(
+            PangramText, "_check_prediction_task", return_value=({"text": "fresh"}, None)
+        ):
+            results = pangram_client.predict_many(["cached", "fresh"])
+            pangram_client.close()
+
+        self.assertEqual(results, [{"text": "cached"}, {"text": "fresh"}])
+        mock_submit.assert_called_once()
+        self.assertEqual(cache.get(cache.key_for_text("fresh", public_dashboard_link=False)), {"text": "fresh"})
+
+    def test_submit_bulk_sends_only_uncached_items(self):
+        cache = ResultCache()
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        cache.set(cache.key_for_text("known", public_dashboard_link=False), {"text": "known"})
+        bulk_response = {
+            "bulk_id": "bulk-1",
+            "status": "queued",
+            "total_items": 1,
+            "accepted_items": [{"index": 0, "id": "b", "task_id": "task-1"}],
+            "failed_items": [],
+        }
+        with patch(
+            "pangram.text_classifier.requests.Session.post",
+            return_value=MockResponse(status_code=202, json_data=bulk_response),
+        ) as mock_post:
+            response = pangram_client.submit_bulk(items=[{"id": "a", "text": "known"}, {"id": "b", "text": "new"}])
+
+        self.assertEqual(json.loads(mock_post.call_args.kwargs["data"]), {"items": [{"id": "b", "text": "new"}]})
+        self.assertEqual(response["cached_items"], [{"index": 0, "id": "a", "result": {"text": "known"}}])
+        self.assertEqual(response["accepted_items"][0]["index"], 1)
+        self.assertEqual(response["submitted_indices"], [1])
+
+    def test_submit_bulk_skips_request_when_everything_is_cached(self):
+        cache = ResultCache()
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        cache.set(cache.key_for_text("known", public_dashboard_link=False), {"text": "known"})
+        with patch("pangram.text_classifier.requests.Session.post") as mock_post:
+            response = pangram_client.submit_bulk(text=["known"])
+
+        mock_post.assert_not_called()
+        self.assertIsNone(response["bulk_id"])
+        self.assertEqual(response["cached_items"], [{"index": 0, "result": {"text": "known"}}])
+
+    def test_bulk_results_pages_populate_cache(self):
+        cache = ResultCache()
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        page = {
+            "total_items": 1,
+            "items": [{"index": 0, "result": {"text": "bulk text", "version": "3.3"}}],
+            "failed_items": [],
+        }
+        with patch(
+            "pangram.text_classifier.requests.Session.get",
+            return_value=MockResponse(json_data=page),
+        ):
+            pangram_client.get_bulk_results("bulk-1")
+
+        self.assertEqual(
+            cache.get(cache.key_for_text("bulk text", public_dashboard_link=False)),
+            {"text": "bulk text", "version": "3.3"},
+        )
+
+    def test_predict_files_uploads_only_uncached_files(self):
+        pangram_client = Pangram(api_key="test-key", cache=ResultCache())
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, contents in (("first.pdf", b"one"), ("second.pdf", b"two")):
+                path = os.path.join(directory, name)
+                with open(path, "wb") as file_obj:
+                    file_obj.write(contents)
+                paths.append(path)
+            with patch(
+                "pangram.text_classifier.requests.Session.post",
+                side_effect=[
+                    MockResponse(json_data=[{"filename": "first.pdf"}]),
+                    MockResponse(json_data=[{"filename": "second.pdf"}]),
+                ],
+            ) as mock_post:
+                pangram_client.predict_file(paths[0])
+                results = pangram_client.predict_files(paths)
+
+        self.assertEqual(results, [{"filename": "first.pdf"}, {"filename": "second.pdf"}])
+        self.assertEqual(mock_post.call_count, 2)
+        uploaded = mock_post.call_args.kwargs["files"]
+        self.assertEqual([file_item[1][0] for file_item in uploaded], ["second.pdf"])
+
 class TestPangramText(unittest.TestCase):
     def test_predict(self):
         """
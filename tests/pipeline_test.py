@@ -0,0 +1,274 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pangram import Pangram, PangramText
+from pangram.cache import ResultCache
+from pangram.pipeline import BulkPipeline, read_manifest, read_records, resume
+from pangram.polling import FixedPolling, PollingStrategy, PollSchedule
+from pangram.retry import NO_RETRY
+from pangram.testing import FakePangramServer, fixed_latency
+
+
+class FakeBulkAPI:
+    """Serves submit_bulk, get_bulk_status, and get_bulk_results_page from memory."""
+
+    def __init__(self, running_polls=0):
+        self.jobs = {}
+        self.running_polls = running_polls
+        self.max_in_flight = 0
+
+    def submit_bulk(self, items):
+        bulk_id = f"blk_{len(self.jobs)}"
+        self.jobs[bulk_id] = {"items": items, "polls": 0, "done": False}
+        in_flight = sum(1 for job in self.jobs.values() if not job["done"])
+        self.max_in_flight = max(self.max_in_flight, in_flight)
+        return {"bulk_id": bulk_id, "status": "queued", "accepted_items": [], "failed_items": []}
+
+    def get_bulk_status(self, bulk_id):
+        job = self.jobs[bulk_id]
+        job["polls"] += 1
+        if job["polls"] > self.running_polls:
+            job["done"] = True
+            return {"bulk_id": bulk_id, "status": "succeeded"}
+        return {"bulk_id": bulk_id, "status": "running"}
+
+    def get_bulk_results_page(self, bulk_id, offset=0, limit=100):
+        items = self.jobs[bulk_id]["items"]
+        page_items = []
+        failed_items = []
+        for index in range(offset, min(offset + limit, len(items))):
+            item = {"index": index, "id": items[index].get("id"), "stage": "STAGE_SUCCESS"}
+            if items[index]["text"] == "bad":
+                failed_items.append({**item, "stage": "STAGE_FAILED", "error": "invalid text"})
+            else:
+                page_items.append({**item, "result": {"text": items[index]["text"]}})
+        return {"bulk_id": bulk_id, "total_items": len(items), "items": page_items, "failed_items": failed_items}
+
+
+class FakeClock:
+    """A monotonic clock that only advances when the code under test sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class BackoffSchedule(PollSchedule):
+    def __init__(self):
+        self.calls = 0
+
+    def next_interval(self, status=None, retry_after=None):
+        self.calls += 1
+        return float(self.calls)
+
+
+class RecordingPolling(PollingStrategy):
+    def __init__(self):
+        self.schedules = []
+
+    def schedule(self):
+        schedule = BackoffSchedule()
+        self.schedules.append(schedule)
+        return schedule
+
+
+class TestReadRecords(unittest.TestCase):
+    def test_reads_jsonl_and_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            jsonl_path = os.path.join(directory, "input.jsonl")
+            with open(jsonl_path, "w", encoding="utf-8") as input_file:
+                input_file.write('{"id": "a", "body": "first"}\n\n"second"\n')
+            csv_path = os.path.join(directory, "input.csv")
+            with open(csv_path, "w", encoding="utf-8", newline="") as input_file:
+                input_file.write("id,text\nr1,hello\n,world\n")
+
+            self.assertEqual(
+                list(read_records(jsonl_path, text_field="body")), [{"text": "first", "id": "a"}, {"text": "second"}]
+            )
+            self.assertEqual(list(read_records(csv_path)), [{"text": "hello", "id": "r1"}, {"text": "world"}])
+
+    def test_rejects_records_without_text(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "input.jsonl")
+            with open(path, "w", encoding="utf-8") as input_file:
+                input_file.write('{"id": "a"}\n')
+            with self.assertRaisesRegex(ValueError, "input.jsonl:1: record has no 'text'"):
+                list(read_records(path))
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaisesRegex(ValueError, "Cannot detect input format"):
+            read_records("input.txt")
+
+
+class TestBulkPipeline(unittest.TestCase):
+    def _write_input(self, directory, texts):
+        path = os.path.join(directory, "input.jsonl")
+        with open(path, "w", encoding="utf-8") as input_file:
+            for index, text in enumerate(texts):
+                input_file.write(json.dumps({"id": f"row-{index}", "text": text}) + "\n")
+        return path
+
+    def _run(self, pangram_client, api, texts, clock=None, **kwargs):
+        clock = clock or FakeClock()
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = self._write_input(directory, texts)
+            output_path = os.path.join(directory, "output.jsonl")
+            with patch.object(PangramText, "submit_bulk", side_effect=api.submit_bulk), patch.object(
+                PangramText, "get_bulk_status", side_effect=api.get_bulk_status
+            ), patch.object(
+                PangramText, "get_bulk_results_page", side_effect=api.get_bulk_results_page
+            ), patch("pangram.pipeline.time.monotonic", clock.monotonic), patch("pangram.pipeline.time.sleep", clock.sleep):
+                summary = BulkPipeline(pangram_client, **kwargs).run(input_path, output_path)
+            with open(output_path, encoding="utf-8") as output_file:
+                lines = [json.loads(line) for line in output_file]
+        return summary, lines
+
+    def test_streams_every_record_to_output_with_input_positions(self):
+        api = FakeBulkAPI(running_polls=1)
+        texts = ["t0", "bad", "t2", "t3", "t4"]
+        summary, lines = self._run(
+            Pangram(api_key="test-key"), api, texts, max_items_per_job=2, max_jobs_in_flight=2, page_size=1
+        )
+
+        self.assertEqual(sorted(line["index"] for line in lines), list(range(5)))
+        for line in lines:
+            self.assertEqual(line["id"], f"row-{line['index']}")
+        failed = [line for line in lines if line.get("failed")]
+        self.assertEqual([line["index"] for line in failed], [1])
+        self.assertEqual(summary["items"], 5)
+        self.assertEqual(summary["jobs"], 3)
+        self.assertEqual(summary["succeeded"], 4)
+        self.assertEqual(summary["failed"], 1)
+        self.assertLessEqual(api.max_in_flight, 2)
+
+    def test_each_job_keeps_its_polling_schedule(self):
+        api = FakeBulkAPI(running_polls=3)
+        polling = RecordingPolling()
+        clock = FakeClock()
+        self._run(Pangram(api_key="test-key"), api, ["a", "b"], clock=clock, max_items_per_job=1, polling=polling)
+
+        self.assertEqual([schedule.calls for schedule in polling.schedules], [3, 3])
+        self.assertEqual([job["polls"] for job in api.jobs.values()], [4, 4])
+        self.assertEqual(clock.sleeps, [1.0, 2.0, 3.0])
+
+    def test_polls_through_transient_status_errors(self):
+        with FakePangramServer(error_rate={"get_bulk_status": 0.5}, processing_time=fixed_latency(0.01), seed=3) as server, \
+                server.client(retry=NO_RETRY, polling=FixedPolling(0.01)) as pangram_client, \
+                tempfile.TemporaryDirectory() as directory:
+            input_path = self._write_input(directory, [f"text {index}" for index in range(6)])
+            summary = BulkPipeline(pangram_client, max_items_per_job=2).run(input_path, os.path.join(directory, "output.jsonl"))
+
+        self.assertEqual(summary["succeeded"], 6)
+        self.assertGreater(server.metrics["injected.errors"], 0)
+
+    def test_writes_cached_items_without_submitting_them(self):
+        cache = ResultCache()
+        cache.set(cache.key_for_text("known", public_dashboard_link=False), {"text": "known"})
+        pangram_client = Pangram(api_key="test-key", cache=cache)
+        api = FakeBulkAPI()
+
+        def submit_bulk(items):
+            return {"bulk_id": None, "cached_items": [{"index": 0, "id": items[0]["id"], "result": {"text": "known"}}]}
+
+        api.submit_bulk = submit_bulk
+        summary, lines = self._run(pangram_client, api, ["known"])
+
+        self.assertEqual(lines, [{"index": 0, "id": "row-0", "result": {"text": "known"}, "stage": "STAGE_SUCCESS", "error": None, "cached": True}])
+        self.assertEqual(summary["cached"], 1)
+        self.assertEqual(summary["jobs"], 0)
+
+    def test_paces_submissions_to_target_rate(self):
+        api = FakeBulkAPI()
+        with patch("pangram.pipeline.time.monotonic", return_value=0.0):
+            pipeline = BulkPipeline(Pangram(api_key="test-key"), max_items_per_job=2, target_items_per_second=4)
+            with patch("pangram.pipeline.time.sleep") as mock_sleep:
+                pipeline._pace(0.0, 0)
+                pipeline._pace(0.0, 2)
+        mock_sleep.assert_called_once_with(0.5)
+
+    def _patch_api(self, api):
+        return (
+            patch.object(PangramText, "submit_bulk", side_effect=api.submit_bulk),
+            patch.object(PangramText, "get_bulk_status", side_effect=api.get_bulk_status),
+            patch.object(PangramText, "get_bulk_results_page", side_effect=api.get_bulk_results_page),
+            patch("pangram.pipeline.time.sleep"),
+        )
+
+    def test_resumes_from_manifest_after_crash(self):
+        api = FakeBulkAPI()
+        texts = [f"t{index}" for index in range(7)]
+        fetch_page = api.get_bulk_results_page
+        crashed = []
+
+        def crash_once(bulk_id, offset=0, limit=100):
+            if bulk_id == "blk_1" and offset == 2 and not crashed:
+                crashed.append(True)
+                raise RuntimeError("process killed")
+            return fetch_page(bulk_id, offset=offset, limit=limit)
+
+        api.get_bulk_results_page = crash_once
+        pangram_client = Pangram(api_key="test-key")
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = self._write_input(directory, texts)
+            output_path = os.path.join(directory, "output.jsonl")
+            manifest_path = os.path.join(directory, "run.manifest")
+            submit, status, page, sleep = self._patch_api(api)
+            with submit, status, page, sleep:
+                pipeline = BulkPipeline(pangram_client, max_items_per_job=4, max_jobs_in_flight=1, page_size=2)
+                with self.assertRaisesRegex(RuntimeError, "process killed"):
+                    pipeline.run(input_path, output_path, manifest_path=manifest_path)
+
+                state = read_manifest(manifest_path)
+                self.assertFalse(state["finished"])
+                self.assertEqual(state["completed_jobs"], ["blk_0"])
+                self.assertEqual(state["jobs"][0]["bulk_id"], "blk_1")
+                self.assertEqual(state["jobs"][0]["next_offset"], 2)
+                # Simulate a partial line written after the last checkpoint.
+                with open(output_path, "ab") as output_file:
+                    output_file.write(b'{"index": 6, "trunc')
+
+                summary = resume(manifest_path, pangram_client)
+                self.assertEqual(resume(manifest_path, pangram_client)["items"], 7)
+
+            with open(output_path, encoding="utf-8") as output_file:
+                lines = [json.loads(line) for line in output_file]
+
+        self.assertEqual(sorted(line["index"] for line in lines), list(range(7)))
+        self.assertEqual(len(api.jobs), 2)
+        self.assertEqual(summary["items"], 7)
+        self.assertEqual(summary["succeeded"], 7)
+        self.assertEqual(summary["jobs"], 2)
+
+    def test_resume_rejects_unreadable_manifest(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.manifest")
+            with open(path, "w", encoding="utf-8") as manifest_file:
+                manifest_file.write('{"version": 99}')
+            with self.assertRaisesRegex(ValueError, "Unsupported pipeline manifest"):
+                resume(path, Pangram(api_key="test-key"))
+            with self.assertRaisesRegex(ValueError, "Cannot read pipeline manifest"):
+                resume(os.path.join(directory, "missing"), Pangram(api_key="test-key"))
+
+    def test_rejects_invalid_parameters(self):
+        with self.assertRaisesRegex(ValueError, "max_jobs_in_flight"):
+            BulkPipeline(Pangram(api_key="test-key"), max_jobs_in_flight=0)
+        with self.assertRaisesRegex(ValueError, "target_items_per_second"):
+            BulkPipeline(Pangram(api_key="test-key"), target_items_per_second=0)
+        with self.assertRaisesRegex(ValueError, "page_size"):
+            BulkPipeline(Pangram(api_key="test-key"), page_size=0)
+        with self.assertRaisesRegex(ValueError, "job_timeout"):
+            BulkPipeline(Pangram(api_key="test-key"), job_timeout=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
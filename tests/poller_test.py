@@ -0,0 +1,102 @@
+import threading
+import time
+import unittest
+
+from pangram.poller import TaskPoller
+from pangram.polling import FixedPolling
+
+
+class TransientError(Exception):
+    pass
+
+
+class TestTaskPoller(unittest.TestCase):
+    def test_resolves_many_tasks_with_few_workers(self):
+        checks = {}
+        lock = threading.Lock()
+
+        def check_task(task_id, deadline):
+            with lock:
+                checks[task_id] = checks.get(task_id, 0) + 1
+                count = checks[task_id]
+            return ({"task_id": task_id} if count >= 2 else None), None
+
+        poller = TaskPoller(check_task, max_workers=2)
+        deadline = time.monotonic() + 10
+        futures = [poller.submit(f"task-{i}", deadline, 10, FixedPolling(0.01).schedule()) for i in range(200)]
+        results = [future.result(timeout=10) for future in futures]
+        poller.close()
+
+        self.assertEqual([result["task_id"] for result in results], [f"task-{i}" for i in range(200)])
+        self.assertTrue(all(count == 2 for count in checks.values()))
+        self.assertEqual(len(poller), 0)
+
+    def test_propagates_task_failure(self):
+        def check_task(task_id, deadline):
+            raise ValueError("task failed")
+
+        poller = TaskPoller(check_task)
+        future = poller.submit("task-1", time.monotonic() + 10, 10, FixedPolling(0.01).schedule())
+        with self.assertRaisesRegex(ValueError, "task failed"):
+            future.result(timeout=5)
+        poller.close()
+
+    def test_retries_transient_errors(self):
+        attempts = []
+
+        def check_task(task_id, deadline):
+            attempts.append(task_id)
+            if len(attempts) == 1:
+                raise TransientError("connection dropped")
+            return {"task_id": task_id}, None
+
+        poller = TaskPoller(check_task, is_retryable=lambda exc: isinstance(exc, TransientError))
+        future = poller.submit("task-1", time.monotonic() + 10, 10, FixedPolling(0.01).schedule())
+        self.assertEqual(future.result(timeout=5), {"task_id": "task-1"})
+        self.assertEqual(len(attempts), 2)
+        poller.close()
+
+    def test_enforces_each_task_deadline(self):
+        poller = TaskPoller(lambda task_id, deadline: (None, None))
+        short = poller.submit("short", time.monotonic() + 0.05, 0.05, FixedPolling(0.01).schedule())
+        long = poller.submit("long", time.monotonic() + 10, 10, FixedPolling(0.01).schedule())
+        with self.assertRaisesRegex(TimeoutError, "short did not complete"):
+            short.result(timeout=5)
+        self.assertFalse(long.done())
+        poller.close()
+        self.assertTrue(long.cancelled())
+
+    def test_close_cancels_tasks_waiting_for_a_worker(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def check_task(task_id, deadline):
+            started.set()
+            release.wait(5)
+            return {"task_id": task_id}, None
+
+        poller = TaskPoller(check_task, max_workers=1)
+        deadline = time.monotonic() + 10
+        futures = [poller.submit(f"task-{i}", deadline, 10, FixedPolling(0.01).schedule()) for i in range(3)]
+        started.wait(5)
+        while len(poller):
+            time.sleep(0.001)
+        poller.close()
+        release.set()
+
+        for future in futures:
+            self.assertTrue(future.cancelled())
+
+    def test_submit_after_close_raises(self):
+        poller = TaskPoller(lambda task_id, deadline: (None, None))
+        poller.close()
+        with self.assertRaisesRegex(RuntimeError, "closed"):
+            poller.submit("task-1", time.monotonic() + 1, 1, FixedPolling(0.1).schedule())
+
+    def test_rejects_invalid_worker_count(self):
+        with self.assertRaisesRegex(ValueError, "max_workers"):
+            TaskPoller(lambda task_id, deadline: None, max_workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
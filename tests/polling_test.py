@@ -0,0 +1,101 @@
+import unittest
+from email.utils import formatdate
+from unittest.mock import patch
+
+from pangram.polling import AdaptivePolling, FixedPolling, PollingStrategy, PollSchedule, parse_retry_after
+
+
+class TestPollingStrategy(unittest.TestCase):
+    def test_base_classes_are_abstract(self):
+        with self.assertRaises(TypeError):
+            PollingStrategy()
+        with self.assertRaises(TypeError):
+            PollSchedule()
+
+        class IncompleteStrategy(PollingStrategy):
+            pass
+
+        with self.assertRaises(TypeError):
+            IncompleteStrategy()
+
+    def test_custom_strategy(self):
+        class Constant(PollSchedule):
+            def next_interval(self, status=None, retry_after=None):
+                return 2.0
+
+        class ConstantPolling(PollingStrategy):
+            def schedule(self):
+                return Constant()
+
+        self.assertEqual(ConstantPolling().schedule().next_interval(), 2.0)
+
+
+class TestFixedPolling(unittest.TestCase):
+    def test_returns_constant_interval(self):
+        schedule = FixedPolling(0.5).schedule()
+        self.assertEqual([schedule.next_interval() for _ in range(3)], [0.5, 0.5, 0.5])
+
+    def test_honors_retry_after(self):
+        schedule = FixedPolling(0.5).schedule()
+        self.assertEqual(schedule.next_interval(retry_after=3), 3)
+        self.assertEqual(schedule.next_interval(retry_after=0.1), 0.5)
+
+    def test_rejects_negative_interval(self):
+        with self.assertRaisesRegex(ValueError, "interval"):
+            FixedPolling(-1)
+
+
+class TestAdaptivePolling(unittest.TestCase):
+    def test_backs_off_exponentially_up_to_cap(self):
+        schedule = AdaptivePolling(initial_interval=1, max_interval=4, multiplier=2, jitter=0).schedule()
+        self.assertEqual([schedule.next_interval() for _ in range(5)], [1, 2, 4, 4, 4])
+
+    def test_applies_jitter(self):
+        schedule = AdaptivePolling(initial_interval=1, jitter=0.5).schedule()
+        with patch("pangram.polling.random.uniform", return_value=1.5) as mock_uniform:
+            self.assertEqual(schedule.next_interval(), 1.5)
+        mock_uniform.assert_called_once_with(0.5, 1.5)
+
+    def test_uses_eta_hint_from_status(self):
+        schedule = AdaptivePolling(initial_interval=0.5, max_interval=30, jitter=0).schedule()
+        self.assertEqual(schedule.next_interval(status={"eta_seconds": 20}), 10)
+        self.assertEqual(schedule.next_interval(status={"eta_seconds": 0.2}), 0.5)
+
+    def test_estimates_completion_from_bulk_progress(self):
+        schedule = AdaptivePolling(initial_interval=0.5, max_interval=60, multiplier=1, jitter=0).schedule()
+        with patch("pangram.polling.time.monotonic", side_effect=[100.0, 110.0]):
+            first = schedule.next_interval(status={"total_items": 1000, "succeeded": 100, "failed": 0})
+            second = schedule.next_interval(status={"total_items": 1000, "succeeded": 190, "failed": 10})
+
+        self.assertEqual(first, 0.5)
+        # 100 items in 10s leaves 800 items, about 80s; wait half of that, capped at 60s.
+        self.assertEqual(second, 40)
+
+    def test_honors_retry_after_over_schedule(self):
+        schedule = AdaptivePolling(initial_interval=0.5, jitter=0).schedule()
+        self.assertEqual(schedule.next_interval(retry_after=5), 5)
+
+    def test_schedules_are_independent(self):
+        strategy = AdaptivePolling(initial_interval=1, multiplier=2, jitter=0)
+        first = strategy.schedule()
+        first.next_interval()
+        first.next_interval()
+        self.assertEqual(strategy.schedule().next_interval(), 1)
+
+    def test_rejects_invalid_parameters(self):
+        with self.assertRaisesRegex(ValueError, "initial_interval"):
+            AdaptivePolling(initial_interval=5, max_interval=1)
+        with self.assertRaisesRegex(ValueError, "multiplier"):
+            AdaptivePolling(multiplier=0.5)
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    def test_parses_seconds_and_dates(self):
+        self.assertEqual(parse_retry_after("3"), 3.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertAlmostEqual(parse_retry_after(formatdate(usegmt=True)), 0.0, delta=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pangram.rate_limit import FileTokenBucket, RateLimiter, TokenBucket, fcntl
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_allows_burst_then_paces_to_rate(self):
+        with patch("pangram.rate_limit.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate=2, burst=2)
+            with patch("pangram.rate_limit.time.sleep") as mock_sleep:
+                for _ in range(4):
+                    self.assertTrue(bucket.acquire())
+
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0])
+
+    def test_refills_over_time(self):
+        with patch("pangram.rate_limit.time.monotonic", side_effect=[0.0, 0.0, 10.0]), patch(
+            "pangram.rate_limit.time.sleep"
+        ) as mock_sleep:
+            bucket = TokenBucket(rate=1, burst=1)
+            bucket.acquire()
+            bucket.acquire()
+
+        mock_sleep.assert_not_called()
+
+    def test_returns_false_without_taking_tokens_when_wait_exceeds_timeout(self):
+        with patch("pangram.rate_limit.time.monotonic", return_value=0.0), patch(
+            "pangram.rate_limit.time.sleep"
+        ) as mock_sleep:
+            bucket = TokenBucket(rate=1, burst=1)
+            bucket.acquire()
+            self.assertFalse(bucket.acquire(timeout=0.5))
+            self.assertTrue(bucket.acquire(timeout=1))
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_rejects_invalid_parameters(self):
+        with self.assertRaisesRegex(ValueError, "rate"):
+            TokenBucket(rate=0)
+        with self.assertRaisesRegex(ValueError, "burst size"):
+            TokenBucket(rate=1, burst=1).acquire(tokens=2)
+
+
+@unittest.skipUnless(fcntl, "requires fcntl")
+class TestFileTokenBucket(unittest.TestCase):
+    def test_instances_share_state_through_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "submit.bucket")
+            first = FileTokenBucket(path, rate=1, burst=1)
+            second = FileTokenBucket(path, rate=1, burst=1)
+            with patch("pangram.rate_limit.time.time", return_value=1000.0), patch(
+                "pangram.rate_limit.time.sleep"
+            ) as mock_sleep:
+                first.acquire()
+                second.acquire()
+            first.close()
+            second.close()
+
+        mock_sleep.assert_called_once_with(1.0)
+
+    def test_can_be_pickled(self):
+        with tempfile.TemporaryDirectory() as directory:
+            bucket = FileTokenBucket(os.path.join(directory, "poll.bucket"), rate=5)
+            bucket.acquire()
+            copy = pickle.loads(pickle.dumps(bucket))
+            self.assertEqual(copy.path, bucket.path)
+            self.assertTrue(copy.acquire())
+            bucket.close()
+            copy.close()
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_unlimited_categories_do_not_wait(self):
+        limiter = RateLimiter.per_second(submits=1)
+        self.assertEqual(set(limiter.buckets), {"submit"})
+        with patch("pangram.rate_limit.time.sleep") as mock_sleep:
+            for _ in range(5):
+                limiter.acquire("poll")
+        mock_sleep.assert_not_called()
+
+    def test_rejects_unknown_category(self):
+        with self.assertRaisesRegex(ValueError, "Unknown rate limit category"):
+            RateLimiter().acquire("download")
+
+    @unittest.skipUnless(fcntl, "requires fcntl")
+    def test_shared_creates_file_buckets(self):
+        with tempfile.TemporaryDirectory() as directory:
+            limiter = RateLimiter.shared(directory, polls=10, bulk_pages=2)
+            self.assertIsInstance(limiter.buckets["poll"], FileTokenBucket)
+            self.assertEqual(limiter.buckets["bulk_page"].path, os.path.join(directory, "bulk_page.bucket"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import pickle
+import unittest
+
+from pangram.results import BulkItem, BulkStatus, Confidence, Prediction, PredictionShort, Stage, typed_bulk_results
+
+TEXT = "First sentence here. Second sentence there."
+PREDICTION = {
+    "stage": "STAGE_SUCCESS",
+    "text": TEXT,
+    "version": "3.1",
+    "prediction_short": "Mixed",
+    "fraction_ai": 0.5,
+    "fraction_human": 0.5,
+    "windows": [
+        {"text": "First sentence here.", "label": "AI-Generated", "confidence": "High", "start_index": 0, "end_index": 20},
+        {"text": "rewritten", "label": "Human", "confidence": "Unusual", "start_index": 21, "end_index": 43},
+    ],
+    "future_field": [1, 2],
+}
+
+
+class TestPrediction(unittest.TestCase):
+    def test_behaves_like_the_response_dict(self):
+        prediction = Prediction.from_dict(PREDICTION)
+
+        self.assertEqual(prediction, PREDICTION)
+        self.assertEqual(prediction["fraction_ai"], 0.5)
+        self.assertEqual(prediction["windows"][0]["label"], "AI-Generated")
+        self.assertEqual(prediction.get("dashboard_link", "none"), "none")
+        self.assertNotIn("dashboard_link", prediction)
+        self.assertIsNone(prediction.dashboard_link)
+        self.assertEqual(prediction.extra, {"future_field": [1, 2]})
+        self.assertEqual(prediction.to_dict(), PREDICTION)
+        with self.assertRaises(KeyError):
+            prediction["dashboard_link"]
+
+    def test_uses_enums_and_shares_window_text(self):
+        prediction = Prediction.from_dict(PREDICTION)
+        first, second = prediction.windows
+
+        self.assertIs(prediction.stage, Stage.SUCCESS)
+        self.assertIs(prediction.prediction_short, PredictionShort.MIXED)
+        self.assertIs(first.confidence, Confidence.HIGH)
+        self.assertEqual(second.confidence, "Unusual")
+        self.assertIs(first.label, Prediction.from_dict(PREDICTION).windows[0].label)
+        self.assertIs(first._source, prediction.text)
+        self.assertEqual(first.text, "First sentence here.")
+        self.assertIsNone(second._source)
+        self.assertEqual(second.text, "rewritten")
+
+    def test_is_read_only_and_picklable(self):
+        prediction = Prediction.from_dict(PREDICTION)
+
+        with self.assertRaises(AttributeError):
+            prediction.fraction_ai = 1.0
+        self.assertFalse(hasattr(prediction, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(prediction)).to_dict(), PREDICTION)
+
+
+class TestBulkResults(unittest.TestCase):
+    def test_converts_items_and_nested_results(self):
+        results = typed_bulk_results(
+            {
+                "bulk_id": "blk_123",
+                "total_items": 2,
+                "items": [{"index": 0, "id": "a", "result": PREDICTION}, {"index": 1, "id": "b", "result": None}],
+                "failed_items": [],
+            }
+        )
+
+        first, second = results["items"]
+        self.assertIsInstance(first, BulkItem)
+        self.assertIsInstance(first.result, Prediction)
+        self.assertEqual(first.result.fraction_ai, 0.5)
+        self.assertIsNone(second.result)
+        self.assertIn("result", second)
+        self.assertEqual(second.to_dict(), {"index": 1, "id": "b", "result": None})
+
+    def test_items_with_different_keys_do_not_share_fields(self):
+        full = BulkItem.from_dict({"index": 0, "id": "a", "stage": "STAGE_SUCCESS", "result": PREDICTION})
+        failed = BulkItem.from_dict({"stage": "STAGE_FAILED", "index": 1, "error": "invalid text", "failed": True})
+        again = BulkItem.from_dict({"index": 2, "id": "c", "stage": "STAGE_SUCCESS", "result": None})
+
+        self.assertIs(full.stage, Stage.SUCCESS)
+        self.assertIs(failed.stage, Stage.FAILED)
+        self.assertIsNone(failed.result)
+        self.assertNotIn("result", failed)
+        self.assertEqual(list(failed), ["index", "stage", "error", "failed"])
+        self.assertEqual(again.to_dict(), {"index": 2, "id": "c", "stage": "STAGE_SUCCESS", "result": None})
+        with self.assertRaises(AttributeError):
+            failed.not_a_field
+
+    def test_bulk_status_keeps_unknown_counters(self):
+        status = BulkStatus.from_dict({"bulk_id": "blk_123", "status": "running", "succeeded": 3, "queued": 7})
+
+        self.assertEqual(status.succeeded, 3)
+        self.assertEqual(status["queued"], 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import patch
+
+from pangram.retry import NO_RETRY, RetryPolicy
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_backs_off_exponentially_up_to_cap(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=3, jitter=0)
+        self.assertEqual([policy.backoff(attempt) for attempt in range(1, 5)], [1, 2, 3, 3])
+
+    def test_applies_jitter(self):
+        policy = RetryPolicy(backoff_base=2, jitter=0.5)
+        with patch("pangram.retry.random.random", return_value=1.0):
+            self.assertEqual(policy.backoff(1), 1.0)
+
+    def test_honors_longer_retry_after(self):
+        policy = RetryPolicy(backoff_base=1, jitter=0)
+        self.assertEqual(policy.backoff(1, retry_after=5), 5)
+        self.assertEqual(policy.backoff(1, retry_after=0.5), 1)
+        self.assertEqual(RetryPolicy(backoff_base=1, jitter=0, respect_retry_after=False).backoff(1, retry_after=5), 1)
+
+    def test_only_retries_safe_statuses_for_non_idempotent_calls(self):
+        policy = RetryPolicy()
+        self.assertTrue(policy.should_retry_status(502, idempotent=True))
+        self.assertFalse(policy.should_retry_status(502, idempotent=False))
+        self.assertTrue(policy.should_retry_status(429, idempotent=False))
+        self.assertTrue(policy.should_retry_status(503, idempotent=False))
+        self.assertFalse(policy.should_retry_status(400, idempotent=True))
+
+    def test_no_retry_makes_a_single_attempt(self):
+        self.assertEqual(NO_RETRY.max_attempts, 1)
+
+    def test_rejects_invalid_parameters(self):
+        with self.assertRaisesRegex(ValueError, "max_attempts"):
+            RetryPolicy(max_attempts=0)
+        with self.assertRaisesRegex(ValueError, "backoff_base"):
+            RetryPolicy(backoff_base=5, backoff_max=1)
+        with self.assertRaisesRegex(ValueError, "jitter"):
+            RetryPolicy(jitter=2)
+        with self.assertRaisesRegex(ValueError, "max_elapsed"):
+            RetryPolicy(max_elapsed=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
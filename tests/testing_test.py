@@ -0,0 +1,122 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from pangram import FixedPolling, RetryPolicy
+from pangram.testing import FakePangramServer, fake_prediction, fixed_latency, lognormal_latency, uniform_latency
+
+TEXT = " ".join(f"word{index}" for index in range(250))
+FAST = {"processing_time": fixed_latency(0.01), "seed": 7}
+
+
+def fast_client(server, **kwargs):
+    kwargs.setdefault("retry", RetryPolicy(max_attempts=3, backoff_base=0.01, backoff_max=0.02, jitter=0))
+    return server.client(polling=FixedPolling(0.01), **kwargs)
+
+
+class TestFakePrediction(unittest.TestCase):
+    def test_windows_and_fractions(self):
+        result = fake_prediction(TEXT, score=lambda text: 0.9 if text.startswith("word0 ") else 0.1)
+
+        self.assertEqual([window["word_count"] for window in result["windows"]], [100, 100, 50])
+        for window in result["windows"]:
+            self.assertEqual(TEXT[window["start_index"] : window["end_index"]], window["text"])
+        self.assertAlmostEqual(result["fraction_ai"], 0.4)
+        self.assertAlmostEqual(result["fraction_human"], 0.6)
+        self.assertEqual(result["prediction_short"], "Mixed")
+        self.assertEqual((result["num_ai_segments"], result["num_human_segments"]), (1, 2))
+        self.assertEqual(fake_prediction(TEXT), fake_prediction(TEXT))
+
+    def test_latency_distributions(self):
+        import random
+
+        rng = random.Random(1)
+        self.assertEqual(fixed_latency(0.2)(rng), 0.2)
+        self.assertTrue(all(0.1 <= uniform_latency(0.1, 0.3)(rng) <= 0.3 for _ in range(100)))
+        self.assertTrue(all(lognormal_latency(0.1, maximum=0.5)(rng) <= 0.5 for _ in range(100)))
+
+
+class TestFakePangramServer(unittest.TestCase):
+    def test_predict_bulk_upload_and_plagiarism_round_trip(self):
+        with FakePangramServer(**FAST) as server, fast_client(server) as client:
+            result = client.predict(TEXT)
+            self.assertEqual(result["text"], TEXT)
+            self.assertEqual(result["stage"], "STAGE_SUCCESS")
+            self.assertEqual(len(client.predict_many(["one text", "two text", "three text"])), 3)
+
+            submission = client.submit_bulk(items=[{"id": "a", "text": "first"}, {"id": "b", "text": " "}])
+            self.assertEqual([item["id"] for item in submission["failed_items"]], ["b"])
+            status = client.wait_for_bulk(submission["bulk_id"], poll_interval=0.01)
+            self.assertEqual(status["status"], "partial")
+            results = client.get_bulk_results(submission["bulk_id"])
+            self.assertEqual(results["items"][0]["result"]["text"], "first")
+            self.assertEqual(client.get_bulk_items(submission["bulk_id"])["items"][1]["stage"], "STAGE_FAILED")
+
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "essay.txt")
+                with open(path, "w") as handle:
+                    handle.write(TEXT)
+                uploaded = client.predict_files([path])
+            self.assertEqual(uploaded[0]["filename"], "essay.txt")
+            self.assertEqual(uploaded[0]["text"], TEXT)
+
+            plagiarism = client.check_plagiarism("One sentence. Another sentence.")
+            self.assertEqual(plagiarism["total_sentences"], 2)
+
+        self.assertLessEqual(server.metrics["connections"], 4)
+        self.assertEqual(server.metrics["requests.upload_files"], 1)
+        self.assertGreater(server.metrics["requests.get_task"], 0)
+
+    def test_queueing_delay_follows_worker_count(self):
+        with FakePangramServer(processing_time=fixed_latency(0.1), workers=1, seed=1) as server:
+            with fast_client(server) as client:
+                started = time.monotonic()
+                client.predict_many(["a", "b", "c"], max_concurrency=3)
+                elapsed = time.monotonic() - started
+        self.assertGreaterEqual(elapsed, 0.3)
+
+    def test_injected_faults_are_retried(self):
+        with FakePangramServer(rate_limit_rate=0.3, error_rate=0.3, retry_after=0.01, **FAST) as server:
+            with fast_client(server, retry=RetryPolicy(max_attempts=20, backoff_base=0.001, jitter=0)) as client:
+                results = client.predict_many([f"text {index}" for index in range(5)])
+        self.assertTrue(all(result["stage"] == "STAGE_SUCCESS" for result in results))
+        self.assertGreater(server.metrics["injected.rate_limited"] + server.metrics["injected.errors"], 0)
+        self.assertEqual(server.metrics["status.429"], server.metrics["injected.rate_limited"])
+
+    def test_throughput_cap_and_api_key(self):
+        with FakePangramServer(max_requests_per_second=5, api_key="secret", **FAST) as server:
+            with fast_client(server, retry=RetryPolicy(max_attempts=1)) as client:
+                errors = 0
+                for _ in range(8):
+                    try:
+                        client.check_plagiarism("Some text.")
+                    except ValueError:
+                        errors += 1
+            self.assertGreater(errors, 0)
+            self.assertEqual(server.metrics["throttled"], errors)
+            with fast_client(server, api_key="wrong") as client:
+                with self.assertRaises(ValueError):
+                    client.check_plagiarism("Some text.")
+            self.assertEqual(server.metrics["status.401"], 1)
+
+    def test_async_client(self):
+        async def run(server):
+            async with server.async_client(polling=FixedPolling(0.01)) as client:
+                return await client.predict("async text")
+
+        with FakePangramServer(**FAST) as server:
+            self.assertEqual(asyncio.run(run(server))["text"], "async text")
+
+    def test_rejects_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            FakePangramServer(workers=0)
+        with self.assertRaises(ValueError):
+            FakePangramServer(error_rate=2)
+        with self.assertRaises(ValueError):
+            FakePangramServer(error_rate={"get_task": -0.1})
+
+
+if __name__ == "__main__":
+    unittest.main()
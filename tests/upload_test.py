@@ -0,0 +1,66 @@
+import os
+import tempfile
+import unittest
+from email.parser import BytesParser
+
+from pangram.upload import MultipartFileStream, batch_files
+
+
+class TestBatchFiles(unittest.TestCase):
+    def test_splits_by_file_count_and_bytes(self):
+        sizes = [(0, 10), (1, 10), (2, 10), (3, 50), (4, 10)]
+
+        self.assertEqual(batch_files(sizes, max_files=2, max_bytes=100), [[0, 1], [2, 3], [4]])
+        self.assertEqual(batch_files(sizes, max_files=10, max_bytes=30), [[0, 1, 2], [3], [4]])
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaisesRegex(ValueError, "at least 1"):
+            batch_files([], max_files=0)
+
+
+class TestMultipartFileStream(unittest.TestCase):
+    def test_streams_fields_and_files_with_exact_length(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, contents in (("first.pdf", b"%PDF-1"), ("second.docx", os.urandom(200000))):
+                path = os.path.join(directory, name)
+                with open(path, "wb") as file_obj:
+                    file_obj.write(contents)
+                paths.append(path)
+            body = MultipartFileStream({"public_dashboard_link": "true"}, paths)
+
+            first_read = body.read(1000)
+            data = first_read + body.read()
+            body.rewind()
+            self.assertEqual(body.read(), data)
+            self.assertEqual(b"".join(body), data)
+            with open(paths[1], "rb") as file_obj:
+                second_contents = file_obj.read()
+
+        self.assertEqual(len(first_read), 1000)
+        self.assertEqual(len(data), len(body))
+        message = BytesParser().parsebytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + data)
+        parts = message.get_payload()
+        self.assertEqual(parts[0].get_param("name", header="content-disposition"), "public_dashboard_link")
+        self.assertEqual(parts[0].get_payload(), "true")
+        self.assertEqual([part.get_filename() for part in parts[1:]], ["first.pdf", "second.docx"])
+        self.assertEqual(parts[1].get_payload(decode=True), b"%PDF-1")
+        self.assertEqual(parts[2].get_payload(decode=True), second_contents)
+
+    def test_escapes_quotes_and_line_breaks_in_file_names(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'evil"\r\nX-Injected: 1\n.pdf')
+            with open(path, "wb") as file_obj:
+                file_obj.write(b"%PDF-1")
+            body = MultipartFileStream({}, [path])
+            data = body.read()
+
+        message = BytesParser().parsebytes(f"Content-Type: {body.content_type}\r\n\r\n".encode() + data)
+        (part,) = message.get_payload()
+        self.assertEqual(part.get_filename(), "evil%22%0D%0AX-Injected: 1%0A.pdf")
+        self.assertIsNone(part["X-Injected"])
+        self.assertEqual(part.get_payload(decode=True), b"%PDF-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+
+from pangram.results import Prediction
+from pangram.windows import Span, WindowIndex, paragraph_spans, render_ansi, render_html, sentence_spans
+
+TEXT = "First <b>sentence</b>. Second one!\n\nA new paragraph? Yes."
+
+
+def window(start, end, score, label):
+    return {"text": TEXT[start:end], "label": label, "ai_assistance_score": score, "start_index": start, "end_index": end}
+
+
+WINDOWS = [
+    window(0, 22, 0.9, "AI-Generated"),
+    window(23, 34, 0.8, "AI-Generated"),
+    window(36, 52, 0.1, "Human"),
+    window(48, 57, 0.3, "Moderately AI-Assisted"),
+]
+
+
+class TestTextSpans(unittest.TestCase):
+    def test_sentences_and_paragraphs(self):
+        self.assertEqual(
+            [TEXT[span.start : span.end] for span in sentence_spans(TEXT)],
+            ["First <b>sentence</b>.", "Second one!", "A new paragraph?", "Yes."],
+        )
+        self.assertEqual(
+            [TEXT[span.start : span.end] for span in paragraph_spans(TEXT)],
+            ["First <b>sentence</b>. Second one!", "A new paragraph? Yes."],
+        )
+        self.assertEqual(paragraph_spans("  \n\n "), [])
+
+
+class TestWindowIndex(unittest.TestCase):
+    def test_point_queries_resolve_overlaps(self):
+        index = WindowIndex(WINDOWS + [{"start_index": 5, "end_index": 1, "ai_assistance_score": 1.0}, {"label": "x"}])
+
+        self.assertEqual(index.score_at(0), 0.9)
+        self.assertEqual(index.label_at(21), "AI-Generated")
+        self.assertIsNone(index.score_at(22))
+        self.assertIsNone(index.score_at(100))
+        self.assertEqual(index.score_at(50), 0.3)
+        self.assertEqual(index.span_at(50), Span(48, 57, 0.3, "Moderately AI-Assisted"))
+        self.assertEqual(index.span_at(40), Span(36, 48, 0.1, "Human"))
+        self.assertEqual(len(index), 4)
+
+        mean = WindowIndex(WINDOWS, overlap="mean")
+        self.assertAlmostEqual(mean.score_at(50), 0.2)
+        self.assertEqual(mean.label_at(50), "Moderately AI-Assisted")
+        with self.assertRaises(ValueError):
+            WindowIndex(WINDOWS, overlap="min")
+
+    def test_range_sentence_and_paragraph_scores(self):
+        index = WindowIndex.from_result(Prediction.from_dict({"text": TEXT, "windows": WINDOWS}))
+
+        self.assertAlmostEqual(index.score_for_range(0, 34), (0.9 * 22 + 0.8 * 11) / 33)
+        self.assertAlmostEqual(index.score_for_range(10, 12), 0.9)
+        self.assertEqual(index.score_for_range(0, 34, reduce="max"), 0.9)
+        self.assertEqual(index.score_for_range(40, 100, reduce="max"), 0.3)
+        self.assertIsNone(index.score_for_range(22, 23))
+        self.assertIsNone(index.score_for_range(22, 23, reduce="max"))
+        with self.assertRaises(ValueError):
+            index.score_for_range(0, 1, reduce="median")
+
+        self.assertEqual([span.score for span in index.sentence_scores(TEXT, reduce="max")], [0.9, 0.8, 0.3, 0.3])
+        paragraphs = index.paragraph_scores(TEXT)
+        self.assertEqual([(span.start, span.end) for span in paragraphs], [(0, 34), (36, 57)])
+        self.assertAlmostEqual(paragraphs[1].score, (0.1 * 12 + 0.3 * 9) / 21)
+        self.assertEqual(len(WindowIndex.from_result({"windows": None})), 0)
+
+    def test_brute_force_agreement(self):
+        windows = [window(start, start + 7, (start % 5) / 4, "AI" if start % 3 else "Human") for start in range(0, 50, 4)]
+        index = WindowIndex(windows)
+
+        for offset in range(60):
+            covering = [w for w in windows if w["start_index"] <= offset < w["end_index"]]
+            expected = max((w["ai_assistance_score"] for w in covering), default=None)
+            self.assertEqual(index.score_at(offset), expected, offset)
+        for start in range(0, 55, 3):
+            for end in range(start + 1, 60, 7):
+                scores = [index.score_at(offset) for offset in range(start, end)]
+                scores = [score for score in scores if score is not None]
+                self.assertEqual(index.score_for_range(start, end, reduce="max"), max(scores, default=None))
+                if scores:
+                    self.assertAlmostEqual(index.score_for_range(start, end), sum(scores) / len(scores))
+
+    def test_merged_spans(self):
+        index = WindowIndex(WINDOWS + [window(22, 23, 0.7, "AI-Generated")])
+
+        self.assertEqual(
+            [(span.start, span.end, span.label) for span in index.merged_spans()],
+            [(0, 34, "AI-Generated"), (36, 48, "Human"), (48, 57, "Moderately AI-Assisted")],
+        )
+        self.assertAlmostEqual(index.merged_spans()[0].score, (0.9 * 22 + 0.7 + 0.8 * 11) / 34)
+        self.assertEqual([span.label for span in index.merged_spans(min_score=0.2)], ["AI-Generated", "Moderately AI-Assisted"])
+
+
+class TestRendering(unittest.TestCase):
+    def test_render_html_escapes_and_highlights(self):
+        rendered = WindowIndex(WINDOWS).render_html(TEXT, min_score=0.5)
+
+        self.assertEqual(
+            rendered,
+            '<mark class="pangram-window pangram-ai-generated" data-score="0.90" title="AI-Generated (0.90)">'
+            "First &lt;b&gt;sentence&lt;/b&gt;.</mark> "
+            '<mark class="pangram-window pangram-ai-generated" data-score="0.80" title="AI-Generated (0.80)">Second one!</mark>'
+            "\n\nA new paragraph? Yes.",
+        )
+
+    def test_render_skips_overlaps_and_plain_spans(self):
+        spans = [Span(0, 5, 0.9, "AI"), Span(3, 8, 0.6, "AI"), Span(8, 10, 0.0, "Human"), Span(12, 99, 0.25, None)]
+
+        self.assertEqual(
+            render_ansi("abcdefghijklmn", spans),
+            "\x1b[1;31mabcde\x1b[0m\x1b[1;31mfgh\x1b[0mijkl\x1b[33mmn\x1b[0m",
+        )
+        self.assertEqual(render_html("a&b", [Span(1, 2, None, None)], class_prefix="p"), 'a<mark class="p-window p-unlabeled" data-score="" title="Unlabeled">&amp;</mark>b')
+
+
+if __name__ == "__main__":
+    unittest.main()